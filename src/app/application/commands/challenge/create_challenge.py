@@ -5,6 +5,7 @@ from typing import TypedDict
 from uuid import UUID
 from datetime import datetime
 from decimal import Decimal
+from app.application.common.ports.event_publisher import EventPublisher
 from app.application.common.ports.flusher import Flusher
 from app.application.common.ports.streamer_command_gateway import StreamerCommandGateway
 from app.application.common.ports.transaction_command_gateway import TransactionCommandGateway
@@ -12,6 +13,7 @@ from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.challenge_command_gateway import ChallengeCommandGateway
+from app.application.common.ports.challenge_updates import ChallengeUpdatePublisher
 
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.application.common.ports.wallet_command_gateway import WalletCommandGateway
@@ -24,6 +26,7 @@ from app.application.common.services.current_user import CurrentUserService
 from app.domain.shared.enums import ProductType
 from app.domain.user.streamer import Streamer
 from app.domain.base import DomainError
+from app.domain.challenge.events import ChallengeCreated
 from app.domain.challenge.service import ChallengeService
 from app.domain.wallet.service import WalletService
 from app.domain.shared.entities.transaction.service import TransactionService
@@ -72,6 +75,8 @@ class CreateChallengeInteractor:
         challenge_command_gateway: ChallengeCommandGateway,
         wallet_command_gateway: WalletCommandGateway,
         transaction_command_gateway: TransactionCommandGateway,
+        event_publisher: EventPublisher,
+        challenge_update_publisher: ChallengeUpdatePublisher,
         flusher: Flusher,
         transaction_manager: TransactionManager,
     ):
@@ -85,6 +90,8 @@ class CreateChallengeInteractor:
         self._challenge_command_gateway = challenge_command_gateway
         self._wallet_command_gateway = wallet_command_gateway
         self._transaction_command_gateway = transaction_command_gateway
+        self._event_publisher = event_publisher
+        self._challenge_update_publisher = challenge_update_publisher
         self._flusher = flusher
         self._transaction_manager = transaction_manager
 
@@ -98,7 +105,7 @@ class CreateChallengeInteractor:
         """
         log.info("Create challenge: started.")
         #get current user
-        current_user = await self._current_user_service.get_current_user()
+        current_user = await self._current_user_service.get_current_principal()
 
         authorize(
             permission=CanCreateChallenge(),
@@ -120,7 +127,7 @@ class CreateChallengeInteractor:
         if streamer is None or streamer.disable_challenges:
             raise DomainError("Assigned to is not a valid streamer")
         
-        challenge_amount = ChallengeAmount(request_data.amount)
+        challenge_amount = ChallengeAmount.from_decimal(request_data.amount)
         
         #create challenge
         challenge = self._challenge_service.create_challenge(
@@ -146,8 +153,21 @@ class CreateChallengeInteractor:
         )
         self._challenge_command_gateway.add(challenge)
         self._transaction_command_gateway.add(transaction)
+        self._event_publisher.publish(
+            ChallengeCreated(
+                id_=challenge.id_,
+                title=challenge.title,
+                description=challenge.description,
+                created_by=challenge.created_by,
+                assigned_to=challenge.assigned_to,
+                amount=challenge.amount,
+                created_at=challenge.created_at,
+            ),
+            aggregate_id=challenge.id_.value,
+        )
         
         await self._flusher.flush()
+        await self._challenge_update_publisher.publish(challenge)
         await self._transaction_manager.commit()
 
         log.info("Create challenge: done.")
@@ -0,0 +1,160 @@
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TypedDict
+
+from app.application.common.ports.challenge_command_gateway import (
+    ChallengeCommandGateway,
+)
+from app.application.common.ports.challenge_updates import ChallengeUpdatePublisher
+from app.application.common.ports.event_publisher import EventPublisher
+from app.application.common.ports.flusher import Flusher
+from app.application.common.ports.transaction_command_gateway import (
+    TransactionCommandGateway,
+)
+from app.application.common.ports.transaction_manager import (
+    TransactionManager,
+)
+from app.application.common.ports.wallet_command_gateway import WalletCommandGateway
+from app.application.common.services.escrow_release import EscrowReleaseService
+from app.domain.challenge.challenge import Challenge
+from app.domain.challenge.challenge_status import ChallengeStatus
+from app.domain.challenge.events import ChallengeExpired
+from app.domain.challenge.service import ChallengeService
+from app.domain.shared.value_objects.id import ProductId
+from app.domain.wallet.wallet import Wallet
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExpireChallengesRequest:
+    batch_size: int
+    skipped_ids: frozenset[ProductId] = frozenset()
+
+
+class ExpireChallengesResponse(TypedDict):
+    claimed: int
+    expired: int
+    skipped_ids: list[ProductId]
+
+
+class ExpireChallengesInteractor:
+    """
+    Fails one batch of expired challenges and releases their escrow
+    in a single database transaction.
+    The batch is claimed with `SKIP LOCKED`, so any number of sweepers
+    can run side by side: each one settles challenges no other sweeper
+    or user request holds, and a settled challenge is no longer expirable.
+    """
+
+    def __init__(
+        self,
+        challenge_service: ChallengeService,
+        escrow_release_service: EscrowReleaseService,
+        challenge_command_gateway: ChallengeCommandGateway,
+        wallet_command_gateway: WalletCommandGateway,
+        transaction_command_gateway: TransactionCommandGateway,
+        event_publisher: EventPublisher,
+        challenge_update_publisher: ChallengeUpdatePublisher,
+        flusher: Flusher,
+        transaction_manager: TransactionManager,
+    ):
+        self._challenge_service = challenge_service
+        self._escrow_release_service = escrow_release_service
+        self._challenge_command_gateway = challenge_command_gateway
+        self._wallet_command_gateway = wallet_command_gateway
+        self._transaction_command_gateway = transaction_command_gateway
+        self._event_publisher = event_publisher
+        self._challenge_update_publisher = challenge_update_publisher
+        self._flusher = flusher
+        self._transaction_manager = transaction_manager
+
+    async def execute(
+        self,
+        request_data: ExpireChallengesRequest,
+    ) -> ExpireChallengesResponse:
+        """
+        :raises DataMapperError: If there's an error accessing the database
+
+        Challenges whose viewer wallet is missing are logged and left as they
+        are, so one broken row does not hold back the rest of the batch.
+        Their IDs are returned, and challenges in `skipped_ids`
+        are not claimed again.
+        Fewer challenges than `batch_size` are claimed once the backlog
+        is drained.
+        """
+        now = datetime.now(UTC)
+        challenges = await self._challenge_command_gateway.read_expired_for_update(
+            now=now,
+            limit=request_data.batch_size,
+            exclude_ids=request_data.skipped_ids,
+        )
+        if not challenges:
+            return ExpireChallengesResponse(claimed=0, expired=0, skipped_ids=[])
+
+        viewer_wallets = {
+            wallet.owner_id: wallet
+            for wallet in await self._wallet_command_gateway.read_by_user_ids(
+                {challenge.created_by for challenge in challenges},
+                for_update=True,
+            )
+        }
+        expired: list[Challenge] = []
+        skipped_ids: list[ProductId] = []
+        for challenge in challenges:
+            viewer_wallet = viewer_wallets.get(challenge.created_by)
+            if viewer_wallet is None:
+                log.error(
+                    "Expire challenges: viewer wallet not found, skipping. "
+                    "Challenge ID: %s",
+                    challenge.id_,
+                )
+                skipped_ids.append(challenge.id_)
+                continue
+
+            self._expire(challenge, viewer_wallet=viewer_wallet)
+            expired.append(challenge)
+
+        await self._flusher.flush()
+        for challenge in expired:
+            await self._challenge_update_publisher.publish(challenge)
+        await self._transaction_manager.commit()
+
+        log.info(
+            "Expire challenges: done. Challenges failed: %d, skipped: %d.",
+            len(expired),
+            len(skipped_ids),
+        )
+        return ExpireChallengesResponse(
+            claimed=len(challenges),
+            expired=len(expired),
+            skipped_ids=skipped_ids,
+        )
+
+    def _expire(self, challenge: Challenge, *, viewer_wallet: Wallet) -> None:
+        """
+        A challenge the streamer never accepted is refunded in full.
+        An accepted one the streamer did not complete in time is settled
+        like a viewer rejection after the deadline.
+        """
+        accepted = challenge.status == ChallengeStatus.STREAMER_ACCEPTED
+        self._challenge_service.expire_challenge(challenge)
+        if accepted:
+            dareus_earn, viewer_get_back = challenge.amount.allocate(10, 90)
+            transaction = self._escrow_release_service.release(
+                challenge,
+                (None, dareus_earn),
+                (viewer_wallet, viewer_get_back),
+            )
+        else:
+            transaction = self._escrow_release_service.release(
+                challenge,
+                (viewer_wallet, challenge.amount),
+            )
+        if transaction is not None:
+            self._transaction_command_gateway.add(transaction)
+        self._event_publisher.publish(
+            ChallengeExpired(challenge.id_),
+            aggregate_id=challenge.id_.value,
+        )
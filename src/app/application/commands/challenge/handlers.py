@@ -1,15 +1,42 @@
-from pyventus.events import EventLinker
+import logging
+from collections.abc import Awaitable, Callable
+
+from app.application.common.ports.event_subscriber import EventSubscriber
+from app.domain.base import Event
 from app.domain.challenge.events import (
-    ChallengeCreated,
     ChallengeAcceptedByStreamer,
-    ChallengeRejectedByStreamer,
     ChallengeCompletedByStreamer,
     ChallengeConfirmedByViewer,
+    ChallengeCreated,
+    ChallengeExpired,
+    ChallengeRejectedByStreamer,
     ChallengeRejectedByViewer,
 )
-from app.domain.wallet.service import WalletService
-from app.application.common.ports.wallet_command_gateway import WalletCommandGateway
 
-@EventLinker.on(ChallengeCreated)
-def debit_viewer_wallet(event: ChallengeCreated):
-    pass
\ No newline at end of file
+log = logging.getLogger(__name__)
+
+
+async def log_challenge_created(event: ChallengeCreated) -> None:
+    log.info(
+        "Challenge created. Challenge ID: %s, assigned to: %s.",
+        event.id_,
+        event.assigned_to,
+    )
+
+
+def subscribe_challenge_handlers(
+    subscriber: EventSubscriber,
+    *,
+    notify_participants: Callable[[Event], Awaitable[None]],
+) -> None:
+    subscriber.subscribe(ChallengeCreated, log_challenge_created)
+    for event_type in (
+        ChallengeCreated,
+        ChallengeAcceptedByStreamer,
+        ChallengeRejectedByStreamer,
+        ChallengeCompletedByStreamer,
+        ChallengeConfirmedByViewer,
+        ChallengeRejectedByViewer,
+        ChallengeExpired,
+    ):
+        subscriber.subscribe(event_type, notify_participants, concurrency=4)
@@ -0,0 +1,140 @@
+import logging
+from typing import TypedDict
+
+from app.application.common.ports.challenge_command_gateway import (
+    ChallengeCommandGateway,
+)
+from app.application.common.ports.challenge_updates import ChallengeUpdatePublisher
+from app.application.common.ports.event_publisher import EventPublisher
+from app.application.common.ports.flusher import Flusher
+from app.application.common.ports.streamer_command_gateway import StreamerCommandGateway
+from app.application.common.ports.transaction_command_gateway import (
+    TransactionCommandGateway,
+)
+from app.application.common.ports.transaction_manager import (
+    TransactionManager,
+)
+from app.application.common.ports.wallet_command_gateway import WalletCommandGateway
+from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.escrow_release import EscrowReleaseService
+from app.domain.base import DomainError
+from app.domain.challenge.events import TRANSITION_EVENTS
+from app.domain.challenge.service import ChallengeService
+from app.domain.challenge.transitions import ChallengeAction
+from app.domain.shared.value_objects.id import ProductId
+
+log = logging.getLogger(__name__)
+
+
+class RejectPendingChallengesResponse(TypedDict):
+    rejected: int
+
+
+class RejectPendingChallengesInteractor:
+    """
+    Rejects every pending challenge assigned to the current streamer,
+    e.g. at the end of a stream, and refunds the viewers in full.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        challenge_service: ChallengeService,
+        escrow_release_service: EscrowReleaseService,
+        challenge_command_gateway: ChallengeCommandGateway,
+        wallet_command_gateway: WalletCommandGateway,
+        streamer_command_gateway: StreamerCommandGateway,
+        transaction_command_gateway: TransactionCommandGateway,
+        event_publisher: EventPublisher,
+        challenge_update_publisher: ChallengeUpdatePublisher,
+        flusher: Flusher,
+        transaction_manager: TransactionManager,
+    ):
+        self._current_user_service = current_user_service
+        self._challenge_service = challenge_service
+        self._escrow_release_service = escrow_release_service
+        self._challenge_command_gateway = challenge_command_gateway
+        self._wallet_command_gateway = wallet_command_gateway
+        self._streamer_command_gateway = streamer_command_gateway
+        self._transaction_command_gateway = transaction_command_gateway
+        self._event_publisher = event_publisher
+        self._challenge_update_publisher = challenge_update_publisher
+        self._flusher = flusher
+        self._transaction_manager = transaction_manager
+
+    async def execute(self) -> RejectPendingChallengesResponse:
+        """
+        :raises AuthenticationError: If the current user is not authenticated
+        :raises DataMapperError: If there's an error accessing the database
+        :raises DomainError: If the streamer is not found
+
+        Challenges whose viewer wallet is missing are logged and left pending.
+        """
+        log.info("Reject pending challenges: started.")
+
+        current_user = await self._current_user_service.get_current_principal()
+        streamer = await self._streamer_command_gateway.read_by_user_id(
+            current_user.id_,
+        )
+        if streamer is None:
+            raise DomainError("Streamer not found")
+
+        transition = self._challenge_service.bulk_transition(
+            ChallengeAction.STREAMER_REJECT,
+        )
+        pending = await self._challenge_command_gateway.read_transitionable_for_update(
+            transition,
+            actor_id=streamer.id_,
+        )
+        viewer_wallets = {
+            wallet.owner_id: wallet
+            for wallet in await self._wallet_command_gateway.read_by_user_ids(
+                {challenge.created_by for challenge in pending},
+                for_update=True,
+            )
+        }
+        refundable: list[ProductId] = []
+        for challenge in pending:
+            if challenge.created_by not in viewer_wallets:
+                log.error(
+                    "Reject pending challenges: viewer wallet not found, skipping. "
+                    "Challenge ID: %s",
+                    challenge.id_,
+                )
+                continue
+            refundable.append(challenge.id_)
+
+        challenges = (
+            await self._challenge_command_gateway.transition_all(
+                transition,
+                actor_id=streamer.id_,
+                challenge_ids=refundable,
+            )
+            if refundable
+            else []
+        )
+        self._challenge_service.record_bulk_transition(challenges, transition)
+
+        for challenge in challenges:
+            release = self._escrow_release_service.release(
+                challenge,
+                (viewer_wallets[challenge.created_by], challenge.amount),
+            )
+            if release is not None:
+                self._transaction_command_gateway.add(release)
+            self._event_publisher.publish(
+                TRANSITION_EVENTS[transition.action](challenge.id_),
+                aggregate_id=challenge.id_.value,
+            )
+
+        await self._flusher.flush()
+        for challenge in challenges:
+            await self._challenge_update_publisher.publish(challenge)
+        await self._transaction_manager.commit()
+
+        log.info(
+            "Reject pending challenges: done. Streamer ID: %s, rejected: %d.",
+            streamer.id_,
+            len(challenges),
+        )
+        return RejectPendingChallengesResponse(rejected=len(challenges))
@@ -1,7 +1,10 @@
 import logging
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
-from typing import TypedDict
+from types import MappingProxyType
+from typing import Final, TypedDict
 
+from app.application.common.ports.event_publisher import EventPublisher
 from app.application.common.ports.flusher import Flusher
 from app.application.common.ports.streamer_command_gateway import StreamerCommandGateway
 from app.application.common.ports.transaction_command_gateway import TransactionCommandGateway
@@ -9,28 +12,29 @@ from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.challenge_command_gateway import ChallengeCommandGateway
+from app.application.common.ports.challenge_updates import ChallengeUpdatePublisher
 from app.application.common.ports.wallet_command_gateway import WalletCommandGateway
 from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.escrow_release import EscrowReleaseService
 from app.domain.base import DomainError
 from app.domain.challenge.challenge import Challenge
 from app.domain.challenge.exceptions import ChallengeNotFoundByIdError
 from app.domain.challenge.challenge_status import ChallengeStatus
+from app.domain.challenge.events import TRANSITION_EVENTS
 from app.domain.challenge.service import ChallengeService
+from app.domain.challenge.transitions import ACTION_BY_TARGET, ChallengeAction
 from uuid import UUID
 from datetime import datetime, timezone
 
-from app.domain.shared.entities.ledger.account_type import AccountType
-from app.domain.shared.entities.transaction.service import TransactionService
 from app.domain.shared.entities.transaction.transaction import Transaction
-from app.domain.shared.entities.transaction.value_objects import Allocation
-from app.domain.shared.enums import ProductType
 from app.domain.shared.value_objects.id import ProductId
 from app.domain.user.streamer import Streamer
-from app.domain.wallet.service import WalletService
 from app.domain.wallet.wallet import Wallet
 from app.domain.base import DomainError
 log = logging.getLogger(__name__)
 
+type _Handler = Callable[..., Awaitable[Transaction | None]]
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ToggleChallengeStatusRequest:
@@ -47,23 +51,25 @@ class ToggleChallengeStatusInteractor:
         self,
         current_user_service: CurrentUserService,
         challenge_service: ChallengeService,
-        wallet_service: WalletService,
-        transaction_service: TransactionService,
+        escrow_release_service: EscrowReleaseService,
         challenge_command_gateway: ChallengeCommandGateway,
         wallet_command_gateway: WalletCommandGateway,
         streamer_command_gateway: StreamerCommandGateway,
         transaction_command_gateway: TransactionCommandGateway,
+        event_publisher: EventPublisher,
+        challenge_update_publisher: ChallengeUpdatePublisher,
         flusher: Flusher,
         transaction_manager: TransactionManager,
     ):
         self._current_user_service = current_user_service
         self._challenge_service = challenge_service
-        self._wallet_service = wallet_service
-        self._transaction_service = transaction_service
+        self._escrow_release_service = escrow_release_service
         self._challenge_command_gateway = challenge_command_gateway
         self._wallet_command_gateway = wallet_command_gateway
         self._streamer_command_gateway = streamer_command_gateway
         self._transaction_command_gateway = transaction_command_gateway
+        self._event_publisher = event_publisher
+        self._challenge_update_publisher = challenge_update_publisher
         self._flusher = flusher
         self._transaction_manager = transaction_manager
 
@@ -80,29 +86,29 @@ class ToggleChallengeStatusInteractor:
             request_data.challenge_id,
         )
 
-        current_user = await self._current_user_service.get_current_user()
+        current_user = await self._current_user_service.get_current_principal()
         
         challenge_id = ProductId(request_data.challenge_id)
         new_status = request_data.status
         
-        challenge: Challenge | None = await self._challenge_command_gateway.read_by_id(challenge_id)
+        # Locked until commit, so the transition below is checked against
+        # the status no sweeper or bulk rejection can change meanwhile.
+        challenge: Challenge | None = await self._challenge_command_gateway.read_by_id(
+            challenge_id,
+            for_update=True,
+        )
         if challenge is None:
             raise ChallengeNotFoundByIdError()
 
         now = datetime.now(timezone.utc)
 
-        handler_map = {
-            ChallengeStatus.STREAMER_ACCEPTED: self._handle_streamer_accepted,
-            ChallengeStatus.STREAMER_REJECTED: self._handle_streamer_rejected,
-            ChallengeStatus.VIEWER_REJECTED: self._handle_viewer_rejected,
-            ChallengeStatus.STREAMER_COMPLETED: self._handle_streamer_completed,
-            ChallengeStatus.VIEWER_CONFIRMED: self._handle_viewer_confirmed,
-        }
-        handler = handler_map.get(new_status)
-        if handler is None:
+        action = ACTION_BY_TARGET.get(new_status)
+        if action is None or action not in self._handlers:
             raise DomainError(f"Unsupported challenge status: {new_status}")
+        handler = self._handlers[action]
 
         transaction = await handler(
+            self,
             challenge=challenge,
             changed_by=current_user.id_,
             now=now,
@@ -110,7 +116,12 @@ class ToggleChallengeStatusInteractor:
 
         if transaction is not None:
             self._transaction_command_gateway.add(transaction)
+        self._event_publisher.publish(
+            TRANSITION_EVENTS[action](challenge.id_),
+            aggregate_id=challenge.id_.value,
+        )
         await self._flusher.flush()
+        await self._challenge_update_publisher.publish(challenge)
         await self._transaction_manager.commit()
 
         log.info(
@@ -143,7 +154,6 @@ class ToggleChallengeStatusInteractor:
             challenge=challenge,
             streamer_id=streamer.id_,
         )
-        # TODO: Add notification to viewer
         return None
 
     async def _handle_streamer_rejected(
@@ -152,7 +162,7 @@ class ToggleChallengeStatusInteractor:
         challenge: Challenge,
         changed_by,
         now: datetime,
-    ) -> Transaction:
+    ) -> Transaction | None:
         streamer: Streamer|None = await self._streamer_command_gateway.read_by_user_id(changed_by)
         if streamer is None:
             raise DomainError(f"Streamer not found")
@@ -165,22 +175,9 @@ class ToggleChallengeStatusInteractor:
             challenge.created_by,
             label="Viewer",
         )
-        self._wallet_service.credit(
-            wallet=viewer_wallet,
-            amount=challenge.amount,
-        )
-        allocations = (
-            Allocation(
-                payee_type=AccountType.USER_WALLET,
-                payee_id=viewer_wallet.id_,
-                amount=challenge.amount,
-            ),
-        )
-        return self._transaction_service.create_escrow_release_transaction(
-            allocations=allocations,
-            amount=challenge.amount,
-            reference_id=challenge.id_,
-            reference_type=ProductType.CHALLENGE,
+        return self._escrow_release_service.release(
+            challenge,
+            (viewer_wallet, challenge.amount),
         )
 
     async def _handle_viewer_rejected(
@@ -189,110 +186,54 @@ class ToggleChallengeStatusInteractor:
         challenge: Challenge,
         changed_by,
         now: datetime,
-    ) -> Transaction:
+    ) -> Transaction | None:
         self._challenge_service.viewer_reject_challenge(
             challenge=challenge,
-            changed_by=changed_by,
+            user_id=changed_by,
         )
-        # TODO: Add notification to streamer
         current_duration = now - challenge.created_at.value
         if current_duration <= challenge.duration * 0.3:
             viewer_wallet = await self._get_wallet_or_error(
                 challenge.created_by,
                 label="Viewer",
             )
-            self._wallet_service.credit(
-                wallet=viewer_wallet,
-                amount=challenge.amount,
-            )
-            allocations = (
-                Allocation(
-                    payee_type=AccountType.USER_WALLET,
-                    payee_id=viewer_wallet.id_,
-                    amount=challenge.amount,
-                ),
-            )
-            return self._transaction_service.create_escrow_release_transaction(
-                allocations=allocations,
-                amount=challenge.amount,
-                reference_id=challenge.id_,
-                reference_type=ProductType.CHALLENGE,
+            return self._escrow_release_service.release(
+                challenge,
+                (viewer_wallet, challenge.amount),
             )
 
         if current_duration >= challenge.duration:
-            dareus_earn = challenge.amount * 0.1
-            viewer_get_back = challenge.amount - dareus_earn
+            dareus_earn, viewer_get_back = challenge.amount.allocate(10, 90)
 
             viewer_wallet = await self._get_wallet_or_error(
                 challenge.created_by,
                 label="Viewer",
             )
-            self._wallet_service.credit(
-                wallet=viewer_wallet,
-                amount=viewer_get_back,
-            )
-            allocations = (
-                Allocation(
-                    payee_type=AccountType.REVENUE,
-                    payee_id=None,
-                    amount=dareus_earn,
-                ),
-                Allocation(
-                    payee_type=AccountType.USER_WALLET,
-                    payee_id=viewer_wallet.id_,
-                    amount=viewer_get_back,
-                ),
-            )
-            return self._transaction_service.create_escrow_release_transaction(
-                allocations=allocations,
-                amount=challenge.amount,
-                reference_id=challenge.id_,
-                reference_type=ProductType.CHALLENGE,
+            return self._escrow_release_service.release(
+                challenge,
+                (None, dareus_earn),
+                (viewer_wallet, viewer_get_back),
             )
 
-        dareus_earn = challenge.amount * 0.1
-        streamer_earn = challenge.amount * 0.2
-        viewer_get_back = challenge.amount - dareus_earn - streamer_earn
+        dareus_earn, streamer_earn, viewer_get_back = challenge.amount.allocate(
+            10,
+            20,
+            70,
+        )
 
         viewer_wallet = await self._get_wallet_or_error(
             challenge.created_by,
             label="Viewer",
         )
-        self._wallet_service.credit(
-            wallet=viewer_wallet,
-            amount=viewer_get_back,
-        )
-
         streamer_wallet = await self._get_wallet_or_error(
             challenge.assigned_to,
             label="Streamer",
         )
-        self._wallet_service.credit(
-            wallet=streamer_wallet,
-            amount=streamer_earn,
-        )
-        allocations = (
-            Allocation(
-                payee_type=AccountType.REVENUE,
-                payee_id=None,
-                amount=dareus_earn,
-            ),
-            Allocation(
-                payee_type=AccountType.USER_WALLET,
-                payee_id=streamer_wallet.id_,
-                amount=streamer_earn,
-            ),
-            Allocation(
-                payee_type=AccountType.USER_WALLET,
-                payee_id=viewer_wallet.id_,
-                amount=viewer_get_back,
-            ),
-        )
-        return self._transaction_service.create_escrow_release_transaction(
-            allocations=allocations,
-            amount=challenge.amount,
-            reference_id=challenge.id_,
-            reference_type=ProductType.CHALLENGE,
+        return self._escrow_release_service.release(
+            challenge,
+            (None, dareus_earn),
+            (streamer_wallet, streamer_earn),
+            (viewer_wallet, viewer_get_back),
         )
 
     async def _handle_streamer_completed(
@@ -310,7 +251,6 @@ class ToggleChallengeStatusInteractor:
             challenge=challenge,
             streamer_id=streamer.id_,
         )
-        # TODO: Add notification to viewer to confirm challenge
         return None
 
     async def _handle_viewer_confirmed(
@@ -319,37 +259,29 @@ class ToggleChallengeStatusInteractor:
         challenge: Challenge,
         changed_by,
         now: datetime,
-    ) -> Transaction:
+    ) -> Transaction | None:
         self._challenge_service.viewer_confirm_challenge(
             challenge=challenge,
             user_id=changed_by,
         )
-        dareus_earn = challenge.amount * 0.1
-        streamer_earn = challenge.amount - dareus_earn
+        dareus_earn, streamer_earn = challenge.amount.allocate(10, 90)
 
         streamer_wallet = await self._get_wallet_or_error(
             challenge.assigned_to,
             label="Streamer",
         )
-        self._wallet_service.credit(
-            wallet=streamer_wallet,
-            amount=streamer_earn,
-        )
-        allocations = (
-            Allocation(
-                payee_type=AccountType.REVENUE,
-                payee_id=None,
-                amount=dareus_earn,
-            ),
-            Allocation(
-                payee_type=AccountType.USER_WALLET,
-                payee_id=streamer_wallet.id_,
-                amount=streamer_earn,
-            ),
-        )
-        return self._transaction_service.create_escrow_release_transaction(
-            allocations=allocations,
-            amount=challenge.amount,
-            reference_id=challenge.id_,
-            reference_type=ProductType.CHALLENGE,
+        return self._escrow_release_service.release(
+            challenge,
+            (None, dareus_earn),
+            (streamer_wallet, streamer_earn),
         )
+
+    # Built once with the class; each handler applies one action
+    # and returns the escrow release it settles, if any.
+    _handlers: Final[Mapping[ChallengeAction, _Handler]] = MappingProxyType({
+        ChallengeAction.STREAMER_ACCEPT: _handle_streamer_accepted,
+        ChallengeAction.STREAMER_REJECT: _handle_streamer_rejected,
+        ChallengeAction.VIEWER_REJECT: _handle_viewer_rejected,
+        ChallengeAction.STREAMER_COMPLETE: _handle_streamer_completed,
+        ChallengeAction.VIEWER_CONFIRM: _handle_viewer_confirmed,
+    })
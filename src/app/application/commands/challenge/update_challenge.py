@@ -71,7 +71,7 @@ class UpdateChallengeInteractor:
             "Update challenge: started. Challenge ID: %s",
             request_data.challenge_id,
         )
-        current_user = await self._current_user_service.get_current_user()
+        current_user = await self._current_user_service.get_current_principal()
 
         challenge_id = ProductId(request_data.challenge_id)
         challenge: Challenge | None = await self._challenge_command_gateway.read_by_id(challenge_id)
@@ -103,7 +103,7 @@ class UpdateChallengeInteractor:
             )
             self._challenge_service.update_challenge_amount(
                 challenge=challenge,
-                amount=ChallengeAmount(request_data.amount),
+                amount=ChallengeAmount.from_decimal(request_data.amount),
                 changed_by=current_user.id_,
             )
         if request_data.expires_at is not None:
@@ -0,0 +1,50 @@
+import logging
+from typing import TypedDict
+
+from app.application.common.ports.notification_command_gateway import (
+    NotificationCommandGateway,
+)
+from app.application.common.ports.transaction_manager import (
+    TransactionManager,
+)
+from app.application.common.services.current_user import CurrentUserService
+
+log = logging.getLogger(__name__)
+
+
+class MarkAllNotificationsReadResponse(TypedDict):
+    marked: int
+
+
+class MarkAllNotificationsReadInteractor:
+    """
+    - Open to authenticated users.
+    - Marks all of the current user's notifications read
+      and resets their unread count.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        notification_command_gateway: NotificationCommandGateway,
+        transaction_manager: TransactionManager,
+    ):
+        self._current_user_service = current_user_service
+        self._notification_command_gateway = notification_command_gateway
+        self._transaction_manager = transaction_manager
+
+    async def execute(self) -> MarkAllNotificationsReadResponse:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        """
+        log.info("Mark all notifications read: started.")
+
+        current_user = await self._current_user_service.get_current_principal()
+        marked = await self._notification_command_gateway.mark_all_read(
+            current_user.id_,
+        )
+        await self._transaction_manager.commit()
+
+        log.info("Mark all notifications read: done. Marked: %d.", marked)
+        return MarkAllNotificationsReadResponse(marked=marked)
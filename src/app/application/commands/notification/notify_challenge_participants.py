@@ -0,0 +1,149 @@
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Final
+
+from app.application.common.ports.challenge_command_gateway import (
+    ChallengeCommandGateway,
+)
+from app.application.common.ports.notification_command_gateway import (
+    NotificationCommandGateway,
+)
+from app.application.common.ports.streamer_command_gateway import StreamerCommandGateway
+from app.application.common.ports.transaction_manager import (
+    TransactionManager,
+)
+from app.domain.base import Event
+from app.domain.challenge.events import (
+    ChallengeAcceptedByStreamer,
+    ChallengeCompletedByStreamer,
+    ChallengeConfirmedByViewer,
+    ChallengeCreated,
+    ChallengeExpired,
+    ChallengeRejectedByStreamer,
+    ChallengeRejectedByViewer,
+)
+from app.domain.shared.entities.notification.service import NotificationService
+from app.domain.shared.value_objects.id import UserId
+
+log = logging.getLogger(__name__)
+
+type ChallengeEvent = (
+    ChallengeCreated
+    | ChallengeAcceptedByStreamer
+    | ChallengeRejectedByStreamer
+    | ChallengeCompletedByStreamer
+    | ChallengeConfirmedByViewer
+    | ChallengeRejectedByViewer
+    | ChallengeExpired
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _Notice:
+    to_viewer: bool
+    to_streamer: bool
+    title: str
+    message: str
+
+
+_NOTICES: Final[Mapping[type[Event], _Notice]] = MappingProxyType({
+    ChallengeCreated: _Notice(
+        to_viewer=False,
+        to_streamer=True,
+        title="New challenge",
+        message="You have a new challenge: {title}.",
+    ),
+    ChallengeAcceptedByStreamer: _Notice(
+        to_viewer=True,
+        to_streamer=False,
+        title="Challenge accepted",
+        message="The streamer accepted your challenge: {title}.",
+    ),
+    ChallengeRejectedByStreamer: _Notice(
+        to_viewer=True,
+        to_streamer=False,
+        title="Challenge rejected",
+        message="The streamer rejected your challenge: {title}. It was refunded.",
+    ),
+    ChallengeCompletedByStreamer: _Notice(
+        to_viewer=True,
+        to_streamer=False,
+        title="Challenge completed",
+        message="The streamer completed your challenge: {title}. Please confirm it.",
+    ),
+    ChallengeConfirmedByViewer: _Notice(
+        to_viewer=False,
+        to_streamer=True,
+        title="Challenge confirmed",
+        message="The viewer confirmed your challenge: {title}.",
+    ),
+    ChallengeRejectedByViewer: _Notice(
+        to_viewer=False,
+        to_streamer=True,
+        title="Challenge rejected",
+        message="The viewer rejected your challenge: {title}.",
+    ),
+    ChallengeExpired: _Notice(
+        to_viewer=True,
+        to_streamer=True,
+        title="Challenge expired",
+        message="The challenge expired: {title}.",
+    ),
+})
+
+
+class NotifyChallengeParticipantsInteractor:
+    """
+    Handles committed challenge events: notifies the viewer
+    and/or the streamer of the challenge, written in one batch.
+    Idempotent, as the outbox delivers events at least once.
+    """
+
+    def __init__(
+        self,
+        notification_service: NotificationService,
+        challenge_command_gateway: ChallengeCommandGateway,
+        streamer_command_gateway: StreamerCommandGateway,
+        notification_command_gateway: NotificationCommandGateway,
+        transaction_manager: TransactionManager,
+    ):
+        self._notification_service = notification_service
+        self._challenge_command_gateway = challenge_command_gateway
+        self._streamer_command_gateway = streamer_command_gateway
+        self._notification_command_gateway = notification_command_gateway
+        self._transaction_manager = transaction_manager
+
+    async def execute(self, event: ChallengeEvent) -> None:
+        """:raises DataMapperError:"""
+        notice = _NOTICES[type(event)]
+        challenge = await self._challenge_command_gateway.read_by_id(event.id_)
+        if challenge is None:
+            log.warning(
+                "Notify challenge participants: challenge not found. ID: %s",
+                event.id_,
+            )
+            return
+
+        recipients: list[UserId] = []
+        if notice.to_viewer:
+            recipients.append(challenge.created_by)
+        if notice.to_streamer:
+            streamer = await self._streamer_command_gateway.read_by_id(
+                challenge.assigned_to,
+            )
+            if streamer is not None:
+                recipients.append(streamer.user_id)
+
+        notifications = self._notification_service.create_notifications(
+            product_id=challenge.id_,
+            user_ids=recipients,
+            title=notice.title,
+            message=notice.message.format(title=challenge.title.value),
+            # Challenge statuses only move forward, so each event type
+            # happens at most once per challenge and identifies the event.
+            event_type=type(event).__name__,
+        )
+        await self._notification_command_gateway.add_many(notifications)
+        await self._transaction_manager.commit()
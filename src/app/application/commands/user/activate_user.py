@@ -2,6 +2,7 @@ import logging
 from dataclasses import dataclass
 from uuid import UUID
 
+from app.application.common.ports.principal_cache import PrincipalCache
 from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
@@ -43,11 +44,13 @@ class ActivateUserInteractor:
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         transaction_manager: TransactionManager,
+        principal_cache: PrincipalCache,
     ):
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
+        self._principal_cache = principal_cache
 
     async def execute(self, request_data: ActivateUserRequest) -> None:
         """
@@ -63,7 +66,7 @@ class ActivateUserInteractor:
             request_data.user_id,
         )
 
-        current_user = await self._current_user_service.get_current_user()
+        current_user = await self._current_user_service.get_current_principal()
 
         authorize(
             CanManageRole(),
@@ -91,6 +94,7 @@ class ActivateUserInteractor:
 
         self._user_service.toggle_user_activation(user, is_active=True)
         await self._transaction_manager.commit()
+        self._principal_cache.invalidate(user.id_)
 
         log.info(
             "Activate user: done. UserId: '%s', Username: '%s'.",
@@ -5,6 +5,7 @@ from typing import TypedDict
 from uuid import UUID
 
 from app.application.common.ports.streamer_command_gateway import StreamerCommandGateway
+from app.application.common.ports.principal_cache import PrincipalCache
 from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
@@ -53,12 +54,14 @@ class ApplyAsStreamerInteractor:
         streamer_command_gateway: StreamerCommandGateway,
         user_service: UserService,
         transaction_manager: TransactionManager,
+        principal_cache: PrincipalCache,
     ):
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._streamer_command_gateway = streamer_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
+        self._principal_cache = principal_cache
 
     async def execute(
         self,
@@ -77,7 +80,7 @@ class ApplyAsStreamerInteractor:
             request_data.user_id,
         )
 
-        current_user = await self._current_user_service.get_current_user()
+        current_user = await self._current_user_service.get_current_principal()
 
         user_id = UserId(request_data.user_id)
         user = await self._user_command_gateway.read_by_id(
@@ -100,7 +103,7 @@ class ApplyAsStreamerInteractor:
 
         streamer: Streamer = self._user_service.apply_as_streamer(
             user,
-            min_amount_challenge=StreamerChallengeFixedAmount(
+            min_amount_challenge=StreamerChallengeFixedAmount.from_decimal(
                 request_data.min_amount_challenge,
             ),
             disable_challenges=request_data.disable_challenges,
@@ -110,6 +113,7 @@ class ApplyAsStreamerInteractor:
         self._streamer_command_gateway.add(streamer)
         
         await self._transaction_manager.commit()
+        self._principal_cache.invalidate(user.id_)
 
         log.info(
             "Apply as streamer: done. UserId: '%s', UserId: '%s'.",
@@ -2,6 +2,7 @@ import logging
 from dataclasses import dataclass
 from uuid import UUID
 
+from app.application.common.ports.principal_cache import PrincipalCache
 from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
@@ -45,11 +46,13 @@ class ChangePasswordInteractor:
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         transaction_manager: TransactionManager,
+        principal_cache: PrincipalCache,
     ):
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
+        self._principal_cache = principal_cache
 
     async def execute(self, request_data: ChangePasswordRequest) -> None:
         """
@@ -58,10 +61,11 @@ class ChangePasswordInteractor:
         :raises AuthorizationError:
         :raises DomainFieldError:
         :raises UserNotFoundByUsernameError:
+        :raises PasswordHasherBusyError:
         """
         log.info("Change password: started.")
 
-        current_user = await self._current_user_service.get_current_user()
+        current_user = await self._current_user_service.get_current_principal()
 
         user_id = UserId(request_data.user_id)
         password = RawPassword(request_data.password)
@@ -83,7 +87,8 @@ class ChangePasswordInteractor:
             ),
         )
 
-        self._user_service.change_password(user, password)
+        await self._user_service.change_password(user, password)
         await self._transaction_manager.commit()
+        self._principal_cache.invalidate(user.id_)
 
         log.info("Change password: done.")
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.principal_cache import PrincipalCache
 from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
@@ -46,12 +47,14 @@ class DeactivateUserInteractor:
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         transaction_manager: TransactionManager,
+        principal_cache: PrincipalCache,
         access_revoker: AccessRevoker,
     ):
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
+        self._principal_cache = principal_cache
         self._access_revoker = access_revoker
 
     async def execute(self, request_data: DeactivateUserRequest) -> None:
@@ -68,7 +71,7 @@ class DeactivateUserInteractor:
             request_data.user_id,
         )
 
-        current_user = await self._current_user_service.get_current_user()
+        current_user = await self._current_user_service.get_current_principal()
 
         authorize(
             CanManageRole(),
@@ -96,6 +99,7 @@ class DeactivateUserInteractor:
 
         self._user_service.toggle_user_activation(user, is_active=False)
         await self._transaction_manager.commit()
+        self._principal_cache.invalidate(user.id_)
         await self._access_revoker.remove_all_user_access(user.id_)
 
         log.info(
@@ -1,8 +1,11 @@
 from abc import abstractmethod
+from collections.abc import Collection
+from datetime import datetime
 from typing import Protocol
 
 from app.domain.challenge.challenge import Challenge
-from app.domain.shared.value_objects.id import ProductId
+from app.domain.challenge.transitions import ChallengeTransition
+from app.domain.shared.value_objects.id import ProductId, StreamerId, UserId
 
 
 class ChallengeCommandGateway(Protocol):
@@ -11,6 +14,55 @@ class ChallengeCommandGateway(Protocol):
         """:raises DataMapperError:"""
 
     @abstractmethod
-    async def read_by_id(self, challenge_id: ProductId) -> Challenge | None:
+    async def read_by_id(
+        self,
+        challenge_id: ProductId,
+        for_update: bool = False,
+    ) -> Challenge | None:
         """:raises DataMapperError:"""
-    
\ No newline at end of file
+
+    @abstractmethod
+    async def read_expired_for_update(
+        self,
+        *,
+        now: datetime,
+        limit: int,
+        exclude_ids: Collection[ProductId] = (),
+    ) -> list[Challenge]:
+        """
+        :raises DataMapperError:
+
+        Locks up to `limit` challenges still holding escrow past `expires_at`,
+        skipping the ones already locked by another transaction
+        and the ones in `exclude_ids`.
+        """
+
+    @abstractmethod
+    async def read_transitionable_for_update(
+        self,
+        transition: ChallengeTransition,
+        *,
+        actor_id: UserId | StreamerId | None,
+    ) -> list[Challenge]:
+        """
+        :raises DataMapperError:
+
+        Locks every challenge `actor_id` may move by `transition`,
+        so that the ones then passed to `transition_all` are still movable.
+        """
+
+    @abstractmethod
+    async def transition_all(
+        self,
+        transition: ChallengeTransition,
+        *,
+        actor_id: UserId | StreamerId | None,
+        challenge_ids: Collection[ProductId] | None = None,
+    ) -> list[Challenge]:
+        """
+        :raises DataMapperError:
+
+        Moves every challenge `actor_id` may move by `transition`,
+        or only those of `challenge_ids`, in one statement,
+        and returns the challenges moved.
+        """
@@ -0,0 +1,29 @@
+from abc import abstractmethod
+from collections.abc import AsyncIterator, Collection
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.challenge.challenge import Challenge
+
+
+class ChallengeUpdatePublisher(Protocol):
+    @abstractmethod
+    async def publish(self, challenge: Challenge) -> None:
+        """
+        :raises DataMapperError:
+
+        Sends the current state of `challenge` to its live subscribers
+        once the current transaction commits, and never if it rolls back.
+        """
+
+
+class ChallengeUpdateStream(Protocol):
+    @abstractmethod
+    def subscribe(self, audience: Collection[UUID]) -> AsyncIterator[bytes]:
+        """
+        Yields, as ready-to-send Server-Sent Events frames, the updates
+        of the challenges created by or assigned to any id in `audience`.
+        The subscription starts when the iterator is first advanced,
+        which yields a frame as soon as it is registered, and ends
+        when the iterator is closed, or when its consumer falls behind.
+        """
@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.base import Event
+
+
+class EventPublisher(Protocol):
+    @abstractmethod
+    def publish(self, event: Event, *, aggregate_id: UUID) -> None:
+        """
+        :raises DataMapperError:
+
+        Stages `event` in the current transaction: it is delivered
+        once the transaction commits, and never if it rolls back.
+        Events of one aggregate are delivered in publication order,
+        provided the transaction holds a lock on the aggregate
+        (its row read `FOR UPDATE`, updated, or inserted) until it commits:
+        concurrent transactions then publish its events one after another.
+        """
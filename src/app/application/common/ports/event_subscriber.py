@@ -0,0 +1,23 @@
+from abc import abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import Protocol
+
+from app.domain.base import Event
+
+
+class EventSubscriber(Protocol):
+    @abstractmethod
+    def subscribe[E: Event](
+        self,
+        event_type: type[E],
+        handler: Callable[[E], Awaitable[None]],
+        *,
+        max_queue_size: int = 100,
+        concurrency: int = 1,
+    ) -> None:
+        """
+        Calls `handler` with every committed event of exactly `event_type`,
+        from up to `concurrency` events at a time.
+        At most `max_queue_size` events wait for the handler;
+        beyond that, delivery waits for room in its queue.
+        """
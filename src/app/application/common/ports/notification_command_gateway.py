@@ -0,0 +1,26 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
+
+from app.domain.shared.entities.notification.notification import Notification
+from app.domain.shared.value_objects.id import UserId
+
+
+class NotificationCommandGateway(Protocol):
+    @abstractmethod
+    async def add_many(self, notifications: Sequence[Notification]) -> None:
+        """
+        :raises DataMapperError:
+
+        Also adds the new notifications to their recipients' unread counts.
+        A notification of an event its recipient was already notified of
+        for the same product is skipped, and not counted.
+        """
+
+    @abstractmethod
+    async def mark_all_read(self, user_id: UserId) -> int:
+        """
+        :raises DataMapperError:
+
+        Returns the number of notifications marked read.
+        """
@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from app.application.common.query_models.notification import NotificationQueryModel
+from app.application.common.query_params.notification import NotificationPageParams
+from app.domain.shared.value_objects.id import UserId
+
+
+class NotificationQueryGateway(Protocol):
+    @abstractmethod
+    async def read_page(
+        self,
+        user_id: UserId,
+        params: NotificationPageParams,
+    ) -> list[NotificationQueryModel]:
+        """:raises ReaderError:"""
+
+    @abstractmethod
+    async def read_unread_count(self, user_id: UserId) -> int:
+        """:raises ReaderError:"""
@@ -0,0 +1,16 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from app.application.common.query_models.principal import Principal
+from app.domain.shared.value_objects.id import UserId
+
+
+class PrincipalCache(Protocol):
+    @abstractmethod
+    def get(self, user_id: UserId) -> Principal | None: ...
+
+    @abstractmethod
+    def put(self, principal: Principal) -> None: ...
+
+    @abstractmethod
+    def invalidate(self, user_id: UserId) -> None: ...
@@ -1,6 +1,7 @@
 from abc import abstractmethod
 from typing import Protocol
 
+from app.application.common.query_models.principal import Principal
 from app.domain.user.user import User
 from app.domain.shared.value_objects.id import UserId
 from app.domain.user.value_objects import Username
@@ -18,6 +19,10 @@ class UserCommandGateway(Protocol):
         ) -> User | None:
         """:raises DataMapperError:"""
 
+    @abstractmethod
+    async def read_principal_by_id(self, user_id: UserId) -> Principal | None:
+        """:raises DataMapperError:"""
+
     @abstractmethod
     async def read_by_username(
         self,
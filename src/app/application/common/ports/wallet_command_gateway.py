@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Collection
 from typing import Protocol
 
 from app.domain.shared.value_objects.id import UserId, WalletId
@@ -21,3 +22,11 @@ class WalletCommandGateway(Protocol):
         for_update: bool = False,
     ) -> Wallet | None:
         """:raises DataMapperError:"""
+
+    @abstractmethod
+    async def read_by_user_ids(
+        self,
+        user_ids: Collection[UserId],
+        for_update: bool = False,
+    ) -> list[Wallet]:
+        """:raises DataMapperError:"""
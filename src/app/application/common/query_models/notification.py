@@ -0,0 +1,12 @@
+from datetime import datetime
+from typing import TypedDict
+from uuid import UUID
+
+
+class NotificationQueryModel(TypedDict):
+    id_: UUID
+    product_id: UUID
+    title: str
+    message: str
+    created_at: datetime
+    is_read: bool
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from app.domain.shared.value_objects.id import UserId
+from app.domain.user.user_role import UserRole
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Principal:
+    """
+    The current user as most use cases need it: who and in what role.
+    Read without the password hash and the other fields of `User`.
+    """
+
+    id_: UserId
+    role: UserRole
+    is_active: bool
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.application.common.exceptions.query import PaginationError
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NotificationPageParams:
+    """
+    raises PaginationError
+
+    Newest first. `before` is the id of the last notification
+    of the previous page; pages are found by key rather than offset,
+    so reading deep pages costs the same as the first.
+    """
+
+    limit: int
+    before: UUID | None = None
+
+    def __post_init__(self):
+        """:raises PaginationError:"""
+        if self.limit <= 0:
+            raise PaginationError(f"Limit must be greater than 0, got {self.limit}")
@@ -8,6 +8,7 @@ from app.application.common.services.authorization.base import (
 from app.application.common.services.authorization.role_hierarchy import (
     SUBORDINATE_ROLES,
 )
+from app.application.common.query_models.principal import Principal
 from app.domain.user.streamer import Streamer
 from app.domain.user.user import User
 from app.domain.challenge.challenge import Challenge
@@ -17,13 +18,13 @@ from app.domain.challenge.challenge_status import ChallengeStatus
 
 @dataclass(frozen=True, kw_only=True)
 class UserManagementContext(PermissionContext):
-    subject: User
+    subject: User | Principal
     target: User
 
 
 class CanManageSelf(Permission[UserManagementContext]):
     def is_satisfied_by(self, context: UserManagementContext) -> bool:
-        return context.subject == context.target
+        return context.subject.id_ == context.target.id_
 
 
 class CanManageSubordinate(Permission[UserManagementContext]):
@@ -40,7 +41,7 @@ class CanManageSubordinate(Permission[UserManagementContext]):
 
 @dataclass(frozen=True, kw_only=True)
 class RoleManagementContext(PermissionContext):
-    subject: User
+    subject: User | Principal
     target_role: UserRole
 
 
@@ -57,7 +58,7 @@ class CanManageRole(Permission[RoleManagementContext]):
 
 @dataclass(frozen=True, kw_only=True)
 class ChallengeCreationContext(PermissionContext):
-    subject: User
+    subject: User | Principal
 
 class CanCreateChallenge(Permission[ChallengeCreationContext]):
     """Permission to create challenge.
@@ -68,7 +69,7 @@ class CanCreateChallenge(Permission[ChallengeCreationContext]):
 
 @dataclass(frozen=True, kw_only=True)
 class ChallengeManagementContext(PermissionContext):
-    subject: User | Streamer
+    subject: User | Streamer | Principal
     challenge: Challenge
 
 
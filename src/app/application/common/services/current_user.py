@@ -3,11 +3,13 @@ import logging
 from app.application.common.exceptions.authorization import AuthorizationError
 from app.application.common.ports.access_revoker import AccessRevoker
 from app.application.common.ports.identity_provider import IdentityProvider
+from app.application.common.ports.principal_cache import PrincipalCache
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.application.common.services.constants import (
     AUTHZ_NO_CURRENT_USER,
     AUTHZ_NOT_AUTHORIZED,
 )
+from app.application.common.query_models.principal import Principal
 from app.domain.user.user import User
 
 log = logging.getLogger(__name__)
@@ -19,10 +21,39 @@ class CurrentUserService:
         identity_provider: IdentityProvider,
         user_command_gateway: UserCommandGateway,
         access_revoker: AccessRevoker,
+        principal_cache: PrincipalCache,
     ):
         self._identity_provider = identity_provider
         self._user_command_gateway = user_command_gateway
         self._access_revoker = access_revoker
+        self._principal_cache = principal_cache
+
+    async def get_current_principal(self) -> Principal:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+
+        Enough for authorization and for acting on behalf of the user.
+        Served from the principal cache; use `get_current_user`
+        when the use case needs the `User` aggregate itself.
+        """
+        current_user_id = await self._identity_provider.get_current_user_id()
+        log.info("Current user ID: %s.", current_user_id)
+        principal = self._principal_cache.get(current_user_id)
+        if principal is None:
+            principal = await self._user_command_gateway.read_principal_by_id(
+                current_user_id,
+            )
+            if principal is not None and principal.is_active:
+                self._principal_cache.put(principal)
+
+        if principal is None or principal.is_active is False:
+            log.warning("%s ID: %s.", AUTHZ_NO_CURRENT_USER, current_user_id)
+            await self._access_revoker.remove_all_user_access(current_user_id)
+            raise AuthorizationError(AUTHZ_NOT_AUTHORIZED)
+
+        return principal
 
     async def get_current_user(self) -> User:
         """
@@ -0,0 +1,69 @@
+from app.domain.challenge.challenge import Challenge
+from app.domain.shared.entities.ledger.account_type import AccountType
+from app.domain.shared.entities.transaction.service import TransactionService
+from app.domain.shared.entities.transaction.transaction import Transaction
+from app.domain.shared.entities.transaction.value_objects import Allocation
+from app.domain.shared.enums import ProductType
+from app.domain.shared.value_objects.token import Token
+from app.domain.wallet.service import WalletService
+from app.domain.wallet.wallet import Wallet
+
+
+class EscrowReleaseService:
+    """
+    Settles the escrow of a challenge on every path that releases it:
+    credits each payee wallet its share and builds the release transaction.
+    Shares of zero, left when an amount is too small to split,
+    are neither credited nor allocated.
+    """
+
+    def __init__(
+        self,
+        wallet_service: WalletService,
+        transaction_service: TransactionService,
+    ):
+        self._wallet_service = wallet_service
+        self._transaction_service = transaction_service
+
+    def release(
+        self,
+        challenge: Challenge,
+        *shares: tuple[Wallet | None, Token],
+    ) -> Transaction | None:
+        """
+        :raises DomainError:
+
+        A share without a wallet goes to the platform revenue account.
+        Returns `None` when no share is left, as for a challenge
+        of zero amount, which has no escrow to release.
+        """
+        allocations: list[Allocation] = []
+        for wallet, amount in shares:
+            if amount.minor_units <= Token.ZERO:
+                continue
+            if wallet is None:
+                allocations.append(
+                    Allocation(
+                        payee_type=AccountType.REVENUE,
+                        payee_id=None,
+                        amount=amount,
+                    ),
+                )
+                continue
+            self._wallet_service.credit(wallet=wallet, amount=amount)
+            allocations.append(
+                Allocation(
+                    payee_type=AccountType.USER_WALLET,
+                    payee_id=wallet.id_,
+                    amount=amount,
+                ),
+            )
+
+        if not allocations:
+            return None
+        return self._transaction_service.create_escrow_release_transaction(
+            allocations=tuple(allocations),
+            amount=challenge.amount,
+            reference_id=challenge.id_,
+            reference_type=ProductType.CHALLENGE,
+        )
@@ -0,0 +1,40 @@
+import logging
+from typing import TypedDict
+
+from app.application.common.ports.notification_query_gateway import (
+    NotificationQueryGateway,
+)
+from app.application.common.services.current_user import CurrentUserService
+
+log = logging.getLogger(__name__)
+
+
+class GetUnreadNotificationCountResponse(TypedDict):
+    unread: int
+
+
+class GetUnreadNotificationCountQueryService:
+    """
+    - Open to authenticated users.
+    - Returns how many of the current user's notifications are unread.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        notification_query_gateway: NotificationQueryGateway,
+    ):
+        self._current_user_service = current_user_service
+        self._notification_query_gateway = notification_query_gateway
+
+    async def execute(self) -> GetUnreadNotificationCountResponse:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises ReaderError:
+        """
+        current_user = await self._current_user_service.get_current_principal()
+        unread = await self._notification_query_gateway.read_unread_count(
+            current_user.id_,
+        )
+        return GetUnreadNotificationCountResponse(unread=unread)
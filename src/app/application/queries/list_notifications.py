@@ -0,0 +1,72 @@
+import logging
+from dataclasses import dataclass
+from typing import TypedDict
+from uuid import UUID
+
+from app.application.common.ports.notification_query_gateway import (
+    NotificationQueryGateway,
+)
+from app.application.common.query_models.notification import NotificationQueryModel
+from app.application.common.query_params.notification import NotificationPageParams
+from app.application.common.services.current_user import CurrentUserService
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ListNotificationsRequest:
+    limit: int
+    before: UUID | None
+
+
+class ListNotificationsResponse(TypedDict):
+    notifications: list[NotificationQueryModel]
+    # Pass as `before` to read the next page; `None` on the last page.
+    next_before: UUID | None
+
+
+class ListNotificationsQueryService:
+    """
+    - Open to authenticated users.
+    - Returns the current user's notifications, newest first,
+      one page at a time.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        notification_query_gateway: NotificationQueryGateway,
+    ):
+        self._current_user_service = current_user_service
+        self._notification_query_gateway = notification_query_gateway
+
+    async def execute(
+        self,
+        request_data: ListNotificationsRequest,
+    ) -> ListNotificationsResponse:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises ReaderError:
+        :raises PaginationError:
+        """
+        log.info("List notifications: started.")
+
+        current_user = await self._current_user_service.get_current_principal()
+        params = NotificationPageParams(
+            limit=request_data.limit,
+            before=request_data.before,
+        )
+        notifications = await self._notification_query_gateway.read_page(
+            current_user.id_,
+            params,
+        )
+        next_before = (
+            notifications[-1]["id_"] if len(notifications) == params.limit else None
+        )
+
+        log.info("List notifications: done.")
+        return ListNotificationsResponse(
+            notifications=notifications,
+            next_before=next_before,
+        )
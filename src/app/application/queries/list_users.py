@@ -61,7 +61,7 @@ class ListUsersQueryService:
         """
         log.info("List users: started.")
 
-        current_user = await self._current_user_service.get_current_user()
+        current_user = await self._current_user_service.get_current_principal()
 
         authorize(
             CanManageRole(),
@@ -0,0 +1,49 @@
+import logging
+from collections.abc import AsyncIterator
+
+from app.application.common.ports.challenge_updates import ChallengeUpdateStream
+from app.application.common.ports.streamer_command_gateway import StreamerCommandGateway
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.services.current_user import CurrentUserService
+
+log = logging.getLogger(__name__)
+
+
+class StreamChallengeUpdatesQueryService:
+    """
+    - Open to authenticated users.
+    - Streams, as Server-Sent Events, the new challenges and status changes
+      of the challenges the current user created or, as a streamer,
+      was assigned.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        streamer_command_gateway: StreamerCommandGateway,
+        challenge_update_stream: ChallengeUpdateStream,
+        transaction_manager: TransactionManager,
+    ):
+        self._current_user_service = current_user_service
+        self._streamer_command_gateway = streamer_command_gateway
+        self._challenge_update_stream = challenge_update_stream
+        self._transaction_manager = transaction_manager
+
+    async def execute(self) -> AsyncIterator[bytes]:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        """
+        current_user = await self._current_user_service.get_current_principal()
+        audience = {current_user.id_.value}
+        streamer = await self._streamer_command_gateway.read_by_user_id(
+            current_user.id_,
+        )
+        if streamer is not None:
+            audience.add(streamer.id_.value)
+        # Ends the read-only transaction, so that its pooled connection
+        # is returned instead of idling for as long as the stream is open.
+        await self._transaction_manager.commit()
+
+        log.debug("Stream challenge updates: started. User ID: %s", current_user.id_)
+        return self._challenge_update_stream.subscribe(audience)
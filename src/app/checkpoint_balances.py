@@ -0,0 +1,72 @@
+"""
+Folds the balance deltas appended since the last checkpoint
+into the account balance projection:
+
+    python -m app.checkpoint_balances [--interval SECONDS]
+
+Runs once, or every `--interval` seconds until stopped.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from dishka import AsyncContainer
+
+from app.infrastructure.adapters.main_transaction_manager_sqla import (
+    SqlaMainTransactionManager,
+)
+from app.infrastructure.balance_projection.projection_sqla import (
+    SqlaAccountBalanceProjection,
+)
+from app.setup.app_factory import create_async_ioc_container
+from app.setup.config.logs import configure_logging
+from app.setup.config.settings import AppSettings, load_settings
+from app.setup.ioc.provider_registry import get_providers
+
+log = logging.getLogger(__name__)
+
+
+async def checkpoint(container: AsyncContainer) -> int:
+    async with container() as request_container:
+        projection = await request_container.get(SqlaAccountBalanceProjection)
+        transaction_manager = await request_container.get(
+            SqlaMainTransactionManager,
+        )
+        accounts = await projection.checkpoint()
+        await transaction_manager.commit()
+    log.info("Balance checkpoint: done. Accounts moved: %d.", accounts)
+    return accounts
+
+
+async def run(settings: AppSettings, *, interval_s: float | None) -> None:
+    container = create_async_ioc_container(
+        providers=get_providers(),
+        settings=settings,
+    )
+    try:
+        await checkpoint(container)
+        while interval_s is not None:
+            await asyncio.sleep(interval_s)
+            await checkpoint(container)
+    finally:
+        await container.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--interval", type=float, default=None)
+    args = parser.parse_args()
+
+    configure_logging()
+    settings = load_settings()
+    configure_logging(level=settings.logs.level)
+
+    asyncio.run(run(settings, interval_s=args.interval))
+
+
+if __name__ == "__main__":
+    main()
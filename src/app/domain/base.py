@@ -1,5 +1,18 @@
 from dataclasses import dataclass, fields
-from typing import Any, Self, cast
+from typing import Any, ClassVar, NamedTuple, Self, cast, overload
+
+
+class _ValueObjectMeta(NamedTuple):
+    field_names: tuple[str, ...]
+    repr_names: tuple[str, ...]
+
+    @classmethod
+    def of(cls, vo_type: "type[ValueObject]") -> "_ValueObjectMeta":
+        vo_fields = fields(vo_type)
+        return cls(
+            field_names=tuple(f.name for f in vo_fields),
+            repr_names=tuple(f.name for f in vo_fields if f.repr),
+        )
 
 
 @dataclass(frozen=True, slots=True, repr=False)
@@ -24,14 +37,37 @@ class ValueObject:
     for forward-compatibility, expecting future enforcement.
     https://github.com/python/cpython/issues/89547
     https://github.com/python/mypy/issues/19607
+
+    Field metadata is computed once per class, not per instance.
+    `@dataclass(slots=True)` rebuilds the class with its fields already in place,
+    so `__init_subclass__` can collect them; other dataclasses get their
+    metadata collected on first instantiation.
     """
 
+    _vo_meta: ClassVar[_ValueObjectMeta | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Zero-arg `super()` breaks in classes recreated by `slots=True`
+        super(ValueObject, cls).__init_subclass__(**kwargs)
+        if "__dataclass_fields__" in cls.__dict__:
+            meta = _ValueObjectMeta.of(cls)
+            if meta.field_names:
+                cls._vo_meta = meta
+
     def __new__(cls, *_args: Any, **_kwargs: Any) -> Self:
+        if cls.__dict__.get("_vo_meta") is None:
+            cls._collect_meta()
+        return object.__new__(cls)
+
+    @classmethod
+    def _collect_meta(cls) -> _ValueObjectMeta:
         if cls is ValueObject:
             raise TypeError("Base ValueObject cannot be instantiated directly.")
-        if not fields(cls):
+        meta = _ValueObjectMeta.of(cls)
+        if not meta.field_names:
             raise TypeError(f"{cls.__name__} must have at least one field!")
-        return object.__new__(cls)
+        cls._vo_meta = meta
+        return meta
 
     def __post_init__(self) -> None:
         """
@@ -57,22 +93,59 @@ class ValueObject:
         - If one field, returns its value.
         - Otherwise, returns comma-separated list of `name=value` pairs.
         """
-        items = [f for f in fields(self) if f.repr]
-        if not items:
+        meta = type(self).__dict__.get("_vo_meta") or self._collect_meta()
+        names = meta.repr_names
+        if not names:
             return "<hidden>"
-        if len(items) == 1:
-            return f"{getattr(self, items[0].name)!r}"
-        return ", ".join(f"{f.name}={getattr(self, f.name)!r}" for f in items)
-    
-    
+        if len(names) == 1:
+            return f"{getattr(self, names[0])!r}"
+        return ", ".join(f"{name}={getattr(self, name)!r}" for name in names)
+
+
+ENTITY_ID_CHANGE_ERROR = "Changing entity ID is not permitted."
+
+
+class _EntityId:
+    """
+    Write-once data descriptor behind `Entity.id_`.
+    Only assignments to `id_` reach it, so writes to other attributes
+    take the plain `object.__setattr__` path.
+    The value is kept in an ordinary attribute rather than read back from
+    `__dict__`, which would force CPython to materialize the instance dict.
+    """
+
+    __slots__ = ()
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> Self: ...
+
+    @overload
+    def __get__[T: ValueObject](self, instance: "Entity[T]", owner: type) -> T: ...
+
+    def __get__(self, instance: "Entity[Any] | None", owner: type) -> Any:
+        if instance is None:
+            return self
+        return instance._entity_id  # noqa: SLF001
+
+    def __set__(self, instance: "Entity[Any]", value: ValueObject) -> None:
+        if instance._entity_id is not None:  # noqa: SLF001
+            raise AttributeError(ENTITY_ID_CHANGE_ERROR)
+        instance._entity_id = value  # noqa: SLF001
+
+
 class Entity[T: ValueObject]:
     """
     Base class for domain entities, defined by a unique identity (`id`).
     Subclassing is optional; any implementation honoring this contract is valid.
     - `id`: Identity that remains constant throughout the entity's lifecycle.
     - Entities are mutable, but are compared solely by their `id`.
+    - `id` can be set once; the guard lives in a descriptor,
+    so no other attribute write is intercepted.
     """
 
+    _entity_id: ValueObject | None = None
+    id_ = _EntityId()
+
     def __new__(cls, *_args: Any, **_kwargs: Any) -> Self:
         if cls is Entity:
             raise TypeError("Base Entity cannot be instantiated directly.")
@@ -81,15 +154,6 @@ class Entity[T: ValueObject]:
     def __init__(self, *, id_: T) -> None:
         self.id_ = id_
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        """
-        Prevents modifying the `id` after it's set.
-        Other attributes can be changed as usual.
-        """
-        if name == "id_" and getattr(self, "id_", None) is not None:
-            raise AttributeError("Changing entity ID is not permitted.")
-        object.__setattr__(self, name, value)
-
     def __eq__(self, other: object) -> bool:
         """
         Two entities are considered equal if they have the same `id`,
@@ -108,6 +172,7 @@ class Entity[T: ValueObject]:
     def __repr__(self) -> str:
         return f"{type(self).__name__}(id_={self.id_!r})"
 
+
 @dataclass(frozen=True, slots=True, repr=False)
 class Event:
     pass
@@ -118,4 +183,4 @@ class DomainFieldError(Exception):
 
 
 class DomainError(Exception):
-    """Domain rule violation not tied to domain type construction."""
\ No newline at end of file
+    """Domain rule violation not tied to domain type construction."""
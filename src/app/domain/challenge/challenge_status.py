@@ -1,4 +1,5 @@
 from enum import StrEnum
+from typing import Final
 
 
 class ChallengeStatus(StrEnum):
@@ -9,4 +10,12 @@ class ChallengeStatus(StrEnum):
     VIEWER_CONFIRMED = "viewer_confirmed"
     VIEWER_REJECTED = "viewer_rejected"
     FAIL = "fail"
-    DONE = "done"
\ No newline at end of file
+    DONE = "done"
+
+
+# Statuses that hold the viewer's amount in escrow until the challenge
+# is settled, and that fail once the challenge expires.
+EXPIRABLE_CHALLENGE_STATUSES: Final[frozenset[ChallengeStatus]] = frozenset({
+    ChallengeStatus.PENDING,
+    ChallengeStatus.STREAMER_ACCEPTED,
+})
@@ -1,7 +1,12 @@
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Final
+
 from app.domain.base import Event
+from app.domain.challenge.transitions import ChallengeAction
 from app.domain.challenge.value_objects import ChallengeAmount, Description, Title
-from app.domain.shared.value_objects.id import ProductId, UserId
+from app.domain.shared.value_objects.id import ProductId, StreamerId, UserId
 from app.domain.shared.value_objects.time import CreatedAt
 
 
@@ -11,7 +16,7 @@ class ChallengeCreated(Event):
     title: Title
     description: Description
     created_by: UserId
-    assigned_to: UserId
+    assigned_to: StreamerId
     amount: ChallengeAmount
     created_at: CreatedAt
 
@@ -34,3 +39,20 @@ class ChallengeConfirmedByViewer(Event):
 @dataclass(frozen=True, slots=True, repr=False)
 class ChallengeRejectedByViewer(Event):
     id_: ProductId
+
+@dataclass(frozen=True, slots=True, repr=False)
+class ChallengeExpired(Event):
+    id_: ProductId
+
+
+# The event each challenge transition publishes, by action.
+TRANSITION_EVENTS: Final[Mapping[ChallengeAction, Callable[[ProductId], Event]]] = (
+    MappingProxyType({
+        ChallengeAction.STREAMER_ACCEPT: ChallengeAcceptedByStreamer,
+        ChallengeAction.STREAMER_REJECT: ChallengeRejectedByStreamer,
+        ChallengeAction.STREAMER_COMPLETE: ChallengeCompletedByStreamer,
+        ChallengeAction.VIEWER_CONFIRM: ChallengeConfirmedByViewer,
+        ChallengeAction.VIEWER_REJECT: ChallengeRejectedByViewer,
+        ChallengeAction.EXPIRE: ChallengeExpired,
+    })
+)
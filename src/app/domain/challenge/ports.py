@@ -0,0 +1,9 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from app.domain.challenge.challenge_history import ChallengeHistory
+
+
+class ChallengeHistoryRecorder(Protocol):
+    @abstractmethod
+    def record(self, history: ChallengeHistory) -> None: ...
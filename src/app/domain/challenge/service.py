@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timezone
 from app.domain.challenge.challenge import Challenge
 from app.domain.challenge.value_objects import (
@@ -6,8 +7,22 @@ from app.domain.challenge.value_objects import (
     ChallengeAmount,    
 )
 from app.domain.user.value_objects import StreamerChallengeFixedAmount
-from app.domain.shared.value_objects.id import ProductId, UserId, StreamerId
+from app.domain.shared.value_objects.id import (
+    ChallengeHistoryId,
+    ProductId,
+    StreamerId,
+    UserId,
+)
+from app.domain.challenge.challenge_history import ChallengeHistory
 from app.domain.challenge.challenge_status import ChallengeStatus
+from app.domain.challenge.ports import ChallengeHistoryRecorder
+from app.domain.challenge.transitions import (
+    CHALLENGE_TRANSITIONS,
+    TRANSITION_TABLE,
+    ChallengeAction,
+    ChallengeActor,
+    ChallengeTransition,
+)
 from app.domain.shared.ports.id_generator import IdGenerator
 from app.domain.shared.value_objects.time import CreatedAt, ExpiresAt, AcceptedAt, UpdatedAt
 from app.domain.shared.value_objects.fee import ChallengeFee
@@ -18,8 +33,12 @@ class ChallengeService:
     def __init__(
         self,
         challenge_id_generator: IdGenerator,
+        challenge_history_id_generator: IdGenerator,
+        challenge_history_recorder: ChallengeHistoryRecorder,
     ):
         self.challenge_id_generator = challenge_id_generator
+        self.challenge_history_id_generator = challenge_history_id_generator
+        self.challenge_history_recorder = challenge_history_recorder
 
     def create_challenge(
             self,
@@ -49,6 +68,12 @@ class ChallengeService:
             expires_at=expires_at,
             accepted_at=None,
         )
+        self._record(
+            challenge,
+            previous_status=None,
+            changed_by=created_by,
+            now=now,
+        )
         return challenge
 
     def update_challenge_content(
@@ -70,10 +95,17 @@ class ChallengeService:
         
         now = datetime.now(timezone.utc)
         updated_at = UpdatedAt(now)
+        changes = ChallengeHistory.build_changes(
+            title_from=challenge.title.value,
+            title_to=title.value,
+            description_from=challenge.description.value,
+            description_to=description.value,
+        )
 
         challenge.title = title
         challenge.description = description
         challenge.updated_at = updated_at
+        self._record_changes(challenge, changes, changed_by=user_id, now=now)
 
     def update_challenge_amount(
         self,
@@ -97,9 +129,14 @@ class ChallengeService:
                 )
         now = datetime.now(timezone.utc)
         updated_at = UpdatedAt(now)
+        changes = ChallengeHistory.build_changes(
+            amount_from=challenge.amount.minor_units,
+            amount_to=amount.minor_units,
+        )
 
         challenge.amount = amount
         challenge.updated_at = updated_at
+        self._record_changes(challenge, changes, changed_by=user_id, now=now)
 
     def extend_challenge_deadline(
         self,
@@ -122,9 +159,14 @@ class ChallengeService:
             )
         now = datetime.now(timezone.utc)
         updated_at = UpdatedAt(now)
+        changes = ChallengeHistory.build_changes(
+            expires_at_from=challenge.expires_at.value.isoformat(),
+            expires_at_to=expires_at.value.isoformat(),
+        )
 
         challenge.expires_at = expires_at
         challenge.updated_at = updated_at
+        self._record_changes(challenge, changes, changed_by=user_id, now=now)
 
     def streamer_accept_challenge(
         self,
@@ -132,24 +174,12 @@ class ChallengeService:
         *,
         streamer_id: StreamerId,
     ) -> None:
-        if challenge.status == ChallengeStatus.STREAMER_ACCEPTED:
-            raise DomainError(
-                "Challenge has already been ACCEPTED by the Streamer"
-            )
-        if challenge.status != ChallengeStatus.PENDING:
-            raise DomainError(
-                "Challenge can only be ACCEPTED for PENDING challenges"
-            )
-        if streamer_id != challenge.assigned_to:
-            raise DomainError(
-                "Challenge can only be ACCEPTED by the assigned streamer"
-            )
-        
-        now = datetime.now(timezone.utc)
-        accepted_at = AcceptedAt(now)
-
-        challenge.status = ChallengeStatus.STREAMER_ACCEPTED
-        challenge.accepted_at = accepted_at
+        now = self._transition(
+            challenge,
+            ChallengeAction.STREAMER_ACCEPT,
+            actor_id=streamer_id,
+        )
+        challenge.accepted_at = AcceptedAt(now)
 
     def streamer_reject_challenge(
         self,
@@ -157,24 +187,11 @@ class ChallengeService:
         *,
         streamer_id: StreamerId,
     ) -> None:
-        if challenge.status == ChallengeStatus.STREAMER_REJECTED:
-            raise DomainError(
-                "Challenge has already been REJECTED by the Streamer"
-            )
-        if challenge.status != ChallengeStatus.PENDING:
-            raise DomainError(
-                "Challenge can only be REJECTED by the Streamer for PENDING challenges"
-            )
-        if streamer_id != challenge.assigned_to:
-            raise DomainError(
-                "Challenge can only be REJECTED by the assigned streamer"
-            )
-        
-        now = datetime.now(timezone.utc)
-        updated_at = UpdatedAt(now)
-
-        challenge.status = ChallengeStatus.STREAMER_REJECTED
-        challenge.updated_at = updated_at
+        self._transition(
+            challenge,
+            ChallengeAction.STREAMER_REJECT,
+            actor_id=streamer_id,
+        )
 
     def viewer_reject_challenge(
         self,
@@ -182,23 +199,11 @@ class ChallengeService:
         *,
         user_id: UserId,
     ) -> None:
-        if challenge.status == ChallengeStatus.VIEWER_REJECTED:
-            raise DomainError(
-                "Challenge has already been REJECTED by the Viewer"
-            )
-        if challenge.status not in {ChallengeStatus.PENDING, ChallengeStatus.STREAMER_ACCEPTED}:
-            raise DomainError(
-                "Challenge can only be REJECTED by the Viewer for PENDING or ACCEPTED challenges"
-            )
-        if user_id != challenge.created_by:
-            raise DomainError(
-                "Challenge can only be REJECTED by the creator"
-            )
-        now = datetime.now(timezone.utc)
-        updated_at = UpdatedAt(now)
-
-        challenge.status = ChallengeStatus.VIEWER_REJECTED
-        challenge.updated_at = updated_at
+        self._transition(
+            challenge,
+            ChallengeAction.VIEWER_REJECT,
+            actor_id=user_id,
+        )
 
     def streamer_complete_challenge(
         self,
@@ -206,29 +211,23 @@ class ChallengeService:
         *,
         streamer_id: StreamerId,
     ) -> None:
-        if challenge.status == ChallengeStatus.STREAMER_COMPLETED:
-            raise DomainError(
-                "Challenge has already been COMPLETED by the Streamer"
-            )
-        if challenge.status != ChallengeStatus.STREAMER_ACCEPTED:
-            raise DomainError(
-                "Challenge can only be marked as COMPLETED by the Streamer for ACCEPTED challenges"
-            )
-        if streamer_id != challenge.assigned_to:
-            raise DomainError(
-                "Challenge can only be marked as COMPLETED by the assigned streamer"
-            )
+        self._check_transition(
+            challenge,
+            ChallengeAction.STREAMER_COMPLETE,
+            actor_id=streamer_id,
+        )
         now = datetime.now(timezone.utc)
-        
         current_duration = now - challenge.created_at.value
         if current_duration > challenge.duration:
             raise DomainError(
                 "Challenge cannot be marked as COMPLETED after its duration has passed"
             )
-
-        updated_at = UpdatedAt(now)
-        challenge.status = ChallengeStatus.STREAMER_COMPLETED
-        challenge.updated_at = updated_at
+        self._apply_transition(
+            challenge,
+            ChallengeAction.STREAMER_COMPLETE,
+            changed_by=None,
+            now=now,
+        )
 
     def viewer_confirm_challenge(
         self,
@@ -236,35 +235,174 @@ class ChallengeService:
         *,
         user_id: UserId,
     ) -> None:
-        if challenge.status == ChallengeStatus.VIEWER_CONFIRMED:
-            raise DomainError(
-                "Challenge has already been CONFIRMED by the Viewer"
-            )
-        if challenge.status not in {ChallengeStatus.STREAMER_COMPLETED, ChallengeStatus.STREAMER_ACCEPTED}:
+        self._transition(
+            challenge,
+            ChallengeAction.VIEWER_CONFIRM,
+            actor_id=user_id,
+        )
+
+    def done_challenge(
+        self,
+        challenge: Challenge,
+    ) -> None:
+        self._transition(challenge, ChallengeAction.FINISH)
+
+    def expire_challenge(
+        self,
+        challenge: Challenge,
+    ) -> None:
+        self._check_transition(challenge, ChallengeAction.EXPIRE)
+        now = datetime.now(timezone.utc)
+        if now < challenge.expires_at.value:
             raise DomainError(
-                "Challenge can only be marked as CONFIRMED by the Viewer for ACCEPTED or STREAMER_COMPLETED challenges"
+                f"Challenge cannot be marked as FAIL before it expires at {challenge.expires_at}"
             )
-        if user_id != challenge.created_by:
+        self._apply_transition(
+            challenge,
+            ChallengeAction.EXPIRE,
+            changed_by=None,
+            now=now,
+        )
+
+    def bulk_transition(self, action: ChallengeAction) -> ChallengeTransition:
+        """
+        Returns the transition for a set-based update of many challenges,
+        which can only check the status and the actor of each challenge.
+        """
+        transition = CHALLENGE_TRANSITIONS[action]
+        if not transition.set_based:
             raise DomainError(
-                "Challenge can only be marked as CONFIRMED by the creator"
+                f"Challenge action {action} cannot be applied to many challenges at once"
             )
+        return transition
+
+    def record_bulk_transition(
+        self,
+        challenges: Iterable[Challenge],
+        transition: ChallengeTransition,
+        *,
+        changed_by: UserId | None = None,
+    ) -> None:
+        """
+        Records the history of challenges already moved by a set-based update.
+        Their previous status is only known when the transition has one source.
+        """
+        (previous_status,) = (
+            transition.sources if len(transition.sources) == 1 else (None,)
+        )
         now = datetime.now(timezone.utc)
-        updated_at = UpdatedAt(now)
+        for challenge in challenges:
+            challenge.updated_at = UpdatedAt(now)
+            self._record(
+                challenge,
+                previous_status=previous_status,
+                changed_by=changed_by,
+                now=now,
+            )
 
-        challenge.status = ChallengeStatus.VIEWER_CONFIRMED
-        challenge.updated_at = updated_at
+    def _transition(
+        self,
+        challenge: Challenge,
+        action: ChallengeAction,
+        *,
+        actor_id: UserId | StreamerId | None = None,
+    ) -> datetime:
+        self._check_transition(challenge, action, actor_id=actor_id)
+        now = datetime.now(timezone.utc)
+        self._apply_transition(
+            challenge,
+            action,
+            changed_by=actor_id if isinstance(actor_id, UserId) else None,
+            now=now,
+        )
+        return now
 
-    def done_challenge(
+    def _check_transition(
         self,
         challenge: Challenge,
+        action: ChallengeAction,
+        *,
+        actor_id: UserId | StreamerId | None = None,
     ) -> None:
-        if challenge.status != ChallengeStatus.VIEWER_CONFIRMED:
+        transition = TRANSITION_TABLE.get((challenge.status, action))
+        if transition is None:
+            transition = CHALLENGE_TRANSITIONS[action]
+            if challenge.status == transition.target:
+                raise DomainError(
+                    f"Challenge is already {transition.target.name}"
+                )
+            sources = " or ".join(sorted(status.name for status in transition.sources))
             raise DomainError(
-                "Challenge can only be marked as DONE for VIEWER_CONFIRMED challenges"
+                f"Challenge can only be moved to {transition.target.name} for {sources} challenges"
+            )
+        if transition.actor == ChallengeActor.SYSTEM:
+            return
+        allowed_id = (
+            challenge.assigned_to
+            if transition.actor == ChallengeActor.STREAMER
+            else challenge.created_by
+        )
+        if actor_id != allowed_id:
+            raise DomainError(
+                f"Challenge can only be moved to {transition.target.name} by {transition.actor}"
             )
-        now = datetime.now(timezone.utc)
-        updated_at = UpdatedAt(now)
 
-        challenge.status = ChallengeStatus.DONE
-        challenge.updated_at = updated_at
+    def _apply_transition(
+        self,
+        challenge: Challenge,
+        action: ChallengeAction,
+        *,
+        changed_by: UserId | None,
+        now: datetime,
+    ) -> None:
+        previous_status = challenge.status
+        challenge.status = CHALLENGE_TRANSITIONS[action].target
+        challenge.updated_at = UpdatedAt(now)
+        self._record(
+            challenge,
+            previous_status=previous_status,
+            changed_by=changed_by,
+            now=now,
+        )
 
+    def _record_changes(
+        self,
+        challenge: Challenge,
+        changes: Mapping[str, Mapping[str, object]],
+        *,
+        changed_by: UserId,
+        now: datetime,
+    ) -> None:
+        if changes:
+            self._record(
+                challenge,
+                previous_status=challenge.status,
+                changed_by=changed_by,
+                now=now,
+                changes=changes,
+            )
+
+    def _record(
+        self,
+        challenge: Challenge,
+        *,
+        previous_status: ChallengeStatus | None,
+        changed_by: UserId | None,
+        now: datetime,
+        changes: Mapping[str, Mapping[str, object]] | None = None,
+    ) -> None:
+        """
+        Streamer and system actions are recorded without `changed_by`:
+        the transition table already names their actor.
+        """
+        self.challenge_history_recorder.record(
+            ChallengeHistory(
+                id_=ChallengeHistoryId(self.challenge_history_id_generator()),
+                challenge_id=challenge.id_,
+                previous_status=previous_status,
+                current_status=challenge.status,
+                changed_by=changed_by,
+                changed_at=CreatedAt(now),
+                changes=changes,
+            ),
+        )
@@ -0,0 +1,114 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+from types import MappingProxyType
+from typing import Final
+
+from app.domain.challenge.challenge_status import (
+    EXPIRABLE_CHALLENGE_STATUSES,
+    ChallengeStatus,
+)
+
+
+class ChallengeAction(StrEnum):
+    STREAMER_ACCEPT = "streamer_accept"
+    STREAMER_REJECT = "streamer_reject"
+    STREAMER_COMPLETE = "streamer_complete"
+    VIEWER_CONFIRM = "viewer_confirm"
+    VIEWER_REJECT = "viewer_reject"
+    EXPIRE = "expire"
+    FINISH = "finish"
+
+
+class ChallengeActor(StrEnum):
+    STREAMER = "the assigned streamer"
+    VIEWER = "the creator"
+    SYSTEM = "the system"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ChallengeTransition:
+    action: ChallengeAction
+    sources: frozenset[ChallengeStatus]
+    target: ChallengeStatus
+    actor: ChallengeActor
+    # Whether the status and the actor alone allow the transition,
+    # so that it can be applied to many challenges by one set-based update.
+    set_based: bool = True
+
+
+CHALLENGE_TRANSITIONS: Final[Mapping[ChallengeAction, ChallengeTransition]] = (
+    MappingProxyType({
+        transition.action: transition
+        for transition in (
+            ChallengeTransition(
+                action=ChallengeAction.STREAMER_ACCEPT,
+                sources=frozenset({ChallengeStatus.PENDING}),
+                target=ChallengeStatus.STREAMER_ACCEPTED,
+                actor=ChallengeActor.STREAMER,
+                set_based=False,
+            ),
+            ChallengeTransition(
+                action=ChallengeAction.STREAMER_REJECT,
+                sources=frozenset({ChallengeStatus.PENDING}),
+                target=ChallengeStatus.STREAMER_REJECTED,
+                actor=ChallengeActor.STREAMER,
+            ),
+            ChallengeTransition(
+                action=ChallengeAction.STREAMER_COMPLETE,
+                sources=frozenset({ChallengeStatus.STREAMER_ACCEPTED}),
+                target=ChallengeStatus.STREAMER_COMPLETED,
+                actor=ChallengeActor.STREAMER,
+                set_based=False,
+            ),
+            ChallengeTransition(
+                action=ChallengeAction.VIEWER_CONFIRM,
+                sources=frozenset({
+                    ChallengeStatus.STREAMER_ACCEPTED,
+                    ChallengeStatus.STREAMER_COMPLETED,
+                }),
+                target=ChallengeStatus.VIEWER_CONFIRMED,
+                actor=ChallengeActor.VIEWER,
+            ),
+            ChallengeTransition(
+                action=ChallengeAction.VIEWER_REJECT,
+                sources=frozenset({
+                    ChallengeStatus.PENDING,
+                    ChallengeStatus.STREAMER_ACCEPTED,
+                }),
+                target=ChallengeStatus.VIEWER_REJECTED,
+                actor=ChallengeActor.VIEWER,
+            ),
+            ChallengeTransition(
+                action=ChallengeAction.EXPIRE,
+                sources=EXPIRABLE_CHALLENGE_STATUSES,
+                target=ChallengeStatus.FAIL,
+                actor=ChallengeActor.SYSTEM,
+                set_based=False,
+            ),
+            ChallengeTransition(
+                action=ChallengeAction.FINISH,
+                sources=frozenset({ChallengeStatus.VIEWER_CONFIRMED}),
+                target=ChallengeStatus.DONE,
+                actor=ChallengeActor.SYSTEM,
+            ),
+        )
+    })
+)
+
+# Every (from-status, action) pair allowed, precompiled from the transitions
+# above so that checking a transition is a single lookup.
+TRANSITION_TABLE: Final[
+    Mapping[tuple[ChallengeStatus, ChallengeAction], ChallengeTransition]
+] = MappingProxyType({
+    (source, transition.action): transition
+    for transition in CHALLENGE_TRANSITIONS.values()
+    for source in transition.sources
+})
+
+# Each status is reached by exactly one action,
+# so a requested status names the action to apply.
+ACTION_BY_TARGET: Final[Mapping[ChallengeStatus, ChallengeAction]] = MappingProxyType({
+    transition.target: transition.action
+    for transition in CHALLENGE_TRANSITIONS.values()
+})
@@ -3,7 +3,6 @@ from typing import ClassVar, Final, Optional
 from uuid import UUID
 from app.domain.base import DomainFieldError, ValueObject
 from app.domain.shared.value_objects.token import Token
-from decimal import Decimal
 
 
 @dataclass(frozen=True, slots=True, repr=False)
@@ -64,15 +63,14 @@ class Description(ValueObject):
 @dataclass(frozen=True, slots=True, repr=False)
 class ChallengeAmount(Token):
     """raises DomainFieldError"""
-    value: Decimal
-    
+
     def __post_init__(self) -> None:
         """:raises DomainFieldError:"""
         super(ChallengeAmount, self).__post_init__()
-        self._validate_challenge_amount(self.value)
+        self._validate_challenge_amount(self.minor_units)
 
-    def _validate_challenge_amount(self, challenge_amount_value: Decimal) -> None:
-        if challenge_amount_value < self.ZERO:
+    def _validate_challenge_amount(self, challenge_amount_minor_units: int) -> None:
+        if challenge_amount_minor_units < self.ZERO:
             raise DomainFieldError(
-                f"Challenge amount must be greater than or equal to {self.ZERO}, but got {challenge_amount_value}.",
+                f"Challenge amount must be greater than or equal to {self.ZERO}, but got {self.value}.",
             )
\ No newline at end of file
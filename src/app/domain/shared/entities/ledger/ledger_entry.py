@@ -26,9 +26,9 @@ class LedgerEntry(Entity[EntryId]):
             raise DomainError("LedgerEntry account_id must be set for user wallets")
         if self.account_type != AccountType.USER_WALLET and self.account_id is not None:
             raise DomainError("LedgerEntry account_id must be None for system accounts")
-        if self.debit.value > Token.ZERO and self.credit.value > Token.ZERO:
+        if self.debit.minor_units > Token.ZERO and self.credit.minor_units > Token.ZERO:
             raise DomainError("LedgerEntry cannot have both debit and credit > 0")
 
-        if self.debit.value == Token.ZERO and self.credit.value == Token.ZERO:
+        if self.debit.minor_units == Token.ZERO and self.credit.minor_units == Token.ZERO:
             raise DomainError("LedgerEntry must have debit or credit > 0")
         
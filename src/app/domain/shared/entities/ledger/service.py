@@ -1,5 +1,8 @@
+from collections.abc import Sequence
+
 from app.domain.shared.entities.ledger.account_type import AccountType
 from app.domain.shared.entities.ledger.ledger_entry import LedgerEntry
+from app.domain.shared.entities.transaction.value_objects import Allocation
 from app.domain.shared.ports.id_generator import IdGenerator
 from app.domain.shared.value_objects.id import WalletId, EntryId
 from app.domain.shared.value_objects.token import Token
@@ -27,6 +30,24 @@ class LedgerService:
             credit=credit,
         )
         return entry
+
+    def create_credit_entries(
+        self,
+        *,
+        allocations: Sequence[Allocation],
+    ) -> list[LedgerEntry]:
+        """creates a credit entry per allocation, with ids generated as one batch"""
+        entry_ids = self._ledger_entry_id_generator.generate(len(allocations))
+        return [
+            LedgerEntry(
+                id_=EntryId(entry_id),
+                account_type=allocation.payee_type,
+                account_id=allocation.payee_id,
+                debit=Token(Token.ZERO),
+                credit=allocation.amount,
+            )
+            for entry_id, allocation in zip(entry_ids, allocations, strict=True)
+        ]
     
     def create_bank_debit_entry(
         self,
@@ -12,8 +12,9 @@ class Notification(Entity[NotificationId]):
         title: str,
         message: str,
         created_at: CreatedAt,
-        delivered_at: DeliveredAt,
+        delivered_at: DeliveredAt | None,
         is_read: bool,
+        event_type: str | None = None,
     ) -> None:
         super().__init__(id_=id_)
         self.product_id = product_id
@@ -23,3 +24,6 @@ class Notification(Entity[NotificationId]):
         self.created_at = created_at
         self.delivered_at = delivered_at
         self.is_read = is_read
+        # Set when the notification reports an event, at most once per
+        # recipient and product, so that redelivered events are ignored.
+        self.event_type = event_type
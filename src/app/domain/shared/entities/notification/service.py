@@ -1,4 +1,4 @@
-
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from app.domain.shared.entities.notification.notification import Notification
 from app.domain.shared.ports.id_generator import IdGenerator
@@ -19,16 +19,37 @@ class NotificationService:
         message: str,
     ) -> Notification:
         """creates a new Notification instance"""
-        notification_id = NotificationId(self._notification_id_generator())
-        now = datetime.now(timezone.utc)
-
-        return Notification(
-            id_=notification_id,
+        (notification,) = self.create_notifications(
             product_id=product_id,
-            user_id=user_id,
+            user_ids=(user_id,),
             title=title,
             message=message,
-            created_at=CreatedAt(now),
-            delivered_at=None,
-            is_read=False,
         )
+        return notification
+
+    def create_notifications(
+        self,
+        *,
+        product_id: ProductId,
+        user_ids: Iterable[UserId],
+        title: str,
+        message: str,
+        event_type: str | None = None,
+    ) -> list[Notification]:
+        """One unread notification per recipient, all created at the same time."""
+        created_at = CreatedAt(datetime.now(timezone.utc))
+
+        return [
+            Notification(
+                id_=NotificationId(self._notification_id_generator()),
+                product_id=product_id,
+                user_id=user_id,
+                title=title,
+                message=message,
+                created_at=created_at,
+                delivered_at=None,
+                is_read=False,
+                event_type=event_type,
+            )
+            for user_id in user_ids
+        ]
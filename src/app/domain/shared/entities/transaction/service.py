@@ -33,14 +33,9 @@ class TransactionService:
         escrow_debit_entry = self._ledger_service.create_escrow_debit_entry(
             debit=amount,
         )
-        payee_credit_entries = [
-            self._ledger_service.create_credit_entry(
-                account_type=allocation.payee_type,
-                account_id=allocation.payee_id,
-                credit=allocation.amount,
-            )
-            for allocation in allocations
-        ]
+        payee_credit_entries = self._ledger_service.create_credit_entries(
+            allocations=allocations,
+        )
         ledger_entries = (escrow_debit_entry, *payee_credit_entries)
         
         transaction = Transaction(
@@ -116,14 +111,9 @@ class TransactionService:
             account_id=payer_id,
             debit=amount,
         )
-        payee_credit_entries = [
-            self._ledger_service.create_credit_entry(
-                account_type=allocation.payee_type,
-                account_id=allocation.payee_id,
-                credit=allocation.amount,
-            )
-            for allocation in allocations
-        ]
+        payee_credit_entries = self._ledger_service.create_credit_entries(
+            allocations=allocations,
+        )
         ledger_entries = (payer_debit_entry, *payee_credit_entries)
         
         transaction = Transaction(
@@ -157,14 +147,9 @@ class TransactionService:
             account_id=payer_id,
             debit=amount,
         )
-        payee_credit_entries = [
-            self._ledger_service.create_credit_entry(
-                account_type=allocation.payee_type,
-                account_id=allocation.payee_id,
-                credit=allocation.amount,
-            )
-            for allocation in allocations
-        ]
+        payee_credit_entries = self._ledger_service.create_credit_entries(
+            allocations=allocations,
+        )
         ledger_entries = (payer_debit_entry, *payee_credit_entries)
         
         transaction = Transaction(
@@ -196,14 +181,9 @@ class TransactionService:
         payer_debit_entry = self._ledger_service.create_bank_debit_entry(
             debit=amount,
         )
-        payee_credit_entries = [
-            self._ledger_service.create_credit_entry(
-                account_type=allocation.payee_type,
-                account_id=allocation.payee_id,
-                credit=allocation.amount,
-            )
-            for allocation in allocations
-        ]
+        payee_credit_entries = self._ledger_service.create_credit_entries(
+            allocations=allocations,
+        )
         ledger_entries = (payer_debit_entry, *payee_credit_entries)
         
         transaction = Transaction(
@@ -1,3 +1,5 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import Tuple
 
 from app.domain.base import DomainError, Entity
@@ -6,12 +8,62 @@ from app.domain.shared.entities.ledger.ledger_entry import LedgerEntry
 from app.domain.shared.entities.transaction.value_objects import Allocation
 from app.domain.shared.enums import ProductType
 from app.domain.shared.value_objects.time import CreatedAt
+from app.domain.shared.value_objects.money import from_minor_units
 from app.domain.shared.value_objects.token import Token
 from app.domain.shared.entities.transaction.transaction_type import TransactionType
 from app.domain.shared.value_objects.id import ProductId, TransactionId, WalletId
 
 
+type AccountKey = tuple[AccountType, WalletId | None]
+
+
+@dataclass(frozen=True, slots=True)
+class LedgerSummary:
+    """
+    Aggregates of a transaction's ledger entries, collected in one pass.
+    `source` is the list the summary was built from;
+    `Transaction` rebuilds the summary once that list is replaced or resized.
+    """
+
+    entries: Tuple[LedgerEntry, ...]
+    total_debit: int
+    total_credit: int
+    debit_count: int
+    debit_entry: LedgerEntry | None
+    credits_by_account: Mapping[AccountKey, int]
+    source: list[LedgerEntry] = field(compare=False, repr=False)
+
+    @classmethod
+    def of(cls, source: list[LedgerEntry]) -> "LedgerSummary":
+        total_debit = total_credit = debit_count = 0
+        debit_entry: LedgerEntry | None = None
+        credits_by_account: dict[AccountKey, int] = {}
+        for entry in source:
+            debit = entry.debit.minor_units
+            credit = entry.credit.minor_units
+            total_debit += debit
+            total_credit += credit
+            if debit > Token.ZERO:
+                debit_count += 1
+                debit_entry = entry
+            if credit > Token.ZERO:
+                key = (entry.account_type, entry.account_id)
+                credits_by_account[key] = credits_by_account.get(key, 0) + credit
+        return cls(
+            entries=tuple(source),
+            total_debit=total_debit,
+            total_credit=total_credit,
+            debit_count=debit_count,
+            debit_entry=debit_entry,
+            credits_by_account=credits_by_account,
+            source=source,
+        )
+
+
 class Transaction(Entity[TransactionId]):
+    # Instances loaded by the ORM skip `__init__`, so this default applies.
+    _ledger_summary: LedgerSummary | None = None
+
     def __init__(
         self,
         *,
@@ -41,39 +93,53 @@ class Transaction(Entity[TransactionId]):
 
     @property
     def ledger_entries(self) -> Tuple[LedgerEntry, ...]:
-        return tuple(self._ledger_entries)
+        return self.ledger_summary.entries
+
+    @property
+    def ledger_summary(self) -> LedgerSummary:
+        summary = self._ledger_summary
+        source = self._ledger_entries
+        if (
+            summary is None
+            or summary.source is not source
+            or len(summary.entries) != len(source)
+        ):
+            summary = LedgerSummary.of(source)
+            self._ledger_summary = summary
+        return summary
 
     def validate(self) -> None:
+        summary = self.ledger_summary
         self._validate_payer()
         self._validate_amount()
-        self._validate_allocations()
-        self._validate_ledger_entries()
-        self._validate_ledger_balance()
-        self._validate_allocation_ledger_mapping()
+        allocations_by_account = self._validate_allocations()
+        self._validate_ledger_entries(summary)
+        self._validate_ledger_balance(summary)
+        self._validate_allocation_ledger_mapping(summary, allocations_by_account)
 
     def _validate_amount(self) -> None:
-        if self.amount.value <= Token.ZERO:
+        if self.amount.minor_units <= Token.ZERO:
             raise DomainError(
                 f"Transaction amount must be greater than 0, but got {self.amount}.",
             )
 
-    def _validate_ledger_entries(self) -> None:
-        if not self.ledger_entries or len(self.ledger_entries) < 2:
+    def _validate_ledger_entries(self, summary: LedgerSummary) -> None:
+        if len(summary.entries) < 2:
             raise DomainError(
                 "Transaction must have at least two ledger entries.",
             )
     
-    def _validate_ledger_balance(self) -> None:
-        total_debit = sum(entry.debit.value for entry in self.ledger_entries)
-        total_credit = sum(entry.credit.value for entry in self.ledger_entries)
+    def _validate_ledger_balance(self, summary: LedgerSummary) -> None:
+        total_debit = summary.total_debit
+        total_credit = summary.total_credit
 
         if total_debit != total_credit:
             raise DomainError(
-                f"Ledger entries are not balanced: total debit {total_debit} != total credit {total_credit}.",
+                f"Ledger entries are not balanced: total debit {from_minor_units(total_debit)} != total credit {from_minor_units(total_credit)}.",
             )
-        if total_debit != self.amount.value or total_credit != self.amount.value:
+        if total_debit != self.amount.minor_units or total_credit != self.amount.minor_units:
             raise DomainError(
-                f"Transaction amount {self.amount} does not match ledger entries debit {total_debit} and credit {total_credit}.",
+                f"Transaction amount {self.amount} does not match ledger entries debit {from_minor_units(total_debit)} and credit {from_minor_units(total_credit)}.",
             )
     
     def _validate_payer(self) -> None:
@@ -86,35 +152,33 @@ class Transaction(Entity[TransactionId]):
                 "Payer id must be None for system accounts.",
             )
 
-    def _validate_allocations(self) -> None:
+    def _validate_allocations(self) -> dict[AccountKey, int]:
         if not self.allocations:
             raise DomainError(
                 "Transaction must have at least one allocation.",
             )
-        total_allocations = sum(
-            allocation.amount.value for allocation in self.allocations
-        )
-        if total_allocations != self.amount.value:
+        total_allocations = 0
+        allocations_by_account: dict[AccountKey, int] = {}
+        for allocation in self.allocations:
+            amount = allocation.amount.minor_units
+            total_allocations += amount
+            key = (allocation.payee_type, allocation.payee_id)
+            allocations_by_account[key] = allocations_by_account.get(key, 0) + amount
+        if total_allocations != self.amount.minor_units:
             raise DomainError(
-                f"Transaction amount {self.amount} does not match allocations total {total_allocations}.",
+                f"Transaction amount {self.amount} does not match allocations total {from_minor_units(total_allocations)}.",
             )
+        return allocations_by_account
 
-    def _validate_allocation_ledger_mapping(self) -> None:
-        debits = [
-            entry
-            for entry in self.ledger_entries
-            if entry.debit.value > Token.ZERO
-        ]
-        credits = [
-            entry
-            for entry in self.ledger_entries
-            if entry.credit.value > Token.ZERO
-        ]
-
-        if len(debits) != 1:
+    def _validate_allocation_ledger_mapping(
+        self,
+        summary: LedgerSummary,
+        allocations_by_account: Mapping[AccountKey, int],
+    ) -> None:
+        debit_entry = summary.debit_entry
+        if summary.debit_count != 1 or debit_entry is None:
             raise DomainError("Transaction must have exactly one debit entry.")
 
-        debit_entry = debits[0]
         if (
             debit_entry.account_type != self.payer_type
             or debit_entry.account_id != self.payer_id
@@ -122,22 +186,12 @@ class Transaction(Entity[TransactionId]):
             raise DomainError(
                 "Payer does not match debit ledger entry.",
             )
-        if debit_entry.debit.value != self.amount.value:
+        if debit_entry.debit.minor_units != self.amount.minor_units:
             raise DomainError(
                 "Debit entry amount does not match transaction amount.",
             )
 
-        allocation_map: dict[tuple[AccountType, WalletId | None], Token] = {}
-        for allocation in self.allocations:
-            key = (allocation.payee_type, allocation.payee_id)
-            allocation_map[key] = allocation_map.get(key, Token.ZERO) + allocation.amount.value
-
-        credit_map: dict[tuple[AccountType, WalletId | None], Token] = {}
-        for entry in credits:
-            key = (entry.account_type, entry.account_id)
-            credit_map[key] = credit_map.get(key, Token.ZERO) + entry.credit.value
-
-        if credit_map != allocation_map:
+        if summary.credits_by_account != allocations_by_account:
             raise DomainError(
                 "Allocations do not match credit ledger entries.",
             )
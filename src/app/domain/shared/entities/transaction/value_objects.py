@@ -16,7 +16,7 @@ class Allocation(ValueObject):
 
     def __post_init__(self) -> None:
         """:raises DomainFieldError:"""
-        if self.amount.value <= Token.ZERO:
+        if self.amount.minor_units <= Token.ZERO:
             raise DomainFieldError(
                 f"Allocation amount must be greater than 0, but got {self.amount}.",
             )
@@ -5,3 +5,7 @@ from uuid import UUID
 class IdGenerator:
     @abstractmethod
     def __call__(self) -> UUID: ...
+
+    def generate(self, n: int) -> list[UUID]:
+        """`n` ids in the order they were generated."""
+        return [self() for _ in range(n)]
@@ -0,0 +1,61 @@
+"""
+Fixed-point rules for token amounts.
+Amounts are held as integer minor units (cents) and stored in
+`NUMERIC(MONEY_PRECISION, MONEY_SCALE)` columns, so both sides quantize
+and range-check with the same constants.
+"""
+
+from collections.abc import Sequence
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Final
+
+from app.domain.base import DomainError
+
+MONEY_PRECISION: Final[int] = 12
+MONEY_SCALE: Final[int] = 2
+MINOR_UNITS_PER_UNIT: Final[int] = 10**MONEY_SCALE
+MAX_MINOR_UNITS: Final[int] = 10**MONEY_PRECISION - 1
+
+_QUANTUM: Final[Decimal] = Decimal(1).scaleb(-MONEY_SCALE)
+
+
+def to_minor_units(amount: Decimal) -> int:
+    """
+    Rounds half away from zero to `MONEY_SCALE` places,
+    which is what Postgres does when storing into the column.
+    """
+    quantized = amount.quantize(_QUANTUM, rounding=ROUND_HALF_UP)
+    return int(quantized.scaleb(MONEY_SCALE))
+
+
+def from_minor_units(minor_units: int) -> Decimal:
+    return Decimal(minor_units).scaleb(-MONEY_SCALE)
+
+
+def allocate_minor_units(total: int, ratios: Sequence[int]) -> tuple[int, ...]:
+    """
+    Splits `total` in proportion to `ratios` with the largest remainder method.
+    The shares always add up to `total`: each gets its floor,
+    and the units left over go to the largest remainders,
+    earlier ratios first on ties.
+
+    :raises DomainError:
+    """
+    if not ratios or min(ratios) < 0:
+        raise DomainError("Ratios must be non-empty and non-negative.")
+    denominator = sum(ratios)
+    if denominator == 0:
+        raise DomainError("At least one ratio must be positive.")
+
+    shares = [total * ratio // denominator for ratio in ratios]
+    leftover = total - sum(shares)
+    if leftover:
+        remainders = [total * ratio % denominator for ratio in ratios]
+        by_remainder = sorted(
+            range(len(ratios)),
+            key=remainders.__getitem__,
+            reverse=True,
+        )
+        for index in by_remainder[:leftover]:
+            shares[index] += 1
+    return tuple(shares)
@@ -1,50 +1,113 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from functools import total_ordering
-from typing import ClassVar, Final
-from app.domain.base import ValueObject, DomainFieldError
+from typing import ClassVar, Final, Self
+
+from app.domain.base import DomainFieldError, ValueObject
+from app.domain.shared.value_objects.money import (
+    MAX_MINOR_UNITS,
+    MONEY_PRECISION,
+    MONEY_SCALE,
+    allocate_minor_units,
+    from_minor_units,
+    to_minor_units,
+)
 
 
 @total_ordering
 @dataclass(frozen=True, slots=True, repr=False)
 class Token(ValueObject):
-    """raises DomainFieldError"""
-    ZERO: ClassVar[Final[Decimal]] = Decimal("0.00")
-    
-    value: Decimal
-    
+    """
+    raises DomainFieldError
+
+    Fixed-point amount held as integer minor units, so arithmetic is exact
+    and never goes through `Decimal`. Use `from_decimal` for external input.
+    """
+
+    ZERO: ClassVar[Final[int]] = 0
+
+    minor_units: int
+
     def __post_init__(self) -> None:
         """:raises DomainFieldError:"""
-        self._validate_token_type(self.value)
-    
+        self._validate_token_minor_units(self.minor_units)
+
+    @classmethod
+    def from_decimal(cls, value: Decimal) -> Self:
+        """
+        Quantizes `value` the way the `NUMERIC` columns store it.
+
+        :raises DomainFieldError:
+        """
+        if not isinstance(value, Decimal) or not value.is_finite():
+            raise DomainFieldError(
+                f"Token must be a finite Decimal, but got {value!r}.",
+            )
+        # Out of range by its exponent alone: quantizing a value this large
+        # could exceed the `Decimal` context precision and raise.
+        if value and value.adjusted() >= MONEY_PRECISION - MONEY_SCALE:
+            raise DomainFieldError(
+                f"Token must be within ±{from_minor_units(MAX_MINOR_UNITS)}, "
+                f"but got {value}.",
+            )
+        return cls(to_minor_units(value))
+
+    @property
+    def value(self) -> Decimal:
+        return from_minor_units(self.minor_units)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Token):
             return NotImplemented
-        return self.value == other.value
+        return self.minor_units == other.minor_units
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Token):
             return NotImplemented
-        return self.value < other.value
-    
-    def __add__(self, other: object):
+        return self.minor_units < other.minor_units
+
+    def __add__(self, other: object) -> Self:
         if not isinstance(other, Token):
             return NotImplemented
-        return self.__class__(self.value + other.value)
-    
-    def __sub__(self, other: object):
+        return self.__class__(self.minor_units + other.minor_units)
+
+    def __sub__(self, other: object) -> Self:
         if not isinstance(other, Token):
             return NotImplemented
-        return self.__class__(self.value - other.value)
-    
-    def __mul__(self, scalar: Decimal):
-        if not isinstance(scalar, Decimal):
+        return self.__class__(self.minor_units - other.minor_units)
+
+    def __mul__(self, scalar: int) -> Self:
+        if not isinstance(scalar, int) or isinstance(scalar, bool):
             return NotImplemented
-        return self.__class__(self.value * scalar)
-        
+        return self.__class__(self.minor_units * scalar)
 
-    def _validate_token_type(self, token_value: Decimal) -> None:
-        if not isinstance(token_value, Decimal):
+    def allocate(self, *ratios: int) -> tuple[Self, ...]:
+        """
+        Splits the amount in proportion to `ratios` without losing a cent,
+        e.g. `amount.allocate(10, 20, 70)` for a 10% / 20% / 70% split.
+
+        :raises DomainError:
+        """
+        shares = allocate_minor_units(self.minor_units, ratios)
+        # Every share lies between zero and the amount itself,
+        # so it is already valid for the amount's own type.
+        return tuple(map(self._from_valid, shares))
+
+    @classmethod
+    def _from_valid(cls, minor_units: int) -> Self:
+        token = object.__new__(cls)
+        # Frozen dataclass: plain assignment and `setattr` raise here.
+        object.__setattr__(token, "minor_units", minor_units)  # noqa: PLC2801
+        return token
+
+    def _validate_token_minor_units(self, minor_units: int) -> None:
+        if type(minor_units) is not int:
+            raise DomainFieldError(
+                f"Token must be an integer amount of minor units, "
+                f"but got {type(minor_units)}.",
+            )
+        if not -MAX_MINOR_UNITS <= minor_units <= MAX_MINOR_UNITS:
             raise DomainFieldError(
-                f"Token must be a Decimal, but got {type(token_value)}.",
-            )
\ No newline at end of file
+                f"Token must be within ±{from_minor_units(MAX_MINOR_UNITS)}, "
+                f"but got {from_minor_units(minor_units)}.",
+            )
@@ -1,10 +1,20 @@
 from abc import abstractmethod
 from typing import Protocol
+
 from app.domain.user.value_objects import RawPassword
 
+
 class PasswordHasher(Protocol):
     @abstractmethod
-    def hash(self, raw_password: RawPassword) -> bytes: ...
+    async def hash(self, raw_password: RawPassword) -> bytes: ...
+
+    @abstractmethod
+    async def verify(
+        self,
+        *,
+        raw_password: RawPassword,
+        hashed_password: bytes,
+    ) -> bool: ...
 
     @abstractmethod
-    def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool: ...
+    def needs_rehash(self, hashed_password: bytes) -> bool: ...
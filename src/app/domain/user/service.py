@@ -27,7 +27,7 @@ class UserService:
         self._id_generator = id_generator
         self._password_hasher = password_hasher
 
-    def create_user(
+    async def create_user(
         self,
         *,
         username: Username,
@@ -36,7 +36,7 @@ class UserService:
     ) -> User:
         
         user_id = UserId(self._id_generator())
-        password_hash = UserPasswordHash(self._password_hasher.hash(raw_password))
+        password_hash = UserPasswordHash(await self._password_hasher.hash(raw_password))
         now = datetime.now(timezone.utc)
 
         return User(
@@ -74,14 +74,19 @@ class UserService:
             verified_by=UserId(None),
         )
         
-    def is_password_valid(self, user: User, raw_password: RawPassword) -> bool:
-        return self._password_hasher.verify(
+    async def is_password_valid(self, user: User, raw_password: RawPassword) -> bool:
+        return await self._password_hasher.verify(
             raw_password=raw_password,
             hashed_password=user.password_hash.value,
         )
 
-    def change_password(self, user: User, raw_password: RawPassword) -> None:
-        hashed_password = UserPasswordHash(self._password_hasher.hash(raw_password))
+    def needs_password_rehash(self, user: User) -> bool:
+        return self._password_hasher.needs_rehash(user.password_hash.value)
+
+    async def change_password(self, user: User, raw_password: RawPassword) -> None:
+        hashed_password = UserPasswordHash(
+            await self._password_hasher.hash(raw_password),
+        )
         user.password_hash = hashed_password
 
     def toggle_user_activation(self, user: User, *, is_active: bool) -> None:
@@ -1,4 +1,3 @@
-from decimal import Decimal
 import re
 from typing import ClassVar, Final
 from dataclasses import dataclass
@@ -151,15 +150,14 @@ class Username(ValueObject):
 @dataclass(frozen=True, slots=True, repr=False)
 class StreamerChallengeFixedAmount(Token):
     """raises DomainFieldError"""
-    value: Decimal
 
     def __post_init__(self) -> None:
         """:raises DomainFieldError:"""
         super(StreamerChallengeFixedAmount, self).__post_init__()
-        self._validate_streamer_challenge_fixed_amount(self.value)
+        self._validate_streamer_challenge_fixed_amount(self.minor_units)
 
-    def _validate_streamer_challenge_fixed_amount(self, streamer_challenge_fixed_amount_value: Decimal) -> None:
-        if streamer_challenge_fixed_amount_value < self.ZERO:
+    def _validate_streamer_challenge_fixed_amount(self, streamer_challenge_fixed_amount_minor_units: int) -> None:
+        if streamer_challenge_fixed_amount_minor_units < self.ZERO:
             raise DomainFieldError(
-                f"Streamer challenge fixed amount must be greater than or equal to {self.ZERO}, but got {streamer_challenge_fixed_amount_value}.",
+                f"Streamer challenge fixed amount must be greater than or equal to {self.ZERO}, but got {self.value}.",
             )
\ No newline at end of file
@@ -1,4 +1,3 @@
-from decimal import Decimal
 from datetime import datetime, timezone
 
 from app.domain.shared.ports.id_generator import IdGenerator
@@ -34,14 +33,14 @@ class WalletService:
 
     def credit(self, wallet: Wallet, amount: Token) -> None:
         """credits the wallet with the specified amount"""
-        if amount.value <= 0:
+        if amount.minor_units <= 0:
             raise DomainError("Amount must be positive")
         wallet.balance += amount
         wallet.updated_at = UpdatedAt(datetime.now(timezone.utc))
         
     def debit(self, wallet: Wallet, amount: Token) -> None:
         """debits the wallet with the specified amount"""
-        if amount.value <= 0:
+        if amount.minor_units <= 0:
             raise DomainError("Amount must be positive")
         if wallet.balance < amount:
             raise DomainError("Insufficient balance in wallet")
@@ -1,5 +1,4 @@
 from app.domain.shared.value_objects.token import Token
-from decimal import Decimal
 from app.domain.base import DomainFieldError
 from dataclasses import dataclass
 
@@ -7,15 +6,14 @@ from dataclasses import dataclass
 @dataclass(frozen=True, slots=True, repr=False)
 class Balance(Token):
     """raises DomainFieldError"""
-    value: Decimal
 
     def __post_init__(self) -> None:
         """:raises DomainFieldError:"""
         super(Balance, self).__post_init__()
-        self._validate_balance(self.value)
+        self._validate_balance(self.minor_units)
 
-    def _validate_balance(self, balance_value: Decimal) -> None:
-        if balance_value < self.ZERO:
+    def _validate_balance(self, balance_minor_units: int) -> None:
+        if balance_minor_units < self.ZERO:
             raise DomainFieldError(
-                f"Balance must be greater than or equal to {self.ZERO}, but got {balance_value}.",
+                f"Balance must be greater than or equal to {self.ZERO}, but got {self.value}.",
             )
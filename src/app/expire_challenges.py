@@ -0,0 +1,100 @@
+"""
+Fails the challenges that expired while still holding escrow
+and releases their escrow, one batch per database transaction:
+
+    python -m app.expire_challenges [--batch-size N] [--interval SECONDS]
+
+Drains the backlog once, or every `--interval` seconds until stopped.
+Batches are claimed with `FOR UPDATE SKIP LOCKED`,
+so several sweepers can run at once without settling a challenge twice.
+A challenge that cannot be settled is logged and skipped,
+and is not claimed again until the next sweep.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from dishka import AsyncContainer
+
+from app.application.commands.challenge.expire_challenges import (
+    ExpireChallengesInteractor,
+    ExpireChallengesRequest,
+)
+from app.domain.shared.value_objects.id import ProductId
+from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.setup.app_factory import create_async_ioc_container
+from app.setup.config.logs import configure_logging
+from app.setup.config.settings import AppSettings, load_settings
+from app.setup.ioc.provider_registry import get_providers
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+async def sweep(container: AsyncContainer, *, batch_size: int) -> int:
+    expired = 0
+    skipped_ids: frozenset[ProductId] = frozenset()
+    while True:
+        request = ExpireChallengesRequest(
+            batch_size=batch_size,
+            skipped_ids=skipped_ids,
+        )
+        async with container() as request_container:
+            interactor = await request_container.get(ExpireChallengesInteractor)
+            batch = await interactor.execute(request)
+        expired += batch["expired"]
+        # Skipped challenges stay expirable; without excluding them,
+        # a full batch of those would be claimed again and again.
+        skipped_ids |= frozenset(batch["skipped_ids"])
+        if batch["claimed"] < batch_size:
+            break
+    log.info(
+        "Challenge expiry sweep: done. Challenges failed: %d, skipped: %d.",
+        expired,
+        len(skipped_ids),
+    )
+    return expired
+
+
+async def run(
+    settings: AppSettings,
+    *,
+    batch_size: int,
+    interval_s: float | None,
+) -> None:
+    map_tables()
+    container = create_async_ioc_container(
+        providers=get_providers(),
+        settings=settings,
+    )
+    try:
+        await sweep(container, batch_size=batch_size)
+        while interval_s is not None:
+            await asyncio.sleep(interval_s)
+            await sweep(container, batch_size=batch_size)
+    finally:
+        await container.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--interval", type=float, default=None)
+    args = parser.parse_args()
+
+    configure_logging()
+    settings = load_settings()
+    configure_logging(level=settings.logs.level)
+
+    asyncio.run(
+        run(settings, batch_size=args.batch_size, interval_s=args.interval),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Creates users and their wallets from a CSV or NDJSON file:
+
+    python -m app.import_users FILE [--rejects PATH] [--batch-size N] [--workers N]
+
+CSV files need a `username,email,password` header;
+NDJSON files hold one object with these keys per line.
+Rows that are invalid, repeated in the file, or clash with existing users
+are written to the reject file, NDJSON next to the input by default,
+and do not stop the import.
+Passwords are hashed in a process pool of `--workers` processes.
+Exits with status 1 when any row was rejected.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from dataclasses import replace
+from functools import partial
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.domain.shared.ports.id_generator import IdGenerator
+from app.domain.user.service import UserService
+from app.domain.wallet.service import WalletService
+from app.infrastructure.adapters.password_hasher_bcrypt import (
+    BcryptCost,
+    BcryptPasswordHasher,
+    PasswordPepper,
+)
+from app.infrastructure.adapters.password_hasher_pool import (
+    PasswordHasherPool,
+    PasswordHasherPoolConfig,
+    create_hasher_executor,
+)
+from app.infrastructure.user_import.importer_sqla import (
+    DEFAULT_BATCH_SIZE,
+    SqlaUserImporter,
+)
+from app.infrastructure.user_import.report import (
+    UserImportReport,
+    write_rejected_row,
+)
+from app.infrastructure.user_import.source import (
+    detect_import_format,
+    read_import_rows,
+)
+from app.setup.app_factory import create_async_ioc_container
+from app.setup.config.logs import configure_logging
+from app.setup.config.settings import AppSettings, load_settings
+from app.setup.ioc.provider_registry import get_providers
+
+log = logging.getLogger(__name__)
+
+
+async def import_users(
+    settings: AppSettings,
+    *,
+    path: Path,
+    rejects_path: Path,
+    batch_size: int,
+    workers: int,
+) -> UserImportReport:
+    """
+    :raises DataMapperError:
+    :raises UnsupportedImportFormatError:
+    """
+    import_format = detect_import_format(path)
+    container = create_async_ioc_container(
+        providers=get_providers(),
+        settings=settings,
+    )
+    try:
+        engine = await container.get(AsyncEngine)
+        id_generator = await container.get(IdGenerator)
+        pepper = await container.get(PasswordPepper)
+        cost = await container.get(BcryptCost)
+        # Every hash of a batch is submitted at once and queues in the pool,
+        # so the pool must not turn the batch away as busy.
+        config = replace(
+            await container.get(PasswordHasherPoolConfig),
+            executor="process",
+            max_workers=workers,
+            max_concurrency=batch_size,
+        )
+        executor = create_hasher_executor(config)
+        try:
+            hasher = BcryptPasswordHasher(
+                pepper,
+                PasswordHasherPool(executor, config),
+                cost,
+            )
+            importer = SqlaUserImporter(
+                engine,
+                UserService(id_generator, hasher),
+                WalletService(id_generator),
+                batch_size=batch_size,
+            )
+            with (
+                path.open(newline="", encoding="utf-8") as source,
+                rejects_path.open("w", encoding="utf-8") as rejects,
+            ):
+                return await importer.import_rows(
+                    read_import_rows(source, import_format),
+                    partial(write_rejected_row, rejects),
+                )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    finally:
+        await container.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--rejects", type=Path, default=None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    configure_logging()
+    settings = load_settings()
+    configure_logging(level=settings.logs.level)
+
+    rejects_path = args.rejects or args.path.with_suffix(".rejects.ndjson")
+    report = asyncio.run(
+        import_users(
+            settings,
+            path=args.path,
+            rejects_path=rejects_path,
+            batch_size=args.batch_size,
+            workers=args.workers,
+        ),
+    )
+    if report.rejected:
+        log.warning("%d rows rejected, see %s.", report.rejected, rejects_path)
+    return 0 if not report.rejected else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
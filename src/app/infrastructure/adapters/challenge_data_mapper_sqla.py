@@ -1,12 +1,117 @@
-from sqlalchemy import Select, select
+from collections.abc import Collection, Mapping
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Final
+from uuid import UUID
+
+from sqlalchemy import Column, ColumnElement, Select, Update, select, update
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.application.common.ports.challenge_command_gateway import ChallengeCommandGateway
+from app.application.common.ports.challenge_command_gateway import (
+    ChallengeCommandGateway,
+)
 from app.domain.challenge.challenge import Challenge
-from app.domain.shared.value_objects.id import ProductId
+from app.domain.challenge.transitions import ChallengeActor, ChallengeTransition
+from app.domain.shared.value_objects.id import ProductId, StreamerId, UserId
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.challenge import (
+    challenges_table,
+    expirable_status_condition,
+)
+
+
+def expired_challenges_select(
+    *,
+    now: datetime,
+    limit: int,
+    exclude_ids: Collection[ProductId] = (),
+) -> Select[tuple[Any, ...]]:
+    """
+    Oldest expired challenges first, read through the partial index
+    on `expires_at`. `SKIP LOCKED` lets concurrent sweepers claim
+    disjoint batches instead of queueing behind each other's locks.
+    `exclude_ids` keeps challenges a sweep already skipped
+    from filling every later batch.
+    """
+    select_stmt = select(challenges_table).where(
+        expirable_status_condition,
+        challenges_table.c.expires_at <= now,
+    )
+    if exclude_ids:
+        select_stmt = select_stmt.where(
+            challenges_table.c.id.not_in([
+                challenge_id.value for challenge_id in exclude_ids
+            ]),
+        )
+    return (
+        select_stmt.order_by(challenges_table.c.expires_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+
+_ACTOR_COLUMNS: Final[Mapping[ChallengeActor, Column[UUID]]] = MappingProxyType({
+    ChallengeActor.STREAMER: challenges_table.c.assigned_to,
+    ChallengeActor.VIEWER: challenges_table.c.created_by,
+})
+
+
+def transition_conditions(
+    transition: ChallengeTransition,
+    *,
+    actor_id: UserId | StreamerId | None,
+) -> list[ColumnElement[bool]]:
+    """The source statuses and the actor rule of a transition."""
+    conditions: list[ColumnElement[bool]] = [
+        challenges_table.c.status.in_(sorted(transition.sources)),
+    ]
+    actor_column = _ACTOR_COLUMNS.get(transition.actor)
+    if actor_column is not None:
+        # Without an actor, `IS NULL` matches no challenge.
+        conditions.append(
+            actor_column == (actor_id.value if actor_id is not None else None),
+        )
+    return conditions
+
+
+def transitionable_challenges_select(
+    transition: ChallengeTransition,
+    *,
+    actor_id: UserId | StreamerId | None,
+) -> Select[tuple[Any, ...]]:
+    return (
+        select(challenges_table)
+        .where(*transition_conditions(transition, actor_id=actor_id))
+        .order_by(challenges_table.c.id)
+        .with_for_update()
+    )
+
+
+def transition_update(
+    transition: ChallengeTransition,
+    *,
+    actor_id: UserId | StreamerId | None,
+    challenge_ids: Collection[ProductId] | None = None,
+) -> Update:
+    """
+    Set-based counterpart of a single transition: the source statuses
+    and the actor rule become the `WHERE` clause,
+    so challenges changed meanwhile are simply not matched.
+    """
+    update_stmt = (
+        update(challenges_table)
+        .where(*transition_conditions(transition, actor_id=actor_id))
+        .values(status=transition.target)
+    )
+    if challenge_ids is not None:
+        update_stmt = update_stmt.where(
+            challenges_table.c.id.in_([
+                challenge_id.value for challenge_id in challenge_ids
+            ]),
+        )
+    return update_stmt.returning(*challenges_table.c)
 
 
 class SqlaChallengeDataMapper(ChallengeCommandGateway):
@@ -20,12 +125,23 @@ class SqlaChallengeDataMapper(ChallengeCommandGateway):
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
-    async def read_by_id(self, challenge_id: ProductId) -> Challenge | None:
+    async def read_by_id(
+        self,
+        challenge_id: ProductId,
+        for_update: bool = False,
+    ) -> Challenge | None:
         """:raises DataMapperError:"""
         select_stmt: Select[tuple[Challenge]] = select(Challenge).where(
             Challenge.id_ == challenge_id  # type: ignore
         )
 
+        if for_update:
+            # A challenge already in the session is refreshed
+            # with the row as it is once locked.
+            select_stmt = select_stmt.with_for_update().execution_options(
+                populate_existing=True,
+            )
+
         try:
             challenge: Challenge | None = (
                 await self._session.execute(select_stmt)
@@ -35,3 +151,74 @@ class SqlaChallengeDataMapper(ChallengeCommandGateway):
 
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def read_expired_for_update(
+        self,
+        *,
+        now: datetime,
+        limit: int,
+        exclude_ids: Collection[ProductId] = (),
+    ) -> list[Challenge]:
+        """:raises DataMapperError:"""
+        select_stmt = select(Challenge).from_statement(
+            expired_challenges_select(
+                now=now,
+                limit=limit,
+                exclude_ids=exclude_ids,
+            ),
+        )
+
+        try:
+            return list((await self._session.execute(select_stmt)).scalars())
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def read_transitionable_for_update(
+        self,
+        transition: ChallengeTransition,
+        *,
+        actor_id: UserId | StreamerId | None,
+    ) -> list[Challenge]:
+        """:raises DataMapperError:"""
+        select_stmt = (
+            select(Challenge)
+            .from_statement(
+                transitionable_challenges_select(transition, actor_id=actor_id),
+            )
+            .execution_options(populate_existing=True)
+        )
+
+        try:
+            return list((await self._session.execute(select_stmt)).scalars())
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def transition_all(
+        self,
+        transition: ChallengeTransition,
+        *,
+        actor_id: UserId | StreamerId | None,
+        challenge_ids: Collection[ProductId] | None = None,
+    ) -> list[Challenge]:
+        """:raises DataMapperError:"""
+        select_stmt = (
+            select(Challenge)
+            .from_statement(
+                transition_update(
+                    transition,
+                    actor_id=actor_id,
+                    challenge_ids=challenge_ids,
+                ),
+            )
+            # Challenges already in the session are refreshed
+            # with the status the update set.
+            .execution_options(populate_existing=True)
+        )
+
+        try:
+            return list((await self._session.execute(select_stmt)).scalars())
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
@@ -0,0 +1,78 @@
+from sqlalchemy import Insert, Select, event, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, UOWTransaction
+
+from app.domain.challenge.challenge_history import ChallengeHistory
+from app.domain.challenge.ports import ChallengeHistoryRecorder
+from app.domain.shared.value_objects.id import ProductId
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.challenge_history import (
+    challenge_history_table,
+)
+
+
+def history_insert(histories: list[ChallengeHistory]) -> Insert:
+    """One multi-row `INSERT ... VALUES` for the whole batch."""
+    return insert(challenge_history_table).values([
+        {
+            "id": history.id_.value,
+            "challenge_id": history.challenge_id.value,
+            "previous_status": history.previous_status,
+            "current_status": history.current_status,
+            "changed_by": (
+                history.changed_by.value if history.changed_by is not None else None
+            ),
+            "changed_at": history.changed_at.value,
+            "changes": history.changes,
+        }
+        for history in histories
+    ])
+
+
+def timeline_select(challenge_id: ProductId) -> Select[tuple[ChallengeHistory]]:
+    return (
+        select(ChallengeHistory)
+        .where(challenge_history_table.c.challenge_id == challenge_id.value)
+        .order_by(challenge_history_table.c.changed_at)
+    )
+
+
+class SqlaChallengeHistoryDataMapper(ChallengeHistoryRecorder):
+    """
+    History rows are buffered for the unit of work
+    and written by the flush that persists the challenge changes they record,
+    as one multi-row insert in the same round of statements,
+    rather than one insert per row or a separate write.
+    """
+
+    def __init__(self, session: MainAsyncSession):
+        self._session = session
+        self._pending: list[ChallengeHistory] = []
+        event.listen(session.sync_session, "after_flush", self._write_pending)
+
+    def record(self, history: ChallengeHistory) -> None:
+        self._pending.append(history)
+
+    async def read_by_challenge_id(
+        self,
+        challenge_id: ProductId,
+    ) -> list[ChallengeHistory]:
+        """:raises DataMapperError:"""
+        try:
+            result = await self._session.execute(timeline_select(challenge_id))
+            return list(result.scalars())
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    def _write_pending(
+        self,
+        session: Session,
+        _flush_context: UOWTransaction,
+    ) -> None:
+        if not self._pending:
+            return
+        histories, self._pending = self._pending, []
+        session.connection().execute(history_insert(histories))
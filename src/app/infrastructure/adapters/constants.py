@@ -6,3 +6,4 @@ DB_COMMIT_FAILED: Final[str] = "Commit failed."
 DB_FLUSH_DONE: Final[str] = "Flush was done."
 DB_FLUSH_FAILED: Final[str] = "Flush failed."
 DB_QUERY_FAILED: Final[str] = "Database query failed."
+PASSWORD_HASHER_BUSY: Final[str] = "Password hasher is saturated, try again later."
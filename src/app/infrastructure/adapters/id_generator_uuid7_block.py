@@ -0,0 +1,164 @@
+"""
+Monotonic UUIDv7 (RFC 9562), with the random bits drawn in blocks.
+
+Layout: 48-bit Unix time in milliseconds, version, a 42-bit counter
+spread over `rand_a` and the top of `rand_b`, variant, 32 random bits.
+The counter starts from a random value in each new millisecond
+and is incremented for every id generated within it,
+so ids sort in the order they were generated.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Final
+from uuid import UUID, SafeUUID
+
+import numpy as np
+
+from app.domain.shared.ports.id_generator import IdGenerator
+
+RANDOM_BLOCK_SIZE: Final[int] = 4096
+
+_COUNTER_BITS: Final[int] = 42
+_COUNTER_MAX: Final[int] = (1 << _COUNTER_BITS) - 1
+# The counter is seeded with its top bit clear,
+# leaving at least 2**41 ids per millisecond before it overflows.
+_COUNTER_SEED_SHIFT: Final[int] = 64 - (_COUNTER_BITS - 1)
+_COUNTER_LOW_BITS: Final[int] = 30
+_COUNTER_LOW_MASK: Final[int] = (1 << _COUNTER_LOW_BITS) - 1
+_RANDOM_MASK: Final[int] = (1 << 32) - 1
+_VERSION: Final[int] = 0x7 << 76
+_VARIANT: Final[int] = 0b10 << 62
+# Below this size, numpy's per-call overhead outweighs assembling ids one by one.
+_VECTORIZED_MIN_BATCH: Final[int] = 32
+
+
+def _uuid_from_int(value: int) -> UUID:
+    """
+    `UUID(int=value)` without the range check and keyword parsing,
+    which cost about as much as generating the id itself.
+    The value is built in range by the generator.
+    """
+    uuid = object.__new__(UUID)
+    # `UUID` is immutable: plain assignment and `setattr` raise here.
+    object.__setattr__(uuid, "int", value)  # noqa: PLC2801
+    object.__setattr__(uuid, "is_safe", SafeUUID.unknown)  # noqa: PLC2801
+    return uuid
+
+
+class BlockUuid7IdGenerator(IdGenerator):
+    """
+    Random bits are filled for a block of ids at once:
+    one `os.urandom` call split into 64-bit words by numpy,
+    instead of a call to the OS random source per id.
+    `generate` reserves a run of counter values under one clock reading
+    and assembles the whole batch with numpy.
+
+    Generating ids never awaits, so concurrent tasks on the event loop
+    cannot interleave within it; the lock covers callers on other threads.
+    `clock_ns` returns the current Unix time in nanoseconds.
+    """
+
+    def __init__(self, clock_ns: Callable[[], int] = time.time_ns) -> None:
+        self._clock_ns = clock_ns
+        self._random_block_size = RANDOM_BLOCK_SIZE
+        self._random = np.empty(0, dtype=np.uint64)
+        self._random_values: list[int] = []
+        self._random_index = 0
+        self._last_ms = -1
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> UUID:
+        with self._lock:
+            unix_ms, counter = self._reserve(1)
+            random = self._random_values[self._random_index]
+            self._random_index += 1
+        return _uuid_from_int(
+            unix_ms << 80
+            | _VERSION
+            | (counter >> _COUNTER_LOW_BITS) << 64
+            | _VARIANT
+            | (counter & _COUNTER_LOW_MASK) << 32
+            | random & _RANDOM_MASK,
+        )
+
+    def generate(self, n: int) -> list[UUID]:
+        if n <= 0:
+            return []
+        with self._lock:
+            unix_ms, first_counter = self._reserve(n)
+            random = self._take_random(n)
+        if n < _VECTORIZED_MIN_BATCH:
+            timestamp = unix_ms << 80 | _VERSION | _VARIANT
+            return [
+                _uuid_from_int(
+                    timestamp
+                    | (counter >> _COUNTER_LOW_BITS) << 64
+                    | (counter & _COUNTER_LOW_MASK) << 32
+                    | random_bits & _RANDOM_MASK,
+                )
+                for counter, random_bits in enumerate(
+                    random.tolist(),
+                    start=first_counter,
+                )
+            ]
+
+        counters = np.arange(first_counter, first_counter + n, dtype=np.uint64)
+        high = np.uint64(unix_ms << 16 | _VERSION >> 64) | (
+            counters >> np.uint64(_COUNTER_LOW_BITS)
+        )
+        low = (
+            np.uint64(_VARIANT)
+            | (counters & np.uint64(_COUNTER_LOW_MASK)) << np.uint64(32)
+            | random & np.uint64(_RANDOM_MASK)
+        )
+        return [
+            _uuid_from_int(high_bits << 64 | low_bits)
+            for high_bits, low_bits in zip(high.tolist(), low.tolist(), strict=True)
+        ]
+
+    def _reserve(self, n: int) -> tuple[int, int]:
+        """
+        The timestamp and the first of `n` consecutive counter values.
+        Also makes sure the random block holds at least one value.
+        """
+        if self._random_index == len(self._random_values):
+            self._refill()
+        now_ms = self._clock_ns() // 1_000_000
+        if now_ms > self._last_ms:
+            self._last_ms = now_ms
+            first_counter = self._seed_counter()
+        else:
+            # Same millisecond, or the clock went back:
+            # keep the last timestamp so that ids stay ordered.
+            first_counter = self._counter + 1
+            if first_counter + n - 1 > _COUNTER_MAX:
+                self._last_ms += 1
+                first_counter = self._seed_counter()
+        self._counter = first_counter + n - 1
+        return self._last_ms, first_counter
+
+    def _seed_counter(self) -> int:
+        seed = self._random_values[self._random_index] >> _COUNTER_SEED_SHIFT
+        self._random_index += 1
+        if self._random_index == len(self._random_values):
+            self._refill()
+        return seed
+
+    def _take_random(self, n: int) -> np.ndarray:
+        if n > self._random_block_size:
+            return np.frombuffer(os.urandom(8 * n), dtype=np.uint64)
+        if self._random_index + n > len(self._random_values):
+            self._refill()
+        random = self._random[self._random_index : self._random_index + n]
+        self._random_index += n
+        return random
+
+    def _refill(self) -> None:
+        block = os.urandom(8 * self._random_block_size)
+        self._random = np.frombuffer(block, dtype=np.uint64)
+        self._random_values = self._random.tolist()
+        self._random_index = 0
@@ -0,0 +1,134 @@
+from collections import Counter
+from collections.abc import Sequence
+
+from sqlalchemy import Insert, Update, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.application.common.ports.notification_command_gateway import (
+    NotificationCommandGateway,
+)
+from app.domain.shared.entities.notification.notification import Notification
+from app.domain.shared.value_objects.id import UserId
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.notification import (
+    notification_counters_table,
+    notifications_table,
+)
+
+
+def notifications_insert(notifications: Sequence[Notification]) -> Insert:
+    """
+    One multi-row `INSERT ... VALUES` for the whole fan-out,
+    returning the IDs of the notifications not already there.
+    """
+    stmt = pg_insert(notifications_table).values([
+        {
+            "id": notification.id_.value,
+            "product_id": notification.product_id.value,
+            "user_id": notification.user_id.value,
+            "title": notification.title,
+            "message": notification.message,
+            "created_at": notification.created_at.value,
+            "delivered_at": (
+                notification.delivered_at.value
+                if notification.delivered_at is not None
+                else None
+            ),
+            "is_read": notification.is_read,
+            "event_type": notification.event_type,
+        }
+        for notification in notifications
+    ])
+    return stmt.on_conflict_do_nothing(
+        index_elements=[
+            notifications_table.c.product_id,
+            notifications_table.c.user_id,
+            notifications_table.c.event_type,
+        ],
+    ).returning(notifications_table.c.id)
+
+
+def unread_counters_upsert(notifications: Sequence[Notification]) -> Insert:
+    """
+    Adds each recipient's new unread notifications to their counter.
+    Rows are written in `user_id` order, so concurrent fan-outs
+    lock shared counters in the same order and cannot deadlock.
+    """
+    unread = Counter(
+        notification.user_id.value
+        for notification in notifications
+        if not notification.is_read
+    )
+    stmt = pg_insert(notification_counters_table).values([
+        {"user_id": user_id, "unread": unread[user_id]} for user_id in sorted(unread)
+    ])
+    return stmt.on_conflict_do_update(
+        index_elements=[notification_counters_table.c.user_id],
+        set_={
+            "unread": notification_counters_table.c.unread + stmt.excluded.unread,
+        },
+    )
+
+
+def unread_counter_reset(user_id: UserId) -> Update:
+    return (
+        update(notification_counters_table)
+        .where(notification_counters_table.c.user_id == user_id.value)
+        .values(unread=0)
+    )
+
+
+def mark_all_read_update(user_id: UserId) -> Update:
+    return (
+        update(notifications_table)
+        .where(
+            notifications_table.c.user_id == user_id.value,
+            notifications_table.c.is_read.is_(False),
+        )
+        .values(is_read=True)
+    )
+
+
+class SqlaNotificationDataMapper(NotificationCommandGateway):
+    def __init__(self, session: MainAsyncSession):
+        self._session = session
+
+    async def add_many(self, notifications: Sequence[Notification]) -> None:
+        """:raises DataMapperError:"""
+        if not notifications:
+            return
+        try:
+            inserted_ids = set(
+                (
+                    await self._session.execute(notifications_insert(notifications))
+                ).scalars(),
+            )
+            unread = [
+                notification
+                for notification in notifications
+                if notification.id_.value in inserted_ids and not notification.is_read
+            ]
+            if unread:
+                await self._session.execute(unread_counters_upsert(unread))
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def mark_all_read(self, user_id: UserId) -> int:
+        """
+        :raises DataMapperError:
+
+        The counter is reset first, so its row lock orders this against
+        a concurrent fan-out to the same user: notifications committed
+        before the lock is granted are marked read, later ones are counted.
+        """
+        try:
+            await self._session.execute(unread_counter_reset(user_id))
+            result = await self._session.execute(mark_all_read_update(user_id))
+            return result.rowcount
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
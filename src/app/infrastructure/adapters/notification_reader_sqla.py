@@ -0,0 +1,86 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.application.common.ports.notification_query_gateway import (
+    NotificationQueryGateway,
+)
+from app.application.common.query_models.notification import NotificationQueryModel
+from app.application.common.query_params.notification import NotificationPageParams
+from app.domain.shared.value_objects.id import UserId
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import ReaderError
+from app.infrastructure.persistence_sqla.mappings.notification import (
+    notification_counters_table,
+    notifications_table,
+)
+
+
+def notification_page_select(
+    user_id: UserId,
+    params: NotificationPageParams,
+) -> Select[tuple[UUID, UUID, str, str, datetime, bool]]:
+    stmt = (
+        select(
+            notifications_table.c.id,
+            notifications_table.c.product_id,
+            notifications_table.c.title,
+            notifications_table.c.message,
+            notifications_table.c.created_at,
+            notifications_table.c.is_read,
+        )
+        .where(notifications_table.c.user_id == user_id.value)
+        .order_by(notifications_table.c.id.desc())
+        .limit(params.limit)
+    )
+    if params.before is not None:
+        stmt = stmt.where(notifications_table.c.id < params.before)
+    return stmt
+
+
+def unread_count_select(user_id: UserId) -> Select[tuple[int]]:
+    return select(notification_counters_table.c.unread).where(
+        notification_counters_table.c.user_id == user_id.value,
+    )
+
+
+class SqlaNotificationReader(NotificationQueryGateway):
+    def __init__(self, session: MainAsyncSession):
+        self._session = session
+
+    async def read_page(
+        self,
+        user_id: UserId,
+        params: NotificationPageParams,
+    ) -> list[NotificationQueryModel]:
+        """:raises ReaderError:"""
+        try:
+            result = await self._session.execute(
+                notification_page_select(user_id, params),
+            )
+            return [
+                NotificationQueryModel(
+                    id_=row.id,
+                    product_id=row.product_id,
+                    title=row.title,
+                    message=row.message,
+                    created_at=row.created_at,
+                    is_read=row.is_read,
+                )
+                for row in result.all()
+            ]
+
+        except SQLAlchemyError as error:
+            raise ReaderError(DB_QUERY_FAILED) from error
+
+    async def read_unread_count(self, user_id: UserId) -> int:
+        """:raises ReaderError:"""
+        try:
+            unread = await self._session.scalar(unread_count_select(user_id))
+            return unread or 0
+
+        except SQLAlchemyError as error:
+            raise ReaderError(DB_QUERY_FAILED) from error
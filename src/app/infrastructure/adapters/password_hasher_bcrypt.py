@@ -1,21 +1,83 @@
+import asyncio
 import base64
 import hashlib
 import hmac
-from typing import NewType
+import logging
+import time
+from dataclasses import dataclass
+from typing import Final, NewType
 
 import bcrypt
 
 from app.domain.user.ports import PasswordHasher
 from app.domain.user.value_objects import RawPassword
+from app.infrastructure.adapters.password_hasher_pool import PasswordHasherPool
+
+log = logging.getLogger(__name__)
 
 PasswordPepper = NewType("PasswordPepper", str)
+BcryptCost = NewType("BcryptCost", int)
+
+BCRYPT_MAX_COST: Final[int] = 31
+_CALIBRATION_PASSWORD: Final[bytes] = b"calibration"
+_CALIBRATION_ROUNDS: Final[int] = 3
+
+
+@dataclass(frozen=True, slots=True)
+class BcryptCostConfig:
+    target_verify_s: float
+    min_cost: int
+
+
+def calibrate_bcrypt_cost(config: BcryptCostConfig) -> BcryptCost:
+    """
+    The highest cost whose verification fits in `target_verify_s`,
+    and never less than `min_cost`.
+    Each step of the cost doubles the work, so verification is timed
+    once at `min_cost` and extrapolated; the best of a few rounds is used,
+    as the slower ones measure contention rather than the hardware.
+    """
+    hashed = bcrypt.hashpw(_CALIBRATION_PASSWORD, bcrypt.gensalt(config.min_cost))
+    elapsed_s = float("inf")
+    for _ in range(_CALIBRATION_ROUNDS):
+        started = time.perf_counter()
+        bcrypt.checkpw(_CALIBRATION_PASSWORD, hashed)
+        elapsed_s = min(elapsed_s, time.perf_counter() - started)
+
+    cost = config.min_cost
+    while cost < BCRYPT_MAX_COST and elapsed_s * 2 <= config.target_verify_s:
+        cost += 1
+        elapsed_s *= 2
+    return BcryptCost(cost)
+
+
+async def get_bcrypt_cost(config: BcryptCostConfig) -> BcryptCost:
+    cost = await asyncio.to_thread(calibrate_bcrypt_cost, config)
+    log.info(
+        "Bcrypt cost calibrated: %d (target verify %.0f ms).",
+        cost,
+        config.target_verify_s * 1000,
+    )
+    return cost
+
+
+def bcrypt_cost_of(hashed_password: bytes) -> int:
+    """Reads the cost recorded in a `$2b$<cost>$...` hash."""
+    return int(hashed_password.split(b"$", 3)[2])
 
 
 class BcryptPasswordHasher(PasswordHasher):
-    def __init__(self, pepper: PasswordPepper):
+    def __init__(
+        self,
+        pepper: PasswordPepper,
+        pool: PasswordHasherPool,
+        cost: BcryptCost,
+    ):
         self._pepper = pepper
+        self._pool = pool
+        self._cost = cost
 
-    def hash(self, raw_password: RawPassword) -> bytes:
+    async def hash(self, raw_password: RawPassword) -> bytes:
         """
         Bcrypt is limited to 72-character passwords. Adding a pepper may surpass this character count.
         To keep the input within the 72-character limit, pre-hashing can be employed.
@@ -25,10 +87,15 @@ class BcryptPasswordHasher(PasswordHasher):
         The resulting `base64(hmac-sha256(password, pepper))` string is then ready for bcrypt hashing.
         Salt is added to this string before passing it to `bcrypt` for the final hashing step.
         Inspired by: https://blog.ircmaxell.com/2015/03/security-issue-combining-bcrypt-with.html
+        The key-stretching step itself runs in the worker pool, so the event loop stays free.
+        The cost calibrated at startup is recorded in the hash by `bcrypt`,
+        which lets `needs_rehash` spot hashes made at a lower one.
+
+        :raises PasswordHasherBusyError:
         """
         base64_hmac_password: bytes = self._add_pepper(raw_password, self._pepper)
-        salt: bytes = bcrypt.gensalt()
-        return bcrypt.hashpw(base64_hmac_password, salt)
+        salt: bytes = bcrypt.gensalt(self._cost)
+        return await self._pool.run(bcrypt.hashpw, base64_hmac_password, salt)
 
     @staticmethod
     def _add_pepper(raw_password: RawPassword, pepper: PasswordPepper) -> bytes:
@@ -39,6 +106,19 @@ class BcryptPasswordHasher(PasswordHasher):
         ).digest()
         return base64.b64encode(hmac_password)
 
-    def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool:
+    async def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool:
+        """:raises PasswordHasherBusyError:"""
         base64_hmac_password: bytes = self._add_pepper(raw_password, self._pepper)
-        return bcrypt.checkpw(base64_hmac_password, hashed_password)
+        return await self._pool.run(
+            bcrypt.checkpw,
+            base64_hmac_password,
+            hashed_password,
+        )
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        """
+        Only hashes weaker than the current cost are replaced,
+        so instances calibrated on different hardware
+        do not keep rehashing each other's hashes.
+        """
+        return bcrypt_cost_of(hashed_password) < self._cost
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Literal
+
+from app.infrastructure.adapters.constants import PASSWORD_HASHER_BUSY
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+
+log = logging.getLogger(__name__)
+
+type HasherExecutorKind = Literal["thread", "process"]
+
+
+@dataclass(frozen=True, slots=True)
+class PasswordHasherPoolConfig:
+    executor: HasherExecutorKind
+    max_workers: int
+    max_concurrency: int
+    queue_timeout_s: float
+
+
+@dataclass(frozen=True, slots=True)
+class PasswordHasherPoolStats:
+    max_concurrency: int
+    in_flight: int
+    waiting: int
+    completed: int
+    rejected: int
+
+    @property
+    def saturation(self) -> float:
+        return self.in_flight / self.max_concurrency
+
+
+class PasswordHasherPool:
+    """
+    Runs CPU-bound hashing off the event loop.
+    `bcrypt` releases the GIL, so a thread pool is usually enough;
+    a process pool is available for builds where it does not.
+    At most `max_concurrency` jobs are submitted at once,
+    the rest wait up to `queue_timeout_s` and are rejected afterward.
+    """
+
+    def __init__(self, executor: Executor, config: PasswordHasherPoolConfig):
+        self._executor = executor
+        self._semaphore = asyncio.Semaphore(config.max_concurrency)
+        self._max_concurrency = config.max_concurrency
+        self._queue_timeout_s = config.queue_timeout_s
+        self._in_flight = 0
+        self._waiting = 0
+        self._completed = 0
+        self._rejected = 0
+
+    async def run[*Ts, R](self, func: Callable[[*Ts], R], *args: *Ts) -> R:
+        """:raises PasswordHasherBusyError:"""
+        await self._acquire()
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            self._semaphore.release()
+
+    async def _acquire(self) -> None:
+        """:raises PasswordHasherBusyError:"""
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(
+                self._semaphore.acquire(),
+                timeout=self._queue_timeout_s,
+            )
+        except TimeoutError as error:
+            self._rejected += 1
+            log.warning(
+                "Password hasher pool saturated: %d in flight, %d waiting.",
+                self._in_flight,
+                self._waiting,
+            )
+            raise PasswordHasherBusyError(PASSWORD_HASHER_BUSY) from error
+        finally:
+            self._waiting -= 1
+
+    @property
+    def stats(self) -> PasswordHasherPoolStats:
+        return PasswordHasherPoolStats(
+            max_concurrency=self._max_concurrency,
+            in_flight=self._in_flight,
+            waiting=self._waiting,
+            completed=self._completed,
+            rejected=self._rejected,
+        )
+
+
+def create_hasher_executor(config: PasswordHasherPoolConfig) -> Executor:
+    if config.executor == "process":
+        return ProcessPoolExecutor(max_workers=config.max_workers)
+    return ThreadPoolExecutor(
+        max_workers=config.max_workers,
+        thread_name_prefix="password-hasher",
+    )
+
+
+async def get_password_hasher_pool(
+    config: PasswordHasherPoolConfig,
+) -> AsyncIterator[PasswordHasherPool]:
+    executor = create_hasher_executor(config)
+    log.debug(
+        "Password hasher pool created: %s executor, %d workers.",
+        config.executor,
+        config.max_workers,
+    )
+    yield PasswordHasherPool(executor, config)
+    log.debug("Shutting down password hasher pool...")
+    # Waiting for running hashes would otherwise block the event loop
+    # while the other app-scoped dependencies are being closed.
+    await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+    log.debug("Password hasher pool is shut down.")
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from sqlalchemy import Update, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.domain.user.ports import PasswordHasher
+from app.domain.user.user import User
+from app.domain.user.value_objects import RawPassword
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+
+log = logging.getLogger(__name__)
+
+
+def password_hash_update(
+    user_id: UUID,
+    *,
+    old_hash: bytes,
+    new_hash: bytes,
+) -> Update:
+    """Applies only while the stored hash is still the one that was verified."""
+    return (
+        update(users_table)
+        .where(
+            users_table.c.id == user_id,
+            users_table.c.password_hash == old_hash,
+        )
+        .values(password_hash=new_hash)
+    )
+
+
+class SqlaPasswordRehasher:
+    """
+    Replaces a hash made at a lower cost than the current one
+    after a successful log-in, the only time the raw password is at hand.
+    The rehash runs in the background on its own connection,
+    so the log-in does not wait for a second round of bcrypt,
+    and a failure is only logged: the old hash still verifies.
+    A password changed in the meantime is kept, see `password_hash_update`.
+    """
+
+    def __init__(self, engine: AsyncEngine, password_hasher: PasswordHasher):
+        self._engine = engine
+        self._password_hasher = password_hasher
+        self._pending: dict[UUID, asyncio.Task[None]] = {}
+
+    def schedule(self, user: User, raw_password: RawPassword) -> None:
+        user_id = user.id_.value
+        if user_id in self._pending:
+            return
+        task = asyncio.create_task(
+            self._rehash(user_id, raw_password, user.password_hash.value),
+        )
+        self._pending[user_id] = task
+        task.add_done_callback(lambda _: self._pending.pop(user_id, None))
+
+    async def _rehash(
+        self,
+        user_id: UUID,
+        raw_password: RawPassword,
+        old_hash: bytes,
+    ) -> None:
+        try:
+            new_hash = await self._password_hasher.hash(raw_password)
+            async with self._engine.begin() as connection:
+                await connection.execute(
+                    password_hash_update(
+                        user_id,
+                        old_hash=old_hash,
+                        new_hash=new_hash,
+                    ),
+                )
+            log.debug("Password rehashed. User ID: '%s'.", user_id)
+        except Exception:
+            log.exception("Password rehash failed. User ID: '%s'.", user_id)
+
+    async def close(self) -> None:
+        if self._pending:
+            await asyncio.gather(*self._pending.values())
+
+
+async def get_password_rehasher(
+    engine: AsyncEngine,
+    password_hasher: PasswordHasher,
+) -> AsyncIterator[SqlaPasswordRehasher]:
+    rehasher = SqlaPasswordRehasher(engine, password_hasher)
+    yield rehasher
+    log.debug("Waiting for pending password rehashes...")
+    await rehasher.close()
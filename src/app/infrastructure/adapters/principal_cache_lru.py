@@ -0,0 +1,53 @@
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import NewType
+
+from app.application.common.ports.principal_cache import PrincipalCache
+from app.application.common.query_models.principal import Principal
+from app.domain.shared.value_objects.id import UserId
+
+PrincipalCacheMaxSize = NewType("PrincipalCacheMaxSize", int)
+PrincipalCacheTtl = NewType("PrincipalCacheTtl", timedelta)
+
+
+class LruPrincipalCache(PrincipalCache):
+    """
+    App-scoped, size-bounded LRU cache of principals keyed by user ID.
+    A change made in this worker invalidates its entry right away;
+    the TTL bounds how long a change made by another worker goes unseen.
+    """
+
+    def __init__(
+        self,
+        principal_cache_max_size: PrincipalCacheMaxSize,
+        principal_cache_ttl: PrincipalCacheTtl,
+    ):
+        self._max_size = principal_cache_max_size
+        self._ttl_s = principal_cache_ttl.total_seconds()
+        self._entries: OrderedDict[UserId, tuple[Principal, float]] = OrderedDict()
+
+    def get(self, user_id: UserId) -> Principal | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        principal, cached_until = entry
+        if cached_until <= time.monotonic():
+            del self._entries[user_id]
+            return None
+
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def put(self, principal: Principal) -> None:
+        if self._max_size <= 0:
+            return
+
+        self._entries[principal.id_] = (principal, time.monotonic() + self._ttl_s)
+        self._entries.move_to_end(principal.id_)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UserId) -> None:
+        self._entries.pop(user_id, None)
@@ -8,12 +8,20 @@ from app.domain.shared.entities.transaction.transaction import Transaction
 from app.domain.shared.value_objects.id import TransactionId
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.balance_projection.projection_sqla import (
+    SqlaAccountBalanceProjection,
+)
 from app.infrastructure.exceptions.gateway import DataMapperError
 
 
 class SqlaTransactionDataMapper(TransactionCommandGateway):
-    def __init__(self, session: MainAsyncSession):
+    def __init__(
+        self,
+        session: MainAsyncSession,
+        balance_projection: SqlaAccountBalanceProjection,
+    ):
         self._session = session
+        self._balance_projection = balance_projection
 
     def add(self, transaction: Transaction) -> None:
         """:raises DataMapperError:"""
@@ -23,6 +31,8 @@ class SqlaTransactionDataMapper(TransactionCommandGateway):
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
+        self._balance_projection.stage(transaction)
+
     async def read_by_id(self, transaction_id: TransactionId) -> Transaction | None:
         """:raises DataMapperError:"""
         select_stmt: Select[tuple[Transaction]] = select(Transaction).where(Transaction.id_ == transaction_id)  # type: ignore
@@ -2,12 +2,15 @@ from sqlalchemy import Select, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.query_models.principal import Principal
 from app.domain.user.user import User
+from app.domain.user.user_role import UserRole
 from app.domain.shared.value_objects.id import UserId
 from app.domain.user.value_objects import Username
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.user import users_table
 
 
 class SqlaUserDataMapper(UserCommandGateway):
@@ -39,6 +42,28 @@ class SqlaUserDataMapper(UserCommandGateway):
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
+    async def read_principal_by_id(self, user_id: UserId) -> Principal | None:
+        """
+        :raises DataMapperError:
+
+        Two columns, and no `User` hydrated into the session.
+        """
+        select_stmt: Select[tuple[UserRole, bool]] = select(
+            users_table.c.role,
+            users_table.c.is_active,
+        ).where(users_table.c.id == user_id.value)
+
+        try:
+            row = (await self._session.execute(select_stmt)).one_or_none()
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+        if row is None:
+            return None
+        role, is_active = row
+        return Principal(id_=user_id, role=role, is_active=is_active)
+
     async def read_by_username(
         self,
         username: Username,
@@ -1,3 +1,5 @@
+from collections.abc import Collection
+
 from sqlalchemy import Select, select
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -7,6 +9,7 @@ from app.domain.shared.value_objects.id import UserId
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.wallet import wallets_table
 
 
 class SqlaWalletDataMapper(WalletCommandGateway):
@@ -55,3 +58,32 @@ class SqlaWalletDataMapper(WalletCommandGateway):
 
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def read_by_user_ids(
+        self,
+        user_ids: Collection[UserId],
+        for_update: bool = False,
+    ) -> list[Wallet]:
+        """
+        :raises DataMapperError:
+
+        Wallets are read in `id` order, so transactions locking
+        overlapping sets of wallets lock them in the same order
+        and cannot deadlock on each other.
+        """
+        select_stmt: Select[tuple[Wallet]] = (
+            select(Wallet)
+            .where(
+                wallets_table.c.owner_id.in_([user_id.value for user_id in user_ids]),
+            )
+            .order_by(wallets_table.c.id)
+        )
+
+        if for_update:
+            select_stmt = select_stmt.with_for_update()
+
+        try:
+            return list((await self._session.execute(select_stmt)).scalars())
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
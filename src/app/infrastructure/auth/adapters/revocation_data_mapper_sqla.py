@@ -0,0 +1,75 @@
+from datetime import datetime
+
+from sqlalchemy import Select, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.auth.adapters.types import AuthAsyncSession
+from app.infrastructure.auth.session.model import AuthSessionRevocation
+from app.infrastructure.auth.session.ports.revocation_gateway import (
+    AuthSessionRevocationGateway,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.commit_order import xact_horizon_select
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_session_revocations_table,
+)
+
+
+def revocations_since_select(
+    sync_horizon: int,
+    *,
+    now: datetime,
+) -> Select[tuple[AuthSessionRevocation]]:
+    """
+    Filtered on the transaction that inserted each row rather than its ID:
+    IDs are taken in insert order, so a revocation committed late
+    can carry a lower ID than one already read.
+    Revocations whose tokens have expired are left out,
+    which also keeps the first sync of a worker small.
+    """
+    return (
+        select(AuthSessionRevocation)
+        .where(
+            auth_session_revocations_table.c.xact_id >= sync_horizon,
+            auth_session_revocations_table.c.expires_at > now,
+        )
+        .order_by(auth_session_revocations_table.c.id)
+    )
+
+
+class SqlaAuthSessionRevocationDataMapper(AuthSessionRevocationGateway):
+    def __init__(self, session: AuthAsyncSession):
+        self._session = session
+
+    def add(self, revocation: AuthSessionRevocation) -> None:
+        """:raises DataMapperError:"""
+        try:
+            self._session.add(revocation)
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def read_sync_horizon(self) -> int:
+        """:raises DataMapperError:"""
+        try:
+            return (await self._session.execute(xact_horizon_select())).scalar_one()
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def read_since(
+        self,
+        sync_horizon: int,
+        *,
+        now: datetime,
+    ) -> list[AuthSessionRevocation]:
+        """:raises DataMapperError:"""
+        try:
+            result = await self._session.execute(
+                revocations_since_select(sync_horizon, now=now),
+            )
+            return list(result.scalars().all())
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
@@ -1,4 +1,5 @@
 import logging
+from typing import Final
 
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -8,23 +9,51 @@ from app.infrastructure.adapters.constants import (
     DB_QUERY_FAILED,
 )
 from app.infrastructure.auth.adapters.types import AuthAsyncSession
+from app.infrastructure.auth.session.model import AuthSession, AuthSessionRevocation
 from app.infrastructure.auth.session.ports.transaction_manager import (
     AuthSessionTransactionManager,
 )
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.config import SqlaEngineConfig
 
 log = logging.getLogger(__name__)
 
+AUTH_COMMIT_WITH_MAIN_CHANGES: Final[str] = (
+    "Auth commit refused: the shared session has pending Main changes."
+)
+
 
 class SqlaAuthSessionTransactionManager(AuthSessionTransactionManager):
-    def __init__(self, session: AuthAsyncSession):
+    """
+    With `share_auth_session`, the auth session is the Main one,
+    so a commit here would also commit the Main context's pending changes.
+    It is refused instead: the auth context only commits where
+    the Main one has nothing pending.
+    """
+
+    def __init__(self, session: AuthAsyncSession, engine_config: SqlaEngineConfig):
         self._session = session
+        self._shares_main_session = engine_config.share_auth_session
 
     async def commit(self) -> None:
         """:raises DataMapperError:"""
+        if self._shares_main_session and self._has_main_changes():
+            log.error(AUTH_COMMIT_WITH_MAIN_CHANGES)
+            raise DataMapperError(AUTH_COMMIT_WITH_MAIN_CHANGES)
+
         try:
             await self._session.commit()
             log.debug("%s Auth session.", DB_COMMIT_DONE)
 
         except SQLAlchemyError as error:
             raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from error
+
+    def _has_main_changes(self) -> bool:
+        return any(
+            not isinstance(instance, (AuthSession, AuthSessionRevocation))
+            for instance in (
+                *self._session.new,
+                *self._session.dirty,
+                *self._session.deleted,
+            )
+        )
@@ -7,3 +7,11 @@ class AuthenticationError(InfrastructureError):
 
 class AlreadyAuthenticatedError(InfrastructureError):
     pass
+
+
+class LoginThrottledError(InfrastructureError):
+    def __init__(self, retry_after_s: float):
+        self.retry_after_s = retry_after_s
+        super().__init__(
+            f"Too many log-in attempts. Try again in {retry_after_s:.0f} seconds.",
+        )
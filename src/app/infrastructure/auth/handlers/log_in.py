@@ -8,9 +8,11 @@ from app.domain.user.service import UserService
 from app.domain.user.user import User
 
 from app.domain.user.value_objects import RawPassword, Username
+from app.infrastructure.adapters.password_rehasher_sqla import SqlaPasswordRehasher
 from app.infrastructure.auth.exceptions import (
     AlreadyAuthenticatedError,
     AuthenticationError,
+    LoginThrottledError,
 )
 from app.infrastructure.auth.handlers.constants import (
     AUTH_ACCOUNT_INACTIVE,
@@ -18,6 +20,13 @@ from app.infrastructure.auth.handlers.constants import (
 )
 from app.infrastructure.auth.session.constants import AUTH_INVALID_PASSWORD
 from app.infrastructure.auth.session.service import AuthSessionService
+from app.infrastructure.auth.throttle.limiter_memory import (
+    InMemoryLoginThrottle,
+    login_throttle_keys,
+)
+from app.infrastructure.auth.throttle.ports.client_address import (
+    ClientAddressProvider,
+)
 
 log = logging.getLogger(__name__)
 
@@ -40,6 +49,11 @@ class LogInHandler:
     when accessing protected routes before expiration.
     - If the JWT is invalid, expired, or the session is terminated,
     the user loses authentication.
+    - A password hashed at a lower cost than the current one
+    is rehashed in the background.
+    - Attempts are throttled per username and client address,
+    with growing lockouts after repeated failures,
+    before the user is looked up or the password is verified.
     """
 
     def __init__(
@@ -48,11 +62,17 @@ class LogInHandler:
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         auth_session_service: AuthSessionService,
+        password_rehasher: SqlaPasswordRehasher,
+        login_throttle: InMemoryLoginThrottle,
+        client_address_provider: ClientAddressProvider,
     ):
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._auth_session_service = auth_session_service
+        self._password_rehasher = password_rehasher
+        self._login_throttle = login_throttle
+        self._client_address_provider = client_address_provider
 
     async def execute(self, request_data: LogInRequest) -> None:
         """
@@ -62,11 +82,21 @@ class LogInHandler:
         :raises DomainFieldError:
         :raises UserNotFoundByUsernameError:
         :raises AuthenticationError:
+        :raises LoginThrottledError:
+        :raises PasswordHasherBusyError:
         """
         log.info("Log in: started. Username: '%s'.", request_data.username)
 
+        throttle_keys = login_throttle_keys(
+            request_data.username,
+            self._client_address_provider.get_client_address(),
+        )
+        retry_after_s = self._login_throttle.acquire(throttle_keys)
+        if retry_after_s is not None:
+            raise LoginThrottledError(retry_after_s)
+
         try:
-            await self._current_user_service.get_current_user()
+            await self._current_user_service.get_current_principal()
             raise AlreadyAuthenticatedError(AUTH_ALREADY_AUTHENTICATED)
         except AuthenticationError:
             pass
@@ -76,16 +106,23 @@ class LogInHandler:
 
         user: User | None = await self._user_command_gateway.read_by_username(username)
         if user is None:
+            self._login_throttle.record_failure(throttle_keys)
             raise UserNotFoundByUsernameError(username)
 
-        if not self._user_service.is_password_valid(user, password):
+        if not await self._user_service.is_password_valid(user, password):
+            self._login_throttle.record_failure(throttle_keys)
             raise AuthenticationError(AUTH_INVALID_PASSWORD)
 
+        self._login_throttle.record_success(throttle_keys[0])
+
         if not user.is_active:
             raise AuthenticationError(AUTH_ACCOUNT_INACTIVE)
 
         await self._auth_session_service.issue_session(user.id_)
 
+        if self._user_service.needs_password_rehash(user):
+            self._password_rehasher.schedule(user, password)
+
         log.info(
             "Log in: done. User, ID: '%s', username '%s', role '%s'.",
             user.id_.value,
@@ -29,7 +29,7 @@ class LogOutHandler:
         """
         log.info("Log out: started for unknown user.")
 
-        current_user = await self._current_user_service.get_current_user()
+        current_user = await self._current_user_service.get_current_principal()
 
         log.info("Log out: user identified. User ID: '%s'.", current_user.id_)
 
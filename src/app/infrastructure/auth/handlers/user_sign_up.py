@@ -69,11 +69,12 @@ class UserSignUpHandler:
         :raises DomainFieldError:
         :raises RoleAssignmentNotPermittedError:
         :raises UsernameAlreadyExistsError:
+        :raises PasswordHasherBusyError:
         """
         log.info("Sign up: started. Username: '%s'.", request_data.username)
 
         try:
-            await self._current_user_service.get_current_user()
+            await self._current_user_service.get_current_principal()
             raise AlreadyAuthenticatedError(AUTH_ALREADY_AUTHENTICATED)
         except AuthenticationError:
             pass
@@ -82,7 +83,7 @@ class UserSignUpHandler:
         password = RawPassword(request_data.password)
         email = Email(request_data.email)
         
-        user = self._user_service.create_user(
+        user = await self._user_service.create_user(
             username=username,
             raw_password=password,
             email=email,
@@ -0,0 +1,116 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import NewType
+
+from app.domain.shared.value_objects.id import UserId
+from app.infrastructure.auth.session.model import AuthSession
+
+AuthSessionCacheMaxSize = NewType("AuthSessionCacheMaxSize", int)
+AuthSessionCacheTtl = NewType("AuthSessionCacheTtl", timedelta)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthSessionCacheStats:
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedAuthSession:
+    user_id: UserId
+    expiration: datetime
+    cached_until: float
+
+
+class LruAuthSessionCache:
+    """
+    App-scoped, size-bounded LRU cache of auth sessions keyed by session ID.
+    Entries also expire after a TTL, which bounds how long a session deleted
+    by another worker can still be served from here.
+    Plain values are stored instead of mapped instances,
+    so every lookup returns a fresh `AuthSession` not bound to any ORM session.
+    """
+
+    def __init__(
+        self,
+        auth_session_cache_max_size: AuthSessionCacheMaxSize,
+        auth_session_cache_ttl: AuthSessionCacheTtl,
+    ):
+        self._max_size = auth_session_cache_max_size
+        self._ttl_s = auth_session_cache_ttl.total_seconds()
+        self._entries: OrderedDict[str, _CachedAuthSession] = OrderedDict()
+        self._ids_by_user: dict[UserId, set[str]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, auth_session_id: str) -> AuthSession | None:
+        entry = self._entries.get(auth_session_id)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.cached_until <= time.monotonic():
+            self.invalidate(auth_session_id)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(auth_session_id)
+        self._hits += 1
+        return AuthSession(
+            id_=auth_session_id,
+            user_id=entry.user_id,
+            expiration=entry.expiration,
+        )
+
+    def put(self, auth_session: AuthSession) -> None:
+        if self._max_size <= 0:
+            return
+
+        self.invalidate(auth_session.id_)
+        self._entries[auth_session.id_] = _CachedAuthSession(
+            user_id=auth_session.user_id,
+            expiration=auth_session.expiration,
+            cached_until=time.monotonic() + self._ttl_s,
+        )
+        self._ids_by_user.setdefault(auth_session.user_id, set()).add(
+            auth_session.id_,
+        )
+
+        while len(self._entries) > self._max_size:
+            oldest_id = next(iter(self._entries))
+            self.invalidate(oldest_id)
+            self._evictions += 1
+
+    def invalidate(self, auth_session_id: str) -> None:
+        entry = self._entries.pop(auth_session_id, None)
+        if entry is None:
+            return
+
+        user_session_ids = self._ids_by_user.get(entry.user_id)
+        if user_session_ids is not None:
+            user_session_ids.discard(auth_session_id)
+            if not user_session_ids:
+                del self._ids_by_user[entry.user_id]
+
+    def invalidate_user(self, user_id: UserId) -> None:
+        for auth_session_id in self._ids_by_user.pop(user_id, set()):
+            self._entries.pop(auth_session_id, None)
+
+    @property
+    def stats(self) -> AuthSessionCacheStats:
+        return AuthSessionCacheStats(
+            size=len(self._entries),
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
@@ -5,6 +5,7 @@ AUTH_IS_UNAVAILABLE: Final[str] = (
     "Authentication is currently unavailable. Please try again later."
 )
 AUTH_NOT_AUTHENTICATED: Final[str] = "Not authenticated."
+AUTH_SESSION_DENYLIST_SYNC_FAILED: Final[str] = "Auth session denylist sync failed."
 AUTH_SESSION_EXPIRED: Final[str] = "Session expired."
 AUTH_SESSION_EXTENSION_FAILED: Final[str] = "Auth session extension failed."
 AUTH_SESSION_EXTRACTION_FAILED: Final[str] = "Auth session extraction failed."
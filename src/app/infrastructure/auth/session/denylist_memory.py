@@ -0,0 +1,91 @@
+import time
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import NewType
+
+from app.domain.shared.value_objects.id import UserId
+from app.infrastructure.auth.session.model import (
+    AuthSessionClaims,
+    AuthSessionRevocation,
+)
+
+AuthSessionDenylistSyncInterval = NewType(
+    "AuthSessionDenylistSyncInterval",
+    timedelta,
+)
+
+
+class InMemoryAuthSessionDenylist:
+    """
+    App-scoped mirror of the `auth_session_revocations` table.
+    Workers pull the rows committed since their previous sync
+    at most once per sync interval, so a revocation made by one worker
+    reaches the others within that interval.
+    Rows near the sync horizon are pulled twice and applied idempotently.
+    Entries are dropped once the revoked tokens could no longer be valid anyway,
+    which keeps the sets small enough that exact lookups stay cheap.
+    A positive answer only means "consult the storage",
+    so false positives cost a query and never a wrong authentication.
+    """
+
+    def __init__(self, sync_interval: AuthSessionDenylistSyncInterval):
+        self._sync_interval_s = sync_interval.total_seconds()
+        self._synced_at: float | None = None
+        self._sync_horizon = 0
+        self._revoked_sessions: dict[str, datetime] = {}
+        self._revoked_users: dict[UserId, tuple[datetime, datetime]] = {}
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self._synced_at is None
+            or time.monotonic() - self._synced_at >= self._sync_interval_s
+        )
+
+    @property
+    def sync_horizon(self) -> int:
+        return self._sync_horizon
+
+    def apply(
+        self,
+        revocations: Iterable[AuthSessionRevocation],
+        *,
+        sync_horizon: int,
+        now: datetime,
+    ) -> None:
+        for revocation in revocations:
+            self.add(revocation)
+        self._sync_horizon = sync_horizon
+        self._prune(now)
+        self._synced_at = time.monotonic()
+
+    def add(self, revocation: AuthSessionRevocation) -> None:
+        if revocation.auth_session_id is not None:
+            self._revoked_sessions[revocation.auth_session_id] = revocation.expires_at
+            return
+
+        known = self._revoked_users.get(revocation.user_id)
+        if known is None or known[0] < revocation.revoked_at:
+            self._revoked_users[revocation.user_id] = (
+                revocation.revoked_at,
+                revocation.expires_at,
+            )
+
+    def may_be_revoked(self, claims: AuthSessionClaims) -> bool:
+        if claims.auth_session_id in self._revoked_sessions:
+            return True
+
+        revoked_user = self._revoked_users.get(claims.user_id)
+        return revoked_user is not None and claims.issued_at <= revoked_user[0]
+
+    def _prune(self, now: datetime) -> None:
+        self._revoked_sessions = {
+            auth_session_id: expires_at
+            for auth_session_id, expires_at in self._revoked_sessions.items()
+            if expires_at > now
+        }
+        self._revoked_users = {
+            user_id: entry
+            for user_id, entry in self._revoked_users.items()
+            if entry[1] > now
+        }
@@ -0,0 +1,103 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator, Mapping
+from datetime import datetime, timedelta
+from typing import NewType
+
+from sqlalchemy import DateTime, String, Update, column, update, values
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.auth.session.constants import AUTH_SESSION_EXTENSION_FAILED
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_sessions_table,
+)
+
+log = logging.getLogger(__name__)
+
+AuthSessionExtensionFlushInterval = NewType(
+    "AuthSessionExtensionFlushInterval",
+    timedelta,
+)
+
+
+def auth_session_expirations_update(expirations: Mapping[str, datetime]) -> Update:
+    """
+    One `UPDATE ... FROM (VALUES ...)` for the whole batch.
+    An expiration is only ever moved forward, so a batch from a worker
+    that extended a session earlier than another cannot shorten it,
+    and a session deleted in the meantime is simply not matched.
+    """
+    extensions = values(
+        column("id", String),
+        column("expiration", DateTime(timezone=True)),
+        name="extensions",
+    ).data(list(expirations.items()))
+    return (
+        update(auth_sessions_table)
+        .where(
+            auth_sessions_table.c.id == extensions.c.id,
+            auth_sessions_table.c.expiration < extensions.c.expiration,
+        )
+        .values(expiration=extensions.c.expiration)
+    )
+
+
+class SqlaAuthSessionExtensionFlusher:
+    """
+    Collects session extensions and writes them once per flush interval,
+    off the request path, so concurrent requests of one browser
+    landing in the refresh window cost a single row update between them.
+    A session extended again before the flush keeps only its latest expiration.
+    A failed flush is retried with the next one: until then,
+    storage holds the old expiration, which is still in the future.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self._engine = engine
+        self._pending: dict[str, datetime] = {}
+
+    def schedule(self, auth_session_id: str, expiration: datetime) -> None:
+        pending = self._pending.get(auth_session_id)
+        if pending is None or pending < expiration:
+            self._pending[auth_session_id] = expiration
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        expirations, self._pending = self._pending, {}
+        try:
+            async with self._engine.begin() as connection:
+                await connection.execute(
+                    auth_session_expirations_update(expirations),
+                )
+        except Exception:
+            for auth_session_id, expiration in expirations.items():
+                self.schedule(auth_session_id, expiration)
+            raise
+        log.debug("Auth session extensions flushed: %d.", len(expirations))
+
+    async def run(self, interval_s: float) -> None:
+        while True:
+            await asyncio.sleep(interval_s)
+            try:
+                await self.flush()
+            except Exception:
+                log.exception(AUTH_SESSION_EXTENSION_FAILED)
+
+
+async def get_auth_session_extension_flusher(
+    engine: AsyncEngine,
+    interval: AuthSessionExtensionFlushInterval,
+) -> AsyncIterator[SqlaAuthSessionExtensionFlusher]:
+    flusher = SqlaAuthSessionExtensionFlusher(engine)
+    task = asyncio.create_task(flusher.run(interval.total_seconds()))
+    yield flusher
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+    log.debug("Flushing remaining auth session extensions...")
+    try:
+        await flusher.flush()
+    except Exception:
+        log.exception(AUTH_SESSION_EXTENSION_FAILED)
@@ -17,3 +17,28 @@ class AuthSession:
     id_: str
     user_id: UserId
     expiration: datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthSessionClaims:
+    """Auth session data carried by a verified access token."""
+
+    auth_session_id: str
+    user_id: UserId
+    issued_at: datetime
+    expiration: datetime
+
+
+@dataclass(eq=False, kw_only=True)
+class AuthSessionRevocation:
+    """
+    Record of a revoked auth session, or of all sessions of a user
+    issued up to `revoked_at` when `auth_session_id` is `None`.
+    Kept until `expires_at`, after which no revoked token can still be valid.
+    """
+
+    id_: int | None = None
+    auth_session_id: str | None
+    user_id: UserId
+    revoked_at: datetime
+    expires_at: datetime
@@ -0,0 +1,34 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Protocol
+
+from app.infrastructure.auth.session.model import AuthSessionRevocation
+
+
+class AuthSessionRevocationGateway(Protocol):
+    """
+    Defined to allow easier mocking and swapping
+    of implementations in the same layer.
+    """
+
+    @abstractmethod
+    def add(self, revocation: AuthSessionRevocation) -> None:
+        """:raises DataMapperError:"""
+
+    @abstractmethod
+    async def read_sync_horizon(self) -> int:
+        """:raises DataMapperError:"""
+
+    @abstractmethod
+    async def read_since(
+        self,
+        sync_horizon: int,
+        *,
+        now: datetime,
+    ) -> list[AuthSessionRevocation]:
+        """
+        :raises DataMapperError:
+
+        Revocations committed since `sync_horizon` was read, and possibly
+        some read before: the caller applies them idempotently.
+        """
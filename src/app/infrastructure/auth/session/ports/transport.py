@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from typing import Protocol
 
-from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.model import AuthSession, AuthSessionClaims
 
 
 class AuthSessionTransport(Protocol):
@@ -11,5 +11,8 @@ class AuthSessionTransport(Protocol):
     @abstractmethod
     def extract_id(self) -> str | None: ...
 
+    @abstractmethod
+    def extract_claims(self) -> AuthSessionClaims | None: ...
+
     @abstractmethod
     def remove_current(self) -> None: ...
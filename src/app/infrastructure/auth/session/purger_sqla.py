@@ -0,0 +1,170 @@
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Final
+
+from psycopg import errors as pg_errors
+from sqlalchemy import Delete, TextClause, delete, select, text
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_session_revocations_table,
+    auth_sessions_table,
+)
+
+log = logging.getLogger(__name__)
+
+DEFAULT_LOCK_TIMEOUT_MS: Final[int] = 500
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthSessionPurgeMetrics:
+    """`lock_timed_out` means the run stopped early and left rows behind."""
+
+    deleted: int
+    revocations_deleted: int
+    chunks: int
+    lock_timed_out: bool
+    duration_s: float
+
+
+def lock_timeout_set(lock_timeout_ms: int) -> TextClause:
+    """Local to the transaction, like `SET LOCAL`, but takes a bound value."""
+    return text("SELECT set_config('lock_timeout', :lock_timeout, true)").bindparams(
+        lock_timeout=f"{lock_timeout_ms}ms",
+    )
+
+
+def expired_auth_sessions_delete(*, now: datetime, chunk_size: int) -> Delete:
+    """
+    Deletes at most `chunk_size` expired sessions, found through the
+    expiration index. Rows another transaction holds, such as a session
+    being terminated, are skipped and left to the next chunk or run.
+    """
+    chunk = (
+        select(auth_sessions_table.c.id)
+        .where(auth_sessions_table.c.expiration <= now)
+        .limit(chunk_size)
+        .with_for_update(skip_locked=True)
+    )
+    return delete(auth_sessions_table).where(
+        auth_sessions_table.c.id.in_(chunk.scalar_subquery()),
+    )
+
+
+def expired_auth_session_revocations_delete(
+    *,
+    now: datetime,
+    chunk_size: int,
+) -> Delete:
+    """
+    Deletes at most `chunk_size` revocations whose tokens have expired:
+    denylists no longer load them, and they could only match
+    tokens that are rejected anyway.
+    """
+    chunk = (
+        select(auth_session_revocations_table.c.id)
+        .where(auth_session_revocations_table.c.expires_at <= now)
+        .limit(chunk_size)
+        .with_for_update(skip_locked=True)
+    )
+    return delete(auth_session_revocations_table).where(
+        auth_session_revocations_table.c.id.in_(chunk.scalar_subquery()),
+    )
+
+
+class SqlaAuthSessionPurger:
+    """
+    Deletes expired auth sessions, then the revocations of expired tokens,
+    in chunks, one short transaction each,
+    so that no chunk holds its row locks for long or bloats a single
+    transaction. Each chunk gives up waiting for a lock after
+    `lock_timeout_ms`; the run then stops and the next one carries on.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self._engine = engine
+
+    async def purge(
+        self,
+        *,
+        chunk_size: int,
+        lock_timeout_ms: int = DEFAULT_LOCK_TIMEOUT_MS,
+    ) -> AuthSessionPurgeMetrics:
+        """:raises DataMapperError:"""
+        started = time.perf_counter()
+        now = datetime.now(UTC)
+        deleted, chunks, lock_timed_out = await self._purge_table(
+            expired_auth_sessions_delete,
+            now=now,
+            chunk_size=chunk_size,
+            lock_timeout_ms=lock_timeout_ms,
+        )
+        revocations_deleted = 0
+        if not lock_timed_out:
+            (
+                revocations_deleted,
+                revocation_chunks,
+                lock_timed_out,
+            ) = await self._purge_table(
+                expired_auth_session_revocations_delete,
+                now=now,
+                chunk_size=chunk_size,
+                lock_timeout_ms=lock_timeout_ms,
+            )
+            chunks += revocation_chunks
+
+        return AuthSessionPurgeMetrics(
+            deleted=deleted,
+            revocations_deleted=revocations_deleted,
+            chunks=chunks,
+            lock_timed_out=lock_timed_out,
+            duration_s=time.perf_counter() - started,
+        )
+
+    async def _purge_table(
+        self,
+        chunk_delete: Callable[..., Delete],
+        *,
+        now: datetime,
+        chunk_size: int,
+        lock_timeout_ms: int,
+    ) -> tuple[int, int, bool]:
+        """
+        :raises DataMapperError:
+
+        Rows deleted, chunks and whether a lock timeout stopped the run.
+        """
+        deleted = 0
+        chunks = 0
+        while True:
+            try:
+                chunk_deleted = await self._purge_chunk(
+                    chunk_delete(now=now, chunk_size=chunk_size),
+                    lock_timeout_ms=lock_timeout_ms,
+                )
+
+            except DBAPIError as error:
+                if not isinstance(error.orig, pg_errors.LockNotAvailable):
+                    raise DataMapperError(DB_QUERY_FAILED) from error
+                log.warning("Auth session purge: lock timeout, stopping early.")
+                return deleted, chunks, True
+
+            except SQLAlchemyError as error:
+                raise DataMapperError(DB_QUERY_FAILED) from error
+
+            deleted += chunk_deleted
+            chunks += 1
+            if chunk_deleted < chunk_size:
+                return deleted, chunks, False
+
+    async def _purge_chunk(self, statement: Delete, *, lock_timeout_ms: int) -> int:
+        async with self._engine.begin() as connection:
+            await connection.execute(lock_timeout_set(lock_timeout_ms))
+            result = await connection.execute(statement)
+            return result.rowcount
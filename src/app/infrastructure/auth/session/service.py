@@ -3,26 +3,39 @@ from datetime import datetime
 
 from app.domain.shared.value_objects.id import UserId
 from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.auth.session.cache_lru import LruAuthSessionCache
 from app.infrastructure.auth.session.constants import (
     AUTH_IS_UNAVAILABLE,
     AUTH_NOT_AUTHENTICATED,
+    AUTH_SESSION_DENYLIST_SYNC_FAILED,
     AUTH_SESSION_EXPIRED,
-    AUTH_SESSION_EXTENSION_FAILED,
     AUTH_SESSION_EXTRACTION_FAILED,
     AUTH_SESSION_NOT_FOUND,
 )
+from app.infrastructure.auth.session.denylist_memory import (
+    InMemoryAuthSessionDenylist,
+)
+from app.infrastructure.auth.session.extension_flusher_sqla import (
+    SqlaAuthSessionExtensionFlusher,
+)
 from app.infrastructure.auth.session.id_generator_str import (
     StrAuthSessionIdGenerator,
 )
-from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.model import AuthSession, AuthSessionRevocation
 from app.infrastructure.auth.session.ports.gateway import (
     AuthSessionGateway,
 )
+from app.infrastructure.auth.session.ports.revocation_gateway import (
+    AuthSessionRevocationGateway,
+)
 from app.infrastructure.auth.session.ports.transaction_manager import (
     AuthSessionTransactionManager,
 )
 from app.infrastructure.auth.session.ports.transport import AuthSessionTransport
 from app.infrastructure.auth.session.timer_utc import UtcAuthSessionTimer
+from app.infrastructure.auth.session.validation_mode import (
+    AuthSessionValidationMode,
+)
 from app.infrastructure.exceptions.gateway import DataMapperError
 
 log = logging.getLogger(__name__)
@@ -36,12 +49,22 @@ class AuthSessionService:
         auth_transaction_manager: AuthSessionTransactionManager,
         auth_session_id_generator: StrAuthSessionIdGenerator,
         auth_session_timer: UtcAuthSessionTimer,
+        auth_session_cache: LruAuthSessionCache,
+        auth_session_revocation_gateway: AuthSessionRevocationGateway,
+        auth_session_denylist: InMemoryAuthSessionDenylist,
+        auth_session_validation_mode: AuthSessionValidationMode,
+        auth_session_extension_flusher: SqlaAuthSessionExtensionFlusher,
     ):
         self._auth_session_gateway = auth_session_gateway
         self._auth_session_transport = auth_session_transport
         self._auth_transaction_manager = auth_transaction_manager
         self._auth_session_id_generator = auth_session_id_generator
         self._auth_session_timer = auth_session_timer
+        self._auth_session_cache = auth_session_cache
+        self._auth_session_revocation_gateway = auth_session_revocation_gateway
+        self._auth_session_denylist = auth_session_denylist
+        self._auth_session_validation_mode = auth_session_validation_mode
+        self._auth_session_extension_flusher = auth_session_extension_flusher
         self._cached_auth_session: AuthSession | None = None
 
     async def issue_session(self, user_id: UserId) -> None:
@@ -63,6 +86,7 @@ class AuthSessionService:
         except DataMapperError as error:
             raise AuthenticationError(AUTH_IS_UNAVAILABLE) from error
 
+        self._auth_session_cache.put(auth_session)
         self._auth_session_transport.deliver(auth_session)
 
         log.debug(
@@ -75,6 +99,17 @@ class AuthSessionService:
         """:raises AuthenticationError:"""
         log.debug("Get authenticated user ID: started.")
 
+        stateless_auth_session = await self._get_stateless_auth_session()
+        if stateless_auth_session is not None:
+            self._cached_auth_session = stateless_auth_session
+            log.debug(
+                "Get authenticated user ID: done (stateless). "
+                "Auth session ID: '%s'. User ID: '%s'.",
+                stateless_auth_session.id_,
+                stateless_auth_session.user_id.value,
+            )
+            return stateless_auth_session.user_id
+
         raw_auth_session = await self._get_current_auth_session()
         valid_auth_session = await self._validate_and_extend_session(raw_auth_session)
         self._cached_auth_session = valid_auth_session
@@ -90,8 +125,10 @@ class AuthSessionService:
         log.debug("Terminate current session: started. Auth session ID: unknown.")
 
         auth_session_id: str | None
+        user_id: UserId | None
         if self._cached_auth_session is not None:
             auth_session_id = self._cached_auth_session.id_
+            user_id = self._cached_auth_session.user_id
             log.debug(
                 "Terminate current session: using ID from cache. "
                 "Auth session ID: '%s'.",
@@ -106,6 +143,8 @@ class AuthSessionService:
                     "Auth session can't be identified.",
                 )
                 return
+            claims = self._auth_session_transport.extract_claims()
+            user_id = claims.user_id if claims is not None else None
             log.debug(
                 "Terminate current session: using ID from transport. "
                 "Auth session ID: '%s'.",
@@ -113,9 +152,12 @@ class AuthSessionService:
             )
 
         self._auth_session_transport.remove_current()
+        self._auth_session_cache.invalidate(auth_session_id)
 
         try:
             await self._auth_session_gateway.delete(auth_session_id)
+            if user_id is not None:
+                self._revoke(user_id=user_id, auth_session_id=auth_session_id)
             await self._auth_transaction_manager.commit()
             log.debug(
                 "Terminate current session: done (transport cleared, storage deleted). "
@@ -141,7 +183,9 @@ class AuthSessionService:
         )
 
         await self._auth_session_gateway.delete_all_for_user(user_id)
+        self._revoke(user_id=user_id, auth_session_id=None)
         await self._auth_transaction_manager.commit()
+        self._auth_session_cache.invalidate_user(user_id)
 
         if self._cached_auth_session and self._cached_auth_session.user_id == user_id:
             self._auth_session_transport.remove_current()
@@ -152,6 +196,75 @@ class AuthSessionService:
             user_id.value,
         )
 
+    def _revoke(self, *, user_id: UserId, auth_session_id: str | None) -> None:
+        """
+        :raises DataMapperError:
+
+        Records the revocation so that stateless validation in every worker
+        stops trusting the affected tokens. Persisted with the caller's commit.
+        """
+        if self._auth_session_validation_mode != AuthSessionValidationMode.STATELESS:
+            return
+
+        revocation = AuthSessionRevocation(
+            auth_session_id=auth_session_id,
+            user_id=user_id,
+            revoked_at=self._auth_session_timer.current_time,
+            expires_at=self._auth_session_timer.auth_session_expiration,
+        )
+        self._auth_session_revocation_gateway.add(revocation)
+        self._auth_session_denylist.add(revocation)
+
+    async def _get_stateless_auth_session(self) -> AuthSession | None:
+        """
+        Returns `None` whenever storage has to decide: stateful mode,
+        no usable claims, refresh window reached, possible revocation,
+        or a failed denylist sync.
+        """
+        if self._auth_session_validation_mode != AuthSessionValidationMode.STATELESS:
+            return None
+
+        claims = self._auth_session_transport.extract_claims()
+        if claims is None:
+            return None
+
+        now = self._auth_session_timer.current_time
+        if claims.expiration - now <= self._auth_session_timer.refresh_trigger_interval:
+            return None
+
+        if self._auth_session_denylist.is_stale:
+            revocation_gateway = self._auth_session_revocation_gateway
+            try:
+                sync_horizon = await revocation_gateway.read_sync_horizon()
+                revocations = await revocation_gateway.read_since(
+                    self._auth_session_denylist.sync_horizon,
+                    now=now,
+                )
+
+            except DataMapperError as error:
+                log.error("%s: '%s'", AUTH_SESSION_DENYLIST_SYNC_FAILED, error)
+                return None
+
+            self._auth_session_denylist.apply(
+                revocations,
+                sync_horizon=sync_horizon,
+                now=now,
+            )
+
+        if self._auth_session_denylist.may_be_revoked(claims):
+            log.debug(
+                "Get stateless auth session: may be revoked, checking storage. "
+                "Auth session ID: '%s'.",
+                claims.auth_session_id,
+            )
+            return None
+
+        return AuthSession(
+            id_=claims.auth_session_id,
+            user_id=claims.user_id,
+            expiration=claims.expiration,
+        )
+
     async def _get_current_auth_session(self) -> AuthSession:
         """:raises AuthenticationError:"""
         log.debug("Get current auth session: started. Auth session ID: unknown.")
@@ -168,6 +281,15 @@ class AuthSessionService:
             log.debug(AUTH_SESSION_NOT_FOUND)
             raise AuthenticationError(AUTH_NOT_AUTHENTICATED)
 
+        cached_auth_session = self._auth_session_cache.get(auth_session_id)
+        if cached_auth_session is not None:
+            log.debug(
+                "Get current auth session: done (from app cache). "
+                "Auth session ID: '%s'.",
+                auth_session_id,
+            )
+            return cached_auth_session
+
         log.debug(
             "Get current auth session: reading from storage. Auth session ID: '%s'.",
             auth_session_id,
@@ -186,6 +308,8 @@ class AuthSessionService:
             log.debug(AUTH_SESSION_NOT_FOUND)
             raise AuthenticationError(AUTH_NOT_AUTHENTICATED)
 
+        self._auth_session_cache.put(auth_session)
+
         log.debug(
             "Get current auth session: done. Auth session ID: '%s'.", auth_session.id_
         )
@@ -195,7 +319,12 @@ class AuthSessionService:
         self,
         auth_session: AuthSession,
     ) -> AuthSession:
-        """:raises AuthenticationError:"""
+        """
+        :raises AuthenticationError:
+
+        The extension is written by the extension flusher,
+        the cookie with the new expiration is delivered right away.
+        """
         log.debug(
             "Validate and extend auth session: started. Auth session ID: '%s'.",
             auth_session.id_,
@@ -203,6 +332,7 @@ class AuthSessionService:
 
         now = self._auth_session_timer.current_time
         if auth_session.expiration <= now:
+            self._auth_session_cache.invalidate(auth_session.id_)
             log.debug(AUTH_SESSION_EXPIRED)
             raise AuthenticationError(AUTH_NOT_AUTHENTICATED)
 
@@ -217,24 +347,24 @@ class AuthSessionService:
             )
             return auth_session
 
-        original_expiration = auth_session.expiration
-        auth_session.expiration = self._auth_session_timer.auth_session_expiration
-
-        try:
-            await self._auth_session_gateway.update(auth_session)
-            await self._auth_transaction_manager.commit()
-
-        except DataMapperError as error:
-            log.error("%s: '%s'", AUTH_SESSION_EXTENSION_FAILED, error)
-            auth_session.expiration = original_expiration
-            return auth_session
-
-        self._auth_session_transport.deliver(auth_session)
+        # A new instance, so that the one loaded by the auth session
+        # is not written back by a later commit of this request.
+        extended_auth_session = AuthSession(
+            id_=auth_session.id_,
+            user_id=auth_session.user_id,
+            expiration=self._auth_session_timer.auth_session_expiration,
+        )
+        self._auth_session_extension_flusher.schedule(
+            extended_auth_session.id_,
+            extended_auth_session.expiration,
+        )
+        self._auth_session_cache.put(extended_auth_session)
+        self._auth_session_transport.deliver(extended_auth_session)
 
         log.debug(
             "Validate and extend auth session: done. "
             "Auth session ID: '%s'. New expiration: '%s'.",
-            auth_session.id_,
-            auth_session.expiration.isoformat(),
+            extended_auth_session.id_,
+            extended_auth_session.expiration.isoformat(),
         )
-        return auth_session
+        return extended_auth_session
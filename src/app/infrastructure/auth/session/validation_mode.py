@@ -0,0 +1,13 @@
+from enum import StrEnum
+
+
+class AuthSessionValidationMode(StrEnum):
+    """
+    - `STATEFUL`: every request reads the session from storage (or app cache).
+    - `STATELESS`: a verified access token outside the refresh window
+    authenticates on its own, unless it may be in the revocation denylist.
+    Storage is consulted only for extension or a possible revocation.
+    """
+
+    STATEFUL = "stateful"
+    STATELESS = "stateless"
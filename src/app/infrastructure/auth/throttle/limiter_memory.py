@@ -0,0 +1,191 @@
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from app.infrastructure.auth.throttle.model import LoginLockout
+
+
+@dataclass(frozen=True, slots=True)
+class LoginThrottleConfig:
+    burst: int
+    refill_per_s: float
+    lockout_after_failures: int
+    base_lockout_s: float
+    max_lockout_s: float
+    sync_interval_s: float
+
+
+def login_throttle_keys(username: str, client_address: str | None) -> tuple[str, ...]:
+    """
+    The username key comes first. Usernames are keyed case-insensitively,
+    so that case variants of one name share a budget.
+    """
+    username_key = f"username:{username.lower()}"
+    if client_address is None:
+        return (username_key,)
+    return username_key, f"address:{client_address}"
+
+
+@dataclass(slots=True)
+class _Bucket:
+    tokens: float
+    updated_at: float
+
+
+@dataclass(slots=True)
+class _Failures:
+    count: int
+    last_at: float
+
+
+class InMemoryLoginThrottle:
+    """
+    App-scoped guard in front of password verification.
+    Every attempt takes a token from the bucket of each of its keys,
+    the username and the client address, and buckets refill at a steady rate.
+    Consecutive failures of a key past `lockout_after_failures`
+    lock it out for `base_lockout_s`, doubled with every further failure
+    up to `max_lockout_s`; a successful log-in clears its username.
+    Checks are plain dict lookups, so a throttled attempt is turned away
+    without a query or a bcrypt round.
+
+    Buckets and failure streaks are per worker, so with N workers a key
+    gets up to N times the burst, the refill rate and the failures
+    before a lockout. Lockouts are shared: new ones are queued here
+    and published by the sync loop, which also pulls the lockouts
+    of other workers, so a lockout reaches every worker within one interval.
+    State that no longer matters is pruned on the log-in path,
+    at most once per sync interval, whether or not syncs succeed.
+    `clock` returns the current Unix time in seconds.
+    """
+
+    def __init__(
+        self,
+        config: LoginThrottleConfig,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._config = config
+        self._clock = clock
+        self._buckets: dict[str, _Bucket] = {}
+        self._failures: dict[str, _Failures] = {}
+        self._locked_until: dict[str, float] = {}
+        self._unpublished: list[LoginLockout] = []
+        self._sync_horizon = 0
+        self._pruned_at = clock()
+
+    @property
+    def config(self) -> LoginThrottleConfig:
+        return self._config
+
+    @property
+    def sync_horizon(self) -> int:
+        return self._sync_horizon
+
+    def acquire(self, keys: Sequence[str]) -> float | None:
+        """
+        Returns the seconds to wait before the next attempt,
+        or `None` once the attempt has been taken from every bucket.
+        """
+        now = self._clock()
+        if now - self._pruned_at >= self._config.sync_interval_s:
+            self._prune(now)
+        wait_s = 0.0
+        for key in keys:
+            locked_until = self._locked_until.get(key)
+            if locked_until is not None and locked_until > now:
+                wait_s = max(wait_s, locked_until - now)
+        if wait_s:
+            return wait_s
+
+        buckets = [self._refilled_bucket(key, now) for key in keys]
+        for bucket in buckets:
+            if bucket.tokens < 1:
+                wait_s = max(wait_s, (1 - bucket.tokens) / self._config.refill_per_s)
+        if wait_s:
+            return wait_s
+
+        for bucket in buckets:
+            bucket.tokens -= 1
+        return None
+
+    def record_failure(self, keys: Sequence[str]) -> None:
+        now = self._clock()
+        for key in keys:
+            failures = self._failures.get(key)
+            if failures is None or now - failures.last_at > self._config.max_lockout_s:
+                failures = self._failures[key] = _Failures(0, now)
+            failures.count += 1
+            failures.last_at = now
+
+            excess = failures.count - self._config.lockout_after_failures
+            if excess < 0:
+                continue
+            lockout_s = min(
+                self._config.base_lockout_s * 2**excess,
+                self._config.max_lockout_s,
+            )
+            self._lock(key, now + lockout_s)
+            self._unpublished.append(
+                LoginLockout(
+                    key=key,
+                    locked_until=datetime.fromtimestamp(now + lockout_s, tz=UTC),
+                ),
+            )
+
+    def record_success(self, username_key: str) -> None:
+        self._failures.pop(username_key, None)
+
+    def take_unpublished(self) -> list[LoginLockout]:
+        unpublished, self._unpublished = self._unpublished, []
+        return unpublished
+
+    def requeue(self, lockouts: Iterable[LoginLockout]) -> None:
+        """Keeps lockouts whose publishing failed for the next sync."""
+        self._unpublished[:0] = lockouts
+
+    def apply(self, lockouts: Iterable[LoginLockout], *, sync_horizon: int) -> None:
+        """Lockouts read again by a later sync leave the state unchanged."""
+        for lockout in lockouts:
+            self._lock(lockout.key, lockout.locked_until.timestamp())
+        self._sync_horizon = sync_horizon
+
+    def _refilled_bucket(self, key: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self._config.burst, now)
+            return bucket
+        bucket.tokens = min(
+            self._config.burst,
+            bucket.tokens + (now - bucket.updated_at) * self._config.refill_per_s,
+        )
+        bucket.updated_at = now
+        return bucket
+
+    def _lock(self, key: str, locked_until: float) -> None:
+        if locked_until > self._locked_until.get(key, 0.0):
+            self._locked_until[key] = locked_until
+
+    def _prune(self, now: float) -> None:
+        """
+        Forgets state that no longer changes any answer:
+        expired lockouts, buckets that would be full again,
+        and failure streaks older than the longest lockout.
+        """
+        self._pruned_at = now
+        full_after_s = self._config.burst / self._config.refill_per_s
+        self._locked_until = {
+            key: locked_until
+            for key, locked_until in self._locked_until.items()
+            if locked_until > now
+        }
+        self._buckets = {
+            key: bucket
+            for key, bucket in self._buckets.items()
+            if now - bucket.updated_at < full_after_s
+        }
+        self._failures = {
+            key: failures
+            for key, failures in self._failures.items()
+            if now - failures.last_at <= self._config.max_lockout_s
+        }
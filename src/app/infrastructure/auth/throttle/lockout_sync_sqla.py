@@ -0,0 +1,112 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime
+
+from sqlalchemy import Delete, Insert, Select, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.auth.throttle.limiter_memory import (
+    InMemoryLoginThrottle,
+    LoginThrottleConfig,
+)
+from app.infrastructure.auth.throttle.model import LoginLockout
+from app.infrastructure.persistence_sqla.commit_order import xact_horizon_select
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    login_lockouts_table,
+)
+
+log = logging.getLogger(__name__)
+
+
+def lockouts_insert(lockouts: Sequence[LoginLockout]) -> Insert:
+    return insert(login_lockouts_table).values([
+        {"key": lockout.key, "locked_until": lockout.locked_until}
+        for lockout in lockouts
+    ])
+
+
+def lockouts_since_select(
+    sync_horizon: int,
+    *,
+    now: datetime,
+) -> Select[tuple[str, datetime]]:
+    """
+    Unexpired lockouts committed since `sync_horizon` was read,
+    and possibly some already read: see `xact_horizon_select`.
+    """
+    return select(
+        login_lockouts_table.c.key,
+        login_lockouts_table.c.locked_until,
+    ).where(
+        login_lockouts_table.c.xact_id >= sync_horizon,
+        login_lockouts_table.c.locked_until > now,
+    )
+
+
+def expired_lockouts_delete(*, now: datetime) -> Delete:
+    return delete(login_lockouts_table).where(
+        login_lockouts_table.c.locked_until <= now,
+    )
+
+
+class SqlaLoginLockoutSync:
+    """
+    Publishes the lockouts a worker made and pulls those of the others,
+    in one transaction per interval, off the log-in path.
+    Expired rows are deleted on the way; they no longer lock anything.
+    """
+
+    def __init__(self, engine: AsyncEngine, throttle: InMemoryLoginThrottle):
+        self._engine = engine
+        self._throttle = throttle
+
+    async def sync(self) -> None:
+        unpublished = self._throttle.take_unpublished()
+        now = datetime.now(UTC)
+        try:
+            async with self._engine.begin() as connection:
+                if unpublished:
+                    await connection.execute(lockouts_insert(unpublished))
+                await connection.execute(expired_lockouts_delete(now=now))
+                sync_horizon = (
+                    await connection.execute(xact_horizon_select())
+                ).scalar_one()
+                result = await connection.execute(
+                    lockouts_since_select(self._throttle.sync_horizon, now=now),
+                )
+                lockouts = [
+                    LoginLockout(key=key, locked_until=locked_until)
+                    for key, locked_until in result
+                ]
+        except Exception:
+            self._throttle.requeue(unpublished)
+            raise
+        self._throttle.apply(lockouts, sync_horizon=sync_horizon)
+
+    async def run(self, interval_s: float) -> None:
+        while True:
+            try:
+                await self.sync()
+            except Exception:
+                log.exception("Login lockout sync failed.")
+            await asyncio.sleep(interval_s)
+
+
+async def get_login_throttle(
+    engine: AsyncEngine,
+    config: LoginThrottleConfig,
+) -> AsyncIterator[InMemoryLoginThrottle]:
+    throttle = InMemoryLoginThrottle(config)
+    lockout_sync = SqlaLoginLockoutSync(engine, throttle)
+    task = asyncio.create_task(lockout_sync.run(config.sync_interval_s))
+    yield throttle
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+    log.debug("Publishing remaining login lockouts...")
+    try:
+        await lockout_sync.sync()
+    except Exception:
+        log.exception("Login lockout sync failed.")
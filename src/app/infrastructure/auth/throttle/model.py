@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LoginLockout:
+    """
+    A throttle key locked out until `locked_until`,
+    shared between workers through the `login_lockouts` table.
+    """
+
+    key: str
+    locked_until: datetime
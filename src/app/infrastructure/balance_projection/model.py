@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from typing import Final
+from uuid import UUID
+
+from app.domain.shared.entities.ledger.account_type import AccountType
+from app.domain.shared.entities.transaction.transaction import Transaction
+from app.domain.shared.value_objects.id import TransactionId
+
+SYSTEM_ACCOUNT_ID: Final[UUID] = UUID(int=0)
+"""
+Key of the single account of each system type (`ESCROW`, `REVENUE`, ...),
+whose ledger entries carry no `account_id`.
+"""
+
+type AccountKey = tuple[AccountType, UUID]
+
+
+@dataclass(eq=False, kw_only=True)
+class AccountBalanceDelta:
+    """
+    Net change, credits minus debits in minor units, that one transaction
+    made to one account. Deltas are appended in the same unit of work as
+    the ledger entries, so writers never contend for a shared balance row,
+    and are folded into the running balances by a checkpoint.
+    """
+
+    transaction_id: TransactionId
+    account_type: AccountType
+    account_id: UUID
+    amount: int
+
+
+def account_key(account_type: AccountType, account_id: UUID | None) -> AccountKey:
+    return account_type, SYSTEM_ACCOUNT_ID if account_id is None else account_id
+
+
+def deltas_of(transaction: Transaction) -> list[AccountBalanceDelta]:
+    """One delta per account the transaction moves money on or off."""
+    net_by_account: dict[AccountKey, int] = {}
+    for entry in transaction.ledger_entries:
+        key = account_key(
+            entry.account_type,
+            None if entry.account_id is None else entry.account_id.value,
+        )
+        net = entry.credit.minor_units - entry.debit.minor_units
+        net_by_account[key] = net_by_account.get(key, 0) + net
+    return [
+        AccountBalanceDelta(
+            transaction_id=transaction.id_,
+            account_type=account_type,
+            account_id=account_id,
+            amount=amount,
+        )
+        for (account_type, account_id), amount in net_by_account.items()
+        if amount
+    ]
@@ -0,0 +1,150 @@
+import logging
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Insert, Select, cast, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.domain.shared.entities.ledger.account_type import AccountType
+from app.domain.shared.entities.transaction.transaction import Transaction
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.balance_projection.model import account_key, deltas_of
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.account_balance import (
+    account_balance_deltas_table,
+    account_balances_table,
+)
+
+log = logging.getLogger(__name__)
+
+
+def balance_select(
+    account_type: AccountType,
+    account_id: UUID | None = None,
+) -> Select[tuple[int]]:
+    """Checkpointed balance plus the deltas appended since the checkpoint."""
+    account_type, account_id = account_key(account_type, account_id)
+    checkpointed = (
+        select(account_balances_table.c.balance)
+        .where(
+            account_balances_table.c.account_type == account_type,
+            account_balances_table.c.account_id == account_id,
+        )
+        .scalar_subquery()
+    )
+    pending = (
+        select(func.sum(account_balance_deltas_table.c.amount))
+        .where(
+            account_balance_deltas_table.c.account_type == account_type,
+            account_balance_deltas_table.c.account_id == account_id,
+        )
+        .scalar_subquery()
+    )
+    # `sum` of `BIGINT` is `NUMERIC` in Postgres, cast back to load an `int`.
+    balance = func.coalesce(checkpointed, 0) + func.coalesce(pending, 0)
+    return select(cast(balance, BigInteger))
+
+
+def checkpoint_insert() -> Insert:
+    """
+    Deletes every visible delta and adds it to its account's balance
+    in one statement, so each delta is folded exactly once:
+    deltas committed meanwhile are not visible to it
+    and wait for the next checkpoint.
+    """
+    folded = (
+        delete(account_balance_deltas_table)
+        .returning(
+            account_balance_deltas_table.c.account_type,
+            account_balance_deltas_table.c.account_id,
+            account_balance_deltas_table.c.amount,
+        )
+        .cte("folded")
+    )
+    per_account = select(
+        folded.c.account_type,
+        folded.c.account_id,
+        func.sum(folded.c.amount),
+        func.now(),
+    ).group_by(folded.c.account_type, folded.c.account_id)
+    upsert = insert(account_balances_table).from_select(
+        ["account_type", "account_id", "balance", "checkpointed_at"],
+        per_account,
+    )
+    return (
+        upsert.on_conflict_do_update(
+            index_elements=[
+                account_balances_table.c.account_type,
+                account_balances_table.c.account_id,
+            ],
+            set_={
+                "balance": account_balances_table.c.balance + upsert.excluded.balance,
+                "checkpointed_at": upsert.excluded.checkpointed_at,
+            },
+        )
+        # Postgres only accepts a data-modifying CTE at the top level.
+        .add_cte(folded)
+        .returning(account_balances_table.c.account_id)
+    )
+
+
+class SqlaAccountBalanceProjection:
+    """
+    Running balance of every account, user wallets and system accounts alike,
+    so e.g. the escrow locked or the revenue to date is read without
+    aggregating `ledger_entries`.
+    `stage` appends the deltas of a new transaction to the session,
+    so they commit or roll back together with its ledger entries.
+    `checkpoint` folds the committed deltas into `account_balances`;
+    a read sums the checkpoint with the deltas appended since,
+    which stays a handful of rows as long as checkpoints run periodically.
+    """
+
+    def __init__(self, session: MainAsyncSession):
+        self._session = session
+
+    def stage(self, transaction: Transaction) -> None:
+        """:raises DataMapperError:"""
+        try:
+            self._session.add_all(deltas_of(transaction))
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def read_balance(
+        self,
+        account_type: AccountType,
+        account_id: UUID | None = None,
+    ) -> int:
+        """
+        :raises DataMapperError:
+
+        Balance in minor units, credits minus debits.
+        `account_id` is only given for user wallets.
+        """
+        try:
+            result = await self._session.execute(
+                balance_select(account_type, account_id),
+            )
+            return result.scalar_one()
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def checkpoint(self) -> int:
+        """
+        :raises DataMapperError:
+
+        Returns the number of accounts whose checkpointed balance moved.
+        Takes effect once the session is committed.
+        """
+        try:
+            result = await self._session.execute(checkpoint_insert())
+            accounts = len(result.all())
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+        log.debug("Balance checkpoint: %d accounts moved.", accounts)
+        return accounts
@@ -0,0 +1,54 @@
+import json
+from typing import Final
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.application.common.ports.challenge_updates import ChallengeUpdatePublisher
+from app.domain.challenge.challenge import Challenge
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+
+CHALLENGE_UPDATES_CHANNEL: Final[str] = "challenge_updates"
+
+
+def encode_challenge_update(challenge: Challenge) -> str:
+    # Well under the 8000-byte `NOTIFY` payload limit: the title is at most
+    # 255 characters and every other field has a fixed size.
+    return json.dumps(
+        {
+            "id": str(challenge.id_.value),
+            "status": challenge.status.value,
+            "title": challenge.title.value,
+            "amount": str(challenge.amount.value),
+            "created_by": str(challenge.created_by.value),
+            "assigned_to": str(challenge.assigned_to.value),
+        },
+        separators=(",", ":"),
+    )
+
+
+def notify_select(payload: str) -> Select[tuple[None]]:
+    return select(func.pg_notify(CHALLENGE_UPDATES_CHANNEL, payload))
+
+
+class PgNotifyChallengeUpdatePublisher(ChallengeUpdatePublisher):
+    """
+    `NOTIFY` is transactional: Postgres delivers the update to listeners
+    when the transaction of the change commits, and drops it on rollback,
+    so subscribers never see a status that was not persisted.
+    """
+
+    def __init__(self, session: MainAsyncSession):
+        self._session = session
+
+    async def publish(self, challenge: Challenge) -> None:
+        """:raises DataMapperError:"""
+        try:
+            await self._session.execute(
+                notify_select(encode_challenge_update(challenge)),
+            )
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
@@ -0,0 +1,160 @@
+import asyncio
+import contextlib
+import json
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Collection
+from dataclasses import dataclass
+from typing import Any, Final, cast
+from uuid import UUID
+
+import psycopg
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.application.common.ports.challenge_updates import ChallengeUpdateStream
+from app.infrastructure.challenge_updates.publisher_pg_notify import (
+    CHALLENGE_UPDATES_CHANNEL,
+)
+
+log = logging.getLogger(__name__)
+
+HEARTBEAT_FRAME: Final[bytes] = b": keep-alive\n\n"
+SUBSCRIBED_FRAME: Final[bytes] = b": subscribed\n\n"
+
+
+def challenge_update_frame(payload: str) -> bytes:
+    return b"event: challenge\ndata: " + payload.encode() + b"\n\n"
+
+
+@dataclass(eq=False, kw_only=True)
+class _Connection:
+    audience: frozenset[str]
+    # `None` ends the stream.
+    frames: asyncio.Queue[bytes | None]
+
+
+class PgListenChallengeUpdateStream(ChallengeUpdateStream):
+    """
+    One `LISTEN` connection per process feeds every open stream.
+    Each update is framed once and the same bytes are queued
+    to every subscribed connection.
+
+    A connection whose queue is full has fallen `buffer_size` updates
+    behind; it is dropped rather than slowing down or growing without
+    bound, and its client reconnects and reloads the current state.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        buffer_size: int = 64,
+        heartbeat_s: float = 15.0,
+        reconnect_s: float = 1.0,
+    ):
+        self._engine = engine
+        self._buffer_size = buffer_size
+        self._heartbeat_s = heartbeat_s
+        self._reconnect_s = reconnect_s
+        self._connections: defaultdict[str, set[_Connection]] = defaultdict(set)
+        self._listener: asyncio.Task[None] | None = None
+
+    def subscribe(self, audience: Collection[UUID]) -> AsyncIterator[bytes]:
+        return self._stream(
+            _Connection(
+                audience=frozenset(str(id_) for id_ in audience),
+                frames=asyncio.Queue(maxsize=self._buffer_size),
+            ),
+        )
+
+    def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+
+    def fan_out(self, payload: str) -> None:
+        update = json.loads(payload)
+        connections = self._connections.get(
+            update["created_by"],
+            set(),
+        ) | self._connections.get(update["assigned_to"], set())
+        if not connections:
+            return
+        frame = challenge_update_frame(payload)
+        for connection in connections:
+            try:
+                connection.frames.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._drop(connection)
+
+    async def _stream(self, connection: _Connection) -> AsyncIterator[bytes]:
+        # Registered here rather than in `subscribe`: a stream that is
+        # never iterated runs no `finally` and would stay registered.
+        for id_ in connection.audience:
+            self._connections[id_].add(connection)
+        try:
+            yield SUBSCRIBED_FRAME
+            while True:
+                try:
+                    frame = await asyncio.wait_for(
+                        connection.frames.get(),
+                        timeout=self._heartbeat_s,
+                    )
+                except TimeoutError:
+                    yield HEARTBEAT_FRAME
+                    continue
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            self._unsubscribe(connection)
+
+    def _drop(self, connection: _Connection) -> None:
+        log.info("Challenge update stream dropped a slow consumer.")
+        self._unsubscribe(connection)
+        while not connection.frames.empty():
+            connection.frames.get_nowait()
+        connection.frames.put_nowait(None)
+
+    def _unsubscribe(self, connection: _Connection) -> None:
+        for id_ in connection.audience:
+            connections = self._connections.get(id_)
+            if connections is None:
+                continue
+            connections.discard(connection)
+            if not connections:
+                del self._connections[id_]
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._engine.connect() as sqla_connection:
+                    await sqla_connection.execution_options(
+                        isolation_level="AUTOCOMMIT",
+                    )
+                    raw_connection = await sqla_connection.get_raw_connection()
+                    connection = cast(
+                        psycopg.AsyncConnection[Any],
+                        raw_connection.driver_connection,
+                    )
+                    await connection.execute(f"LISTEN {CHALLENGE_UPDATES_CHANNEL}")
+                    log.debug("Listening for challenge updates.")
+                    async for notify in connection.notifies():
+                        self.fan_out(notify.payload)
+            except Exception:
+                log.exception("Challenge update listener failed; reconnecting.")
+                await asyncio.sleep(self._reconnect_s)
+
+
+async def get_challenge_update_stream(
+    engine: AsyncEngine,
+) -> AsyncIterator[PgListenChallengeUpdateStream]:
+    stream = PgListenChallengeUpdateStream(engine)
+    stream.start()
+    yield stream
+    await stream.close()
@@ -0,0 +1,205 @@
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from dishka import AsyncContainer
+
+from app.application.commands.challenge.handlers import (
+    subscribe_challenge_handlers,
+)
+from app.application.commands.notification.notify_challenge_participants import (
+    NotifyChallengeParticipantsInteractor,
+)
+from app.application.common.ports.event_subscriber import EventSubscriber
+from app.domain.base import Event
+from app.infrastructure.exceptions.base import InfrastructureError
+from app.infrastructure.outbox.dispatcher import EventDispatcher
+
+log = logging.getLogger(__name__)
+
+type _Delivery = tuple[Event, asyncio.Future[None], float]
+
+
+class EventHandlingError(InfrastructureError):
+    pass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HandlerMetrics:
+    """
+    `latency_*` spans from the event entering the queue
+    to the handler returning, so it includes the time spent waiting.
+    """
+
+    handler: str
+    queue_depth: int
+    max_queue_size: int
+    handled: int
+    failed: int
+    latency_mean_s: float
+    latency_max_s: float
+
+
+@dataclass(eq=False, kw_only=True)
+class _Subscription:
+    name: str
+    handler: Callable[[Any], Awaitable[None]]
+    queue: asyncio.Queue[_Delivery]
+    concurrency: int
+    workers: list[asyncio.Task[None]] = field(default_factory=list)
+    handled: int = 0
+    failed: int = 0
+    latency_total_s: float = 0.0
+    latency_max_s: float = 0.0
+
+    def metrics(self) -> HandlerMetrics:
+        done = self.handled + self.failed
+        return HandlerMetrics(
+            handler=self.name,
+            queue_depth=self.queue.qsize(),
+            max_queue_size=self.queue.maxsize,
+            handled=self.handled,
+            failed=self.failed,
+            latency_mean_s=self.latency_total_s / done if done else 0.0,
+            latency_max_s=self.latency_max_s,
+        )
+
+
+class AsyncioEventBus(EventDispatcher, EventSubscriber):
+    """
+    In-process bus behind the outbox relay, so handlers only ever see
+    committed events and never run within an HTTP request.
+
+    Each subscription owns a bounded queue drained by its own workers:
+    a slow handler fills its queue and slows down the delivery of the
+    events it subscribes to, without holding back other handlers.
+    `dispatch` returns once every handler of the event has handled it,
+    so the relay acknowledges an event only after its handlers succeeded.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: defaultdict[type[Event], list[_Subscription]] = (
+            defaultdict(list)
+        )
+
+    def subscribe[E: Event](
+        self,
+        event_type: type[E],
+        handler: Callable[[E], Awaitable[None]],
+        *,
+        max_queue_size: int = 100,
+        concurrency: int = 1,
+    ) -> None:
+        self._subscriptions[event_type].append(
+            _Subscription(
+                name=f"{event_type.__name__}:{handler.__qualname__}",
+                handler=handler,
+                queue=asyncio.Queue(maxsize=max_queue_size),
+                concurrency=concurrency,
+            ),
+        )
+
+    async def dispatch(self, event: Event) -> None:
+        """:raises EventHandlingError:"""
+        subscriptions = self._subscriptions.get(type(event), ())
+        if not subscriptions:
+            return
+        loop = asyncio.get_running_loop()
+        deliveries: list[asyncio.Future[None]] = []
+        for subscription in subscriptions:
+            self._start(subscription)
+            delivery: asyncio.Future[None] = loop.create_future()
+            await subscription.queue.put((event, delivery, loop.time()))
+            deliveries.append(delivery)
+
+        results = await asyncio.gather(*deliveries, return_exceptions=True)
+        for subscription, result in zip(subscriptions, results, strict=True):
+            if isinstance(result, Exception):
+                raise EventHandlingError(subscription.name) from result
+
+    def metrics(self) -> list[HandlerMetrics]:
+        return [
+            subscription.metrics()
+            for subscriptions in self._subscriptions.values()
+            for subscription in subscriptions
+        ]
+
+    async def close(self) -> None:
+        workers = [
+            worker
+            for subscriptions in self._subscriptions.values()
+            for subscription in subscriptions
+            for worker in subscription.workers
+        ]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def _start(self, subscription: _Subscription) -> None:
+        # Workers need a running loop, so they start with the first delivery.
+        if not subscription.workers:
+            subscription.workers.extend(
+                asyncio.create_task(self._work(subscription))
+                for _ in range(subscription.concurrency)
+            )
+
+    @staticmethod
+    async def _work(subscription: _Subscription) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            event, delivery, enqueued_at = await subscription.queue.get()
+            try:
+                # The dispatcher gave up on this event, e.g. its relay stopped.
+                if delivery.cancelled():
+                    continue
+                try:
+                    await subscription.handler(event)
+                except Exception as error:
+                    subscription.failed += 1
+                    log.exception("Event handler failed: %s.", subscription.name)
+                    if not delivery.done():
+                        delivery.set_exception(error)
+                else:
+                    subscription.handled += 1
+                    if not delivery.done():
+                        delivery.set_result(None)
+                latency_s = loop.time() - enqueued_at
+                subscription.latency_total_s += latency_s
+                subscription.latency_max_s = max(subscription.latency_max_s, latency_s)
+            finally:
+                subscription.queue.task_done()
+
+
+class _EventInteractor(Protocol):
+    async def execute(self, event: Any, /) -> None: ...
+
+
+def in_request_scope(
+    container: AsyncContainer,
+    interactor_type: type[_EventInteractor],
+) -> Callable[[Event], Awaitable[None]]:
+    """Handles each event with its own interactor and database session."""
+
+    async def handle(event: Event) -> None:
+        async with container() as request_container:
+            interactor = await request_container.get(interactor_type)
+            await interactor.execute(event)
+
+    handle.__qualname__ = interactor_type.__qualname__
+    return handle
+
+
+async def get_event_bus(container: AsyncContainer) -> AsyncIterator[AsyncioEventBus]:
+    bus = AsyncioEventBus()
+    subscribe_challenge_handlers(
+        bus,
+        notify_participants=in_request_scope(
+            container,
+            NotifyChallengeParticipantsInteractor,
+        ),
+    )
+    yield bus
+    await bus.close()
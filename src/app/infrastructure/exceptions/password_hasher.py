@@ -0,0 +1,5 @@
+from app.infrastructure.exceptions.base import InfrastructureError
+
+
+class PasswordHasherBusyError(InfrastructureError):
+    pass
@@ -0,0 +1,108 @@
+"""
+JSON form of domain events, as stored in the outbox.
+
+A value object is stored as its field value, or as a list of field values
+when it has several; UUIDs and datetimes are stored as strings.
+Decoding follows the type hints of the event class, and rebuilds
+value objects without validating them again,
+since they were validated when the event was created.
+"""
+
+from collections.abc import Mapping
+from dataclasses import fields
+from datetime import datetime
+from enum import Enum
+from types import MappingProxyType, NoneType, UnionType
+from typing import Any, Final, get_args, get_type_hints
+from uuid import UUID
+
+from app.domain.base import Event, ValueObject
+from app.domain.challenge.events import (
+    ChallengeAcceptedByStreamer,
+    ChallengeCompletedByStreamer,
+    ChallengeConfirmedByViewer,
+    ChallengeCreated,
+    ChallengeExpired,
+    ChallengeRejectedByStreamer,
+    ChallengeRejectedByViewer,
+)
+from app.infrastructure.exceptions.base import InfrastructureError
+from app.infrastructure.persistence_sqla.composites import trusted_factory
+
+# Stored names are part of the outbox format:
+# renaming an event class must keep its name here.
+EVENT_TYPES: Final[Mapping[str, type[Event]]] = MappingProxyType({
+    event_type.__name__: event_type
+    for event_type in (
+        ChallengeCreated,
+        ChallengeAcceptedByStreamer,
+        ChallengeRejectedByStreamer,
+        ChallengeCompletedByStreamer,
+        ChallengeConfirmedByViewer,
+        ChallengeRejectedByViewer,
+        ChallengeExpired,
+    )
+})
+
+
+class UnknownEventTypeError(InfrastructureError):
+    pass
+
+
+def encode_event(event: Event) -> tuple[str, dict[str, Any]]:
+    """:raises UnknownEventTypeError:"""
+    event_type = type(event).__name__
+    if EVENT_TYPES.get(event_type) is not type(event):
+        raise UnknownEventTypeError(event_type)
+    payload = {
+        field.name: _encode(getattr(event, field.name)) for field in fields(event)
+    }
+    return event_type, payload
+
+
+def decode_event(event_type: str, payload: Mapping[str, Any]) -> Event:
+    """:raises UnknownEventTypeError:"""
+    event_class = EVENT_TYPES.get(event_type)
+    if event_class is None:
+        raise UnknownEventTypeError(event_type)
+    hints = get_type_hints(event_class)
+    return event_class(**{
+        name: _decode(hints[name], value) for name, value in payload.items()
+    })
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, ValueObject):
+        values = [_encode(getattr(value, field.name)) for field in fields(value)]
+        return values[0] if len(values) == 1 else values
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _decode(hint: Any, value: Any) -> Any:
+    if isinstance(hint, UnionType):
+        if value is None and NoneType in get_args(hint):
+            return None
+        (hint,) = (arg for arg in get_args(hint) if arg is not NoneType)
+    if isinstance(hint, type) and issubclass(hint, ValueObject):
+        vo_fields = fields(hint)
+        vo_hints = get_type_hints(hint)
+        values = [value] if len(vo_fields) == 1 else value
+        return trusted_factory(hint)(
+            *(
+                _decode(vo_hints[field.name], field_value)
+                for field, field_value in zip(vo_fields, values, strict=True)
+            )
+        )
+    if hint is UUID:
+        return UUID(value)
+    if hint is datetime:
+        return datetime.fromisoformat(value)
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return hint(value)
+    return value
@@ -0,0 +1,10 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from app.domain.base import Event
+
+
+class EventDispatcher(Protocol):
+    @abstractmethod
+    async def dispatch(self, event: Event) -> None:
+        """Returns once every handler of `event` has handled it; raises if one fails."""
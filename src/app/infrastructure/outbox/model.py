@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+
+@dataclass(eq=False, kw_only=True)
+class OutboxMessage:
+    """
+    Domain event staged in the transaction of the state change it describes,
+    until the outbox relay has dispatched it.
+    `attempts` counts failed dispatches.
+    """
+
+    id_: int | None = None
+    aggregate_id: UUID
+    event_type: str
+    payload: Any
+    created_at: datetime
+    attempts: int = 0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ClaimedOutboxMessage:
+    """Outbox message leased to one relay, as read back from its row."""
+
+    id_: int
+    aggregate_id: UUID
+    event_type: str
+    payload: Any
+    attempts: int
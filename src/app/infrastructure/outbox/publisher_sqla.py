@@ -0,0 +1,42 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.application.common.ports.event_publisher import EventPublisher
+from app.domain.base import Event
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.outbox.codec import encode_event
+from app.infrastructure.outbox.model import OutboxMessage
+
+
+class SqlaOutboxEventPublisher(EventPublisher):
+    """
+    Adds events to the outbox in the session of the state change,
+    so they commit or roll back together with it;
+    `SqlaOutboxRelay` dispatches them after the commit.
+    """
+
+    def __init__(self, session: MainAsyncSession):
+        self._session = session
+
+    def publish(self, event: Event, *, aggregate_id: UUID) -> None:
+        """
+        :raises DataMapperError:
+        :raises UnknownEventTypeError:
+        """
+        event_type, payload = encode_event(event)
+        try:
+            self._session.add(
+                OutboxMessage(
+                    aggregate_id=aggregate_id,
+                    event_type=event_type,
+                    payload=payload,
+                    created_at=datetime.now(timezone.utc),
+                ),
+            )
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
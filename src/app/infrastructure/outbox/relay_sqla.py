@@ -0,0 +1,270 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from itertools import groupby
+from typing import Final
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    Delete,
+    Select,
+    Update,
+    case,
+    delete,
+    exists,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.outbox.codec import decode_event
+from app.infrastructure.outbox.dispatcher import EventDispatcher
+from app.infrastructure.outbox.model import ClaimedOutboxMessage
+from app.infrastructure.persistence_sqla.mappings.outbox import outbox_table
+
+log = logging.getLogger(__name__)
+
+# A message that failed this many times stays in the outbox for inspection,
+# and holds back the later events of its aggregate.
+MAX_ATTEMPTS: Final[int] = 10
+# Longer than the slowest batch is expected to take to dispatch.
+DEFAULT_LEASE: Final[timedelta] = timedelta(minutes=5)
+
+
+def claim_heads_select(
+    *,
+    now: datetime,
+    batch_size: int,
+    max_attempts: int,
+) -> Select[tuple[UUID]]:
+    """
+    Locks the oldest message of up to `batch_size` aggregates
+    that no relay holds a live lease on, skipping aggregates whose oldest
+    message another relay is claiming at the same moment.
+    Only one relay at a time can own the head of an aggregate,
+    so the events of an aggregate are never dispatched out of order.
+    An earlier message still uncommitted would be invisible here, but
+    publishers lock the aggregate until they commit, so a message of the
+    same aggregate with a lower ID has always committed by then.
+    """
+    head = outbox_table.alias("head")
+    earlier = outbox_table.alias("earlier")
+    return (
+        select(head.c.aggregate_id)
+        .where(
+            head.c.attempts < max_attempts,
+            or_(head.c.claimed_until.is_(None), head.c.claimed_until <= now),
+            ~exists().where(
+                earlier.c.aggregate_id == head.c.aggregate_id,
+                earlier.c.id < head.c.id,
+            ),
+        )
+        .order_by(head.c.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True, of=head)
+    )
+
+
+def claim_update(
+    *,
+    now: datetime,
+    batch_size: int,
+    max_attempts: int,
+    claimed_by: UUID,
+    lease: timedelta,
+) -> Update:
+    """
+    Leases every message of the claimed aggregates to `claimed_by`
+    until `now + lease` and returns them.
+    Once committed, the lease keeps other relays off these aggregates
+    while the handlers run, without a row lock or a connection held.
+    """
+    heads = claim_heads_select(
+        now=now,
+        batch_size=batch_size,
+        max_attempts=max_attempts,
+    )
+    return (
+        update(outbox_table)
+        .where(outbox_table.c.aggregate_id.in_(heads.scalar_subquery()))
+        .values(claimed_by=claimed_by, claimed_until=now + lease)
+        .returning(
+            outbox_table.c.id,
+            outbox_table.c.aggregate_id,
+            outbox_table.c.event_type,
+            outbox_table.c.payload,
+            outbox_table.c.attempts,
+        )
+    )
+
+
+def delivered_delete(message_ids: Sequence[int]) -> Delete:
+    return delete(outbox_table).where(outbox_table.c.id.in_(message_ids))
+
+
+def lease_release_update(
+    claimed_by: UUID,
+    *,
+    failed_ids: Sequence[int] = (),
+) -> Update:
+    """
+    Ends the lease early, so the messages left can be claimed again,
+    and counts a failed attempt for each of `failed_ids`.
+    """
+    return (
+        update(outbox_table)
+        .where(outbox_table.c.claimed_by == claimed_by)
+        .values(
+            claimed_by=None,
+            claimed_until=None,
+            attempts=case(
+                (outbox_table.c.id.in_(failed_ids), outbox_table.c.attempts + 1),
+                else_=outbox_table.c.attempts,
+            ),
+        )
+    )
+
+
+async def dispatch_in_order(
+    dispatcher: EventDispatcher,
+    messages: Sequence[ClaimedOutboxMessage],
+    *,
+    max_attempts: int = MAX_ATTEMPTS,
+) -> tuple[list[int], int | None]:
+    """
+    Dispatches the messages of one aggregate oldest first,
+    stopping at the first failure so that no later event overtakes it.
+
+    Returns the ids of the delivered messages, and the id of the failed one.
+    """
+    delivered: list[int] = []
+    for message in messages:
+        if message.attempts >= max_attempts:
+            break
+        try:
+            await dispatcher.dispatch(
+                decode_event(message.event_type, message.payload),
+            )
+        except Exception:
+            log.exception(
+                "Outbox dispatch failed. Message ID: %s, event: %s.",
+                message.id_,
+                message.event_type,
+            )
+            return delivered, message.id_
+        delivered.append(message.id_)
+    return delivered, None
+
+
+class SqlaOutboxRelay:
+    """
+    Moves one batch of events from the outbox to their handlers
+    in two short database transactions: the first leases the aggregates
+    and commits, then their events are dispatched concurrently across
+    aggregates and in order within each, and the second deletes
+    the delivered messages and ends the lease, counting the failed attempts.
+
+    Delivery is at least once: if the relay dies after dispatching,
+    or dispatching outlasts the lease, the events are dispatched again,
+    so handlers must be idempotent.
+    """
+
+    def __init__(self, session: MainAsyncSession, dispatcher: EventDispatcher):
+        self._session = session
+        self._dispatcher = dispatcher
+
+    async def relay(
+        self,
+        *,
+        batch_size: int,
+        concurrency: int,
+        lease: timedelta = DEFAULT_LEASE,
+    ) -> int:
+        """
+        :raises DataMapperError:
+
+        Returns the number of aggregates claimed,
+        fewer than `batch_size` once the outbox is drained.
+        """
+        claimed_by = uuid4()
+        try:
+            rows = (
+                await self._session.execute(
+                    claim_update(
+                        now=datetime.now(UTC),
+                        batch_size=batch_size,
+                        max_attempts=MAX_ATTEMPTS,
+                        claimed_by=claimed_by,
+                        lease=lease,
+                    ),
+                )
+            ).all()
+            await self._session.commit()
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+        if not rows:
+            return 0
+
+        messages = sorted(
+            (
+                ClaimedOutboxMessage(
+                    id_=row.id,
+                    aggregate_id=row.aggregate_id,
+                    event_type=row.event_type,
+                    payload=row.payload,
+                    attempts=row.attempts,
+                )
+                for row in rows
+            ),
+            key=lambda message: (message.aggregate_id, message.id_),
+        )
+        batches = [
+            list(aggregate_messages)
+            for _, aggregate_messages in groupby(
+                messages,
+                key=lambda message: message.aggregate_id,
+            )
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def dispatch(
+            messages: list[ClaimedOutboxMessage],
+        ) -> tuple[list[int], int | None]:
+            async with semaphore:
+                return await dispatch_in_order(self._dispatcher, messages)
+
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(dispatch(batch)) for batch in batches]
+
+        delivered: list[int] = []
+        failed: list[int] = []
+        for task in tasks:
+            delivered_ids, failed_id = task.result()
+            delivered.extend(delivered_ids)
+            if failed_id is not None:
+                failed.append(failed_id)
+
+        try:
+            if delivered:
+                await self._session.execute(delivered_delete(delivered))
+            await self._session.execute(
+                lease_release_update(claimed_by, failed_ids=failed),
+            )
+            await self._session.commit()
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+        log.info(
+            "Outbox relay: batch done. Delivered: %d, failed: %d.",
+            len(delivered),
+            len(failed),
+        )
+        return len(batches)
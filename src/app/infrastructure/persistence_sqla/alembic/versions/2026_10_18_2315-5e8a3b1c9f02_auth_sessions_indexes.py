@@ -0,0 +1,51 @@
+"""auth sessions indexes
+
+Revision ID: 5e8a3b1c9f02
+Revises: d41f6a2c8b97
+Create Date: 2026-10-18 23:15:27.530914
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8a3b1c9f02"
+down_revision: Union[str, None] = "d41f6a2c8b97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently: every authenticated request reads `auth_sessions`,
+    # and a plain CREATE INDEX would block its writes until done.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_auth_sessions_expiration"),
+            "auth_sessions",
+            ["expiration"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f("ix_auth_sessions_user_id"),
+            "auth_sessions",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_auth_sessions_user_id"),
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_auth_sessions_expiration"),
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+        )
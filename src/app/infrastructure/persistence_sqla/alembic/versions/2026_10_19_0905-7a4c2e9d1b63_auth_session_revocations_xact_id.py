@@ -0,0 +1,56 @@
+"""auth session revocations xact id
+
+Revision ID: 7a4c2e9d1b63
+Revises: 5e8a3b1c9f02
+Create Date: 2026-10-19 09:05:12.318406
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7a4c2e9d1b63"
+down_revision: Union[str, None] = "5e8a3b1c9f02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows take the ID of this transaction, which is below the
+    # horizon of any later sync, and a first sync reads them all anyway.
+    op.add_column(
+        "auth_session_revocations",
+        sa.Column(
+            "xact_id",
+            sa.BigInteger(),
+            server_default=sa.text("pg_current_xact_id()::text::bigint"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        op.f("ix_auth_session_revocations_xact_id"),
+        "auth_session_revocations",
+        ["xact_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_auth_session_revocations_expires_at"),
+        "auth_session_revocations",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_auth_session_revocations_expires_at"),
+        table_name="auth_session_revocations",
+    )
+    op.drop_index(
+        op.f("ix_auth_session_revocations_xact_id"),
+        table_name="auth_session_revocations",
+    )
+    op.drop_column("auth_session_revocations", "xact_id")
@@ -0,0 +1,43 @@
+"""login lockouts xact id
+
+Revision ID: e6b2d8f4a193
+Revises: c3f7a9e2d5b8
+Create Date: 2026-10-19 13:20:41.573218
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b2d8f4a193"
+down_revision: Union[str, None] = "c3f7a9e2d5b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows take the ID of this transaction, which is below the
+    # horizon of any later sync, and a first sync reads them all anyway.
+    op.add_column(
+        "login_lockouts",
+        sa.Column(
+            "xact_id",
+            sa.BigInteger(),
+            server_default=sa.text("pg_current_xact_id()::text::bigint"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        op.f("ix_login_lockouts_xact_id"),
+        "login_lockouts",
+        ["xact_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_login_lockouts_xact_id"), table_name="login_lockouts")
+    op.drop_column("login_lockouts", "xact_id")
@@ -0,0 +1,41 @@
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Numeric,
+    cast,
+    literal_column,
+    type_coerce,
+)
+from sqlalchemy.types import TypeDecorator
+
+from app.domain.shared.value_objects.money import (
+    MINOR_UNITS_PER_UNIT,
+    MONEY_PRECISION,
+    MONEY_SCALE,
+)
+
+_SCALE_FACTOR = literal_column(str(MINOR_UNITS_PER_UNIT), BigInteger)
+
+
+class MinorUnits(TypeDecorator[int]):
+    """
+    `NUMERIC(MONEY_PRECISION, MONEY_SCALE)` column exchanged as integer
+    minor units.
+    Scaling is done by Postgres in the statement itself, so psycopg loads
+    and dumps plain `int8` values with its native int adapters
+    and no `Decimal` is built or parsed per row.
+    Scaling a `NUMERIC` with this scale by `MINOR_UNITS_PER_UNIT`
+    always yields an integer, so the casts are exact.
+    """
+
+    impl = Numeric(MONEY_PRECISION, MONEY_SCALE)
+    cache_ok = True
+
+    def column_expression(self, column: ColumnElement[Any]) -> ColumnElement[int]:
+        return cast(type_coerce(column, self.impl) * _SCALE_FACTOR, BigInteger)
+
+    def bind_expression(self, bindvalue: Any) -> ColumnElement[Any]:
+        minor_units = cast(type_coerce(bindvalue, BigInteger), Numeric())
+        return cast(minor_units / _SCALE_FACTOR, self.impl)
@@ -0,0 +1,30 @@
+from sqlalchemy import BigInteger, Column, Select, Text, func, select, text
+
+
+def xact_id_column() -> Column[int]:
+    """
+    ID of the transaction that inserted the row, for tables that other
+    workers pull incrementally. Unlike an identity column, it lets a reader
+    find rows whose transaction committed after a higher ID was already read.
+    `xid8` is 64-bit and never wraps around, so it fits a `BIGINT`.
+    """
+    return Column(
+        "xact_id",
+        BigInteger,
+        nullable=False,
+        server_default=text("pg_current_xact_id()::text::bigint"),
+    )
+
+
+def xact_horizon_select() -> Select[tuple[int]]:
+    """
+    Oldest transaction ID still running when the statement starts:
+    every transaction below it has committed or aborted.
+    Read it before the rows, then read rows with `xact_id >= previous horizon`
+    on the next sync, and no commit is missed however late it lands.
+    Rows committed above the horizon are read twice, so applying them
+    must be idempotent.
+    """
+    return select(
+        func.pg_snapshot_xmin(func.pg_current_snapshot()).cast(Text).cast(BigInteger),
+    )
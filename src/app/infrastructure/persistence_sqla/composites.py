@@ -0,0 +1,121 @@
+"""
+Composite value objects for imperative mappings.
+
+Rows read from the database were validated when they were written,
+so rebuilding their value objects does not have to run `__post_init__` again.
+`vo_composite(..., trusted=True)` maps a value object the usual way,
+but hydrates it by setting its fields directly.
+Value objects created from user input are unaffected and stay fully validated.
+"""
+
+from collections.abc import Callable
+from dataclasses import fields
+from typing import Any, Literal, overload
+
+from sqlalchemy import Column
+from sqlalchemy.orm import Composite, composite
+
+from app.domain.base import ValueObject
+
+
+def trusted_factory[VO: ValueObject](vo_type: type[VO]) -> Callable[..., VO]:
+    """Builds instances of `vo_type` without `__init__` or `__post_init__`."""
+    new = object.__new__
+    set_field = object.__setattr__
+    field_names = tuple(f.name for f in fields(vo_type))
+
+    if len(field_names) == 1:
+        (field_name,) = field_names
+
+        def build_single(value: Any) -> VO:
+            vo = new(vo_type)
+            set_field(vo, field_name, value)
+            return vo
+
+        return build_single
+
+    def build(*values: Any) -> VO:
+        vo = new(vo_type)
+        for field_name, value in zip(field_names, values, strict=True):
+            set_field(vo, field_name, value)
+        return vo
+
+    return build
+
+
+class TrustedComposite[VO: ValueObject](Composite[VO]):
+    """
+    `Composite` that is configured with `vo_type` (so state extraction
+    is generated from the dataclass fields) and then constructs instances
+    with `trusted_factory(vo_type)` on load.
+    Bulk ORM `UPDATE ... SET` with a composite value is not supported;
+    set the underlying columns instead.
+    """
+
+    def __init__(self, vo_type: type[VO], *columns: Column[Any]) -> None:
+        super().__init__(vo_type, *columns)
+        self.vo_type = vo_type
+        self.composite_class = trusted_factory(vo_type)
+
+
+def none_if_null[VO: ValueObject](
+    factory: Callable[..., VO],
+) -> Callable[..., VO | None]:
+    """Loads a value object from all-`NULL` columns as `None`."""
+
+    def build(*values: Any) -> VO | None:
+        if all(value is None for value in values):
+            return None
+        return factory(*values)
+
+    return build
+
+
+class NullableComposite[VO: ValueObject](Composite[VO | None]):
+    """
+    `Composite` of an optional value object, loaded as `None`
+    when all of its columns are `NULL`.
+    """
+
+    def __init__(
+        self,
+        vo_type: type[VO],
+        *columns: Column[Any],
+        trusted: bool,
+    ) -> None:
+        super().__init__(vo_type, *columns)
+        self.vo_type = vo_type
+        self.composite_class = none_if_null(
+            trusted_factory(vo_type) if trusted else vo_type,
+        )
+
+
+@overload
+def vo_composite[VO: ValueObject](
+    vo_type: type[VO],
+    *columns: Column[Any],
+    trusted: bool,
+    nullable: Literal[False] = False,
+) -> Composite[VO]: ...
+
+
+@overload
+def vo_composite[VO: ValueObject](
+    vo_type: type[VO],
+    *columns: Column[Any],
+    trusted: bool,
+    nullable: Literal[True],
+) -> Composite[VO | None]: ...
+
+
+def vo_composite[VO: ValueObject](
+    vo_type: type[VO],
+    *columns: Column[Any],
+    trusted: bool,
+    nullable: bool = False,
+) -> Composite[VO] | Composite[VO | None]:
+    if nullable:
+        return NullableComposite(vo_type, *columns, trusted=trusted)
+    if trusted:
+        return TrustedComposite(vo_type, *columns)
+    return composite(vo_type, *columns)
@@ -10,3 +10,4 @@ class SqlaEngineConfig:
     echo_pool: bool
     pool_size: int
     max_overflow: int
+    share_auth_session: bool
@@ -0,0 +1,55 @@
+from sqlalchemy import UUID, BigInteger, Column, DateTime, Enum, Index, Table
+
+from app.domain.shared.entities.ledger.account_type import AccountType
+from app.domain.shared.value_objects.id import TransactionId
+from app.infrastructure.balance_projection.model import AccountBalanceDelta
+from app.infrastructure.persistence_sqla.composites import vo_composite
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+# Balances and deltas are running sums over many entries,
+# so they are kept as `BIGINT` minor units
+# rather than in the `NUMERIC(12, 2)` range of a single amount.
+account_balances_table = Table(
+    "account_balances",
+    mapping_registry.metadata,
+    Column(
+        "account_type",
+        Enum(AccountType, name="account_type"),
+        primary_key=True,
+    ),
+    Column("account_id", UUID(as_uuid=True), primary_key=True),
+    Column("balance", BigInteger, nullable=False),
+    Column("checkpointed_at", DateTime(timezone=True), nullable=False),
+)
+
+account_balance_deltas_table = Table(
+    "account_balance_deltas",
+    mapping_registry.metadata,
+    Column("transaction_id", UUID(as_uuid=True), primary_key=True),
+    Column(
+        "account_type",
+        Enum(AccountType, name="account_type"),
+        primary_key=True,
+    ),
+    Column("account_id", UUID(as_uuid=True), primary_key=True),
+    Column("amount", BigInteger, nullable=False),
+    Index(None, "account_type", "account_id"),
+)
+
+
+def map_account_balance_deltas_table(*, trusted_hydration: bool = True) -> None:
+    mapping_registry.map_imperatively(
+        AccountBalanceDelta,
+        account_balance_deltas_table,
+        properties={
+            "transaction_id": vo_composite(
+                TransactionId,
+                account_balance_deltas_table.c.transaction_id,
+                trusted=trusted_hydration,
+            ),
+            "account_type": account_balance_deltas_table.c.account_type,
+            "account_id": account_balance_deltas_table.c.account_id,
+            "amount": account_balance_deltas_table.c.amount,
+        },
+        column_prefix="_",
+    )
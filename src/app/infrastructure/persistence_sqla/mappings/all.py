@@ -19,9 +19,16 @@ Call the `map_tables` function in the application factory to initialize
 mappings at startup. Additionally, it is necessary to call this function
 in `env.py` for Alembic migrations to ensure all models are available
 during database migrations.
+
+`trusted_hydration` controls how value objects are rebuilt from loaded rows;
+see `app.infrastructure.persistence_sqla.composites`.
 """
 
+from app.infrastructure.persistence_sqla.mappings.account_balance import (
+    map_account_balance_deltas_table,
+)
 from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    map_auth_session_revocations_table,
     map_auth_sessions_table,
 )
 from app.infrastructure.persistence_sqla.mappings.streamer import (
@@ -33,16 +40,28 @@ from app.infrastructure.persistence_sqla.mappings.transaction import (
 from app.infrastructure.persistence_sqla.mappings.ledger_entry import (
     map_ledger_entries_table,
 )
+from app.infrastructure.persistence_sqla.mappings.notification import (
+    map_notifications_table,
+)
+from app.infrastructure.persistence_sqla.mappings.outbox import map_outbox_table
 from app.infrastructure.persistence_sqla.mappings.user import map_users_table
 from app.infrastructure.persistence_sqla.mappings.challenge import map_challenges_table
+from app.infrastructure.persistence_sqla.mappings.challenge_history import (
+    map_challenge_history_table,
+)
 from app.infrastructure.persistence_sqla.mappings.wallet import map_wallets_table
 
 
-def map_tables() -> None:
-    map_users_table()
-    map_streamers_table()
-    map_ledger_entries_table()
-    map_transactions_table()
-    map_auth_sessions_table()
-    map_challenges_table()
-    map_wallets_table()
+def map_tables(*, trusted_hydration: bool = True) -> None:
+    map_users_table(trusted_hydration=trusted_hydration)
+    map_streamers_table(trusted_hydration=trusted_hydration)
+    map_ledger_entries_table(trusted_hydration=trusted_hydration)
+    map_transactions_table(trusted_hydration=trusted_hydration)
+    map_auth_sessions_table(trusted_hydration=trusted_hydration)
+    map_auth_session_revocations_table(trusted_hydration=trusted_hydration)
+    map_challenges_table(trusted_hydration=trusted_hydration)
+    map_challenge_history_table(trusted_hydration=trusted_hydration)
+    map_wallets_table(trusted_hydration=trusted_hydration)
+    map_account_balance_deltas_table(trusted_hydration=trusted_hydration)
+    map_notifications_table(trusted_hydration=trusted_hydration)
+    map_outbox_table()
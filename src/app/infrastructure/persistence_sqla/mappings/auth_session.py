@@ -1,8 +1,18 @@
-from sqlalchemy import UUID, Column, DateTime, String, Table
-from sqlalchemy.orm import composite
+from sqlalchemy import (
+    UUID,
+    BigInteger,
+    Column,
+    DateTime,
+    Identity,
+    Index,
+    String,
+    Table,
+)
 
 from app.domain.shared.value_objects.id import UserId
-from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.model import AuthSession, AuthSessionRevocation
+from app.infrastructure.persistence_sqla.commit_order import xact_id_column
+from app.infrastructure.persistence_sqla.composites import vo_composite
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 auth_sessions_table = Table(
@@ -11,17 +21,72 @@ auth_sessions_table = Table(
     Column("id", String, primary_key=True),
     Column("user_id", UUID(as_uuid=True), nullable=False),
     Column("expiration", DateTime(timezone=True), nullable=False),
+    Index(None, "expiration"),
+    Index(None, "user_id"),
+)
+
+auth_session_revocations_table = Table(
+    "auth_session_revocations",
+    mapping_registry.metadata,
+    Column("id", BigInteger, Identity(), primary_key=True),
+    Column("auth_session_id", String, nullable=True),
+    Column("user_id", UUID(as_uuid=True), nullable=False),
+    Column("revoked_at", DateTime(timezone=True), nullable=False),
+    Column("expires_at", DateTime(timezone=True), nullable=False),
+    xact_id_column(),
+    Index(None, "xact_id"),
+    Index(None, "expires_at"),
+)
+
+# Read in commit order in every worker's throttle sync and pruned by expiry,
+# so it is not mapped: rows go through Core statements only.
+login_lockouts_table = Table(
+    "login_lockouts",
+    mapping_registry.metadata,
+    Column("id", BigInteger, Identity(), primary_key=True),
+    Column("key", String, nullable=False),
+    Column("locked_until", DateTime(timezone=True), nullable=False),
+    xact_id_column(),
+    Index(None, "xact_id"),
+    Index(None, "locked_until"),
 )
 
 
-def map_auth_sessions_table() -> None:
+def map_auth_sessions_table(*, trusted_hydration: bool = True) -> None:
     mapping_registry.map_imperatively(
         AuthSession,
         auth_sessions_table,
         properties={
             "id_": auth_sessions_table.c.id,
-            "user_id": composite(UserId, auth_sessions_table.c.user_id),
+            "user_id": vo_composite(
+                UserId,
+                auth_sessions_table.c.user_id,
+                trusted=trusted_hydration,
+            ),
             "expiration": auth_sessions_table.c.expiration,
         },
         column_prefix="_",
     )
+
+
+def map_auth_session_revocations_table(
+    *,
+    trusted_hydration: bool = True,
+) -> None:
+    mapping_registry.map_imperatively(
+        AuthSessionRevocation,
+        auth_session_revocations_table,
+        properties={
+            "id_": auth_session_revocations_table.c.id,
+            "auth_session_id": auth_session_revocations_table.c.auth_session_id,
+            "user_id": vo_composite(
+                UserId,
+                auth_session_revocations_table.c.user_id,
+                trusted=trusted_hydration,
+            ),
+            "revoked_at": auth_session_revocations_table.c.revoked_at,
+            "expires_at": auth_session_revocations_table.c.expires_at,
+        },
+        exclude_properties=["xact_id"],
+        column_prefix="_",
+    )
@@ -1,14 +1,28 @@
-from sqlalchemy import UUID, Column, DateTime, Enum, Numeric, String, Table
-from sqlalchemy.orm import composite
+from sqlalchemy import (
+    UUID,
+    Column,
+    DateTime,
+    Enum,
+    Index,
+    Numeric,
+    String,
+    Table,
+    bindparam,
+)
 
 from app.domain.challenge.challenge import Challenge
-from app.domain.challenge.challenge_status import ChallengeStatus
+from app.domain.challenge.challenge_status import (
+    EXPIRABLE_CHALLENGE_STATUSES,
+    ChallengeStatus,
+)
 
 from app.domain.challenge.value_objects import ChallengeAmount, Description, Title
 from app.domain.shared.value_objects.fee import ChallengeFee
 from app.domain.shared.value_objects.id import ProductId, StreamerId, UserId
 from app.domain.shared.value_objects.time import AcceptedAt, CreatedAt, ExpiresAt
 from app.domain.user.value_objects import StreamerChallengeFixedAmount
+from app.infrastructure.persistence_sqla.column_types import MinorUnits
+from app.infrastructure.persistence_sqla.composites import vo_composite
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 challenges_table = Table(
@@ -19,9 +33,9 @@ challenges_table = Table(
     Column("description", String(Description.MAX_LEN), nullable=True),
     Column("created_by", UUID(as_uuid=True), nullable=False),
     Column("assigned_to", UUID(as_uuid=True), nullable=False),
-    Column("amount", Numeric(precision=12, scale=2), nullable=False),
+    Column("amount", MinorUnits(), nullable=False),
     Column("fee", Numeric(precision=12, scale=2), nullable=False),
-    Column("streamer_fixed_amount", Numeric(precision=12, scale=2), nullable=False),
+    Column("streamer_fixed_amount", MinorUnits(), nullable=False),
     Column(
         "status",
         Enum(ChallengeStatus, name="challengestatus"),
@@ -31,26 +45,91 @@ challenges_table = Table(
     Column("created_at", DateTime(timezone=True), nullable=False),
     Column("expires_at", DateTime(timezone=True), nullable=False),
     Column("accepted_at", DateTime(timezone=True), nullable=True),
+    # A streamer's challenges are moved in bulk by status.
+    Index(None, "assigned_to", "status"),
+)
+
+# Only challenges still holding escrow are indexed by expiry,
+# so the index stays as small as the backlog of open challenges.
+# The statuses are rendered inline, in the index and in the queries using it,
+# so the planner can match the predicate of a prepared statement as well.
+expirable_status_condition = challenges_table.c.status.in_(
+    bindparam(
+        "expirable_statuses",
+        sorted(EXPIRABLE_CHALLENGE_STATUSES),
+        expanding=True,
+        literal_execute=True,
+    ),
+)
+
+Index(
+    None,
+    challenges_table.c.expires_at,
+    postgresql_where=expirable_status_condition,
 )
 
 
-def map_challenges_table() -> None:
+def map_challenges_table(*, trusted_hydration: bool = True) -> None:
     mapping_registry.map_imperatively(
         Challenge,
         challenges_table,
         properties={
-            "id_": composite(ProductId, challenges_table.c.id),
-            "title": composite(Title, challenges_table.c.title),
-            "description": composite(Description, challenges_table.c.description),
-            "created_by": composite(UserId, challenges_table.c.created_by),
-            "assigned_to": composite(StreamerId, challenges_table.c.assigned_to),
-            "amount": composite(ChallengeAmount, challenges_table.c.amount),
-            "fee": composite(ChallengeFee, challenges_table.c.fee),
-            "streamer_fixed_amount": composite(StreamerChallengeFixedAmount, challenges_table.c.streamer_fixed_amount),
+            "id_": vo_composite(
+                ProductId,
+                challenges_table.c.id,
+                trusted=trusted_hydration,
+            ),
+            "title": vo_composite(
+                Title,
+                challenges_table.c.title,
+                trusted=trusted_hydration,
+            ),
+            "description": vo_composite(
+                Description,
+                challenges_table.c.description,
+                trusted=trusted_hydration,
+            ),
+            "created_by": vo_composite(
+                UserId,
+                challenges_table.c.created_by,
+                trusted=trusted_hydration,
+            ),
+            "assigned_to": vo_composite(
+                StreamerId,
+                challenges_table.c.assigned_to,
+                trusted=trusted_hydration,
+            ),
+            "amount": vo_composite(
+                ChallengeAmount,
+                challenges_table.c.amount,
+                trusted=trusted_hydration,
+            ),
+            "fee": vo_composite(
+                ChallengeFee,
+                challenges_table.c.fee,
+                trusted=trusted_hydration,
+            ),
+            "streamer_fixed_amount": vo_composite(
+                StreamerChallengeFixedAmount,
+                challenges_table.c.streamer_fixed_amount,
+                trusted=trusted_hydration,
+            ),
             "status": challenges_table.c.status,
-            "created_at": composite(CreatedAt, challenges_table.c.created_at),
-            "expires_at": composite(ExpiresAt, challenges_table.c.expires_at),
-            "accepted_at": composite(AcceptedAt, challenges_table.c.accepted_at),
+            "created_at": vo_composite(
+                CreatedAt,
+                challenges_table.c.created_at,
+                trusted=trusted_hydration,
+            ),
+            "expires_at": vo_composite(
+                ExpiresAt,
+                challenges_table.c.expires_at,
+                trusted=trusted_hydration,
+            ),
+            "accepted_at": vo_composite(
+                AcceptedAt,
+                challenges_table.c.accepted_at,
+                trusted=trusted_hydration,
+            ),
         },
         column_prefix="_",
     )
\ No newline at end of file
@@ -0,0 +1,67 @@
+from sqlalchemy import UUID, Column, DateTime, Enum, Index, Table
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.domain.challenge.challenge_history import ChallengeHistory
+from app.domain.challenge.challenge_status import ChallengeStatus
+from app.domain.shared.value_objects.id import ChallengeHistoryId, ProductId, UserId
+from app.domain.shared.value_objects.time import CreatedAt
+from app.infrastructure.persistence_sqla.composites import vo_composite
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+challenge_history_table = Table(
+    "challenge_history",
+    mapping_registry.metadata,
+    Column("id", UUID(as_uuid=True), primary_key=True),
+    Column("challenge_id", UUID(as_uuid=True), nullable=False),
+    Column(
+        "previous_status",
+        Enum(ChallengeStatus, name="challengestatus"),
+        nullable=True,
+    ),
+    Column(
+        "current_status",
+        Enum(ChallengeStatus, name="challengestatus"),
+        nullable=False,
+    ),
+    Column("changed_by", UUID(as_uuid=True), nullable=True),
+    Column("changed_at", DateTime(timezone=True), nullable=False),
+    # Only the fields that changed, as plain JSON values;
+    # a transition without field changes stores SQL `NULL`.
+    Column("changes", JSONB(none_as_null=True), nullable=True),
+    # A challenge's timeline is one range scan in `changed_at` order.
+    Index(None, "challenge_id", "changed_at"),
+)
+
+
+def map_challenge_history_table(*, trusted_hydration: bool = True) -> None:
+    mapping_registry.map_imperatively(
+        ChallengeHistory,
+        challenge_history_table,
+        properties={
+            "id_": vo_composite(
+                ChallengeHistoryId,
+                challenge_history_table.c.id,
+                trusted=trusted_hydration,
+            ),
+            "challenge_id": vo_composite(
+                ProductId,
+                challenge_history_table.c.challenge_id,
+                trusted=trusted_hydration,
+            ),
+            "previous_status": challenge_history_table.c.previous_status,
+            "current_status": challenge_history_table.c.current_status,
+            "changed_by": vo_composite(
+                UserId,
+                challenge_history_table.c.changed_by,
+                trusted=trusted_hydration,
+                nullable=True,
+            ),
+            "changed_at": vo_composite(
+                CreatedAt,
+                challenge_history_table.c.changed_at,
+                trusted=trusted_hydration,
+            ),
+            "changes": challenge_history_table.c.changes,
+        },
+        column_prefix="_",
+    )
@@ -1,10 +1,11 @@
-from sqlalchemy import UUID, Column, Enum, ForeignKey, Numeric, Table
-from sqlalchemy.orm import composite
+from sqlalchemy import UUID, Column, Enum, ForeignKey, Table
 
 from app.domain.shared.entities.ledger.account_type import AccountType
 from app.domain.shared.entities.ledger.ledger_entry import LedgerEntry
 from app.domain.shared.value_objects.id import EntryId, TransactionId, WalletId
 from app.domain.shared.value_objects.token import Token
+from app.infrastructure.persistence_sqla.column_types import MinorUnits
+from app.infrastructure.persistence_sqla.composites import vo_composite
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 ledger_entries_table = Table(
@@ -19,25 +20,42 @@ ledger_entries_table = Table(
     ),
     Column("account_type", Enum(AccountType, name="account_type"), nullable=False),
     Column("account_id", UUID(as_uuid=True), nullable=True),
-    Column("debit", Numeric(12, 2), default=0, nullable=False),
-    Column("credit", Numeric(12, 2), default=0, nullable=False),
+    Column("debit", MinorUnits(), default=0, nullable=False),
+    Column("credit", MinorUnits(), default=0, nullable=False),
 )
 
 
-def map_ledger_entries_table() -> None:
+def map_ledger_entries_table(*, trusted_hydration: bool = True) -> None:
     mapping_registry.map_imperatively(
         LedgerEntry,
         ledger_entries_table,
         properties={
-            "id_": composite(EntryId, ledger_entries_table.c.id),
-            "transaction_id": composite(
+            "id_": vo_composite(
+                EntryId,
+                ledger_entries_table.c.id,
+                trusted=trusted_hydration,
+            ),
+            "transaction_id": vo_composite(
                 TransactionId,
                 ledger_entries_table.c.transaction_id,
+                trusted=trusted_hydration,
             ),
             "account_type": ledger_entries_table.c.account_type,
-            "account_id": composite(WalletId, ledger_entries_table.c.account_id),
-            "debit": composite(Token, ledger_entries_table.c.debit),
-            "credit": composite(Token, ledger_entries_table.c.credit),
+            "account_id": vo_composite(
+                WalletId,
+                ledger_entries_table.c.account_id,
+                trusted=trusted_hydration,
+            ),
+            "debit": vo_composite(
+                Token,
+                ledger_entries_table.c.debit,
+                trusted=trusted_hydration,
+            ),
+            "credit": vo_composite(
+                Token,
+                ledger_entries_table.c.credit,
+                trusted=trusted_hydration,
+            ),
         },
         column_prefix="_",
     )
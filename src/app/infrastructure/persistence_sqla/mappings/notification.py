@@ -0,0 +1,87 @@
+from sqlalchemy import (
+    UUID,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Table,
+    UniqueConstraint,
+)
+
+from app.domain.shared.entities.notification.notification import Notification
+from app.domain.shared.value_objects.id import NotificationId, ProductId, UserId
+from app.domain.shared.value_objects.time import CreatedAt, DeliveredAt
+from app.infrastructure.persistence_sqla.composites import vo_composite
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+notifications_table = Table(
+    "notifications",
+    mapping_registry.metadata,
+    # Time-ordered (UUIDv7), so it doubles as the pagination key.
+    Column("id", UUID(as_uuid=True), primary_key=True),
+    Column("product_id", UUID(as_uuid=True), nullable=False),
+    Column("user_id", UUID(as_uuid=True), nullable=False),
+    Column("title", String, nullable=False),
+    Column("message", String, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("delivered_at", DateTime(timezone=True), nullable=True),
+    Column("is_read", Boolean, nullable=False, default=False),
+    Column("event_type", String, nullable=True),
+    # A page of a user's notifications is one range scan from the cursor.
+    Index(None, "user_id", "id"),
+    # An event redelivered by the outbox notifies nobody twice.
+    # Notifications of no event are `NULL` here, hence never in conflict.
+    UniqueConstraint("product_id", "user_id", "event_type"),
+)
+
+# Kept in step with `notifications` by every write that changes
+# how many of a user's notifications are unread,
+# so that badge counts are a primary key lookup.
+notification_counters_table = Table(
+    "notification_counters",
+    mapping_registry.metadata,
+    Column("user_id", UUID(as_uuid=True), primary_key=True),
+    Column("unread", Integer, nullable=False),
+)
+
+
+def map_notifications_table(*, trusted_hydration: bool = True) -> None:
+    mapping_registry.map_imperatively(
+        Notification,
+        notifications_table,
+        properties={
+            "id_": vo_composite(
+                NotificationId,
+                notifications_table.c.id,
+                trusted=trusted_hydration,
+            ),
+            "product_id": vo_composite(
+                ProductId,
+                notifications_table.c.product_id,
+                trusted=trusted_hydration,
+            ),
+            "user_id": vo_composite(
+                UserId,
+                notifications_table.c.user_id,
+                trusted=trusted_hydration,
+            ),
+            "title": notifications_table.c.title,
+            "message": notifications_table.c.message,
+            "created_at": vo_composite(
+                CreatedAt,
+                notifications_table.c.created_at,
+                trusted=trusted_hydration,
+            ),
+            "delivered_at": vo_composite(
+                DeliveredAt,
+                notifications_table.c.delivered_at,
+                trusted=trusted_hydration,
+                nullable=True,
+            ),
+            "is_read": notifications_table.c.is_read,
+            "event_type": notifications_table.c.event_type,
+        },
+        column_prefix="_",
+    )
@@ -0,0 +1,50 @@
+from sqlalchemy import (
+    UUID,
+    BigInteger,
+    Column,
+    DateTime,
+    Identity,
+    Index,
+    Integer,
+    String,
+    Table,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.infrastructure.outbox.model import OutboxMessage
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+outbox_table = Table(
+    "outbox",
+    mapping_registry.metadata,
+    # Publication order, within and across transactions.
+    Column("id", BigInteger, Identity(), primary_key=True),
+    Column("aggregate_id", UUID(as_uuid=True), nullable=False),
+    Column("event_type", String, nullable=False),
+    Column("payload", JSONB, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("attempts", Integer, nullable=False, server_default="0"),
+    # Lease of the relay dispatching the aggregate, so that it
+    # holds no lock or connection while the handlers run.
+    Column("claimed_by", UUID(as_uuid=True), nullable=True),
+    Column("claimed_until", DateTime(timezone=True), nullable=True),
+    # Finds the earlier events of an aggregate still waiting for dispatch.
+    Index(None, "aggregate_id", "id"),
+)
+
+
+def map_outbox_table() -> None:
+    mapping_registry.map_imperatively(
+        OutboxMessage,
+        outbox_table,
+        properties={
+            "id_": outbox_table.c.id,
+            "aggregate_id": outbox_table.c.aggregate_id,
+            "event_type": outbox_table.c.event_type,
+            "payload": outbox_table.c.payload,
+            "created_at": outbox_table.c.created_at,
+            "attempts": outbox_table.c.attempts,
+        },
+        exclude_properties=["claimed_by", "claimed_until"],
+        column_prefix="_",
+    )
@@ -1,11 +1,11 @@
-from sqlalchemy import UUID, Boolean, Column, DateTime, Numeric, Table
-from sqlalchemy.orm import composite
+from sqlalchemy import UUID, Boolean, Column, DateTime, Table
 
 from app.domain.shared.value_objects.id import UserId, StreamerId
 from app.domain.shared.value_objects.time import CreatedAt, UpdatedAt, VerifiedAt
 from app.domain.user.streamer import Streamer
 from app.domain.user.value_objects import StreamerChallengeFixedAmount
-
+from app.infrastructure.persistence_sqla.column_types import MinorUnits
+from app.infrastructure.persistence_sqla.composites import vo_composite
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 streamers_table = Table(
@@ -14,7 +14,7 @@ streamers_table = Table(
     Column("id", UUID(as_uuid=True), primary_key=True),
     Column("user_id", UUID(as_uuid=True), nullable=False, unique=True),
     Column("is_verified", Boolean, default=False, nullable=False),
-    Column("min_amount_challenge", Numeric(precision=12, scale=2), nullable=False),
+    Column("min_amount_challenge", MinorUnits(), nullable=False),
     Column("disable_challenges", Boolean, default=False, nullable=False),
     Column("created_at", DateTime(timezone=True), nullable=False),
     Column("updated_at", DateTime(timezone=True), nullable=False),
@@ -23,23 +23,48 @@ streamers_table = Table(
 )
 
 
-def map_streamers_table() -> None:
+def map_streamers_table(*, trusted_hydration: bool = True) -> None:
     mapping_registry.map_imperatively(
         Streamer,
         streamers_table,
         properties={
-            "id_": composite(StreamerId, streamers_table.c.id),
-            "user_id": composite(UserId, streamers_table.c.user_id),
+            "id_": vo_composite(
+                StreamerId,
+                streamers_table.c.id,
+                trusted=trusted_hydration,
+            ),
+            "user_id": vo_composite(
+                UserId,
+                streamers_table.c.user_id,
+                trusted=trusted_hydration,
+            ),
             "is_verified": streamers_table.c.is_verified,
-            "min_amount_challenge": composite(
+            "min_amount_challenge": vo_composite(
                 StreamerChallengeFixedAmount,
                 streamers_table.c.min_amount_challenge,
+                trusted=trusted_hydration,
             ),
             "disable_challenges": streamers_table.c.disable_challenges,
-            "created_at": composite(CreatedAt, streamers_table.c.created_at),
-            "updated_at": composite(UpdatedAt, streamers_table.c.updated_at),
-            "verified_at": composite(VerifiedAt, streamers_table.c.verified_at),
-            "verified_by": composite(UserId, streamers_table.c.verified_by),
+            "created_at": vo_composite(
+                CreatedAt,
+                streamers_table.c.created_at,
+                trusted=trusted_hydration,
+            ),
+            "updated_at": vo_composite(
+                UpdatedAt,
+                streamers_table.c.updated_at,
+                trusted=trusted_hydration,
+            ),
+            "verified_at": vo_composite(
+                VerifiedAt,
+                streamers_table.c.verified_at,
+                trusted=trusted_hydration,
+            ),
+            "verified_by": vo_composite(
+                UserId,
+                streamers_table.c.verified_by,
+                trusted=trusted_hydration,
+            ),
         },
         column_prefix="_",
     )
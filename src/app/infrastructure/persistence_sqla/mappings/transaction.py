@@ -1,5 +1,5 @@
-from sqlalchemy import UUID, Column, DateTime, Enum, Numeric, Table
-from sqlalchemy.orm import composite, relationship
+from sqlalchemy import UUID, Column, DateTime, Enum, Table
+from sqlalchemy.orm import relationship
 
 from app.domain.shared.entities.ledger.account_type import AccountType
 from app.domain.shared.entities.transaction.transaction import Transaction
@@ -8,6 +8,8 @@ from app.domain.shared.enums import ProductType
 from app.domain.shared.value_objects.id import ProductId, TransactionId, WalletId
 from app.domain.shared.value_objects.time import CreatedAt
 from app.domain.shared.value_objects.token import Token
+from app.infrastructure.persistence_sqla.column_types import MinorUnits
+from app.infrastructure.persistence_sqla.composites import vo_composite
 from app.infrastructure.persistence_sqla.mappings.ledger_entry import (
     ledger_entries_table,
 )
@@ -24,26 +26,46 @@ transactions_table = Table(
     ),
     Column("payer_type", Enum(AccountType, name="account_type"), nullable=False),
     Column("payer_id", UUID(as_uuid=True), nullable=True),
-    Column("amount", Numeric(12, 2), nullable=False),
+    Column("amount", MinorUnits(), nullable=False),
     Column("reference_id", UUID(as_uuid=True), nullable=False),
     Column("reference_type", Enum(ProductType, name="product_type"), nullable=False),
     Column("created_at", DateTime(timezone=True), nullable=False),
 )
 
 
-def map_transactions_table() -> None:
+def map_transactions_table(*, trusted_hydration: bool = True) -> None:
     mapping_registry.map_imperatively(
         Transaction,
         transactions_table,
         properties={
-            "id_": composite(TransactionId, transactions_table.c.id),
+            "id_": vo_composite(
+                TransactionId,
+                transactions_table.c.id,
+                trusted=trusted_hydration,
+            ),
             "transaction_type": transactions_table.c.transaction_type,
             "payer_type": transactions_table.c.payer_type,
-            "payer_id": composite(WalletId, transactions_table.c.payer_id),
-            "amount": composite(Token, transactions_table.c.amount),
-            "reference_id": composite(ProductId, transactions_table.c.reference_id),
+            "payer_id": vo_composite(
+                WalletId,
+                transactions_table.c.payer_id,
+                trusted=trusted_hydration,
+            ),
+            "amount": vo_composite(
+                Token,
+                transactions_table.c.amount,
+                trusted=trusted_hydration,
+            ),
+            "reference_id": vo_composite(
+                ProductId,
+                transactions_table.c.reference_id,
+                trusted=trusted_hydration,
+            ),
             "reference_type": transactions_table.c.reference_type,
-            "created_at": composite(CreatedAt, transactions_table.c.created_at),
+            "created_at": vo_composite(
+                CreatedAt,
+                transactions_table.c.created_at,
+                trusted=trusted_hydration,
+            ),
             "_ledger_entries": relationship(
                 "LedgerEntry",
                 collection_class=list,
@@ -1,5 +1,4 @@
 from sqlalchemy import UUID, Boolean, Column, Enum, LargeBinary, String, Table, NUMERIC, DateTime, DOUBLE_PRECISION
-from sqlalchemy.orm import composite
 
 from app.domain.shared.value_objects.id import UserId
 from app.domain.shared.value_objects.time import CreatedAt, UpdatedAt
@@ -9,6 +8,7 @@ from app.domain.user.value_objects import Credibility, Email, UserPasswordHash
 from app.domain.user.value_objects import Username
 
 
+from app.infrastructure.persistence_sqla.composites import vo_composite
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 users_table = Table(
@@ -31,20 +31,44 @@ users_table = Table(
 )
 
 
-def map_users_table() -> None:
+def map_users_table(*, trusted_hydration: bool = True) -> None:
     mapping_registry.map_imperatively(
         User,
         users_table,
         properties={
-            "id_": composite(UserId, users_table.c.id),
-            "username": composite(Username, users_table.c.username),
-            "email": composite(Email, users_table.c.email),
-            "password_hash": composite(UserPasswordHash, users_table.c.password_hash),
+            "id_": vo_composite(UserId, users_table.c.id, trusted=trusted_hydration),
+            "username": vo_composite(
+                Username,
+                users_table.c.username,
+                trusted=trusted_hydration,
+            ),
+            "email": vo_composite(
+                Email,
+                users_table.c.email,
+                trusted=trusted_hydration,
+            ),
+            "password_hash": vo_composite(
+                UserPasswordHash,
+                users_table.c.password_hash,
+                trusted=trusted_hydration,
+            ),
             "role": users_table.c.role,
             "is_active": users_table.c.is_active,
-            "credibility": composite(Credibility, users_table.c.credibility),
-            "created_at": composite(CreatedAt, users_table.c.created_at),
-            "updated_at": composite(UpdatedAt, users_table.c.updated_at),
+            "credibility": vo_composite(
+                Credibility,
+                users_table.c.credibility,
+                trusted=trusted_hydration,
+            ),
+            "created_at": vo_composite(
+                CreatedAt,
+                users_table.c.created_at,
+                trusted=trusted_hydration,
+            ),
+            "updated_at": vo_composite(
+                UpdatedAt,
+                users_table.c.updated_at,
+                trusted=trusted_hydration,
+            ),
         },
         column_prefix="_",
     )
@@ -1,11 +1,12 @@
-from sqlalchemy import UUID, Column, Table, NUMERIC, DateTime
-from sqlalchemy.orm import composite
+from sqlalchemy import UUID, Column, Table, DateTime
 
 from app.domain.shared.value_objects.time import CreatedAt, UpdatedAt
 from app.domain.wallet.value_objects import Balance
 from app.domain.wallet.wallet import Wallet
 from app.domain.shared.value_objects.id import UserId, WalletId
 
+from app.infrastructure.persistence_sqla.column_types import MinorUnits
+from app.infrastructure.persistence_sqla.composites import vo_composite
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 wallets_table = Table(
@@ -13,22 +14,42 @@ wallets_table = Table(
     mapping_registry.metadata,
     Column("id", UUID(as_uuid=True), primary_key=True),
     Column("owner_id", UUID(as_uuid=True), nullable=False),
-    Column("balance", NUMERIC(12, 2), default=0, nullable=False),
+    Column("balance", MinorUnits(), default=0, nullable=False),
     Column("created_at", DateTime(timezone=True), nullable=False),
     Column("updated_at", DateTime(timezone=True), nullable=False),
 )
 
 
-def map_wallets_table() -> None:
+def map_wallets_table(*, trusted_hydration: bool = True) -> None:
     mapping_registry.map_imperatively(
         Wallet,
         wallets_table,
         properties={
-            "id_": composite(WalletId, wallets_table.c.id),
-            "owner_id": composite(UserId, wallets_table.c.owner_id),
-            "balance": composite(Balance, wallets_table.c.balance),
-            "created_at": composite(CreatedAt, wallets_table.c.created_at),
-            "updated_at": composite(UpdatedAt, wallets_table.c.updated_at),
+            "id_": vo_composite(
+                WalletId,
+                wallets_table.c.id,
+                trusted=trusted_hydration,
+            ),
+            "owner_id": vo_composite(
+                UserId,
+                wallets_table.c.owner_id,
+                trusted=trusted_hydration,
+            ),
+            "balance": vo_composite(
+                Balance,
+                wallets_table.c.balance,
+                trusted=trusted_hydration,
+            ),
+            "created_at": vo_composite(
+                CreatedAt,
+                wallets_table.c.created_at,
+                trusted=trusted_hydration,
+            ),
+            "updated_at": vo_composite(
+                UpdatedAt,
+                wallets_table.c.updated_at,
+                trusted=trusted_hydration,
+            ),
         },
         column_prefix="_",
     )
@@ -65,8 +65,23 @@ async def get_main_async_session(
 
 async def get_auth_async_session(
     async_session_factory: async_sessionmaker[AsyncSession],
+    engine_config: SqlaEngineConfig,
+    main_session: MainAsyncSession,
 ) -> AsyncIterator[AuthAsyncSession]:
-    """Provides UoW (AsyncSession) for the auth context."""
+    """
+    Provides UoW (AsyncSession) for the auth context.
+
+    With `share_auth_session`, it is the Main one: both contexts run
+    on a single pooled connection, in the same transaction. An auth commit
+    then also commits what the main context has flushed, so the auth context
+    only commits where the main one has nothing pending: at log-in
+    and log-out, and on revoking access, after the main commit or reads only.
+    """
+    if engine_config.share_auth_session:
+        log.debug("Auth async session shares the Main one.")
+        yield cast(AuthAsyncSession, main_session)
+        return
+
     log.debug("Starting Auth async session...")
     async with async_session_factory() as session:
         log.debug("Auth async session started.")
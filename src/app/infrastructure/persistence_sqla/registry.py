@@ -1,9 +1,12 @@
 from collections.abc import Mapping
 from types import MappingProxyType
-from typing import Final
+from typing import Any, Final
 
-from sqlalchemy import MetaData
-from sqlalchemy.orm import registry
+from sqlalchemy import MetaData, event
+from sqlalchemy.orm import Mapper, registry
+from sqlalchemy.orm.base import LoaderCallableStatus
+
+from app.domain.base import ENTITY_ID_CHANGE_ERROR, Entity, ValueObject
 
 NAMING_CONVENTIONS: Final[Mapping[str, str]] = MappingProxyType({
     "ix": "ix_%(column_0_label)s",
@@ -14,3 +17,24 @@ NAMING_CONVENTIONS: Final[Mapping[str, str]] = MappingProxyType({
 })
 
 mapping_registry = registry(metadata=MetaData(naming_convention=NAMING_CONVENTIONS))
+
+
+def _reject_entity_id_change(
+    _target: Entity[Any],
+    value: ValueObject,
+    oldvalue: object,
+    _initiator: object,
+) -> ValueObject:
+    if oldvalue is not None and oldvalue is not LoaderCallableStatus.NO_VALUE:
+        raise AttributeError(ENTITY_ID_CHANGE_ERROR)
+    return value
+
+
+@event.listens_for(Entity, "mapper_configured", propagate=True)
+def _guard_entity_id(mapper: Mapper[Any], class_: type[Entity[Any]]) -> None:
+    """
+    Mapping `id_` replaces the write-once `Entity.id_` descriptor
+    with an ORM attribute, so the same rule is enforced on that attribute.
+    """
+    if "id_" in mapper.all_orm_descriptors:
+        event.listen(class_.id_, "set", _reject_entity_id_change, retval=True)
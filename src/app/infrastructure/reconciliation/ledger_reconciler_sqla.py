@@ -0,0 +1,251 @@
+import logging
+from collections.abc import AsyncIterator
+from typing import Any, Final
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    LargeBinary,
+    Select,
+    cast,
+    func,
+    select,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.domain.shared.entities.ledger.account_type import AccountType
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.exceptions.gateway import ReaderError
+from app.infrastructure.persistence_sqla.column_types import MinorUnits
+from app.infrastructure.persistence_sqla.mappings.ledger_entry import (
+    ledger_entries_table,
+)
+from app.infrastructure.persistence_sqla.mappings.transaction import (
+    transactions_table,
+)
+from app.infrastructure.persistence_sqla.mappings.wallet import wallets_table
+from app.infrastructure.reconciliation.report import (
+    DEFAULT_MAX_REPORTED,
+    ReconciliationReport,
+    UnbalancedTransaction,
+    WalletMismatch,
+)
+from app.infrastructure.reconciliation.sorted_group_sums import (
+    GroupSums,
+    SortedGroupSums,
+    unpack_records,
+)
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE: Final[int] = 100_000
+
+
+def _record(
+    key: ColumnElement[Any],
+    *values: ColumnElement[int],
+) -> ColumnElement[bytes]:
+    """Packs a row the way `unpack_records` reads it."""
+    record: ColumnElement[bytes] = func.uuid_send(key, type_=LargeBinary)
+    for value in values:
+        record = record.op("||", return_type=LargeBinary)(
+            func.int8send(value, type_=LargeBinary),
+        )
+    return record
+
+
+def _minor_units(column: ColumnElement[Any]) -> ColumnElement[int]:
+    return MinorUnits().column_expression(column)
+
+
+def _minor_units_or_zero(column: ColumnElement[Any]) -> ColumnElement[int]:
+    return _minor_units(func.coalesce(column, 0))
+
+
+def wallet_net_select() -> Select[tuple[bytes]]:
+    """
+    One record per `USER_WALLET` ledger entry, paired with its wallet and
+    ordered by wallet, so both tables go through a single sorted stream:
+    wallet id, missing wallet flag, balance, net of the entry.
+    A wallet without entries still shows up once with a zero net,
+    and entries without a wallet show up with the flag set.
+    """
+    entries = (
+        select(
+            ledger_entries_table.c.account_id,
+            ledger_entries_table.c.debit,
+            ledger_entries_table.c.credit,
+        )
+        .where(
+            ledger_entries_table.c.account_type == AccountType.USER_WALLET,
+            ledger_entries_table.c.account_id.is_not(None),
+        )
+        .subquery("wallet_entries")
+    )
+    wallet_id = func.coalesce(wallets_table.c.id, entries.c.account_id)
+    return (
+        select(
+            _record(
+                wallet_id,
+                cast(wallets_table.c.id.is_(None), Integer),
+                _minor_units_or_zero(wallets_table.c.balance),
+                _minor_units_or_zero(entries.c.credit - entries.c.debit),
+            ).label("record"),
+        )
+        .select_from(
+            wallets_table.outerjoin(
+                entries,
+                wallets_table.c.id == entries.c.account_id,
+                full=True,
+            ),
+        )
+        .order_by(wallet_id)
+    )
+
+
+def transaction_totals_select() -> Select[tuple[bytes]]:
+    """
+    One record per ledger entry, paired with its transaction and ordered by it:
+    transaction id, amount, debit, credit.
+    A transaction without entries still shows up once with zero totals.
+    """
+    return (
+        select(
+            _record(
+                transactions_table.c.id,
+                _minor_units(transactions_table.c.amount),
+                _minor_units_or_zero(ledger_entries_table.c.debit),
+                _minor_units_or_zero(ledger_entries_table.c.credit),
+            ).label("record"),
+        )
+        .select_from(
+            transactions_table.outerjoin(
+                ledger_entries_table,
+                transactions_table.c.id == ledger_entries_table.c.transaction_id,
+            ),
+        )
+        .order_by(transactions_table.c.id)
+    )
+
+
+class SqlaLedgerReconciler:
+    """
+    Checks that every wallet balance equals the net of its `USER_WALLET`
+    ledger entries (credits minus debits) and that every transaction's
+    debits and credits both add up to its amount.
+    Rows are streamed through server-side cursors in chunks, no entity is
+    loaded, and memory is bounded by the chunk size. Postgres packs each row
+    into one fixed-width record of integer minor units, so a chunk decodes
+    in a single `frombuffer`, and sorts each stream by its group key,
+    so NumPy only has to find group boundaries and sum between them.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_reported: int = DEFAULT_MAX_REPORTED,
+    ):
+        self._engine = engine
+        self._chunk_size = chunk_size
+        self._max_reported = max_reported
+
+    async def reconcile(self) -> ReconciliationReport:
+        """:raises ReaderError:"""
+        report = ReconciliationReport(max_reported=self._max_reported)
+        try:
+            async with self._engine.connect() as connection:
+                # Both checks see the same snapshot of the ledger.
+                snapshot = await connection.execution_options(
+                    isolation_level="REPEATABLE READ",
+                    postgresql_readonly=True,
+                )
+                await self._check_wallets(snapshot, report)
+                await self._check_transactions(snapshot, report)
+        except SQLAlchemyError as err:
+            raise ReaderError(DB_QUERY_FAILED) from err
+        return report
+
+    async def _check_wallets(
+        self,
+        connection: AsyncConnection,
+        report: ReconciliationReport,
+    ) -> None:
+        groups = SortedGroupSums(head_count=2, value_count=1)
+        async for chunk in self._grouped(connection, wallet_net_select(), groups):
+            self._record_wallets(chunk, report)
+        log.info(
+            "Wallets checked: %d, mismatched: %d.",
+            report.wallets_checked,
+            report.wallet_mismatch_count,
+        )
+
+    async def _check_transactions(
+        self,
+        connection: AsyncConnection,
+        report: ReconciliationReport,
+    ) -> None:
+        groups = SortedGroupSums(head_count=1, value_count=2)
+        statement = transaction_totals_select()
+        async for chunk in self._grouped(connection, statement, groups):
+            self._record_transactions(chunk, report)
+        log.info(
+            "Transactions checked: %d, unbalanced: %d.",
+            report.transactions_checked,
+            report.unbalanced_transaction_count,
+        )
+
+    async def _grouped(
+        self,
+        connection: AsyncConnection,
+        statement: Select[tuple[bytes]],
+        groups: SortedGroupSums,
+    ) -> AsyncIterator[GroupSums]:
+        records = await connection.stream_scalars(
+            statement.execution_options(yield_per=self._chunk_size),
+        )
+        async for chunk in records.partitions():
+            yield groups.feed(*unpack_records(chunk, groups.column_count))
+        yield groups.finish()
+
+    @staticmethod
+    def _record_wallets(groups: GroupSums, report: ReconciliationReport) -> None:
+        report.wallets_checked += len(groups)
+        missing_wallet, balance = groups.heads
+        (net,) = groups.sums
+        mismatched = np.flatnonzero((missing_wallet != 0) | (balance != net))
+        report.wallet_mismatch_count += len(mismatched)
+        room = report.max_reported - len(report.wallet_mismatches)
+        report.wallet_mismatches.extend(
+            WalletMismatch(
+                wallet_id=UUID(bytes=groups.keys[i].tobytes()),
+                balance=None if missing_wallet[i] else int(balance[i]),
+                ledger_net=int(net[i]),
+            )
+            for i in mismatched[: max(room, 0)]
+        )
+
+    @staticmethod
+    def _record_transactions(
+        groups: GroupSums,
+        report: ReconciliationReport,
+    ) -> None:
+        report.transactions_checked += len(groups)
+        (amount,) = groups.heads
+        total_debit, total_credit = groups.sums
+        unbalanced = np.flatnonzero((total_debit != amount) | (total_credit != amount))
+        report.unbalanced_transaction_count += len(unbalanced)
+        room = report.max_reported - len(report.unbalanced_transactions)
+        report.unbalanced_transactions.extend(
+            UnbalancedTransaction(
+                transaction_id=UUID(bytes=groups.keys[i].tobytes()),
+                amount=int(amount[i]),
+                total_debit=int(total_debit[i]),
+                total_credit=int(total_credit[i]),
+            )
+            for i in unbalanced[: max(room, 0)]
+        )
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from typing import Final
+from uuid import UUID
+
+DEFAULT_MAX_REPORTED: Final[int] = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class WalletMismatch:
+    """`balance` is `None` for ledger entries whose wallet does not exist."""
+
+    wallet_id: UUID
+    balance: int | None
+    ledger_net: int
+
+
+@dataclass(frozen=True, slots=True)
+class UnbalancedTransaction:
+    transaction_id: UUID
+    amount: int
+    total_debit: int
+    total_credit: int
+
+
+@dataclass(slots=True)
+class ReconciliationReport:
+    """
+    Amounts are in minor units.
+    Every mismatch is counted, but only the first `max_reported`
+    of each kind are kept, so a badly broken ledger cannot exhaust memory.
+    """
+
+    max_reported: int = DEFAULT_MAX_REPORTED
+    wallets_checked: int = 0
+    transactions_checked: int = 0
+    wallet_mismatch_count: int = 0
+    unbalanced_transaction_count: int = 0
+    wallet_mismatches: list[WalletMismatch] = field(default_factory=list)
+    unbalanced_transactions: list[UnbalancedTransaction] = field(
+        default_factory=list,
+    )
+
+    @property
+    def is_consistent(self) -> bool:
+        return not self.wallet_mismatch_count and not self.unbalanced_transaction_count
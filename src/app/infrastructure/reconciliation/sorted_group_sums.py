@@ -0,0 +1,123 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+KEY_SIZE: Final[int] = 16
+_KEY_WORDS: Final[int] = KEY_SIZE // np.dtype(np.uint64).itemsize
+
+type Keys = NDArray[np.uint64]
+type Columns = NDArray[np.int64]
+
+
+def unpack_records(records: Sequence[bytes], column_count: int) -> tuple[Keys, Columns]:
+    """
+    Splits fixed-width records, each a 16-byte key followed by `column_count`
+    big-endian `int8` values, the way Postgres sends them out of
+    `uuid_send(key) || int8send(value) || ...`.
+    A whole chunk is decoded by one `frombuffer`, with no object per value.
+    Keys come out as rows of two words, so they compare with integer ops;
+    only equality is ever asked of them, and `key.tobytes()`
+    gives the original bytes back.
+    Columns come out shaped `(column_count, number of records)`.
+    """
+    layout = np.dtype(
+        [
+            ("key", np.uint64, (_KEY_WORDS,)),
+            ("columns", ">i8", (column_count,)),
+        ],
+    )
+    packed = np.frombuffer(b"".join(records), dtype=layout)
+    return packed["key"], np.ascontiguousarray(packed["columns"].T, dtype=np.int64)
+
+
+@dataclass(frozen=True, slots=True)
+class GroupSums:
+    """
+    One column per group: `heads` are taken from the first row of the group,
+    `sums` add up every row of it.
+    """
+
+    keys: Keys
+    heads: Columns
+    sums: Columns
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class SortedGroupSums:
+    """
+    Group-by over a stream of chunks whose rows arrive sorted by key,
+    so groups are found by comparing neighbours instead of hashing or sorting.
+    The last group of a chunk may continue in the next one:
+    it is held back, already summed, until a different key or `finish` shows up.
+    Memory stays within one chunk regardless of the number of groups.
+    """
+
+    __slots__ = ("_head_count", "_pending", "_value_count")
+
+    def __init__(self, *, head_count: int, value_count: int) -> None:
+        self._head_count = head_count
+        self._value_count = value_count
+        self._pending: tuple[Keys, Columns] | None = None
+
+    @property
+    def column_count(self) -> int:
+        return self._head_count + self._value_count
+
+    def feed(self, keys: Keys, columns: Columns) -> GroupSums:
+        """
+        Takes a chunk of `keys` and `columns` shaped `(heads + values, rows)`
+        and returns the groups that are complete.
+        """
+        if self._pending is not None:
+            pending_keys, pending_columns = self._pending
+            keys = np.concatenate((pending_keys, keys))
+            columns = np.concatenate((pending_columns, columns), axis=1)
+        if len(keys) == 0:
+            return self._empty()
+
+        is_start = np.empty(len(keys), dtype=np.bool_)
+        is_start[0] = True
+        np.any(keys[1:] != keys[:-1], axis=1, out=is_start[1:])
+        starts = np.flatnonzero(is_start)
+
+        last = starts[-1]
+        self._pending = (
+            keys[last : last + 1].copy(),
+            self._collapse(columns[:, last:]),
+        )
+        complete = starts[:-1]
+        if len(complete) == 0:
+            return self._empty()
+
+        heads = columns[: self._head_count, complete]
+        sums = np.add.reduceat(columns[self._head_count :, :last], complete, axis=1)
+        return GroupSums(keys=keys[complete], heads=heads, sums=sums)
+
+    def finish(self) -> GroupSums:
+        """Returns the group held back from the last chunk, if any."""
+        if self._pending is None:
+            return self._empty()
+        keys, columns = self._pending
+        self._pending = None
+        return GroupSums(
+            keys=keys,
+            heads=columns[: self._head_count],
+            sums=columns[self._head_count :],
+        )
+
+    def _collapse(self, group: Columns) -> Columns:
+        heads = group[: self._head_count, :1]
+        sums = group[self._head_count :].sum(axis=1, keepdims=True)
+        return np.concatenate((heads, sums))
+
+    def _empty(self) -> GroupSums:
+        return GroupSums(
+            keys=np.empty((0, _KEY_WORDS), dtype=np.uint64),
+            heads=np.empty((self._head_count, 0), dtype=np.int64),
+            sums=np.empty((self._value_count, 0), dtype=np.int64),
+        )
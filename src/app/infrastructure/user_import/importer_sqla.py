@@ -0,0 +1,333 @@
+import asyncio
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, Final, cast
+from uuid import UUID
+
+import psycopg
+from sqlalchemy import (
+    Select,
+    TextClause,
+    column,
+    or_,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.sql.dml import ReturningInsert
+
+from app.domain.base import DomainFieldError
+from app.domain.shared.value_objects.money import from_minor_units
+from app.domain.user.service import UserService
+from app.domain.user.user import User
+from app.domain.user.value_objects import Email, RawPassword, Username
+from app.domain.wallet.service import WalletService
+from app.domain.wallet.wallet import Wallet
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+from app.infrastructure.persistence_sqla.mappings.wallet import wallets_table
+from app.infrastructure.user_import.report import RejectedRow, UserImportReport
+from app.infrastructure.user_import.source import ImportRow
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE: Final[int] = 1000
+
+USER_COPY_COLUMNS: Final[tuple[str, ...]] = (
+    "id",
+    "username",
+    "email",
+    "password_hash",
+    "role",
+    "is_active",
+    "credibility",
+    "created_at",
+    "updated_at",
+)
+WALLET_COPY_COLUMNS: Final[tuple[str, ...]] = (
+    "id",
+    "owner_id",
+    "balance",
+    "created_at",
+    "updated_at",
+)
+
+_STAGING_TABLE: Final[str] = "user_import_staging"
+_staging_table = table(
+    _STAGING_TABLE,
+    *(column(name) for name in USER_COPY_COLUMNS),
+)
+
+type RejectSink = Callable[[RejectedRow], None]
+
+
+@dataclass(frozen=True, slots=True)
+class ValidRow:
+    line: int
+    username: Username
+    email: Email
+    password: RawPassword
+
+
+def validate_row(row: ImportRow) -> ValidRow | RejectedRow:
+    try:
+        return ValidRow(
+            line=row.line,
+            username=Username(row.username),
+            email=Email(row.email),
+            password=RawPassword(row.password),
+        )
+    except DomainFieldError as error:
+        return RejectedRow(row.line, row.username, row.email, str(error))
+
+
+def existing_users_select(
+    usernames: Sequence[str],
+    emails: Sequence[str],
+) -> Select[tuple[str, str]]:
+    return select(users_table.c.username, users_table.c.email).where(
+        or_(
+            users_table.c.username.in_(usernames),
+            users_table.c.email.in_(emails),
+        ),
+    )
+
+
+def staging_create() -> TextClause:
+    """Dropped with the transaction that loads the batch."""
+    return text(
+        f"CREATE TEMPORARY TABLE {_STAGING_TABLE} "
+        f"(LIKE {users_table.name} INCLUDING DEFAULTS) ON COMMIT DROP",
+    )
+
+
+def staged_users_insert() -> ReturningInsert[tuple[UUID]]:
+    """
+    Moves the staged users into `users`, skipping any that a concurrent
+    sign-up or import created since the batch was checked.
+    The ids returned are the users actually inserted.
+    """
+    return (
+        insert(users_table)
+        .from_select(list(USER_COPY_COLUMNS), select(_staging_table))
+        .on_conflict_do_nothing()
+        .returning(users_table.c.id)
+    )
+
+
+def copy_statement(table_name: str, columns: Sequence[str]) -> str:
+    return f"COPY {table_name} ({', '.join(columns)}) FROM STDIN"
+
+
+def user_copy_row(user: User) -> tuple[Any, ...]:
+    """Values in `USER_COPY_COLUMNS` order; the role enum is stored by name."""
+    return (
+        user.id_.value,
+        user.username.value,
+        user.email.value,
+        user.password_hash.value,
+        user.role.name,
+        user.is_active,
+        user.credibility.value,
+        user.created_at.value,
+        user.updated_at.value,
+    )
+
+
+def wallet_copy_row(wallet: Wallet) -> tuple[Any, ...]:
+    """
+    Values in `WALLET_COPY_COLUMNS` order.
+    `COPY` bypasses the column type, so the balance goes in as a decimal.
+    """
+    return (
+        wallet.id_.value,
+        wallet.owner_id.value,
+        from_minor_units(wallet.balance.minor_units),
+        wallet.created_at.value,
+        wallet.updated_at.value,
+    )
+
+
+class SqlaUserImporter:
+    """
+    Creates users and their wallets from import rows, one batch at a time.
+    A row that fails validation, repeats a username or email seen earlier
+    in the file, or clashes with an existing user is sent to the reject sink,
+    and the rest of its batch is still imported.
+
+    Existing users are looked up before hashing, so no bcrypt work is spent
+    on rows that will be rejected. The hashes of a batch are computed
+    concurrently, and the pool of the password hasher spreads them
+    over its workers.
+    Each batch is loaded in one transaction with `COPY`:
+    users through a staging table, so that a clash with a user created
+    in the meantime skips that row instead of failing the batch,
+    and wallets straight into their table for the users inserted.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        user_service: UserService,
+        wallet_service: WalletService,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self._engine = engine
+        self._user_service = user_service
+        self._wallet_service = wallet_service
+        self._batch_size = batch_size
+
+    async def import_rows(
+        self,
+        rows: Iterable[ImportRow | RejectedRow],
+        reject: RejectSink,
+    ) -> UserImportReport:
+        """
+        :raises DataMapperError:
+        :raises PasswordHasherBusyError:
+        """
+        report = UserImportReport()
+
+        def rejected(row: RejectedRow) -> None:
+            report.rejected += 1
+            reject(row)
+
+        seen_usernames: set[str] = set()
+        seen_emails: set[str] = set()
+        batch: list[ValidRow] = []
+        for row in rows:
+            valid_row = row if isinstance(row, RejectedRow) else validate_row(row)
+            if isinstance(valid_row, RejectedRow):
+                rejected(valid_row)
+                continue
+            username, email = valid_row.username.value, valid_row.email.value
+            if username in seen_usernames:
+                rejected(_reject(valid_row, "Duplicate username in file."))
+                continue
+            if email in seen_emails:
+                rejected(_reject(valid_row, "Duplicate email in file."))
+                continue
+            seen_usernames.add(username)
+            seen_emails.add(email)
+            batch.append(valid_row)
+
+            if len(batch) == self._batch_size:
+                report.imported += await self._import_batch(batch, rejected)
+                batch = []
+        if batch:
+            report.imported += await self._import_batch(batch, rejected)
+
+        log.info(
+            "User import: done. Imported: %d, rejected: %d.",
+            report.imported,
+            report.rejected,
+        )
+        return report
+
+    async def _import_batch(self, batch: list[ValidRow], reject: RejectSink) -> int:
+        """
+        :raises DataMapperError:
+        :raises PasswordHasherBusyError:
+        """
+        new_rows = await self._drop_existing(batch, reject)
+        if not new_rows:
+            return 0
+
+        users = await asyncio.gather(*(
+            self._user_service.create_user(
+                username=row.username,
+                raw_password=row.password,
+                email=row.email,
+            )
+            for row in new_rows
+        ))
+        inserted_ids = await self._load(users)
+
+        for row, user in zip(new_rows, users, strict=True):
+            if user.id_.value not in inserted_ids:
+                reject(_reject(row, "Username or email already exists."))
+        log.debug("User import: batch of %d loaded.", len(inserted_ids))
+        return len(inserted_ids)
+
+    async def _drop_existing(
+        self,
+        batch: list[ValidRow],
+        reject: RejectSink,
+    ) -> list[ValidRow]:
+        """:raises DataMapperError:"""
+        try:
+            async with self._engine.connect() as connection:
+                result = await connection.execute(
+                    existing_users_select(
+                        [row.username.value for row in batch],
+                        [row.email.value for row in batch],
+                    ),
+                )
+                existing = result.all()
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+        taken_usernames = {username for username, _ in existing}
+        taken_emails = {email for _, email in existing}
+        new_rows = []
+        for row in batch:
+            if row.username.value in taken_usernames:
+                reject(_reject(row, "Username already exists."))
+            elif row.email.value in taken_emails:
+                reject(_reject(row, "Email already exists."))
+            else:
+                new_rows.append(row)
+        return new_rows
+
+    async def _load(self, users: Sequence[User]) -> set[UUID]:
+        """:raises DataMapperError:"""
+        try:
+            async with self._engine.begin() as connection:
+                await connection.execute(staging_create())
+                await _copy(
+                    connection,
+                    copy_statement(_STAGING_TABLE, USER_COPY_COLUMNS),
+                    (user_copy_row(user) for user in users),
+                )
+                result = await connection.execute(staged_users_insert())
+                inserted_ids = set(result.scalars())
+                await _copy(
+                    connection,
+                    copy_statement(wallets_table.name, WALLET_COPY_COLUMNS),
+                    (
+                        wallet_copy_row(self._wallet_service.create_wallet(user.id_))
+                        for user in users
+                        if user.id_.value in inserted_ids
+                    ),
+                )
+                return inserted_ids
+
+        except (SQLAlchemyError, psycopg.Error) as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+
+async def _copy(
+    connection: AsyncConnection,
+    statement: str,
+    rows: Iterable[tuple[Any, ...]],
+) -> None:
+    """Runs on the driver connection, inside the transaction of `connection`."""
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = cast(
+        psycopg.AsyncConnection[Any],
+        raw_connection.driver_connection,
+    )
+    async with driver_connection.cursor() as cursor, cursor.copy(statement) as copy:
+        for row in rows:
+            await copy.write_row(row)
+
+
+def _reject(row: ValidRow, reason: str) -> RejectedRow:
+    return RejectedRow(row.line, row.username.value, row.email.value, reason)
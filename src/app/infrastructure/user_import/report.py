@@ -0,0 +1,28 @@
+import json
+from dataclasses import asdict, dataclass
+from typing import TextIO
+
+
+@dataclass(frozen=True, slots=True)
+class RejectedRow:
+    """
+    `line` is the line of the import file the row starts on.
+    The password is never kept, so reject files can be shared safely.
+    """
+
+    line: int
+    username: str | None
+    email: str | None
+    reason: str
+
+
+@dataclass(slots=True)
+class UserImportReport:
+    imported: int = 0
+    rejected: int = 0
+
+
+def write_rejected_row(file: TextIO, row: RejectedRow) -> None:
+    """One NDJSON line per rejected row."""
+    file.write(json.dumps(asdict(row), ensure_ascii=False))
+    file.write("\n")
@@ -0,0 +1,104 @@
+"""
+Rows of a user import file, read lazily,
+so that a file of any size streams through one batch at a time.
+
+CSV files need a header with `username`, `email` and `password` columns;
+NDJSON files hold one object with these keys per line.
+A line that cannot be read becomes a rejected row instead of an error.
+"""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final, Literal
+
+from app.infrastructure.exceptions.base import InfrastructureError
+from app.infrastructure.user_import.report import RejectedRow
+
+type ImportFormat = Literal["csv", "ndjson"]
+
+IMPORT_FIELDS: Final[tuple[str, ...]] = ("username", "email", "password")
+
+_FORMATS_BY_SUFFIX: Final[Mapping[str, ImportFormat]] = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+
+class UnsupportedImportFormatError(InfrastructureError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ImportRow:
+    line: int
+    username: str
+    email: str
+    password: str = field(repr=False)
+
+
+def detect_import_format(path: Path) -> ImportFormat:
+    """:raises UnsupportedImportFormatError:"""
+    import_format = _FORMATS_BY_SUFFIX.get(path.suffix.lower())
+    if import_format is None:
+        raise UnsupportedImportFormatError(path.suffix)
+    return import_format
+
+
+def read_import_rows(
+    lines: Iterable[str],
+    import_format: ImportFormat,
+) -> Iterator[ImportRow | RejectedRow]:
+    if import_format == "csv":
+        return _read_csv(lines)
+    return _read_ndjson(lines)
+
+
+def _read_csv(lines: Iterable[str]) -> Iterator[ImportRow | RejectedRow]:
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None:
+        return
+    # A quoted value may span lines, so a row starts after the previous one.
+    line = reader.line_num + 1
+    for record in reader:
+        yield _to_row(line, record)
+        line = reader.line_num + 1
+
+
+def _read_ndjson(lines: Iterable[str]) -> Iterator[ImportRow | RejectedRow]:
+    for line, text in enumerate(lines, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except json.JSONDecodeError:
+            yield RejectedRow(line, None, None, "Line is not valid JSON.")
+            continue
+        if not isinstance(record, dict):
+            yield RejectedRow(line, None, None, "Line is not a JSON object.")
+            continue
+        yield _to_row(line, record)
+
+
+def _to_row(line: int, record: Mapping[str, Any]) -> ImportRow | RejectedRow:
+    username, email, password = (record.get(name) for name in IMPORT_FIELDS)
+    if (
+        isinstance(username, str)
+        and isinstance(email, str)
+        and isinstance(password, str)
+    ):
+        return ImportRow(line, username, email, password)
+    missing = next(
+        name
+        for name, value in zip(IMPORT_FIELDS, (username, email, password), strict=True)
+        if not isinstance(value, str)
+    )
+    return RejectedRow(
+        line,
+        username if isinstance(username, str) else None,
+        email if isinstance(email, str) else None,
+        f"Field {missing!r} is missing or not a string.",
+    )
@@ -1,9 +1,12 @@
 import logging
-from typing import Any, Literal, NewType, TypedDict, cast
+from datetime import UTC, datetime
+from typing import Any, Literal, NewType, NotRequired, TypedDict, cast
+from uuid import UUID
 
 import jwt
 
-from app.infrastructure.auth.session.model import AuthSession
+from app.domain.shared.value_objects.id import UserId
+from app.infrastructure.auth.session.model import AuthSession, AuthSessionClaims
 from app.presentation.http.auth.constants import (
     ACCESS_TOKEN_INVALID_OR_EXPIRED,
     ACCESS_TOKEN_PAYLOAD_MISSING,
@@ -19,6 +22,9 @@ JwtAlgorithm = Literal["HS256", "HS384", "HS512", "RS256", "RS384", "RS512"]
 class JwtPayload(TypedDict):
     auth_session_id: str
     exp: int
+    # Absent in tokens issued before stateless validation was introduced
+    sub: NotRequired[str]
+    iat: NotRequired[int]
 
 
 class JwtAccessTokenProcessor:
@@ -30,6 +36,8 @@ class JwtAccessTokenProcessor:
         payload = JwtPayload(
             auth_session_id=auth_session.id_,
             exp=int(auth_session.expiration.timestamp()),
+            sub=str(auth_session.user_id.value),
+            iat=int(datetime.now(tz=UTC).timestamp()),
         )
         return jwt.encode(
             cast(dict[str, Any], payload),
@@ -38,15 +46,8 @@ class JwtAccessTokenProcessor:
         )
 
     def decode_auth_session_id(self, token: str) -> str | None:
-        try:
-            payload = jwt.decode(
-                token,
-                key=self._secret,
-                algorithms=[self._algorithm],
-            )
-
-        except jwt.PyJWTError as error:
-            log.debug("%s %s", ACCESS_TOKEN_INVALID_OR_EXPIRED, error)
+        payload = self._decode(token)
+        if payload is None:
             return None
 
         auth_session_id: str | None = payload.get(ACCESS_TOKEN_PAYLOAD_OF_INTEREST)
@@ -59,3 +60,34 @@ class JwtAccessTokenProcessor:
             return None
 
         return auth_session_id
+
+    def decode_claims(self, token: str) -> AuthSessionClaims | None:
+        payload = self._decode(token)
+        if payload is None:
+            return None
+
+        try:
+            return AuthSessionClaims(
+                auth_session_id=payload[ACCESS_TOKEN_PAYLOAD_OF_INTEREST],
+                user_id=UserId(UUID(payload["sub"])),
+                issued_at=datetime.fromtimestamp(payload["iat"], tz=UTC),
+                expiration=datetime.fromtimestamp(payload["exp"], tz=UTC),
+            )
+
+        except (KeyError, TypeError, ValueError) as error:
+            log.debug("%s %s", ACCESS_TOKEN_PAYLOAD_MISSING, error)
+            return None
+
+    def _decode(self, token: str) -> dict[str, Any] | None:
+        try:
+            payload: dict[str, Any] = jwt.decode(
+                token,
+                key=self._secret,
+                algorithms=[self._algorithm],
+            )
+
+        except jwt.PyJWTError as error:
+            log.debug("%s %s", ACCESS_TOKEN_INVALID_OR_EXPIRED, error)
+            return None
+
+        return payload
@@ -0,0 +1,20 @@
+from starlette.requests import Request
+
+from app.infrastructure.auth.throttle.ports.client_address import (
+    ClientAddressProvider,
+)
+
+
+class RequestClientAddressProvider(ClientAddressProvider):
+    """
+    The peer address of the connection.
+    Behind a reverse proxy, run uvicorn with `--proxy-headers`
+    and `--forwarded-allow-ips`, so that it is the client's, not the proxy's.
+    """
+
+    def __init__(self, request: Request):
+        self._request = request
+
+    def get_client_address(self) -> str | None:
+        client = self._request.client
+        return client.host if client is not None else None
@@ -2,7 +2,7 @@ import logging
 
 from starlette.requests import Request
 
-from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.auth.session.model import AuthSession, AuthSessionClaims
 from app.infrastructure.auth.session.ports.transport import AuthSessionTransport
 from app.presentation.http.auth.access_token_processor_jwt import (
     JwtAccessTokenProcessor,
@@ -55,6 +55,14 @@ class JwtCookieAuthSessionTransport(AuthSessionTransport):
 
         return self._access_token_processor.decode_auth_session_id(access_token)
 
+    def extract_claims(self) -> AuthSessionClaims | None:
+        access_token = self._request.cookies.get(COOKIE_ACCESS_TOKEN_NAME)
+        if access_token is None:
+            log.debug("%s", ACCESS_TOKEN_NOT_FOUND_IN_COOKIE)
+            return None
+
+        return self._access_token_processor.decode_claims(access_token)
+
     def remove_current(self) -> None:
         setattr(self._request.state, REQUEST_STATE_DELETE_ACCESS_TOKEN_KEY, True)
 
@@ -11,9 +11,11 @@ from app.domain.user.exceptions import UserNotFoundByUsernameError
 from app.infrastructure.auth.exceptions import (
     AlreadyAuthenticatedError,
     AuthenticationError,
+    LoginThrottledError,
 )
 from app.infrastructure.auth.handlers.log_in import LogInHandler, LogInRequest
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
 from app.presentation.http.errors.callbacks import log_error, log_info
 from app.presentation.http.errors.translators import (
     ServiceUnavailableTranslator,
@@ -34,9 +36,15 @@ def create_log_in_router() -> APIRouter:
                 translator=ServiceUnavailableTranslator(),
                 on_error=log_error,
             ),
+            PasswordHasherBusyError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
             DomainFieldError: status.HTTP_400_BAD_REQUEST,
             UserNotFoundByUsernameError: status.HTTP_404_NOT_FOUND,
             AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            LoginThrottledError: status.HTTP_429_TOO_MANY_REQUESTS,
         },
         default_on_error=log_info,
         status_code=status.HTTP_204_NO_CONTENT,
@@ -17,6 +17,7 @@ from app.infrastructure.auth.handlers.user_sign_up import (
 )
 
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
 from app.presentation.http.errors.callbacks import (
     log_error,
     log_info,
@@ -40,6 +41,11 @@ def create_viewer_sign_up_router() -> APIRouter:
                 translator=ServiceUnavailableTranslator(),
                 on_error=log_error,
             ),
+            PasswordHasherBusyError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
             DomainFieldError: status.HTTP_400_BAD_REQUEST,
             RoleAssignmentNotPermittedError: status.HTTP_422_UNPROCESSABLE_ENTITY,
             UsernameAlreadyExistsError: status.HTTP_409_CONFLICT,
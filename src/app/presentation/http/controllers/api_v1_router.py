@@ -2,6 +2,9 @@ from fastapi import APIRouter
 
 from app.presentation.http.controllers.account.router import create_account_router
 from app.presentation.http.controllers.general.router import create_general_router
+from app.presentation.http.controllers.notifications.router import (
+    create_notifications_router,
+)
 from app.presentation.http.controllers.users.router import create_users_router
 from app.presentation.http.controllers.challenges.router import create_challenges_router
 
@@ -16,6 +19,7 @@ def create_api_v1_router() -> APIRouter:
         create_general_router(),
         create_users_router(),
         create_challenges_router(),
+        create_notifications_router(),
     )
 
     for sub_router in sub_routers:
@@ -0,0 +1,47 @@
+from inspect import getdoc
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+
+from app.application.commands.challenge.reject_pending_challenges import (
+    RejectPendingChallengesInteractor,
+    RejectPendingChallengesResponse,
+)
+from app.domain.base import DomainError
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.presentation.http.auth.fastapi_openapi_markers import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+
+def reject_pending_challenges_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.post(
+        "/reject-pending",
+        description=getdoc(RejectPendingChallengesInteractor),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            DomainError: status.HTTP_400_BAD_REQUEST,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def reject_pending_challenges(
+        interactor: FromDishka[RejectPendingChallengesInteractor],
+    ) -> RejectPendingChallengesResponse:
+        return await interactor.execute()
+
+    return router
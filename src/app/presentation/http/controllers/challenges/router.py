@@ -6,6 +6,12 @@ from app.presentation.http.controllers.challenges.create_challenge import (
 from app.presentation.http.controllers.challenges.update_challenge import (
     update_challenge_router,
 )
+from app.presentation.http.controllers.challenges.reject_pending_challenges import (
+    reject_pending_challenges_router,
+)
+from app.presentation.http.controllers.challenges.stream_challenge_updates import (
+    stream_challenge_updates_router,
+)
 from app.presentation.http.controllers.challenges.toggle_challenge_status import (
     toggle_challenge_status_router,
 )
@@ -21,6 +27,8 @@ def create_challenges_router() -> APIRouter:
         create_challenge_router(),
         update_challenge_router(),
         toggle_challenge_status_router(),
+        reject_pending_challenges_router(),
+        stream_challenge_updates_router(),
         
     )
 
@@ -0,0 +1,52 @@
+from inspect import getdoc
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+from fastapi.responses import StreamingResponse
+from fastapi_error_map import ErrorAwareRouter, rule
+
+from app.application.queries.stream_challenge_updates import (
+    StreamChallengeUpdatesQueryService,
+)
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.presentation.http.auth.fastapi_openapi_markers import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+
+def stream_challenge_updates_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.get(
+        "/stream",
+        description=getdoc(StreamChallengeUpdatesQueryService),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        response_class=StreamingResponse,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def stream_challenge_updates(
+        service: FromDishka[StreamChallengeUpdatesQueryService],
+    ) -> StreamingResponse:
+        frames = await service.execute()
+        return StreamingResponse(
+            frames,
+            media_type="text/event-stream",
+            # Proxies must pass each frame through as soon as it is written.
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return router
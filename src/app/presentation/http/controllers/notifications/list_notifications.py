@@ -0,0 +1,76 @@
+from inspect import getdoc
+from typing import Annotated
+from uuid import UUID
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.application.common.exceptions.query import PaginationError
+from app.application.queries.list_notifications import (
+    ListNotificationsQueryService,
+    ListNotificationsRequest,
+    ListNotificationsResponse,
+)
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError, ReaderError
+from app.presentation.http.auth.fastapi_openapi_markers import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+
+class ListNotificationsRequestPydantic(BaseModel):
+    """
+    Using a Pydantic model here is generally unnecessary.
+    It's only implemented to render a specific Swagger UI (OpenAPI) schema.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    limit: Annotated[int, Field(ge=1, le=100)] = 20
+    before: Annotated[UUID | None, Field()] = None
+
+
+def create_list_notifications_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.get(
+        "/",
+        description=getdoc(ListNotificationsQueryService),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            ReaderError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            PaginationError: status.HTTP_400_BAD_REQUEST,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def list_notifications(
+        request_data_pydantic: Annotated[
+            ListNotificationsRequestPydantic,
+            Depends(),
+        ],
+        interactor: FromDishka[ListNotificationsQueryService],
+    ) -> ListNotificationsResponse:
+        request_data = ListNotificationsRequest(
+            limit=request_data_pydantic.limit,
+            before=request_data_pydantic.before,
+        )
+        return await interactor.execute(request_data)
+
+    return router
@@ -0,0 +1,45 @@
+from inspect import getdoc
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+
+from app.application.commands.notification.mark_all_notifications_read import (
+    MarkAllNotificationsReadInteractor,
+    MarkAllNotificationsReadResponse,
+)
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.presentation.http.auth.fastapi_openapi_markers import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+
+def create_mark_all_notifications_read_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.post(
+        "/mark-all-read",
+        description=getdoc(MarkAllNotificationsReadInteractor),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def mark_all_notifications_read(
+        interactor: FromDishka[MarkAllNotificationsReadInteractor],
+    ) -> MarkAllNotificationsReadResponse:
+        return await interactor.execute()
+
+    return router
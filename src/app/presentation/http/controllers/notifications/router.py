@@ -0,0 +1,29 @@
+from fastapi import APIRouter
+
+from app.presentation.http.controllers.notifications.get_unread_notification_count import (  # noqa: E501
+    create_get_unread_notification_count_router,
+)
+from app.presentation.http.controllers.notifications.list_notifications import (
+    create_list_notifications_router,
+)
+from app.presentation.http.controllers.notifications.mark_all_notifications_read import (  # noqa: E501
+    create_mark_all_notifications_read_router,
+)
+
+
+def create_notifications_router() -> APIRouter:
+    router = APIRouter(
+        prefix="/notifications",
+        tags=["Notifications"],
+    )
+
+    sub_routers = (
+        create_list_notifications_router(),
+        create_get_unread_notification_count_router(),
+        create_mark_all_notifications_read_router(),
+    )
+
+    for sub_router in sub_routers:
+        router.include_router(sub_router)
+
+    return router
@@ -0,0 +1,109 @@
+"""
+Deletes the auth sessions that have expired, then the revocations
+of expired tokens, one chunk per transaction:
+
+    python -m app.purge_auth_sessions [--chunk-size N] [--lock-timeout-ms N]
+                                      [--interval SECONDS]
+
+Purges once, or every `--interval` seconds until stopped.
+A chunk that waits on a lock longer than `--lock-timeout-ms` ends the run,
+and the rows left behind are deleted by the next one.
+Rows reclaimed, chunks, lock timeouts and duration are logged per run.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.infrastructure.auth.session.purger_sqla import (
+    DEFAULT_LOCK_TIMEOUT_MS,
+    AuthSessionPurgeMetrics,
+    SqlaAuthSessionPurger,
+)
+from app.setup.app_factory import create_async_ioc_container
+from app.setup.config.logs import configure_logging
+from app.setup.config.settings import AppSettings, load_settings
+from app.setup.ioc.provider_registry import get_providers
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+async def purge(
+    purger: SqlaAuthSessionPurger,
+    *,
+    chunk_size: int,
+    lock_timeout_ms: int,
+) -> AuthSessionPurgeMetrics:
+    metrics = await purger.purge(
+        chunk_size=chunk_size,
+        lock_timeout_ms=lock_timeout_ms,
+    )
+    log.info(
+        "Auth session purge: done. Sessions deleted: %d, revocations deleted: %d, "
+        "chunks: %d, lock timed out: %s, duration %.3fs.",
+        metrics.deleted,
+        metrics.revocations_deleted,
+        metrics.chunks,
+        metrics.lock_timed_out,
+        metrics.duration_s,
+    )
+    return metrics
+
+
+async def run(
+    settings: AppSettings,
+    *,
+    chunk_size: int,
+    lock_timeout_ms: int,
+    interval_s: float | None,
+) -> None:
+    container = create_async_ioc_container(
+        providers=get_providers(),
+        settings=settings,
+    )
+    try:
+        purger = await container.get(SqlaAuthSessionPurger)
+        await purge(purger, chunk_size=chunk_size, lock_timeout_ms=lock_timeout_ms)
+        while interval_s is not None:
+            await asyncio.sleep(interval_s)
+            await purge(
+                purger,
+                chunk_size=chunk_size,
+                lock_timeout_ms=lock_timeout_ms,
+            )
+    finally:
+        await container.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--lock-timeout-ms",
+        type=int,
+        default=DEFAULT_LOCK_TIMEOUT_MS,
+    )
+    parser.add_argument("--interval", type=float, default=None)
+    args = parser.parse_args()
+
+    configure_logging()
+    settings = load_settings()
+    configure_logging(level=settings.logs.level)
+
+    asyncio.run(
+        run(
+            settings,
+            chunk_size=args.chunk_size,
+            lock_timeout_ms=args.lock_timeout_ms,
+            interval_s=args.interval,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
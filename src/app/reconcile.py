@@ -0,0 +1,105 @@
+"""
+Reconciles wallet balances and transactions against the ledger:
+
+    python -m app.reconcile [--chunk-size N] [--max-reported N]
+
+Exits with status 1 when anything does not add up.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.domain.shared.value_objects.money import from_minor_units
+from app.infrastructure.reconciliation.ledger_reconciler_sqla import (
+    DEFAULT_CHUNK_SIZE,
+    SqlaLedgerReconciler,
+)
+from app.infrastructure.reconciliation.report import (
+    DEFAULT_MAX_REPORTED,
+    ReconciliationReport,
+)
+from app.setup.app_factory import create_async_ioc_container
+from app.setup.config.logs import configure_logging
+from app.setup.config.settings import AppSettings, load_settings
+from app.setup.ioc.provider_registry import get_providers
+
+log = logging.getLogger(__name__)
+
+
+async def reconcile(
+    settings: AppSettings,
+    *,
+    chunk_size: int,
+    max_reported: int,
+) -> ReconciliationReport:
+    container = create_async_ioc_container(
+        providers=get_providers(),
+        settings=settings,
+    )
+    try:
+        engine = await container.get(AsyncEngine)
+        reconciler = SqlaLedgerReconciler(
+            engine,
+            chunk_size=chunk_size,
+            max_reported=max_reported,
+        )
+        return await reconciler.reconcile()
+    finally:
+        await container.close()
+
+
+def log_report(report: ReconciliationReport) -> None:
+    for wallet in report.wallet_mismatches:
+        log.error(
+            "Wallet %s: balance %s, ledger net %s.",
+            wallet.wallet_id,
+            "missing" if wallet.balance is None else from_minor_units(wallet.balance),
+            from_minor_units(wallet.ledger_net),
+        )
+    for tx in report.unbalanced_transactions:
+        log.error(
+            "Transaction %s: amount %s, debit %s, credit %s.",
+            tx.transaction_id,
+            from_minor_units(tx.amount),
+            from_minor_units(tx.total_debit),
+            from_minor_units(tx.total_credit),
+        )
+    log.info(
+        "Reconciled %d wallets (%d mismatched) and %d transactions (%d unbalanced).",
+        report.wallets_checked,
+        report.wallet_mismatch_count,
+        report.transactions_checked,
+        report.unbalanced_transaction_count,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--max-reported", type=int, default=DEFAULT_MAX_REPORTED)
+    args = parser.parse_args()
+
+    configure_logging()
+    settings = load_settings()
+    configure_logging(level=settings.logs.level)
+
+    report = asyncio.run(
+        reconcile(
+            settings,
+            chunk_size=args.chunk_size,
+            max_reported=args.max_reported,
+        ),
+    )
+    log_report(report)
+    return 0 if report.is_consistent else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Dispatches the domain events staged in the outbox to their handlers,
+one batch of aggregates at a time:
+
+    python -m app.relay_outbox [--batch-size N] [--concurrency N]
+                               [--lease-seconds SECONDS] [--interval SECONDS]
+
+Drains the outbox once, or every `--interval` seconds until stopped.
+Aggregates are leased for `--lease-seconds` by a short transaction
+using `FOR UPDATE SKIP LOCKED`, so several relays can run at once,
+and no lock or connection is held while handlers run.
+The events of one aggregate are still dispatched in the order
+they were published. A lease that runs out before its batch is acked
+lets another relay dispatch the same events again.
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import timedelta
+
+from dishka import AsyncContainer
+
+from app.infrastructure.event_bus.bus_asyncio import AsyncioEventBus
+from app.infrastructure.outbox.relay_sqla import DEFAULT_LEASE, SqlaOutboxRelay
+from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.setup.app_factory import create_async_ioc_container
+from app.setup.config.logs import configure_logging
+from app.setup.config.settings import AppSettings, load_settings
+from app.setup.ioc.provider_registry import get_providers
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_CONCURRENCY = 16
+
+
+async def drain(
+    container: AsyncContainer,
+    *,
+    batch_size: int,
+    concurrency: int,
+    lease: timedelta,
+) -> int:
+    claimed = 0
+    while True:
+        async with container() as request_container:
+            relay = await request_container.get(SqlaOutboxRelay)
+            batch = await relay.relay(
+                batch_size=batch_size,
+                concurrency=concurrency,
+                lease=lease,
+            )
+        claimed += batch
+        if batch < batch_size:
+            break
+    log.info("Outbox relay: drained. Aggregates claimed: %d.", claimed)
+    await log_handler_metrics(container)
+    return claimed
+
+
+async def log_handler_metrics(container: AsyncContainer) -> None:
+    bus = await container.get(AsyncioEventBus)
+    for metrics in bus.metrics():
+        log.info(
+            "Event handler %s: queued %d/%d, handled %d, failed %d, "
+            "latency mean %.3fs, max %.3fs.",
+            metrics.handler,
+            metrics.queue_depth,
+            metrics.max_queue_size,
+            metrics.handled,
+            metrics.failed,
+            metrics.latency_mean_s,
+            metrics.latency_max_s,
+        )
+
+
+async def run(
+    settings: AppSettings,
+    *,
+    batch_size: int,
+    concurrency: int,
+    lease: timedelta,
+    interval_s: float | None,
+) -> None:
+    map_tables()
+    container = create_async_ioc_container(
+        providers=get_providers(),
+        settings=settings,
+    )
+    try:
+        await drain(
+            container,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            lease=lease,
+        )
+        while interval_s is not None:
+            await asyncio.sleep(interval_s)
+            await drain(
+                container,
+                batch_size=batch_size,
+                concurrency=concurrency,
+                lease=lease,
+            )
+    finally:
+        await container.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=DEFAULT_LEASE.total_seconds(),
+    )
+    parser.add_argument("--interval", type=float, default=None)
+    args = parser.parse_args()
+
+    configure_logging()
+    settings = load_settings()
+    configure_logging(level=settings.logs.level)
+
+    asyncio.run(
+        run(
+            settings,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            lease=timedelta(seconds=args.lease_seconds),
+            interval_s=args.interval,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -49,3 +49,4 @@ class SqlaEngineSettings(BaseModel):
     echo_pool: bool = Field(alias="ECHO_POOL")
     pool_size: int = Field(alias="POOL_SIZE")
     max_overflow: int = Field(alias="MAX_OVERFLOW")
+    share_auth_session: bool = Field(alias="SHARE_AUTH_SESSION")
@@ -16,6 +16,27 @@ class AuthSettings(BaseModel):
     ] = Field(alias="JWT_ALGORITHM")
     session_ttl_min: timedelta = Field(alias="SESSION_TTL_MIN")
     session_refresh_threshold: float = Field(alias="SESSION_REFRESH_THRESHOLD")
+    session_cache_max_size: int = Field(alias="SESSION_CACHE_MAX_SIZE", ge=0)
+    session_cache_ttl_s: timedelta = Field(
+        alias="SESSION_CACHE_TTL_S",
+        gt=timedelta(0),
+    )
+    session_validation_mode: Literal["stateful", "stateless"] = Field(
+        alias="SESSION_VALIDATION_MODE",
+    )
+    session_denylist_sync_interval_s: timedelta = Field(
+        alias="SESSION_DENYLIST_SYNC_INTERVAL_S",
+        gt=timedelta(0),
+    )
+    session_extension_flush_interval_s: timedelta = Field(
+        alias="SESSION_EXTENSION_FLUSH_INTERVAL_S",
+        gt=timedelta(0),
+    )
+    principal_cache_max_size: int = Field(alias="PRINCIPAL_CACHE_MAX_SIZE", ge=0)
+    principal_cache_ttl_s: timedelta = Field(
+        alias="PRINCIPAL_CACHE_TTL_S",
+        gt=timedelta(0),
+    )
 
     @field_validator("session_ttl_min", mode="before")
     @classmethod
@@ -47,9 +68,31 @@ class CookiesSettings(BaseModel):
 
 class PasswordSettings(BaseModel):
     pepper: str = Field(alias="PEPPER")
+    hasher_executor: Literal["thread", "process"] = Field(alias="HASHER_EXECUTOR")
+    hasher_max_workers: int = Field(alias="HASHER_MAX_WORKERS", ge=1)
+    hasher_max_concurrency: int = Field(alias="HASHER_MAX_CONCURRENCY", ge=1)
+    hasher_queue_timeout_s: float = Field(alias="HASHER_QUEUE_TIMEOUT_S", gt=0)
+    hasher_target_verify_ms: float = Field(alias="HASHER_TARGET_VERIFY_MS", gt=0)
+    hasher_min_cost: int = Field(alias="HASHER_MIN_COST", ge=4, le=31)
+
+
+class LoginThrottleSettings(BaseModel):
+    """
+    Limits per worker: buckets and failure counts are not shared,
+    so with N workers a key gets up to N times `burst`, `refill_per_min`
+    and `lockout_after_failures`. Lockouts are shared.
+    """
+
+    burst: int = Field(alias="BURST", ge=1)
+    refill_per_min: float = Field(alias="REFILL_PER_MIN", gt=0)
+    lockout_after_failures: int = Field(alias="LOCKOUT_AFTER_FAILURES", ge=1)
+    base_lockout_s: float = Field(alias="BASE_LOCKOUT_S", gt=0)
+    max_lockout_s: float = Field(alias="MAX_LOCKOUT_S", gt=0)
+    sync_interval_s: float = Field(alias="SYNC_INTERVAL_S", gt=0)
 
 
 class SecuritySettings(BaseModel):
     auth: AuthSettings
     cookies: CookiesSettings
     password: PasswordSettings
+    login_throttle: LoginThrottleSettings
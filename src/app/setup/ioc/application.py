@@ -1,47 +1,107 @@
-from app.application.commands.challenge.toggle_challenge_status import ToggleChallengeStatusInteractor
-from app.application.commands.user.apply_as_streamer import ApplyAsStreamerInteractor
-from app.application.common.ports.transaction_command_gateway import TransactionCommandGateway
-from app.application.common.ports.wallet_command_gateway import WalletCommandGateway
-from app.infrastructure.adapters.transaction_data_mapper_sqla import SqlaTransactionDataMapper
-from app.infrastructure.adapters.wallet_data_mapper_sqla import SqlaWalletDataMapper
-from dishka import Provider, Scope, provide, provide_all
+from dishka import Provider, Scope, alias, provide, provide_all
 
+from app.application.commands.challenge.create_challenge import (
+    CreateChallengeInteractor,
+)
+from app.application.commands.challenge.expire_challenges import (
+    ExpireChallengesInteractor,
+)
+from app.application.commands.challenge.reject_pending_challenges import (
+    RejectPendingChallengesInteractor,
+)
+from app.application.commands.challenge.toggle_challenge_status import (
+    ToggleChallengeStatusInteractor,
+)
+from app.application.commands.challenge.update_challenge import (
+    UpdateChallengeInteractor,
+)
+from app.application.commands.notification.mark_all_notifications_read import (
+    MarkAllNotificationsReadInteractor,
+)
+from app.application.commands.notification.notify_challenge_participants import (
+    NotifyChallengeParticipantsInteractor,
+)
 from app.application.commands.user.activate_user import ActivateUserInteractor
+from app.application.commands.user.apply_as_streamer import ApplyAsStreamerInteractor
 from app.application.commands.user.change_password import ChangePasswordInteractor
-from app.application.commands.challenge.create_challenge import CreateChallengeInteractor
-from app.application.commands.challenge.update_challenge import UpdateChallengeInteractor
 from app.application.commands.user.deactivate_user import DeactivateUserInteractor
 from app.application.common.ports.access_revoker import AccessRevoker
-from app.application.common.ports.challenge_command_gateway import ChallengeCommandGateway
+from app.application.common.ports.challenge_command_gateway import (
+    ChallengeCommandGateway,
+)
+from app.application.common.ports.challenge_updates import (
+    ChallengeUpdatePublisher,
+    ChallengeUpdateStream,
+)
+from app.application.common.ports.event_publisher import EventPublisher
 from app.application.common.ports.flusher import Flusher
 from app.application.common.ports.identity_provider import IdentityProvider
+from app.application.common.ports.notification_command_gateway import (
+    NotificationCommandGateway,
+)
+from app.application.common.ports.notification_query_gateway import (
+    NotificationQueryGateway,
+)
+from app.application.common.ports.principal_cache import PrincipalCache
 from app.application.common.ports.streamer_command_gateway import StreamerCommandGateway
+from app.application.common.ports.transaction_command_gateway import (
+    TransactionCommandGateway,
+)
 from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.application.common.ports.user_query_gateway import UserQueryGateway
+from app.application.common.ports.wallet_command_gateway import WalletCommandGateway
 from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.escrow_release import EscrowReleaseService
 from app.application.queries.get_me import GetMeQueryService
+from app.application.queries.get_unread_notification_count import (
+    GetUnreadNotificationCountQueryService,
+)
+from app.application.queries.list_notifications import ListNotificationsQueryService
 from app.application.queries.list_users import ListUsersQueryService
-from app.infrastructure.adapters.challenge_data_mapper_sqla import SqlaChallengeDataMapper
+from app.application.queries.stream_challenge_updates import (
+    StreamChallengeUpdatesQueryService,
+)
+from app.infrastructure.adapters.challenge_data_mapper_sqla import (
+    SqlaChallengeDataMapper,
+)
 from app.infrastructure.adapters.main_flusher_sqla import SqlaMainFlusher
 from app.infrastructure.adapters.main_transaction_manager_sqla import (
     SqlaMainTransactionManager,
 )
-from app.infrastructure.adapters.user_data_mapper_sqla import (
-    SqlaUserDataMapper,
+from app.infrastructure.adapters.notification_data_mapper_sqla import (
+    SqlaNotificationDataMapper,
 )
+from app.infrastructure.adapters.notification_reader_sqla import (
+    SqlaNotificationReader,
+)
+from app.infrastructure.adapters.principal_cache_lru import LruPrincipalCache
 from app.infrastructure.adapters.streamer_data_mapper_sqla import (
     SqlaStreamerDataMapper,
 )
+from app.infrastructure.adapters.transaction_data_mapper_sqla import (
+    SqlaTransactionDataMapper,
+)
+from app.infrastructure.adapters.user_data_mapper_sqla import (
+    SqlaUserDataMapper,
+)
 from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
+from app.infrastructure.adapters.wallet_data_mapper_sqla import SqlaWalletDataMapper
 from app.infrastructure.auth.adapters.access_revoker import (
     AuthSessionAccessRevoker,
 )
 from app.infrastructure.auth.adapters.identity_provider import (
     AuthSessionIdentityProvider,
 )
+from app.infrastructure.challenge_updates.publisher_pg_notify import (
+    PgNotifyChallengeUpdatePublisher,
+)
+from app.infrastructure.challenge_updates.stream_pg_listen import (
+    PgListenChallengeUpdateStream,
+)
+from app.infrastructure.outbox.publisher_sqla import SqlaOutboxEventPublisher
 
 
 class ApplicationProvider(Provider):
@@ -50,6 +110,7 @@ class ApplicationProvider(Provider):
     # Services
     services = provide_all(
         CurrentUserService,
+        EscrowReleaseService,
     )
 
     # Ports Auth
@@ -61,6 +122,11 @@ class ApplicationProvider(Provider):
         source=AuthSessionIdentityProvider,
         provides=IdentityProvider,
     )
+    principal_cache = provide(
+        source=LruPrincipalCache,
+        provides=PrincipalCache,
+        scope=Scope.APP,
+    )
 
     # Ports Persistence
     tx_manager = provide(
@@ -88,16 +154,36 @@ class ApplicationProvider(Provider):
         source=SqlaChallengeDataMapper,
         provides=ChallengeCommandGateway,
     )
-    
+
     wallet_command_gateway = provide(
         source=SqlaWalletDataMapper,
         provides=WalletCommandGateway,
     )
-    
+
     transaction_command_gateway = provide(
         source=SqlaTransactionDataMapper,
         provides=TransactionCommandGateway,
     )
+    event_publisher = provide(
+        source=SqlaOutboxEventPublisher,
+        provides=EventPublisher,
+    )
+    challenge_update_publisher = provide(
+        source=PgNotifyChallengeUpdatePublisher,
+        provides=ChallengeUpdatePublisher,
+    )
+    challenge_update_stream = alias(
+        source=PgListenChallengeUpdateStream,
+        provides=ChallengeUpdateStream,
+    )
+    notification_command_gateway = provide(
+        source=SqlaNotificationDataMapper,
+        provides=NotificationCommandGateway,
+    )
+    notification_query_gateway = provide(
+        source=SqlaNotificationReader,
+        provides=NotificationQueryGateway,
+    )
     # Commands
     commands = provide_all(
         ActivateUserInteractor,
@@ -106,11 +192,18 @@ class ApplicationProvider(Provider):
         CreateChallengeInteractor,
         UpdateChallengeInteractor,
         ToggleChallengeStatusInteractor,
+        ExpireChallengesInteractor,
+        RejectPendingChallengesInteractor,
         ApplyAsStreamerInteractor,
+        MarkAllNotificationsReadInteractor,
+        NotifyChallengeParticipantsInteractor,
     )
 
     # Queries
     query_services = provide_all(
         ListUsersQueryService,
         GetMeQueryService,
+        ListNotificationsQueryService,
+        GetUnreadNotificationCountQueryService,
+        StreamChallengeUpdatesQueryService,
     )
@@ -1,17 +1,22 @@
 from dishka import Provider, Scope, provide
 
+from app.domain.challenge.ports import ChallengeHistoryRecorder
 from app.domain.challenge.service import ChallengeService
 from app.domain.shared.ports.id_generator import IdGenerator
 from app.domain.user.ports import PasswordHasher
 from app.domain.user.service import UserService
 from app.domain.wallet.service import WalletService
 from app.domain.shared.entities.ledger.service import LedgerService
+from app.domain.shared.entities.notification.service import NotificationService
 from app.domain.shared.entities.transaction.service import TransactionService
 from app.infrastructure.adapters.password_hasher_bcrypt import (
     BcryptPasswordHasher,
 )
-from app.infrastructure.adapters.id_generator_uuid import (
-    UuidIdGenerator,
+from app.infrastructure.adapters.challenge_history_data_mapper_sqla import (
+    SqlaChallengeHistoryDataMapper,
+)
+from app.infrastructure.adapters.id_generator_uuid7_block import (
+    BlockUuid7IdGenerator,
 )
 
 class DomainProvider(Provider):
@@ -23,12 +28,19 @@ class DomainProvider(Provider):
     wallet_service = provide(source=WalletService)
     ledger_service = provide(source=LedgerService)
     transaction_service = provide(source=TransactionService)
+    notification_service = provide(source=NotificationService)
     # Ports
     password_hasher = provide(
         source=BcryptPasswordHasher,
         provides=PasswordHasher,
+        scope=Scope.APP,
     )
-    user_id_generator = provide(
-        source=UuidIdGenerator,
-        provides=IdGenerator,
+    challenge_history_recorder = provide(
+        source=SqlaChallengeHistoryDataMapper,
+        provides=ChallengeHistoryRecorder,
     )
+
+    @provide(provides=IdGenerator, scope=Scope.APP)
+    def provide_id_generator(self) -> BlockUuid7IdGenerator:
+        # With the system clock.
+        return BlockUuid7IdGenerator()
@@ -3,6 +3,13 @@ from dishka import Provider, Scope, provide, provide_all
 from app.infrastructure.adapters.main_transaction_manager_sqla import (
     SqlaMainTransactionManager,
 )
+from app.infrastructure.adapters.password_hasher_bcrypt import get_bcrypt_cost
+from app.infrastructure.adapters.password_hasher_pool import (
+    get_password_hasher_pool,
+)
+from app.infrastructure.adapters.password_rehasher_sqla import (
+    get_password_rehasher,
+)
 from app.infrastructure.adapters.user_data_mapper_sqla import (
     SqlaUserDataMapper,
 )
@@ -13,28 +20,58 @@ from app.infrastructure.auth.adapters.data_mapper_sqla import (
 from app.infrastructure.auth.adapters.identity_provider import (
     AuthSessionIdentityProvider,
 )
+from app.infrastructure.auth.adapters.revocation_data_mapper_sqla import (
+    SqlaAuthSessionRevocationDataMapper,
+)
 from app.infrastructure.auth.adapters.transaction_manager_sqla import (
     SqlaAuthSessionTransactionManager,
 )
 from app.infrastructure.auth.handlers.log_in import LogInHandler
 from app.infrastructure.auth.handlers.log_out import LogOutHandler
 from app.infrastructure.auth.handlers.user_sign_up import UserSignUpHandler
+from app.infrastructure.auth.session.cache_lru import LruAuthSessionCache
+from app.infrastructure.auth.session.denylist_memory import (
+    InMemoryAuthSessionDenylist,
+)
+from app.infrastructure.auth.session.extension_flusher_sqla import (
+    get_auth_session_extension_flusher,
+)
 from app.infrastructure.auth.session.id_generator_str import (
     StrAuthSessionIdGenerator,
 )
 from app.infrastructure.auth.session.ports.gateway import AuthSessionGateway
+from app.infrastructure.auth.session.ports.revocation_gateway import (
+    AuthSessionRevocationGateway,
+)
 from app.infrastructure.auth.session.ports.transaction_manager import (
     AuthSessionTransactionManager,
 )
 from app.infrastructure.auth.session.ports.transport import AuthSessionTransport
+from app.infrastructure.auth.session.purger_sqla import SqlaAuthSessionPurger
 from app.infrastructure.auth.session.service import AuthSessionService
 from app.infrastructure.auth.session.timer_utc import UtcAuthSessionTimer
+from app.infrastructure.auth.throttle.lockout_sync_sqla import get_login_throttle
+from app.infrastructure.auth.throttle.ports.client_address import (
+    ClientAddressProvider,
+)
+from app.infrastructure.balance_projection.projection_sqla import (
+    SqlaAccountBalanceProjection,
+)
+from app.infrastructure.challenge_updates.stream_pg_listen import (
+    get_challenge_update_stream,
+)
+from app.infrastructure.event_bus.bus_asyncio import AsyncioEventBus, get_event_bus
+from app.infrastructure.outbox.dispatcher import EventDispatcher
+from app.infrastructure.outbox.relay_sqla import SqlaOutboxRelay
 from app.infrastructure.persistence_sqla.provider import (
     get_async_engine,
     get_async_session_factory,
     get_auth_async_session,
     get_main_async_session,
 )
+from app.presentation.http.auth.adapters.client_address_request import (
+    RequestClientAddressProvider,
+)
 from app.presentation.http.auth.adapters.session_transport_jwt_cookie import (
     JwtCookieAuthSessionTransport,
 )
@@ -45,12 +82,22 @@ class InfrastructureProvider(Provider):
 
     # Auth Services
     auth_session_service = provide(source=AuthSessionService)
+    auth_session_cache = provide(source=LruAuthSessionCache, scope=Scope.APP)
+    auth_session_denylist = provide(
+        source=InMemoryAuthSessionDenylist,
+        scope=Scope.APP,
+    )
+    auth_session_purger = provide(source=SqlaAuthSessionPurger, scope=Scope.APP)
 
     # Auth Ports Persistence
     auth_session_gateway = provide(
         source=SqlaAuthSessionDataMapper,
         provides=AuthSessionGateway,
     )
+    auth_session_revocation_gateway = provide(
+        source=SqlaAuthSessionRevocationDataMapper,
+        provides=AuthSessionRevocationGateway,
+    )
     auth_session_tx_manager = provide(
         source=SqlaAuthSessionTransactionManager,
         provides=AuthSessionTransactionManager,
@@ -61,6 +108,10 @@ class InfrastructureProvider(Provider):
         source=JwtCookieAuthSessionTransport,
         provides=AuthSessionTransport,
     )
+    client_address_provider = provide(
+        source=RequestClientAddressProvider,
+        provides=ClientAddressProvider,
+    )
 
     # Infrastructure Handlers
     infra_handlers = provide_all(
@@ -79,6 +130,8 @@ class InfrastructureProvider(Provider):
         SqlaUserDataMapper,
         SqlaUserReader,
         SqlaMainTransactionManager,
+        SqlaAccountBalanceProjection,
+        SqlaOutboxRelay,
     )
 
 
@@ -102,4 +155,46 @@ def infrastructure_provider() -> InfrastructureProvider:
         source=get_auth_async_session,
         scope=Scope.REQUEST,
     )
+
+    # Auth Session Extensions
+    provider.provide(
+        source=get_auth_session_extension_flusher,
+        scope=Scope.APP,
+    )
+
+    # Challenge Updates
+    provider.provide(
+        source=get_challenge_update_stream,
+        scope=Scope.APP,
+    )
+
+    # Event Bus
+    provider.provide(
+        source=get_event_bus,
+        scope=Scope.APP,
+    )
+    provider.alias(
+        source=AsyncioEventBus,
+        provides=EventDispatcher,
+    )
+
+    # Login Throttle
+    provider.provide(
+        source=get_login_throttle,
+        scope=Scope.APP,
+    )
+
+    # Password Hashing
+    provider.provide(
+        source=get_password_hasher_pool,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_bcrypt_cost,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_password_rehasher,
+        scope=Scope.APP,
+    )
     return provider
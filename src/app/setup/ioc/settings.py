@@ -1,10 +1,32 @@
 from dishka import Provider, Scope, from_context, provide
 
-from app.infrastructure.adapters.password_hasher_bcrypt import PasswordPepper
+from app.infrastructure.adapters.password_hasher_bcrypt import (
+    BcryptCostConfig,
+    PasswordPepper,
+)
+from app.infrastructure.adapters.password_hasher_pool import PasswordHasherPoolConfig
+from app.infrastructure.adapters.principal_cache_lru import (
+    PrincipalCacheMaxSize,
+    PrincipalCacheTtl,
+)
+from app.infrastructure.auth.session.cache_lru import (
+    AuthSessionCacheMaxSize,
+    AuthSessionCacheTtl,
+)
+from app.infrastructure.auth.session.denylist_memory import (
+    AuthSessionDenylistSyncInterval,
+)
+from app.infrastructure.auth.session.extension_flusher_sqla import (
+    AuthSessionExtensionFlushInterval,
+)
 from app.infrastructure.auth.session.timer_utc import (
     AuthSessionRefreshThreshold,
     AuthSessionTtlMin,
 )
+from app.infrastructure.auth.session.validation_mode import (
+    AuthSessionValidationMode,
+)
+from app.infrastructure.auth.throttle.limiter_memory import LoginThrottleConfig
 from app.infrastructure.persistence_sqla.config import PostgresDsn, SqlaEngineConfig
 from app.presentation.http.auth.access_token_processor_jwt import (
     JwtAlgorithm,
@@ -31,6 +53,42 @@ class SettingsProvider(Provider):
     def provide_password_pepper(self, settings: AppSettings) -> PasswordPepper:
         return PasswordPepper(settings.security.password.pepper)
 
+    @provide
+    def provide_password_hasher_pool_config(
+        self,
+        settings: AppSettings,
+    ) -> PasswordHasherPoolConfig:
+        password = settings.security.password
+        return PasswordHasherPoolConfig(
+            executor=password.hasher_executor,
+            max_workers=password.hasher_max_workers,
+            max_concurrency=password.hasher_max_concurrency,
+            queue_timeout_s=password.hasher_queue_timeout_s,
+        )
+
+    @provide
+    def provide_bcrypt_cost_config(self, settings: AppSettings) -> BcryptCostConfig:
+        password = settings.security.password
+        return BcryptCostConfig(
+            target_verify_s=password.hasher_target_verify_ms / 1000,
+            min_cost=password.hasher_min_cost,
+        )
+
+    @provide
+    def provide_login_throttle_config(
+        self,
+        settings: AppSettings,
+    ) -> LoginThrottleConfig:
+        throttle = settings.security.login_throttle
+        return LoginThrottleConfig(
+            burst=throttle.burst,
+            refill_per_s=throttle.refill_per_min / 60,
+            lockout_after_failures=throttle.lockout_after_failures,
+            base_lockout_s=throttle.base_lockout_s,
+            max_lockout_s=throttle.max_lockout_s,
+            sync_interval_s=throttle.sync_interval_s,
+        )
+
     @provide
     def provide_jwt_secret(self, settings: AppSettings) -> JwtSecret:
         return JwtSecret(settings.security.auth.jwt_secret)
@@ -52,6 +110,58 @@ class SettingsProvider(Provider):
             settings.security.auth.session_refresh_threshold,
         )
 
+    @provide
+    def provide_auth_session_cache_max_size(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionCacheMaxSize:
+        return AuthSessionCacheMaxSize(settings.security.auth.session_cache_max_size)
+
+    @provide
+    def provide_auth_session_cache_ttl(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionCacheTtl:
+        return AuthSessionCacheTtl(settings.security.auth.session_cache_ttl_s)
+
+    @provide
+    def provide_auth_session_validation_mode(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionValidationMode:
+        return AuthSessionValidationMode(
+            settings.security.auth.session_validation_mode,
+        )
+
+    @provide
+    def provide_auth_session_denylist_sync_interval(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionDenylistSyncInterval:
+        return AuthSessionDenylistSyncInterval(
+            settings.security.auth.session_denylist_sync_interval_s,
+        )
+
+    @provide
+    def provide_auth_session_extension_flush_interval(
+        self,
+        settings: AppSettings,
+    ) -> AuthSessionExtensionFlushInterval:
+        return AuthSessionExtensionFlushInterval(
+            settings.security.auth.session_extension_flush_interval_s,
+        )
+
+    @provide
+    def provide_principal_cache_max_size(
+        self,
+        settings: AppSettings,
+    ) -> PrincipalCacheMaxSize:
+        return PrincipalCacheMaxSize(settings.security.auth.principal_cache_max_size)
+
+    @provide
+    def provide_principal_cache_ttl(self, settings: AppSettings) -> PrincipalCacheTtl:
+        return PrincipalCacheTtl(settings.security.auth.principal_cache_ttl_s)
+
     @provide
     def provide_cookie_params(self, settings: AppSettings) -> CookieParams:
         return CookieParams(secure=settings.security.cookies.secure)
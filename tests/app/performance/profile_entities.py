@@ -0,0 +1,217 @@
+"""
+Construction time and memory per instance of the mapped entities,
+before (`Entity.__setattr__` intercepting every attribute write)
+and after (write-once `id_` descriptor).
+Value objects are built up front, so only entity construction is measured.
+"""
+
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from app.domain.base import Entity
+from app.domain.challenge.challenge import Challenge
+from app.domain.challenge.challenge_status import ChallengeStatus
+from app.domain.shared.entities.ledger.account_type import AccountType
+from app.domain.shared.entities.ledger.ledger_entry import LedgerEntry
+from app.domain.shared.entities.transaction.transaction import Transaction
+from app.domain.shared.entities.transaction.transaction_type import TransactionType
+from app.domain.shared.entities.transaction.value_objects import Allocation
+from app.domain.shared.enums import ProductType
+from app.domain.shared.value_objects.fee import ChallengeFee
+from app.domain.shared.value_objects.id import StreamerId, UserId, WalletId
+from app.domain.shared.value_objects.time import (
+    AcceptedAt,
+    CreatedAt,
+    ExpiresAt,
+    UpdatedAt,
+)
+from app.domain.shared.value_objects.token import Token
+from app.domain.user.user import User
+from app.domain.user.user_role import UserRole
+from app.domain.user.value_objects import Credibility
+from app.domain.wallet.value_objects import Balance
+from app.domain.wallet.wallet import Wallet
+from tests.app.unit.factories.ledger_entries import create_balanced_ledger_entries
+from tests.app.unit.factories.value_objects import (
+    create_challenge_amount,
+    create_challenge_id,
+    create_description,
+    create_email,
+    create_entry_id,
+    create_id,
+    create_password_hash,
+    create_reference_id,
+    create_streamer_fixed_amount,
+    create_title,
+    create_token,
+    create_transaction_id,
+    create_username,
+)
+
+NUMBER = 50_000
+INSTANCES = 10_000
+
+
+def intercepting_setattr(self: Entity[Any], name: str, value: Any) -> None:
+    if name == "id_" and getattr(self, "id_", None) is not None:
+        raise AttributeError("Changing entity ID is not permitted.")
+    object.__setattr__(self, name, value)
+
+
+def user_factory(user_id: UserId, now: datetime) -> Callable[[], User]:
+    username = create_username()
+    email = create_email()
+    password_hash = create_password_hash()
+    credibility = Credibility(5.0)
+    created_at, updated_at = CreatedAt(now), UpdatedAt(now)
+    return lambda: User(
+        id_=user_id,
+        username=username,
+        email=email,
+        password_hash=password_hash,
+        role=UserRole.VIEWER,
+        is_active=True,
+        credibility=credibility,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
+
+
+def wallet_factory(user_id: UserId, now: datetime) -> Callable[[], Wallet]:
+    wallet_id = WalletId(user_id.value)
+    balance = Balance.from_decimal(Decimal("100.00"))
+    created_at, updated_at = CreatedAt(now), UpdatedAt(now)
+    return lambda: Wallet(
+        id_=wallet_id,
+        owner_id=user_id,
+        balance=balance,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
+
+
+def challenge_factory(user_id: UserId, now: datetime) -> Callable[[], Challenge]:
+    challenge_id = create_challenge_id()
+    title = create_title()
+    description = create_description()
+    streamer_id = StreamerId(create_id().value)
+    amount = create_challenge_amount()
+    fee = ChallengeFee(Decimal("0.10"))
+    streamer_fixed_amount = create_streamer_fixed_amount()
+    created_at = CreatedAt(now)
+    expires_at = ExpiresAt(now + timedelta(days=1))
+    accepted_at = AcceptedAt(now)
+    return lambda: Challenge(
+        id_=challenge_id,
+        title=title,
+        description=description,
+        created_by=user_id,
+        assigned_to=streamer_id,
+        amount=amount,
+        fee=fee,
+        streamer_fixed_amount=streamer_fixed_amount,
+        status=ChallengeStatus.PENDING,
+        created_at=created_at,
+        expires_at=expires_at,
+        accepted_at=accepted_at,
+    )
+
+
+def ledger_entry_factory(amount: Token) -> Callable[[], LedgerEntry]:
+    entry_id = create_entry_id()
+    zero = create_token(Decimal(0))
+    return lambda: LedgerEntry(
+        id_=entry_id,
+        account_type=AccountType.BANK,
+        account_id=None,
+        debit=zero,
+        credit=amount,
+    )
+
+
+def transaction_factory(
+    user_id: UserId,
+    amount: Token,
+    now: datetime,
+) -> Callable[[], Transaction]:
+    transaction_id = create_transaction_id()
+    wallet_id = WalletId(user_id.value)
+    allocations = (
+        Allocation(payee_type=AccountType.ESCROW, payee_id=None, amount=amount),
+    )
+    reference_id = create_reference_id()
+    ledger_entries = tuple(
+        create_balanced_ledger_entries(
+            amount=amount,
+            debit_account_type=AccountType.USER_WALLET,
+            credit_account_type=AccountType.ESCROW,
+            debit_account_id=wallet_id,
+        ),
+    )
+    created_at = CreatedAt(now)
+    return lambda: Transaction(
+        id_=transaction_id,
+        transaction_type=TransactionType.DEPOSIT,
+        payer_type=AccountType.USER_WALLET,
+        payer_id=wallet_id,
+        allocations=allocations,
+        amount=amount,
+        reference_id=reference_id,
+        reference_type=ProductType.CHALLENGE,
+        ledger_entries=ledger_entries,
+        created_at=created_at,
+    )
+
+
+def build_factories() -> dict[str, Callable[[], Entity[Any]]]:
+    now = datetime.now(tz=UTC)
+    user_id = create_id()
+    amount = create_token(Decimal("50.00"))
+    return {
+        "User": user_factory(user_id, now),
+        "Wallet": wallet_factory(user_id, now),
+        "Challenge": challenge_factory(user_id, now),
+        "LedgerEntry": ledger_entry_factory(amount),
+        "Transaction": transaction_factory(user_id, amount, now),
+    }
+
+
+def measure(factory: Callable[[], Entity[Any]]) -> tuple[float, float]:
+    ns = min(timeit.repeat(factory, number=NUMBER, repeat=5)) / NUMBER * 1e9
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    instances = [factory() for _ in range(INSTANCES)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return ns, (current - baseline) / INSTANCES
+
+
+def main() -> None:
+    factories = build_factories()
+
+    Entity.__setattr__ = intercepting_setattr  # type: ignore[method-assign, assignment]
+    try:
+        before = {name: measure(factory) for name, factory in factories.items()}
+    finally:
+        del Entity.__setattr__
+    after = {name: measure(factory) for name, factory in factories.items()}
+
+    print(  # noqa: T201
+        f"{'Entity':<13}{'before, ns':>12}{'after, ns':>12}{'speedup':>9}"
+        f"{'before, B':>11}{'after, B':>10}",
+    )
+    for name in factories:
+        (before_ns, before_b), (after_ns, after_b) = before[name], after[name]
+        print(  # noqa: T201
+            f"{name:<13}{before_ns:>12.0f}{after_ns:>12.0f}"
+            f"{before_ns / after_ns:>8.2f}x{before_b:>11.0f}{after_b:>10.0f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Per-id cost of the UUIDv7 generators: one `uuid6.uuid7()` call per id
+against the block-allocating generator, one id at a time and in batches
+the size of an escrow release and of a bulk insert.
+"""
+
+import timeit
+from collections.abc import Callable
+
+from app.domain.shared.ports.id_generator import IdGenerator
+from app.infrastructure.adapters.id_generator_uuid import UuidIdGenerator
+from app.infrastructure.adapters.id_generator_uuid7_block import (
+    BlockUuid7IdGenerator,
+)
+
+IDS = 200_000
+BATCH_SIZES = (1, 3, 1_000)
+
+
+def measure_ns(generator: IdGenerator, batch_size: int) -> float:
+    run: Callable[[], object]
+    if batch_size == 1:
+        run = generator
+    else:
+        run = lambda: generator.generate(batch_size)  # noqa: E731
+    number = IDS // batch_size
+    return min(timeit.repeat(run, number=number, repeat=5)) / IDS * 1e9
+
+
+def main() -> None:
+    before = UuidIdGenerator()
+    after = BlockUuid7IdGenerator()
+
+    print(f"{'batch':<8}{'before, ns':>12}{'after, ns':>12}{'speedup':>10}")  # noqa: T201
+    for batch_size in BATCH_SIZES:
+        before_ns = measure_ns(before, batch_size)
+        after_ns = measure_ns(after, batch_size)
+        print(  # noqa: T201
+            f"{batch_size:<8}{before_ns:>12.0f}{after_ns:>12.0f}"
+            f"{before_ns / after_ns:>9.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
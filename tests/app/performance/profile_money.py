@@ -0,0 +1,121 @@
+"""
+Settlement calculations of `ToggleChallengeStatusInteractor` and loading of
+amount columns, with `Decimal`-backed tokens (before) and integer minor
+units (after).
+The "before" token reproduces the previous `Token`: a validated `Decimal`
+value object, with percentages taken by `Decimal` multiplication.
+"""
+
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Self
+
+import psycopg
+from psycopg.postgres import types
+from psycopg.pq import Format
+
+from app.domain.base import DomainFieldError, ValueObject
+from app.domain.shared.value_objects.token import Token
+from app.domain.wallet.value_objects import Balance
+
+NUMBER = 100_000
+CENT = Decimal("0.01")
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class DecimalToken(ValueObject):
+    value: Decimal
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.value, Decimal):
+            raise DomainFieldError("Token must be a Decimal.")
+
+    def __add__(self, other: Any) -> Self:
+        return self.__class__(self.value + other.value)
+
+    def __sub__(self, other: Any) -> Self:
+        return self.__class__(self.value - other.value)
+
+    def __mul__(self, scalar: Decimal) -> Self:
+        return self.__class__(
+            (self.value * scalar).quantize(CENT, rounding=ROUND_HALF_UP),
+        )
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class DecimalBalance(DecimalToken):
+    def __post_init__(self) -> None:
+        super(DecimalBalance, self).__post_init__()
+        if self.value < 0:
+            raise DomainFieldError("Balance must not be negative.")
+
+
+def settle_decimal(
+    amount: DecimalToken,
+    viewer: DecimalBalance,
+    streamer: DecimalBalance,
+) -> tuple[DecimalBalance, DecimalBalance]:
+    dareus_earn = amount * Decimal("0.1")
+    streamer_earn = amount * Decimal("0.2")
+    viewer_get_back = amount - dareus_earn - streamer_earn
+    return viewer + viewer_get_back, streamer + streamer_earn
+
+
+def settle_minor_units(
+    amount: Token,
+    viewer: Balance,
+    streamer: Balance,
+) -> tuple[Balance, Balance]:
+    _dareus_earn, streamer_earn, viewer_get_back = amount.allocate(10, 20, 70)
+    return viewer + viewer_get_back, streamer + streamer_earn
+
+
+def measure_ns(func: Callable[[], object]) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+
+def main() -> None:
+    numeric_oid = types["numeric"].oid
+    int8_oid = types["int8"].oid
+    numeric_loader = psycopg.adapters.get_loader(numeric_oid, Format.TEXT)(
+        numeric_oid,
+    )
+    int8_loader = psycopg.adapters.get_loader(int8_oid, Format.TEXT)(int8_oid)
+
+    decimal_args = (
+        DecimalToken(Decimal("1234.57")),
+        DecimalBalance(Decimal("100.00")),
+        DecimalBalance(Decimal("200.00")),
+    )
+    minor_units_args = (Token(123457), Balance(10000), Balance(20000))
+
+    rows: dict[str, tuple[Callable[[], object], Callable[[], object]]] = {
+        "3-way settlement": (
+            lambda: settle_decimal(*decimal_args),
+            lambda: settle_minor_units(*minor_units_args),
+        ),
+        "decode column value": (
+            lambda: numeric_loader.load(b"1234.57"),
+            lambda: int8_loader.load(b"123457"),
+        ),
+        "load amount column": (
+            lambda: DecimalToken(numeric_loader.load(b"1234.57")),
+            lambda: Token(int8_loader.load(b"123457")),
+        ),
+    }
+
+    print(  # noqa: T201
+        f"{'operation':<20}{'Decimal, ns':>13}{'int, ns':>10}{'speedup':>9}",
+    )
+    for name, (before, after) in rows.items():
+        before_ns, after_ns = measure_ns(before), measure_ns(after)
+        print(  # noqa: T201
+            f"{name:<20}{before_ns:>13.0f}{after_ns:>10.0f}"
+            f"{before_ns / after_ns:>8.2f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,77 @@
+import asyncio
+import time
+
 from line_profiler import LineProfiler
 
-from app.domain.value_objects.raw_password import RawPassword
+from app.domain.user.value_objects import RawPassword
 from app.infrastructure.adapters.password_hasher_bcrypt import (
+    BcryptCost,
+    BcryptCostConfig,
     BcryptPasswordHasher,
     PasswordPepper,
+    calibrate_bcrypt_cost,
+)
+from app.infrastructure.adapters.password_hasher_pool import (
+    PasswordHasherPool,
+    PasswordHasherPoolConfig,
+    create_hasher_executor,
 )
 
+SWEEP_COSTS = range(8, 15)
+SWEEP_ROUNDS = 3
+TARGET_VERIFY_S = 0.25
+
 
-def profile_password_hashing(hasher: BcryptPasswordHasher) -> None:
+async def profile_password_hashing(hasher: BcryptPasswordHasher) -> None:
     raw_password = RawPassword("raw_password")
-    hashed = hasher.hash(raw_password)
-    hasher.verify(raw_password=raw_password, hashed_password=hashed)
+    hashed = await hasher.hash(raw_password)
+    await hasher.verify(raw_password=raw_password, hashed_password=hashed)
+
+
+async def measure_verify_s(hasher: BcryptPasswordHasher) -> float:
+    raw_password = RawPassword("raw_password")
+    hashed = await hasher.hash(raw_password)
+    best = float("inf")
+    for _ in range(SWEEP_ROUNDS):
+        started = time.perf_counter()
+        await hasher.verify(raw_password=raw_password, hashed_password=hashed)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+async def sweep_costs(pepper: PasswordPepper, pool: PasswordHasherPool) -> None:
+    calibrated = calibrate_bcrypt_cost(
+        BcryptCostConfig(target_verify_s=TARGET_VERIFY_S, min_cost=min(SWEEP_COSTS)),
+    )
+    print(f"{'cost':<6}{'verify, ms':>12}")  # noqa: T201
+    for cost in SWEEP_COSTS:
+        hasher = BcryptPasswordHasher(pepper, pool, BcryptCost(cost))
+        verify_s = await measure_verify_s(hasher)
+        marker = "  <- calibrated" if cost == calibrated else ""
+        print(f"{cost:<6}{verify_s * 1000:>12.1f}{marker}")  # noqa: T201
 
 
 def main() -> None:
     pepper = PasswordPepper("Cayenne!")
-    hasher = BcryptPasswordHasher(pepper)
+    config = PasswordHasherPoolConfig(
+        executor="thread",
+        max_workers=1,
+        max_concurrency=1,
+        queue_timeout_s=5.0,
+    )
+    pool = PasswordHasherPool(create_hasher_executor(config), config)
+    hasher = BcryptPasswordHasher(pepper, pool, BcryptCost(12))
 
     profiler = LineProfiler()
-    profiler.add_function(profile_password_hashing)
+    profiler.add_function(BcryptPasswordHasher.hash)
+    profiler.add_function(BcryptPasswordHasher.verify)
 
-    profiler.runcall(profile_password_hashing, hasher)
+    with profiler:
+        asyncio.run(profile_password_hashing(hasher))
     profiler.print_stats()
 
+    asyncio.run(sweep_costs(pepper, pool))
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,73 @@
+"""
+Bulk load of mapped `User` rows, with value objects validated on every load
+(`trusted_hydration=False`) and hydrated directly (`trusted_hydration=True`).
+Uses in-memory SQLite so the timings are dominated by ORM hydration.
+"""
+
+import timeit
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from sqlalchemy import Engine, create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.domain.user.user import User
+from app.domain.user.user_role import UserRole
+from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+ROWS = 20_000
+REPEAT = 5
+
+
+def create_populated_engine() -> Engine:
+    engine = create_engine("sqlite://")
+    users_table.create(engine)
+    now = datetime.now(tz=UTC)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(users_table),
+            [
+                {
+                    "id": uuid4(),
+                    "username": f"user{i}",
+                    "email": f"user{i}@example.com",
+                    "password_hash": b"hash",
+                    "role": UserRole.VIEWER,
+                    "is_active": True,
+                    "credibility": 5.0,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(ROWS)
+            ],
+        )
+    return engine
+
+
+def measure_s(engine: Engine, *, trusted_hydration: bool) -> float:
+    mapping_registry.dispose()
+    map_tables(trusted_hydration=trusted_hydration)
+
+    def read_all() -> None:
+        with Session(engine) as session:
+            users = session.scalars(select(User)).all()
+            assert len(users) == ROWS
+
+    return min(timeit.repeat(read_all, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    engine = create_populated_engine()
+    validated = measure_s(engine, trusted_hydration=False)
+    trusted = measure_s(engine, trusted_hydration=True)
+
+    print(f"rows: {ROWS}")  # noqa: T201
+    print(f"validated: {validated * 1e3:.1f} ms")  # noqa: T201
+    print(f"trusted:   {trusted * 1e3:.1f} ms")  # noqa: T201
+    print(f"speedup:   {validated / trusted:.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Per-instance construction time of frequently built value objects,
+before (field reflection on every `__new__`) and after (per-class metadata).
+"""
+
+import timeit
+from collections.abc import Callable
+from dataclasses import fields
+from datetime import UTC, datetime
+from typing import Any
+
+from app.domain.base import ValueObject
+from app.domain.shared.value_objects.time import CreatedAt
+from app.domain.shared.value_objects.token import Token
+from app.domain.user.value_objects import Email, Username
+
+NUMBER = 200_000
+
+
+def reflective_new(cls: type[ValueObject], *_args: Any, **_kwargs: Any) -> Any:
+    if cls is ValueObject:
+        raise TypeError("Base ValueObject cannot be instantiated directly.")
+    if not fields(cls):
+        raise TypeError(f"{cls.__name__} must have at least one field!")
+    return object.__new__(cls)
+
+
+def measure_ns(factory: Callable[[], ValueObject]) -> float:
+    return min(timeit.repeat(factory, number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+
+def main() -> None:
+    now = datetime.now(tz=UTC)
+    factories: dict[str, Callable[[], ValueObject]] = {
+        "Token": lambda: Token(1000),
+        "Username": lambda: Username("username"),
+        "Email": lambda: Email("viewer@example.com"),
+        "CreatedAt": lambda: CreatedAt(now),
+    }
+
+    cached_new = ValueObject.__new__
+    ValueObject.__new__ = reflective_new  # type: ignore[method-assign, assignment]
+    try:
+        before = {name: measure_ns(factory) for name, factory in factories.items()}
+    finally:
+        ValueObject.__new__ = cached_new  # type: ignore[method-assign]
+    after = {name: measure_ns(factory) for name, factory in factories.items()}
+
+    print(f"{'VO':<12}{'before, ns':>12}{'after, ns':>12}{'speedup':>10}")  # noqa: T201
+    for name in factories:
+        print(  # noqa: T201
+            f"{name:<12}{before[name]:>12.1f}{after[name]:>12.1f}"
+            f"{before[name] / after[name]:>9.2f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.identity_provider import IdentityProvider
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.query_models.principal import Principal
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.shared.value_objects.id import UserId
+from app.domain.user.user_role import UserRole
+from app.infrastructure.adapters.principal_cache_lru import (
+    LruPrincipalCache,
+    PrincipalCacheMaxSize,
+    PrincipalCacheTtl,
+)
+from tests.app.unit.factories.value_objects import create_id
+
+
+def create_service(
+    user_id: UserId,
+    principal: Principal | None,
+) -> tuple[CurrentUserService, MagicMock, MagicMock, LruPrincipalCache]:
+    identity_provider = create_autospec(IdentityProvider)
+    identity_provider.get_current_user_id = AsyncMock(return_value=user_id)
+    user_command_gateway = create_autospec(UserCommandGateway)
+    user_command_gateway.read_principal_by_id = AsyncMock(return_value=principal)
+    access_revoker = create_autospec(AccessRevoker)
+    access_revoker.remove_all_user_access = AsyncMock()
+    cache = LruPrincipalCache(
+        PrincipalCacheMaxSize(10),
+        PrincipalCacheTtl(timedelta(seconds=5)),
+    )
+    sut = CurrentUserService(
+        identity_provider,
+        user_command_gateway,
+        access_revoker,
+        cache,
+    )
+    return sut, user_command_gateway, access_revoker, cache
+
+
+@pytest.mark.asyncio
+async def test_principal_is_read_once_then_served_from_cache() -> None:
+    user_id = create_id()
+    principal = Principal(id_=user_id, role=UserRole.VIEWER, is_active=True)
+    sut, user_command_gateway, _, _ = create_service(user_id, principal)
+
+    assert await sut.get_current_principal() == principal
+    assert await sut.get_current_principal() == principal
+
+    user_command_gateway.read_principal_by_id.assert_awaited_once_with(user_id)
+    user_command_gateway.read_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalidated_principal_is_read_again() -> None:
+    user_id = create_id()
+    principal = Principal(id_=user_id, role=UserRole.VIEWER, is_active=True)
+    sut, user_command_gateway, _, cache = create_service(user_id, principal)
+    await sut.get_current_principal()
+
+    cache.invalidate(user_id)
+    await sut.get_current_principal()
+
+    assert user_command_gateway.read_principal_by_id.await_count == 2
+
+
+@pytest.mark.parametrize(
+    "principal",
+    [None, Principal(id_=create_id(), role=UserRole.VIEWER, is_active=False)],
+)
+@pytest.mark.asyncio
+async def test_missing_or_inactive_user_loses_access(
+    principal: Principal | None,
+) -> None:
+    user_id = principal.id_ if principal is not None else create_id()
+    sut, _, access_revoker, cache = create_service(user_id, principal)
+
+    with pytest.raises(AuthorizationError):
+        await sut.get_current_principal()
+
+    access_revoker.remove_all_user_access.assert_awaited_once_with(user_id)
+    assert cache.get(user_id) is None
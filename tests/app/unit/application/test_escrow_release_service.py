@@ -0,0 +1,98 @@
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import cast
+
+from app.application.common.services.escrow_release import EscrowReleaseService
+from app.domain.challenge.challenge import Challenge
+from app.domain.challenge.value_objects import ChallengeAmount
+from app.domain.shared.entities.ledger.account_type import AccountType
+from app.domain.shared.entities.ledger.service import LedgerService
+from app.domain.shared.entities.transaction.service import TransactionService
+from app.domain.wallet.service import WalletService
+from app.domain.wallet.wallet import Wallet
+from app.infrastructure.adapters.id_generator_uuid7_block import (
+    BlockUuid7IdGenerator,
+)
+from tests.app.unit.factories.value_objects import (
+    create_challenge_amount,
+    create_challenge_id,
+    create_id,
+)
+
+
+def create_sut() -> tuple[EscrowReleaseService, WalletService]:
+    id_generator = BlockUuid7IdGenerator()
+    wallet_service = WalletService(id_generator)
+    sut = EscrowReleaseService(
+        wallet_service,
+        TransactionService(id_generator, LedgerService(id_generator)),
+    )
+    return sut, wallet_service
+
+
+def create_challenge(amount: ChallengeAmount) -> Challenge:
+    return cast(Challenge, SimpleNamespace(id_=create_challenge_id(), amount=amount))
+
+
+def create_wallet(wallet_service: WalletService) -> Wallet:
+    return wallet_service.create_wallet(create_id())
+
+
+def test_shares_are_credited_and_allocated() -> None:
+    sut, wallet_service = create_sut()
+    challenge = create_challenge(create_challenge_amount(Decimal("10.00")))
+    wallet = create_wallet(wallet_service)
+    dareus_earn, viewer_get_back = challenge.amount.allocate(10, 90)
+
+    transaction = sut.release(
+        challenge,
+        (None, dareus_earn),
+        (wallet, viewer_get_back),
+    )
+
+    assert transaction is not None
+    assert [
+        (allocation.payee_type, allocation.payee_id, allocation.amount)
+        for allocation in transaction.allocations
+    ] == [
+        (AccountType.REVENUE, None, dareus_earn),
+        (AccountType.USER_WALLET, wallet.id_, viewer_get_back),
+    ]
+    assert wallet.balance.minor_units == viewer_get_back.minor_units
+
+
+def test_zero_shares_of_a_small_amount_are_skipped() -> None:
+    sut, wallet_service = create_sut()
+    challenge = create_challenge(create_challenge_amount(Decimal("0.01")))
+    wallet = create_wallet(wallet_service)
+    dareus_earn, viewer_get_back = challenge.amount.allocate(10, 90)
+
+    transaction = sut.release(
+        challenge,
+        (None, dareus_earn),
+        (wallet, viewer_get_back),
+    )
+
+    assert transaction is not None
+    assert [allocation.payee_type for allocation in transaction.allocations] == [
+        AccountType.USER_WALLET,
+    ]
+    assert wallet.balance.minor_units == 1
+
+
+def test_zero_amount_has_no_escrow_to_release() -> None:
+    sut, wallet_service = create_sut()
+    challenge = create_challenge(create_challenge_amount(Decimal(0)))
+    wallet = create_wallet(wallet_service)
+    dareus_earn, viewer_get_back = challenge.amount.allocate(10, 90)
+
+    refund = sut.release(challenge, (wallet, challenge.amount))
+    settlement = sut.release(
+        challenge,
+        (None, dareus_earn),
+        (wallet, viewer_get_back),
+    )
+
+    assert refund is None
+    assert settlement is None
+    assert wallet.balance.minor_units == 0
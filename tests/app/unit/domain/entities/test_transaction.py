@@ -10,8 +10,13 @@ from app.domain.shared.entities.transaction.transaction_type import TransactionT
 from app.domain.shared.entities.transaction.value_objects import Allocation
 from app.domain.shared.enums import ProductType
 from app.domain.shared.value_objects.time import CreatedAt
-from tests.app.unit.factories.ledger_entries import create_balanced_ledger_entries
+from tests.app.unit.factories.ledger_entries import (
+    create_balanced_ledger_entries,
+    create_credit_entry,
+    create_debit_entry,
+)
 from tests.app.unit.factories.value_objects import (
+    create_allocation,
     create_id,
     create_reference_id,
     create_token,
@@ -122,3 +127,68 @@ def test_rejects_allocation_total_mismatch() -> None:
             ),
             created_at=CreatedAt(datetime(2024, 1, 1, tzinfo=timezone.utc)),
         )
+
+
+def create_escrow_release(
+    payee_amounts: tuple[Decimal, ...] = (Decimal("3.00"), Decimal("7.00")),
+) -> Transaction:
+    amount = create_token(sum(payee_amounts, Decimal(0)))
+    allocations = tuple(
+        create_allocation(amount=payee_amount) for payee_amount in payee_amounts
+    )
+    credit_entries = [
+        create_credit_entry(
+            account_type=allocation.payee_type,
+            account_id=allocation.payee_id,
+            amount=allocation.amount,
+        )
+        for allocation in allocations
+    ]
+    return Transaction(
+        id_=create_transaction_id(),
+        transaction_type=TransactionType.ESCROW_RELEASE,
+        payer_type=AccountType.ESCROW,
+        payer_id=None,
+        allocations=allocations,
+        amount=amount,
+        reference_id=create_reference_id(),
+        reference_type=ProductType.CHALLENGE,
+        ledger_entries=(
+            create_debit_entry(account_type=AccountType.ESCROW, amount=amount),
+            *credit_entries,
+        ),
+        created_at=CreatedAt(datetime(2024, 1, 1, tzinfo=timezone.utc)),
+    )
+
+
+def test_ledger_summary_aggregates_entries() -> None:
+    sut = create_escrow_release((Decimal("3.00"), Decimal("7.00")))
+
+    summary = sut.ledger_summary
+
+    assert summary.total_debit == summary.total_credit == 1000
+    assert summary.debit_count == 1
+    assert summary.debit_entry is sut.ledger_entries[0]
+    assert sorted(summary.credits_by_account.values()) == [300, 700]
+
+
+def test_ledger_summary_is_cached_until_entries_change() -> None:
+    sut = create_escrow_release()
+    summary = sut.ledger_summary
+
+    assert sut.ledger_summary is summary
+    assert sut.ledger_entries is summary.entries
+
+    sut._ledger_entries = list(sut.ledger_entries)  # noqa: SLF001
+
+    assert sut.ledger_summary is not summary
+    assert sut.ledger_summary.entries == summary.entries
+
+
+def test_ledger_summary_is_rebuilt_after_entry_is_added() -> None:
+    sut = create_escrow_release()
+    entries_before = sut.ledger_entries
+
+    sut._ledger_entries.append(create_credit_entry())  # noqa: SLF001
+
+    assert len(sut.ledger_entries) == len(entries_before) + 1
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, create_autospec
 
 import pytest
 
+from app.domain.challenge.ports import ChallengeHistoryRecorder
 from app.domain.user.ports import PasswordHasher
 from app.domain.shared.ports.id_generator import IdGenerator
 
@@ -17,6 +18,16 @@ def challenge_id_generator() -> MagicMock:
     return cast(MagicMock, create_autospec(IdGenerator))
 
 
+@pytest.fixture
+def challenge_history_id_generator() -> MagicMock:
+    return cast(MagicMock, create_autospec(IdGenerator))
+
+
+@pytest.fixture
+def challenge_history_recorder() -> MagicMock:
+    return cast(MagicMock, create_autospec(ChallengeHistoryRecorder))
+
+
 @pytest.fixture
 def transaction_id_generator() -> MagicMock:
     return cast(MagicMock, create_autospec(IdGenerator))
@@ -29,3 +40,8 @@ def ledger_entry_id_generator() -> MagicMock:
 @pytest.fixture
 def password_hasher() -> MagicMock:
     return cast(MagicMock, create_autospec(PasswordHasher))
+
+
+@pytest.fixture
+def notification_id_generator() -> MagicMock:
+    return cast(MagicMock, create_autospec(IdGenerator))
@@ -8,6 +8,7 @@ from app.domain.base import DomainError
 from app.domain.challenge.challenge import Challenge
 from app.domain.challenge.challenge_status import ChallengeStatus
 from app.domain.challenge.service import ChallengeService
+from app.domain.challenge.transitions import ChallengeAction, ChallengeActor
 from app.domain.challenge.value_objects import ChallengeAmount, Description, Title
 from app.domain.shared.value_objects.fee import ChallengeFee
 from app.domain.shared.value_objects.time import AcceptedAt, CreatedAt, ExpiresAt
@@ -65,13 +66,19 @@ def _create_challenge(
 
 def test_create_challenge_sets_defaults(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     expected_id = create_challenge_id()
     fixed_now = datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
     _patch_datetime(monkeypatch, fixed_now)
     challenge_id_generator.return_value = expected_id.value
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     expires_at = ExpiresAt(fixed_now + timedelta(days=2))
     title = create_title("First challenge")
     description = create_description("Do something cool")
@@ -106,9 +113,15 @@ def test_create_challenge_sets_defaults(
 
 def test_update_content_when_pending(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.PENDING)
     fixed_now = datetime(2024, 1, 2, 9, 0, tzinfo=timezone.utc)
     _patch_datetime(monkeypatch, fixed_now)
@@ -128,8 +141,14 @@ def test_update_content_when_pending(
 
 def test_update_content_rejects_non_pending(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.STREAMER_ACCEPTED)
 
     with pytest.raises(DomainError):
@@ -142,9 +161,15 @@ def test_update_content_rejects_non_pending(
 
 def test_update_amount_for_pending(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(
         status=ChallengeStatus.PENDING,
         amount=create_challenge_amount(ChallengeAmount.ZERO + Decimal("10.00")),
@@ -161,8 +186,14 @@ def test_update_amount_for_pending(
 
 def test_update_amount_requires_increase_for_accepted(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(
         status=ChallengeStatus.STREAMER_ACCEPTED,
         amount=create_challenge_amount(Decimal("30.00")),
@@ -175,8 +206,14 @@ def test_update_amount_requires_increase_for_accepted(
 
 def test_update_amount_rejects_disallowed_status(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.DONE)
     new_amount = create_challenge_amount(Decimal("50.00"))
 
@@ -186,9 +223,15 @@ def test_update_amount_rejects_disallowed_status(
 
 def test_extend_deadline_updates_when_later(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.PENDING)
     new_expiration = ExpiresAt(challenge.expires_at.value + timedelta(days=1))
     fixed_now = datetime(2024, 1, 4, 8, 0, tzinfo=timezone.utc)
@@ -202,8 +245,14 @@ def test_extend_deadline_updates_when_later(
 
 def test_extend_deadline_rejects_earlier_or_equal(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.STREAMER_ACCEPTED)
 
     with pytest.raises(DomainError):
@@ -212,9 +261,15 @@ def test_extend_deadline_rejects_earlier_or_equal(
 
 def test_accept_challenge_sets_status_and_timestamp(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.PENDING, accepted_at=None)
     fixed_now = datetime(2024, 1, 5, 12, 0, tzinfo=timezone.utc)
     _patch_datetime(monkeypatch, fixed_now)
@@ -227,8 +282,14 @@ def test_accept_challenge_sets_status_and_timestamp(
 
 def test_accept_challenge_rejects_non_pending(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.STREAMER_ACCEPTED)
 
     with pytest.raises(DomainError):
@@ -237,9 +298,15 @@ def test_accept_challenge_rejects_non_pending(
 
 def test_streamer_rejects_pending_challenge(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.PENDING)
     fixed_now = datetime(2024, 1, 6, 10, 0, tzinfo=timezone.utc)
     _patch_datetime(monkeypatch, fixed_now)
@@ -252,9 +319,15 @@ def test_streamer_rejects_pending_challenge(
 
 def test_viewer_rejects_pending_or_accepted(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.STREAMER_ACCEPTED)
     fixed_now = datetime(2024, 1, 7, 11, 0, tzinfo=timezone.utc)
     _patch_datetime(monkeypatch, fixed_now)
@@ -267,9 +340,15 @@ def test_viewer_rejects_pending_or_accepted(
 
 def test_streamer_complete_challenge_within_duration(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
     expires_at = created_at + timedelta(days=1)
     challenge = _create_challenge(
@@ -288,9 +367,15 @@ def test_streamer_complete_challenge_within_duration(
 
 def test_streamer_complete_challenge_after_duration_fails(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
     expires_at = created_at + timedelta(hours=1)
     challenge = _create_challenge(
@@ -307,9 +392,15 @@ def test_streamer_complete_challenge_after_duration_fails(
 
 def test_viewer_confirm_after_streamer_completion(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.STREAMER_COMPLETED)
     fixed_now = datetime(2024, 1, 8, 14, 0, tzinfo=timezone.utc)
     _patch_datetime(monkeypatch, fixed_now)
@@ -322,8 +413,14 @@ def test_viewer_confirm_after_streamer_completion(
 
 def test_viewer_confirm_invalid_status_raises(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.PENDING)
 
     with pytest.raises(DomainError):
@@ -332,9 +429,15 @@ def test_viewer_confirm_invalid_status_raises(
 
 def test_done_challenge_transitions_to_done(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.VIEWER_CONFIRMED)
     fixed_now = datetime(2024, 1, 9, 16, 0, tzinfo=timezone.utc)
     _patch_datetime(monkeypatch, fixed_now)
@@ -347,9 +450,205 @@ def test_done_challenge_transitions_to_done(
 
 def test_done_challenge_requires_viewer_confirmed(
     challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
 ) -> None:
-    sut = ChallengeService(challenge_id_generator)
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
     challenge = _create_challenge(status=ChallengeStatus.STREAMER_ACCEPTED)
 
     with pytest.raises(DomainError):
         sut.done_challenge(challenge)
+
+
+@pytest.mark.parametrize(
+    "status",
+    [ChallengeStatus.PENDING, ChallengeStatus.STREAMER_ACCEPTED],
+)
+def test_expire_challenge_fails_expired_challenge(
+    challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+    status: ChallengeStatus,
+) -> None:
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
+    challenge = _create_challenge(status=status)
+    fixed_now = challenge.expires_at.value + timedelta(minutes=1)
+    _patch_datetime(monkeypatch, fixed_now)
+
+    sut.expire_challenge(challenge)
+
+    assert challenge.status is ChallengeStatus.FAIL
+    assert challenge.updated_at.value == fixed_now
+
+
+def test_expire_challenge_before_expiry_raises(
+    challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
+    challenge = _create_challenge(status=ChallengeStatus.PENDING)
+    _patch_datetime(monkeypatch, challenge.expires_at.value - timedelta(minutes=1))
+
+    with pytest.raises(DomainError):
+        sut.expire_challenge(challenge)
+
+    assert challenge.status is ChallengeStatus.PENDING
+
+
+def test_expire_challenge_requires_escrow_holding_status(
+    challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
+) -> None:
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
+    challenge = _create_challenge(status=ChallengeStatus.STREAMER_COMPLETED)
+
+    with pytest.raises(DomainError):
+        sut.expire_challenge(challenge)
+
+
+def test_transition_by_other_streamer_raises(
+    challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
+) -> None:
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
+    challenge = _create_challenge(status=ChallengeStatus.PENDING)
+
+    with pytest.raises(DomainError):
+        sut.streamer_reject_challenge(challenge, streamer_id=create_id())
+
+    assert challenge.status is ChallengeStatus.PENDING
+
+
+def test_bulk_transition_returns_set_based_transition(
+    challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
+) -> None:
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
+
+    transition = sut.bulk_transition(ChallengeAction.STREAMER_REJECT)
+
+    assert transition.sources == {ChallengeStatus.PENDING}
+    assert transition.target is ChallengeStatus.STREAMER_REJECTED
+    assert transition.actor is ChallengeActor.STREAMER
+
+
+@pytest.mark.parametrize(
+    "action",
+    [ChallengeAction.STREAMER_COMPLETE, ChallengeAction.EXPIRE],
+)
+def test_bulk_transition_rejects_time_guarded_actions(
+    challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
+    action: ChallengeAction,
+) -> None:
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
+
+    with pytest.raises(DomainError):
+        sut.bulk_transition(action)
+
+
+def test_transition_records_status_change(
+    challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
+) -> None:
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
+    challenge = _create_challenge(status=ChallengeStatus.STREAMER_ACCEPTED)
+
+    sut.viewer_confirm_challenge(challenge, user_id=challenge.created_by)
+
+    (history,) = (
+        call.args[0] for call in challenge_history_recorder.record.call_args_list
+    )
+    assert history.challenge_id == challenge.id_
+    assert history.previous_status is ChallengeStatus.STREAMER_ACCEPTED
+    assert history.current_status is ChallengeStatus.VIEWER_CONFIRMED
+    assert history.changed_by == challenge.created_by
+    assert history.changes is None
+
+
+def test_content_update_records_only_changed_fields(
+    challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
+) -> None:
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
+    challenge = _create_challenge(status=ChallengeStatus.PENDING)
+    old_title = challenge.title
+
+    sut.update_challenge_content(
+        challenge,
+        user_id=challenge.created_by,
+        title=create_title("Renamed"),
+        description=challenge.description,
+    )
+
+    history = challenge_history_recorder.record.call_args.args[0]
+    assert history.changes == {
+        "title": {"from": old_title.value, "to": "Renamed"},
+    }
+
+
+def test_unchanged_content_update_records_nothing(
+    challenge_id_generator: MagicMock,
+    challenge_history_id_generator: MagicMock,
+    challenge_history_recorder: MagicMock,
+) -> None:
+    sut = ChallengeService(
+        challenge_id_generator,
+        challenge_history_id_generator,
+        challenge_history_recorder,
+    )
+    challenge = _create_challenge(status=ChallengeStatus.PENDING)
+
+    sut.update_challenge_content(
+        challenge,
+        user_id=challenge.created_by,
+        title=challenge.title,
+        description=challenge.description,
+    )
+
+    challenge_history_recorder.record.assert_not_called()
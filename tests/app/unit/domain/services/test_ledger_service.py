@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 
 from app.domain.shared.entities.ledger.account_type import AccountType
 from app.domain.shared.entities.ledger.service import LedgerService
+from app.domain.shared.entities.transaction.value_objects import Allocation
 from app.domain.shared.value_objects.token import Token
 from tests.app.unit.factories.value_objects import create_account_id, create_token
 
@@ -15,7 +16,7 @@ def test_create_ledger_entry_sets_fields(
     ledger_entry_id_generator.return_value = expected_id
     sut = LedgerService(ledger_entry_id_generator)
     account_id = create_account_id()
-    debit = Token(Decimal("5.00"))
+    debit = Token.from_decimal(Decimal("5.00"))
     credit = Token(Token.ZERO)
 
     entry = sut.create_ledger_entry(
@@ -147,3 +148,39 @@ def test_create_commission_credit_entry_sets_defaults(
     assert entry.debit == Token(Token.ZERO)
     assert entry.credit == credit
     ledger_entry_id_generator.assert_called_once()
+
+
+def test_create_credit_entries_generates_ids_as_one_batch(
+    ledger_entry_id_generator: MagicMock,
+) -> None:
+    expected_ids = [uuid4(), uuid4()]
+    ledger_entry_id_generator.generate.return_value = expected_ids
+    sut = LedgerService(ledger_entry_id_generator)
+    account_id = create_account_id()
+    allocations = (
+        Allocation(
+            payee_type=AccountType.REVENUE,
+            payee_id=None,
+            amount=create_token(Decimal("1.00")),
+        ),
+        Allocation(
+            payee_type=AccountType.USER_WALLET,
+            payee_id=account_id,
+            amount=create_token(Decimal("9.00")),
+        ),
+    )
+
+    entries = sut.create_credit_entries(allocations=allocations)
+
+    assert [entry.id_.value for entry in entries] == expected_ids
+    assert [entry.account_type for entry in entries] == [
+        AccountType.REVENUE,
+        AccountType.USER_WALLET,
+    ]
+    assert [entry.account_id for entry in entries] == [None, account_id]
+    assert [entry.credit for entry in entries] == [
+        allocation.amount for allocation in allocations
+    ]
+    assert all(entry.debit == Token(Token.ZERO) for entry in entries)
+    ledger_entry_id_generator.generate.assert_called_once_with(2)
+    ledger_entry_id_generator.assert_not_called()
@@ -0,0 +1,46 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.domain.shared.entities.notification.service import NotificationService
+from tests.app.unit.factories.value_objects import create_challenge_id, create_id
+
+
+def test_create_notifications_fans_out_one_unread_per_recipient(
+    notification_id_generator: MagicMock,
+) -> None:
+    notification_ids = [uuid4(), uuid4()]
+    notification_id_generator.side_effect = notification_ids
+    product_id = create_challenge_id()
+    recipients = [create_id(), create_id()]
+    sut = NotificationService(notification_id_generator)
+
+    notifications = sut.create_notifications(
+        product_id=product_id,
+        user_ids=recipients,
+        title="Challenge expired",
+        message="The challenge expired.",
+    )
+
+    assert [n.id_.value for n in notifications] == notification_ids
+    assert [n.user_id for n in notifications] == recipients
+    assert all(n.product_id == product_id for n in notifications)
+    assert all(not n.is_read for n in notifications)
+    assert len({n.created_at for n in notifications}) == 1
+
+
+def test_create_notification_creates_one(
+    notification_id_generator: MagicMock,
+) -> None:
+    notification_id_generator.return_value = uuid4()
+    user_id = create_id()
+    sut = NotificationService(notification_id_generator)
+
+    notification = sut.create_notification(
+        product_id=create_challenge_id(),
+        user_id=user_id,
+        title="New challenge",
+        message="You have a new challenge.",
+    )
+
+    assert notification.user_id == user_id
+    notification_id_generator.assert_called_once()
@@ -24,7 +24,8 @@ from tests.app.unit.factories.value_objects import (
     "role",
     [UserRole.VIEWER, UserRole.STREAMER],
 )
-def test_creates_active_user_with_hashed_password(
+@pytest.mark.asyncio
+async def test_creates_active_user_with_hashed_password(
     role: UserRole,
     user_id_generator: MagicMock,
     password_hasher: MagicMock,
@@ -41,7 +42,7 @@ def test_creates_active_user_with_hashed_password(
     sut = UserService(user_id_generator, password_hasher)
 
     # Act
-    result = sut.create_user(
+    result = await sut.create_user(
         username=username,
         raw_password=raw_password,
         email=email,
@@ -56,7 +57,8 @@ def test_creates_active_user_with_hashed_password(
     assert result.role == role
     assert result.is_active is True
 
-def test_fails_to_create_user_with_unassignable_role(
+@pytest.mark.asyncio
+async def test_fails_to_create_user_with_unassignable_role(
     user_id_generator: MagicMock,
     password_hasher: MagicMock,
 ) -> None:
@@ -66,7 +68,7 @@ def test_fails_to_create_user_with_unassignable_role(
     sut = UserService(user_id_generator, password_hasher)
 
     with pytest.raises(RoleAssignmentNotPermittedError):
-        sut.create_user(
+        await sut.create_user(
             username=username,
             raw_password=raw_password,
             email=email,
@@ -78,7 +80,8 @@ def test_fails_to_create_user_with_unassignable_role(
     "is_valid",
     [True, False],
 )
-def test_checks_password_authenticity(
+@pytest.mark.asyncio
+async def test_checks_password_authenticity(
     is_valid: bool,
     user_id_generator: MagicMock,
     password_hasher: MagicMock,
@@ -91,13 +94,14 @@ def test_checks_password_authenticity(
     sut = UserService(user_id_generator, password_hasher)
 
     # Act
-    result = sut.is_password_valid(user, raw_password=raw_password)
+    result = await sut.is_password_valid(user, raw_password=raw_password)
 
     # Assert
     assert result is is_valid
 
 
-def test_changes_password(
+@pytest.mark.asyncio
+async def test_changes_password(
     user_id_generator: MagicMock,
     password_hasher: MagicMock,
 ) -> None:
@@ -111,7 +115,7 @@ def test_changes_password(
     sut = UserService(user_id_generator, password_hasher)
 
     # Act
-    sut.change_password(user, raw_password=raw_password)
+    await sut.change_password(user, raw_password=raw_password)
 
     # Assert
     assert user.password_hash == expected_hash
@@ -1,4 +1,4 @@
-from dataclasses import FrozenInstanceError, dataclass, fields
+from dataclasses import FrozenInstanceError, dataclass, field, fields
 from typing import ClassVar, Final
 
 import pytest
@@ -116,3 +116,16 @@ def test_class_field_not_in_repr() -> None:
     sut = MixedFieldsVO(baz=1)
 
     assert repr(sut) == "MixedFieldsVO(1)"
+
+
+def test_slotted_vo_collects_field_metadata_at_class_creation() -> None:
+    @dataclass(frozen=True, slots=True, repr=False)
+    class SecretVO(ValueObject):
+        login: str
+        secret: str = field(repr=False)
+
+    meta = SecretVO.__dict__["_vo_meta"]
+
+    assert meta.field_names == ("login", "secret")
+    assert meta.repr_names == ("login",)
+    assert repr(SecretVO(login="abc", secret="xyz")) == "SecretVO('abc')"
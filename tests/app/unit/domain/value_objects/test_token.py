@@ -0,0 +1,123 @@
+from decimal import Decimal
+
+import pytest
+
+from app.domain.base import DomainError, DomainFieldError
+from app.domain.shared.value_objects.money import MAX_MINOR_UNITS
+from app.domain.shared.value_objects.token import Token
+from app.domain.wallet.value_objects import Balance
+
+
+@pytest.mark.parametrize(
+    ("value", "minor_units"),
+    [
+        pytest.param(Decimal("10.00"), 1000, id="exact"),
+        pytest.param(Decimal("10.005"), 1001, id="half_up"),
+        pytest.param(Decimal("-10.005"), -1001, id="half_away_from_zero"),
+        pytest.param(Decimal("10.004"), 1000, id="below_half"),
+        pytest.param(Decimal(7), 700, id="integer"),
+    ],
+)
+def test_from_decimal_quantizes_like_numeric_column(
+    value: Decimal,
+    minor_units: int,
+) -> None:
+    sut = Token.from_decimal(value)
+
+    assert sut.minor_units == minor_units
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(10.0, id="float"),
+        pytest.param(Decimal("NaN"), id="nan"),
+        pytest.param(Decimal("Infinity"), id="infinity"),
+    ],
+)
+def test_from_decimal_rejects_non_finite_decimals(value: object) -> None:
+    with pytest.raises(DomainFieldError):
+        Token.from_decimal(value)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(Decimal("1E+30"), id="beyond_context_precision"),
+        pytest.param(Decimal("-1E+30"), id="negative_beyond_context_precision"),
+        pytest.param(Decimal("10000000000"), id="just_out_of_range"),
+        pytest.param(Decimal("9999999999.995"), id="rounds_out_of_range"),
+    ],
+)
+def test_from_decimal_rejects_out_of_range_values(value: Decimal) -> None:
+    with pytest.raises(DomainFieldError):
+        Token.from_decimal(value)
+
+
+@pytest.mark.parametrize(
+    "minor_units",
+    [
+        pytest.param(MAX_MINOR_UNITS + 1, id="too_big"),
+        pytest.param(-MAX_MINOR_UNITS - 1, id="too_small"),
+        pytest.param(True, id="bool"),
+        pytest.param(Decimal(1), id="decimal"),
+    ],
+)
+def test_rejects_invalid_minor_units(minor_units: object) -> None:
+    with pytest.raises(DomainFieldError):
+        Token(minor_units)  # type: ignore[arg-type]
+
+
+def test_value_is_decimal_with_column_scale() -> None:
+    assert str(Token(1234).value) == "12.34"
+    assert str(Token(0).value) == "0.00"
+
+
+def test_arithmetic_keeps_subclass_and_validation() -> None:
+    balance = Balance(1000) + Token(250)
+
+    assert balance == Balance(1250)
+    assert type(balance) is Balance
+    with pytest.raises(DomainFieldError):
+        _ = Balance(100) - Token(101)
+
+
+@pytest.mark.parametrize(
+    ("minor_units", "ratios", "shares"),
+    [
+        pytest.param(1000, (10, 20, 70), (100, 200, 700), id="exact"),
+        pytest.param(1001, (10, 20, 70), (100, 200, 701), id="one_leftover"),
+        pytest.param(100, (1, 1, 1), (34, 33, 33), id="tie_goes_first"),
+        pytest.param(5, (10, 90), (1, 4), id="tiny"),
+        pytest.param(999, (0, 1), (0, 999), id="zero_ratio"),
+    ],
+)
+def test_allocate_splits_without_losing_minor_units(
+    minor_units: int,
+    ratios: tuple[int, ...],
+    shares: tuple[int, ...],
+) -> None:
+    parts = Token(minor_units).allocate(*ratios)
+
+    assert tuple(part.minor_units for part in parts) == shares
+    assert sum(part.minor_units for part in parts) == minor_units
+
+
+def test_allocate_keeps_the_amount_type() -> None:
+    parts = Balance(1000).allocate(10, 90)
+
+    assert [type(part) for part in parts] == [Balance, Balance]
+    assert parts == (Balance(100), Balance(900))
+
+
+@pytest.mark.parametrize(
+    "ratios",
+    [
+        pytest.param((), id="empty"),
+        pytest.param((0, 0), id="all_zero"),
+        pytest.param((1, -1), id="negative"),
+    ],
+)
+def test_allocate_rejects_invalid_ratios(ratios: tuple[int, ...]) -> None:
+    with pytest.raises(DomainError):
+        Token(100).allocate(*ratios)
@@ -0,0 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app.infrastructure.adapters.password_hasher_pool import (
+    PasswordHasherPool,
+    PasswordHasherPoolConfig,
+)
+
+
+def create_password_hasher_pool(
+    max_concurrency: int = 4,
+    queue_timeout_s: float = 5.0,
+) -> PasswordHasherPool:
+    config = PasswordHasherPoolConfig(
+        executor="thread",
+        max_workers=2,
+        max_concurrency=max_concurrency,
+        queue_timeout_s=queue_timeout_s,
+    )
+    return PasswordHasherPool(ThreadPoolExecutor(max_workers=2), config)
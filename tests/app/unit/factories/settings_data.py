@@ -13,6 +13,13 @@ class AuthSettingsData(TypedDict):
     ]
     SESSION_TTL_MIN: int | float
     SESSION_REFRESH_THRESHOLD: int | float
+    SESSION_CACHE_MAX_SIZE: int
+    SESSION_CACHE_TTL_S: int | float
+    SESSION_VALIDATION_MODE: Literal["stateful", "stateless"]
+    SESSION_DENYLIST_SYNC_INTERVAL_S: int | float
+    SESSION_EXTENSION_FLUSH_INTERVAL_S: int | float
+    PRINCIPAL_CACHE_MAX_SIZE: int
+    PRINCIPAL_CACHE_TTL_S: int | float
 
 
 class PostgresSettingsData(TypedDict):
@@ -36,12 +43,26 @@ def create_auth_settings_data(
     ] = "RS256",
     session_ttl_min: int | float = 2,
     session_refresh_threshold: int | float = 0.5,
+    session_cache_max_size: int = 100,
+    session_cache_ttl_s: int | float = 30,
+    session_validation_mode: Literal["stateful", "stateless"] = "stateful",
+    session_denylist_sync_interval_s: int | float = 2,
+    session_extension_flush_interval_s: int | float = 1,
+    principal_cache_max_size: int = 100,
+    principal_cache_ttl_s: int | float = 5,
 ) -> AuthSettingsData:
     return AuthSettingsData(
         JWT_SECRET=jwt_secret,
         JWT_ALGORITHM=jwt_algorithm,
         SESSION_TTL_MIN=session_ttl_min,
         SESSION_REFRESH_THRESHOLD=session_refresh_threshold,
+        SESSION_CACHE_MAX_SIZE=session_cache_max_size,
+        SESSION_CACHE_TTL_S=session_cache_ttl_s,
+        SESSION_VALIDATION_MODE=session_validation_mode,
+        SESSION_DENYLIST_SYNC_INTERVAL_S=session_denylist_sync_interval_s,
+        SESSION_EXTENSION_FLUSH_INTERVAL_S=session_extension_flush_interval_s,
+        PRINCIPAL_CACHE_MAX_SIZE=principal_cache_max_size,
+        PRINCIPAL_CACHE_TTL_S=principal_cache_ttl_s,
     )
 
 
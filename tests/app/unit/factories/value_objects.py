@@ -52,8 +52,8 @@ def create_password_hash(value: bytes = b"password_hash") -> UserPasswordHash:
 def create_email(value: str = "viewer@example.com") -> Email:
     return Email(value)
 
-def create_challenge_amount(value: Decimal = '10000') -> ChallengeAmount:
-    return ChallengeAmount(value)
+def create_challenge_amount(value: Decimal = Decimal("10000")) -> ChallengeAmount:
+    return ChallengeAmount.from_decimal(value)
 
 def create_challenge_id(value: UUID | None = None) -> ProductId:
     return ProductId(value or uuid6.uuid7())
@@ -67,10 +67,10 @@ def create_description(value: str | None = "Complete the task") -> Description:
 def create_streamer_fixed_amount(
     value: Decimal = Decimal("10.00"),
 ) -> StreamerChallengeFixedAmount:
-    return StreamerChallengeFixedAmount(value)
+    return StreamerChallengeFixedAmount.from_decimal(value)
 
 def create_token(value: Decimal = Decimal("10.00")) -> Token:
-    return Token(value)
+    return Token.from_decimal(value)
 
 def create_transaction_id(value: UUID | None = None) -> TransactionId:
     return TransactionId(value or uuid6.uuid7())
@@ -95,7 +95,7 @@ def create_allocation(
     return Allocation(
         payee_type=payee_type,
         payee_id=payee_id,
-        amount=Token(amount),
+        amount=Token.from_decimal(amount),
     )
 
 def create_reference_type() -> ProductType:
@@ -0,0 +1,97 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+
+from app.domain.shared.entities.ledger.account_type import AccountType
+from app.domain.shared.entities.transaction.transaction import Transaction
+from app.domain.shared.entities.transaction.transaction_type import TransactionType
+from app.domain.shared.enums import ProductType
+from app.domain.shared.value_objects.time import CreatedAt
+from app.infrastructure.balance_projection.model import SYSTEM_ACCOUNT_ID, deltas_of
+from app.infrastructure.balance_projection.projection_sqla import (
+    balance_select,
+    checkpoint_insert,
+)
+from tests.app.unit.factories.ledger_entries import (
+    create_credit_entry,
+    create_debit_entry,
+)
+from tests.app.unit.factories.value_objects import (
+    create_account_id,
+    create_allocation,
+    create_reference_id,
+    create_token,
+    create_transaction_id,
+)
+
+
+def create_settlement() -> Transaction:
+    """Releases 10.00 from escrow: 1.00 of revenue, 4.00 + 5.00 to one wallet."""
+    wallet_id = create_account_id()
+    allocations = (
+        create_allocation(payee_type=AccountType.REVENUE, amount=Decimal("1.00")),
+        create_allocation(payee_id=wallet_id, amount=Decimal("4.00")),
+        create_allocation(payee_id=wallet_id, amount=Decimal("5.00")),
+    )
+    return Transaction(
+        id_=create_transaction_id(),
+        transaction_type=TransactionType.ESCROW_RELEASE,
+        payer_type=AccountType.ESCROW,
+        payer_id=None,
+        allocations=allocations,
+        amount=create_token(Decimal("10.00")),
+        reference_id=create_reference_id(),
+        reference_type=ProductType.CHALLENGE,
+        ledger_entries=(
+            create_debit_entry(
+                account_type=AccountType.ESCROW,
+                amount=create_token(Decimal("10.00")),
+            ),
+            *(
+                create_credit_entry(
+                    account_type=allocation.payee_type,
+                    account_id=allocation.payee_id,
+                    amount=allocation.amount,
+                )
+                for allocation in allocations
+            ),
+        ),
+        created_at=CreatedAt(datetime(2024, 1, 1, tzinfo=timezone.utc)),
+    )
+
+
+def test_deltas_net_entries_per_account() -> None:
+    transaction = create_settlement()
+    wallet_id = transaction.allocations[1].payee_id
+    assert wallet_id is not None
+
+    deltas = deltas_of(transaction)
+
+    assert {
+        (delta.account_type, delta.account_id): delta.amount for delta in deltas
+    } == {
+        (AccountType.ESCROW, SYSTEM_ACCOUNT_ID): -1000,
+        (AccountType.REVENUE, SYSTEM_ACCOUNT_ID): 100,
+        (AccountType.USER_WALLET, wallet_id.value): 900,
+    }
+    assert {delta.transaction_id for delta in deltas} == {transaction.id_}
+
+
+def test_checkpoint_folds_deltas_in_one_top_level_statement() -> None:
+    sql = str(checkpoint_insert().compile(dialect=postgresql.psycopg.dialect()))
+
+    assert sql.startswith("WITH folded AS \n(DELETE FROM account_balance_deltas")
+    assert "ON CONFLICT (account_type, account_id) DO UPDATE SET" in sql
+    assert "balance = (account_balances.balance + excluded.balance)" in sql
+
+
+def test_system_account_balance_reads_checkpoint_plus_pending_deltas() -> None:
+    statement = balance_select(AccountType.ESCROW)
+
+    compiled = statement.compile(dialect=postgresql.psycopg.dialect())
+
+    assert "FROM account_balances" in str(compiled)
+    assert "sum(account_balance_deltas.amount)" in str(compiled)
+    assert compiled.params["account_id_1"] == SYSTEM_ACCOUNT_ID
+    assert compiled.params["account_id_2"] == SYSTEM_ACCOUNT_ID
@@ -0,0 +1,48 @@
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.persistence_sqla.config import SqlaEngineConfig
+from app.infrastructure.persistence_sqla.provider import get_auth_async_session
+
+
+def create_engine_config(*, share_auth_session: bool) -> SqlaEngineConfig:
+    return SqlaEngineConfig(
+        echo=False,
+        echo_pool=False,
+        pool_size=5,
+        max_overflow=0,
+        share_auth_session=share_auth_session,
+    )
+
+
+@pytest.mark.asyncio
+async def test_shared_auth_session_is_the_main_one() -> None:
+    factory = MagicMock()
+    main_session = MainAsyncSession(AsyncSession())
+    config = create_engine_config(share_auth_session=True)
+
+    async with asynccontextmanager(get_auth_async_session)(
+        factory,
+        config,
+        main_session,
+    ) as auth_session:
+        assert auth_session is main_session
+    factory.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_separate_auth_session_is_opened_from_the_factory() -> None:
+    factory = async_sessionmaker(class_=AsyncSession)
+    main_session = MainAsyncSession(AsyncSession())
+    config = create_engine_config(share_auth_session=False)
+
+    async with asynccontextmanager(get_auth_async_session)(
+        factory,
+        config,
+        main_session,
+    ) as auth_session:
+        assert auth_session is not main_session
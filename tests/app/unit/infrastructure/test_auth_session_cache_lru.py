@@ -0,0 +1,85 @@
+from datetime import UTC, datetime, timedelta
+
+from app.domain.shared.value_objects.id import UserId
+from app.infrastructure.auth.session.cache_lru import (
+    AuthSessionCacheMaxSize,
+    AuthSessionCacheTtl,
+    LruAuthSessionCache,
+)
+from app.infrastructure.auth.session.model import AuthSession
+from tests.app.unit.factories.value_objects import create_id
+
+
+def create_auth_session(
+    id_: str = "session",
+    user_id: UserId | None = None,
+) -> AuthSession:
+    return AuthSession(
+        id_=id_,
+        user_id=user_id or create_id(),
+        expiration=datetime.now(tz=UTC) + timedelta(minutes=5),
+    )
+
+
+def create_cache(max_size: int = 2, ttl_s: float = 60) -> LruAuthSessionCache:
+    return LruAuthSessionCache(
+        AuthSessionCacheMaxSize(max_size),
+        AuthSessionCacheTtl(timedelta(seconds=ttl_s)),
+    )
+
+
+def test_returns_copy_of_cached_session_and_counts_hit() -> None:
+    sut = create_cache()
+    auth_session = create_auth_session()
+    sut.put(auth_session)
+
+    result = sut.get(auth_session.id_)
+
+    assert result is not None
+    assert result is not auth_session
+    assert result.user_id == auth_session.user_id
+    assert result.expiration == auth_session.expiration
+    assert sut.stats.hits == 1
+    assert sut.stats.misses == 0
+
+
+def test_counts_miss_for_unknown_session() -> None:
+    sut = create_cache()
+
+    assert sut.get("unknown") is None
+    assert sut.stats.misses == 1
+
+
+def test_evicts_least_recently_used_session() -> None:
+    sut = create_cache(max_size=2)
+    sut.put(create_auth_session("a"))
+    sut.put(create_auth_session("b"))
+    sut.get("a")
+
+    sut.put(create_auth_session("c"))
+
+    assert sut.get("b") is None
+    assert sut.get("a") is not None
+    assert sut.stats.evictions == 1
+
+
+def test_expires_session_after_ttl() -> None:
+    sut = create_cache(ttl_s=0)
+    sut.put(create_auth_session())
+
+    assert sut.get("session") is None
+    assert sut.stats.size == 0
+
+
+def test_invalidates_all_sessions_of_user() -> None:
+    sut = create_cache(max_size=3)
+    user_id = create_id()
+    sut.put(create_auth_session("a", user_id))
+    sut.put(create_auth_session("b", user_id))
+    sut.put(create_auth_session("c"))
+
+    sut.invalidate_user(user_id)
+
+    assert sut.get("a") is None
+    assert sut.get("b") is None
+    assert sut.get("c") is not None
@@ -0,0 +1,115 @@
+from datetime import UTC, datetime, timedelta
+
+from app.domain.shared.value_objects.id import UserId
+from app.infrastructure.auth.session.denylist_memory import (
+    AuthSessionDenylistSyncInterval,
+    InMemoryAuthSessionDenylist,
+)
+from app.infrastructure.auth.session.model import (
+    AuthSessionClaims,
+    AuthSessionRevocation,
+)
+from tests.app.unit.factories.value_objects import create_id
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def create_claims(
+    auth_session_id: str = "session",
+    user_id: UserId | None = None,
+    issued_at: datetime = NOW,
+) -> AuthSessionClaims:
+    return AuthSessionClaims(
+        auth_session_id=auth_session_id,
+        user_id=user_id or create_id(),
+        issued_at=issued_at,
+        expiration=issued_at + timedelta(minutes=5),
+    )
+
+
+def create_revocation(
+    *,
+    id_: int = 1,
+    auth_session_id: str | None = None,
+    user_id: UserId | None = None,
+    revoked_at: datetime = NOW,
+) -> AuthSessionRevocation:
+    return AuthSessionRevocation(
+        id_=id_,
+        auth_session_id=auth_session_id,
+        user_id=user_id or create_id(),
+        revoked_at=revoked_at,
+        expires_at=revoked_at + timedelta(minutes=5),
+    )
+
+
+def create_denylist() -> InMemoryAuthSessionDenylist:
+    return InMemoryAuthSessionDenylist(
+        AuthSessionDenylistSyncInterval(timedelta(seconds=60)),
+    )
+
+
+def test_flags_revoked_session() -> None:
+    sut = create_denylist()
+    claims = create_claims()
+
+    sut.apply(
+        [create_revocation(auth_session_id=claims.auth_session_id)],
+        sync_horizon=1,
+        now=NOW,
+    )
+
+    assert sut.may_be_revoked(claims)
+    assert not sut.may_be_revoked(create_claims("other"))
+
+
+def test_flags_user_sessions_issued_before_revocation_only() -> None:
+    sut = create_denylist()
+    user_id = create_id()
+    sut.apply([create_revocation(user_id=user_id)], sync_horizon=1, now=NOW)
+
+    assert sut.may_be_revoked(create_claims(user_id=user_id))
+    assert not sut.may_be_revoked(
+        create_claims(user_id=user_id, issued_at=NOW + timedelta(seconds=1)),
+    )
+
+
+def test_tracks_sync_horizon_and_staleness() -> None:
+    sut = create_denylist()
+    assert sut.is_stale
+
+    sut.apply([create_revocation(id_=7)], sync_horizon=42, now=NOW)
+
+    assert sut.sync_horizon == 42
+    assert not sut.is_stale
+
+
+def test_reapplied_revocations_keep_the_latest_user_revocation() -> None:
+    sut = create_denylist()
+    user_id = create_id()
+    later = create_revocation(id_=3, user_id=user_id)
+    earlier = create_revocation(
+        id_=2,
+        user_id=user_id,
+        revoked_at=NOW - timedelta(minutes=1),
+    )
+    claims = create_claims(user_id=user_id, issued_at=NOW - timedelta(seconds=30))
+
+    sut.apply([later], sync_horizon=10, now=NOW)
+    sut.apply([earlier, later], sync_horizon=11, now=NOW)
+
+    assert sut.may_be_revoked(claims)
+
+
+def test_drops_revocations_after_tokens_expire() -> None:
+    sut = create_denylist()
+    claims = create_claims()
+    sut.apply(
+        [create_revocation(auth_session_id=claims.auth_session_id)],
+        sync_horizon=1,
+        now=NOW,
+    )
+
+    sut.apply([], sync_horizon=2, now=NOW + timedelta(minutes=10))
+
+    assert not sut.may_be_revoked(claims)
@@ -0,0 +1,92 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.auth.session.extension_flusher_sqla import (
+    SqlaAuthSessionExtensionFlusher,
+    auth_session_expirations_update,
+)
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class FakeConnection:
+    def __init__(self, statements: list[Any]):
+        self._statements = statements
+
+    async def execute(self, statement: Any) -> None:
+        self._statements.append(statement)
+
+
+class FakeEngine:
+    """Fails the first `failures` transactions, then records the statements."""
+
+    def __init__(self, failures: int = 0):
+        self._failures = failures
+        self.transactions = 0
+        self.statements: list[Any] = []
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[FakeConnection]:
+        self.transactions += 1
+        if self.transactions <= self._failures:
+            raise ConnectionError("database is down")
+        yield FakeConnection(self.statements)
+
+
+def compile_params(statement: Any) -> dict[str, Any]:
+    return dict(statement.compile(dialect=postgresql.psycopg.dialect()).params)
+
+
+def test_update_moves_expirations_forward_in_one_statement() -> None:
+    statement = auth_session_expirations_update({
+        "first": NOW,
+        "second": NOW + timedelta(minutes=1),
+    }).compile(dialect=postgresql.psycopg.dialect())
+
+    sql = " ".join(str(statement).split())
+    assert sql.startswith(
+        "UPDATE auth_sessions SET expiration=extensions.expiration FROM (VALUES ",
+    )
+    assert sql.count("::VARCHAR, ") == 2
+    assert ") AS extensions (id, expiration) " in sql
+    assert sql.endswith(
+        "WHERE auth_sessions.id = extensions.id "
+        "AND auth_sessions.expiration < extensions.expiration",
+    )
+
+
+@pytest.mark.asyncio
+async def test_flush_without_extensions_does_not_connect() -> None:
+    engine = FakeEngine()
+    sut = SqlaAuthSessionExtensionFlusher(cast(AsyncEngine, engine))
+
+    await sut.flush()
+
+    assert engine.transactions == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_latest_expirations_for_retry() -> None:
+    engine = FakeEngine(failures=1)
+    sut = SqlaAuthSessionExtensionFlusher(cast(AsyncEngine, engine))
+    sut.schedule("session", NOW + timedelta(minutes=1))
+    sut.schedule("session", NOW)
+
+    with pytest.raises(ConnectionError):
+        await sut.flush()
+    sut.schedule("session", NOW + timedelta(seconds=30))
+    await sut.flush()
+    await sut.flush()
+
+    assert engine.transactions == 2
+    assert [compile_params(statement) for statement in engine.statements] == [
+        compile_params(
+            auth_session_expirations_update({"session": NOW + timedelta(minutes=1)}),
+        ),
+    ]
@@ -0,0 +1,129 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from psycopg import errors as pg_errors
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DBAPIError
+
+from app.infrastructure.auth.session.purger_sqla import (
+    SqlaAuthSessionPurger,
+    expired_auth_session_revocations_delete,
+    expired_auth_sessions_delete,
+    lock_timeout_set,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class FakeResult:
+    def __init__(self, rowcount: int):
+        self.rowcount = rowcount
+
+
+class FakeConnection:
+    def __init__(self, outcome: int | Exception):
+        self._outcome = outcome
+
+    async def execute(self, statement: Any) -> FakeResult:
+        if statement.is_dml and isinstance(self._outcome, Exception):
+            raise self._outcome
+        return FakeResult(self._outcome if isinstance(self._outcome, int) else 0)
+
+
+class FakeEngine:
+    """Each chunk transaction takes the next outcome: rows deleted or an error."""
+
+    def __init__(self, *outcomes: int | Exception):
+        self._outcomes = list(outcomes)
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[FakeConnection]:
+        self.transactions += 1
+        yield FakeConnection(self._outcomes.pop(0))
+
+
+def create_db_error(orig: Exception) -> DBAPIError:
+    return DBAPIError("DELETE", None, orig)
+
+
+def test_delete_takes_one_chunk_of_expired_sessions_skipping_locked() -> None:
+    statement = expired_auth_sessions_delete(now=NOW, chunk_size=100).compile(
+        dialect=postgresql.psycopg.dialect(),
+    )
+
+    sql = " ".join(str(statement).split())
+    assert sql.startswith("DELETE FROM auth_sessions WHERE auth_sessions.id IN (")
+    assert "auth_sessions.expiration <= %(expiration_1)s" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert statement.params["param_1"] == 100
+
+
+def test_delete_takes_one_chunk_of_revocations_of_expired_tokens() -> None:
+    statement = expired_auth_session_revocations_delete(
+        now=NOW,
+        chunk_size=100,
+    ).compile(dialect=postgresql.psycopg.dialect())
+
+    sql = " ".join(str(statement).split())
+    assert sql.startswith(
+        "DELETE FROM auth_session_revocations WHERE auth_session_revocations.id IN (",
+    )
+    assert "auth_session_revocations.expires_at <= %(expires_at_1)s" in sql
+    assert statement.params["param_1"] == 100
+
+
+def test_lock_timeout_is_local_to_the_transaction() -> None:
+    statement = lock_timeout_set(250)
+
+    assert "set_config('lock_timeout', :lock_timeout, true)" in str(statement)
+    assert statement.compile().params == {"lock_timeout": "250ms"}
+
+
+@pytest.mark.asyncio
+async def test_purge_runs_chunks_until_one_is_not_full() -> None:
+    engine = FakeEngine(100, 100, 7, 3)
+    sut = SqlaAuthSessionPurger(engine)  # type: ignore[arg-type]
+
+    metrics = await sut.purge(chunk_size=100)
+
+    assert (
+        metrics.deleted,
+        metrics.revocations_deleted,
+        metrics.chunks,
+        metrics.lock_timed_out,
+    ) == (207, 3, 4, False)
+    assert engine.transactions == 4
+
+
+@pytest.mark.asyncio
+async def test_lock_timeout_stops_the_run_and_keeps_what_was_deleted() -> None:
+    engine = FakeEngine(
+        100,
+        create_db_error(pg_errors.LockNotAvailable("lock timeout")),
+        100,
+    )
+    sut = SqlaAuthSessionPurger(engine)  # type: ignore[arg-type]
+
+    metrics = await sut.purge(chunk_size=100)
+
+    assert (
+        metrics.deleted,
+        metrics.revocations_deleted,
+        metrics.chunks,
+        metrics.lock_timed_out,
+    ) == (100, 0, 1, True)
+    assert engine.transactions == 2
+
+
+@pytest.mark.asyncio
+async def test_other_database_errors_are_raised() -> None:
+    engine = FakeEngine(create_db_error(pg_errors.QueryCanceled("canceled")))
+    sut = SqlaAuthSessionPurger(engine)  # type: ignore[arg-type]
+
+    with pytest.raises(DataMapperError):
+        await sut.purge(chunk_size=100)
@@ -0,0 +1,83 @@
+from datetime import UTC, datetime
+from typing import Any, cast
+
+import pytest
+
+from app.infrastructure.auth.adapters.transaction_manager_sqla import (
+    SqlaAuthSessionTransactionManager,
+)
+from app.infrastructure.auth.adapters.types import AuthAsyncSession
+from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.config import SqlaEngineConfig
+from tests.app.unit.factories.value_objects import create_id
+
+
+class FakeSession:
+    def __init__(self, *new: Any):
+        self.new = set(new)
+        self.dirty: set[Any] = set()
+        self.deleted: set[Any] = set()
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+class MainEntity:
+    pass
+
+
+def create_sut(
+    session: FakeSession,
+    *,
+    share_auth_session: bool,
+) -> SqlaAuthSessionTransactionManager:
+    return SqlaAuthSessionTransactionManager(
+        cast(AuthAsyncSession, session),
+        SqlaEngineConfig(
+            echo=False,
+            echo_pool=False,
+            pool_size=5,
+            max_overflow=0,
+            share_auth_session=share_auth_session,
+        ),
+    )
+
+
+def create_auth_session() -> AuthSession:
+    return AuthSession(
+        id_="session",
+        user_id=create_id(),
+        expiration=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio
+async def test_shared_session_commits_auth_changes() -> None:
+    session = FakeSession(create_auth_session())
+    sut = create_sut(session, share_auth_session=True)
+
+    await sut.commit()
+
+    assert session.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_session_refuses_to_commit_pending_main_changes() -> None:
+    session = FakeSession(create_auth_session(), MainEntity())
+    sut = create_sut(session, share_auth_session=True)
+
+    with pytest.raises(DataMapperError):
+        await sut.commit()
+    assert session.commits == 0
+
+
+@pytest.mark.asyncio
+async def test_separate_session_commits_whatever_it_holds() -> None:
+    session = FakeSession(MainEntity())
+    sut = create_sut(session, share_auth_session=False)
+
+    await sut.commit()
+
+    assert session.commits == 1
@@ -0,0 +1,63 @@
+from datetime import UTC, datetime
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.infrastructure.adapters.challenge_data_mapper_sqla import (
+    expired_challenges_select,
+)
+from app.infrastructure.persistence_sqla.mappings.challenge import challenges_table
+from tests.app.unit.factories.value_objects import create_challenge_id
+
+EXPIRABLE_CONDITION = "status IN ('PENDING', 'STREAMER_ACCEPTED')"
+
+
+def test_partial_index_covers_escrow_holding_challenges() -> None:
+    (index,) = (
+        index
+        for index in challenges_table.indexes
+        if index.name == "ix_challenges_expires_at"
+    )
+
+    sql = str(CreateIndex(index).compile(dialect=postgresql.psycopg.dialect()))
+
+    assert sql == (
+        "CREATE INDEX ix_challenges_expires_at ON challenges (expires_at) "
+        f"WHERE {EXPIRABLE_CONDITION}"
+    )
+
+
+def test_expired_challenges_are_claimed_skipping_locked_rows() -> None:
+    statement = expired_challenges_select(
+        now=datetime(2024, 1, 1, tzinfo=UTC),
+        limit=100,
+    )
+
+    sql = str(
+        statement.compile(
+            dialect=postgresql.psycopg.dialect(),
+            compile_kwargs={"render_postcompile": True},
+        ),
+    )
+
+    # The condition must match the index predicate verbatim,
+    # including under a generic plan of the prepared statement.
+    assert f"WHERE challenges.{EXPIRABLE_CONDITION}" in sql
+    assert "ORDER BY challenges.expires_at" in sql
+    assert sql.endswith("FOR UPDATE SKIP LOCKED")
+
+
+def test_skipped_challenges_are_excluded_from_the_claim() -> None:
+    skipped_id = create_challenge_id()
+
+    compiled = expired_challenges_select(
+        now=datetime(2024, 1, 1, tzinfo=UTC),
+        limit=100,
+        exclude_ids=[skipped_id],
+    ).compile(
+        dialect=postgresql.psycopg.dialect(),
+        compile_kwargs={"render_postcompile": True},
+    )
+
+    assert "challenges.id NOT IN (" in str(compiled)
+    assert compiled.params["id_1_1"] == skipped_id.value
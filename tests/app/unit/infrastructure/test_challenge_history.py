@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.domain.challenge.challenge_history import ChallengeHistory
+from app.domain.challenge.challenge_status import ChallengeStatus
+from app.domain.shared.value_objects.id import ChallengeHistoryId
+from app.domain.shared.value_objects.time import CreatedAt
+from app.infrastructure.adapters.challenge_history_data_mapper_sqla import (
+    history_insert,
+)
+from app.infrastructure.persistence_sqla.mappings.challenge_history import (
+    challenge_history_table,
+)
+from tests.app.unit.factories.value_objects import create_challenge_id
+
+
+def create_history(**changes: object) -> ChallengeHistory:
+    return ChallengeHistory(
+        id_=ChallengeHistoryId(uuid4()),
+        challenge_id=create_challenge_id(),
+        previous_status=ChallengeStatus.PENDING,
+        current_status=ChallengeStatus.PENDING,
+        changed_by=None,
+        changed_at=CreatedAt(datetime(2024, 1, 1, tzinfo=timezone.utc)),
+        changes={
+            field: {"from": None, "to": value} for field, value in changes.items()
+        },
+    )
+
+
+def test_histories_are_written_by_one_multi_row_insert() -> None:
+    histories = [create_history(title="A"), create_history(amount=1000)]
+
+    compiled = history_insert(histories).compile(
+        dialect=postgresql.psycopg.dialect(),
+    )
+
+    assert str(compiled).count("INSERT INTO challenge_history") == 1
+    assert str(compiled).count("), (") == 1
+    assert compiled.params["changes_m1"] == {"amount": {"from": None, "to": 1000}}
+
+
+def test_timeline_index_leads_with_challenge_id() -> None:
+    (index,) = challenge_history_table.indexes
+
+    sql = str(CreateIndex(index).compile(dialect=postgresql.psycopg.dialect()))
+
+    assert sql == (
+        "CREATE INDEX ix_challenge_history_challenge_id "
+        "ON challenge_history (challenge_id, changed_at)"
+    )
@@ -0,0 +1,66 @@
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.domain.challenge.challenge_status import ChallengeStatus
+from app.domain.challenge.transitions import CHALLENGE_TRANSITIONS, ChallengeAction
+from app.domain.shared.value_objects.id import StreamerId
+from app.infrastructure.adapters.challenge_data_mapper_sqla import (
+    transition_update,
+    transitionable_challenges_select,
+)
+from tests.app.unit.factories.value_objects import create_challenge_id
+
+
+def test_streamer_transition_is_one_update_filtered_by_status_and_actor() -> None:
+    streamer_id = StreamerId(uuid4())
+    challenge_id = create_challenge_id()
+
+    compiled = transition_update(
+        CHALLENGE_TRANSITIONS[ChallengeAction.STREAMER_REJECT],
+        actor_id=streamer_id,
+        challenge_ids=[challenge_id],
+    ).compile(
+        dialect=postgresql.psycopg.dialect(),
+        compile_kwargs={"render_postcompile": True},
+    )
+    sql = str(compiled)
+
+    assert sql.startswith("UPDATE challenges SET status=")
+    assert "challenges.assigned_to = " in sql
+    assert " RETURNING challenges.id, " in sql
+    assert compiled.params["status"] is ChallengeStatus.STREAMER_REJECTED
+    assert compiled.params["status_1_1"] is ChallengeStatus.PENDING
+    assert compiled.params["assigned_to_1"] == streamer_id.value
+    assert compiled.params["id_1_1"] == challenge_id.value
+
+
+def test_system_transition_has_no_actor_filter() -> None:
+    sql = str(
+        transition_update(
+            CHALLENGE_TRANSITIONS[ChallengeAction.FINISH],
+            actor_id=None,
+        ).compile(dialect=postgresql.psycopg.dialect()),
+    )
+
+    assert "assigned_to =" not in sql
+    assert "created_by =" not in sql
+
+
+def test_transitionable_select_locks_what_the_update_would_move() -> None:
+    streamer_id = StreamerId(uuid4())
+
+    compiled = transitionable_challenges_select(
+        CHALLENGE_TRANSITIONS[ChallengeAction.STREAMER_REJECT],
+        actor_id=streamer_id,
+    ).compile(
+        dialect=postgresql.psycopg.dialect(),
+        compile_kwargs={"render_postcompile": True},
+    )
+    sql = str(compiled)
+
+    assert sql.startswith("SELECT challenges.id, ")
+    assert "challenges.assigned_to = " in sql
+    assert sql.endswith("FOR UPDATE")
+    assert compiled.params["status_1_1"] is ChallengeStatus.PENDING
+    assert compiled.params["assigned_to_1"] == streamer_id.value
@@ -0,0 +1,94 @@
+import asyncio
+import json
+from typing import Any, cast
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.challenge_updates.publisher_pg_notify import notify_select
+from app.infrastructure.challenge_updates.stream_pg_listen import (
+    HEARTBEAT_FRAME,
+    SUBSCRIBED_FRAME,
+    PgListenChallengeUpdateStream,
+    challenge_update_frame,
+)
+
+
+def create_payload(*, created_by: UUID, assigned_to: UUID) -> str:
+    return json.dumps({
+        "id": str(uuid4()),
+        "status": "pending",
+        "created_by": str(created_by),
+        "assigned_to": str(assigned_to),
+    })
+
+
+def create_stream(**kwargs: Any) -> PgListenChallengeUpdateStream:
+    # Not started: updates are fed through `fan_out` directly.
+    return PgListenChallengeUpdateStream(cast(AsyncEngine, None), **kwargs)
+
+
+def test_update_is_notified_on_the_channel() -> None:
+    sql = str(notify_select("{}").compile(dialect=postgresql.psycopg.dialect()))
+
+    assert sql.startswith("SELECT pg_notify(")
+
+
+@pytest.mark.asyncio
+async def test_update_reaches_viewer_and_streamer_as_one_shared_frame() -> None:
+    viewer_id, streamer_id = uuid4(), uuid4()
+    sut = create_stream()
+    viewer = sut.subscribe([viewer_id])
+    streamer = sut.subscribe([streamer_id])
+    other = sut.subscribe([uuid4()])
+    for stream in (viewer, streamer, other):
+        assert await anext(stream) == SUBSCRIBED_FRAME
+    payload = create_payload(created_by=viewer_id, assigned_to=streamer_id)
+
+    sut.fan_out(payload)
+
+    viewer_frame = await anext(viewer)
+    streamer_frame = await anext(streamer)
+    assert viewer_frame == challenge_update_frame(payload)
+    assert streamer_frame is viewer_frame
+    await asyncio.gather(viewer.aclose(), streamer.aclose(), other.aclose())
+
+
+@pytest.mark.asyncio
+async def test_idle_stream_sends_heartbeats() -> None:
+    sut = create_stream(heartbeat_s=0.001)
+    stream = sut.subscribe([uuid4()])
+    await anext(stream)
+
+    assert await anext(stream) == HEARTBEAT_FRAME
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_dropped() -> None:
+    viewer_id = uuid4()
+    sut = create_stream(buffer_size=2)
+    stream = sut.subscribe([viewer_id])
+    await anext(stream)
+
+    for _ in range(3):
+        sut.fan_out(create_payload(created_by=viewer_id, assigned_to=uuid4()))
+
+    assert [frame async for frame in stream] == []
+    # Later updates are no longer queued for the dropped connection.
+    sut.fan_out(create_payload(created_by=viewer_id, assigned_to=uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_stream_is_not_subscribed_until_iterated() -> None:
+    viewer_id = uuid4()
+    sut = create_stream(heartbeat_s=0.001)
+    stream = sut.subscribe([viewer_id])
+
+    sut.fan_out(create_payload(created_by=viewer_id, assigned_to=uuid4()))
+
+    assert await anext(stream) == SUBSCRIBED_FRAME
+    assert await anext(stream) == HEARTBEAT_FRAME
+    await stream.aclose()
@@ -0,0 +1,13 @@
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.persistence_sqla.commit_order import xact_horizon_select
+
+
+def test_horizon_is_the_snapshot_xmin_as_bigint() -> None:
+    statement = xact_horizon_select().compile(dialect=postgresql.psycopg.dialect())
+
+    sql = " ".join(str(statement).split())
+    assert sql == (
+        "SELECT CAST(CAST(pg_snapshot_xmin(pg_current_snapshot()) AS TEXT) "
+        "AS BIGINT) AS pg_snapshot_xmin_1"
+    )
@@ -0,0 +1,57 @@
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import Column, Integer, Table
+from sqlalchemy.orm import composite, registry
+
+import app.infrastructure.persistence_sqla.registry  # noqa: F401
+from app.domain.base import Entity
+from tests.app.unit.factories.value_objects import (
+    SingleFieldVO,
+    create_single_field_vo,
+)
+
+
+class MappedEntity(Entity[SingleFieldVO]):
+    def __init__(self, *, id_: SingleFieldVO, name: str) -> None:
+        super().__init__(id_=id_)
+        self.name = name
+
+
+@pytest.fixture
+def mapped_entity_type() -> Iterator[type[MappedEntity]]:
+    local_registry = registry()
+    table = Table(
+        "mapped_entities",
+        local_registry.metadata,
+        Column("id", Integer, primary_key=True),
+    )
+    local_registry.map_imperatively(
+        MappedEntity,
+        table,
+        properties={"id_": composite(SingleFieldVO, table.c.id)},
+        column_prefix="_",
+    )
+    local_registry.configure()
+    yield MappedEntity
+    local_registry.dispose()
+
+
+def test_mapped_entity_id_cannot_be_changed(
+    mapped_entity_type: type[MappedEntity],
+) -> None:
+    sut = mapped_entity_type(id_=create_single_field_vo(1), name="name")
+
+    with pytest.raises(AttributeError):
+        sut.id_ = create_single_field_vo(2)
+
+
+def test_mapped_entity_is_mutable_except_id(
+    mapped_entity_type: type[MappedEntity],
+) -> None:
+    sut = mapped_entity_type(id_=create_single_field_vo(1), name="Alice")
+
+    sut.name = "Bob"
+
+    assert sut.name == "Bob"
+    assert sut.id_ == create_single_field_vo(1)
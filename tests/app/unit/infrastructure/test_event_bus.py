@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from app.domain.challenge.events import ChallengeAcceptedByStreamer, ChallengeExpired
+from app.infrastructure.event_bus.bus_asyncio import (
+    AsyncioEventBus,
+    EventHandlingError,
+)
+from tests.app.unit.factories.value_objects import create_challenge_id
+
+
+@pytest.mark.asyncio
+async def test_dispatch_waits_for_subscribers_of_exact_type() -> None:
+    sut = AsyncioEventBus()
+    handled: list[ChallengeExpired] = []
+
+    async def on_expired(event: ChallengeExpired) -> None:
+        await asyncio.sleep(0)
+        handled.append(event)
+
+    async def on_accepted(_event: ChallengeAcceptedByStreamer) -> None:
+        await asyncio.sleep(0)
+        raise AssertionError("not subscribed to this event")
+
+    sut.subscribe(ChallengeExpired, on_expired)
+    sut.subscribe(ChallengeAcceptedByStreamer, on_accepted)
+    event = ChallengeExpired(create_challenge_id())
+
+    await sut.dispatch(event)
+    await sut.close()
+
+    assert handled == [event]
+    (expired_metrics, accepted_metrics) = sut.metrics()
+    assert expired_metrics.handled == 1
+    assert expired_metrics.queue_depth == 0
+    assert accepted_metrics.handled == 0
+
+
+@pytest.mark.asyncio
+async def test_handler_failure_fails_dispatch_and_is_counted() -> None:
+    sut = AsyncioEventBus()
+
+    async def on_expired(_event: ChallengeExpired) -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError("handler failed")
+
+    sut.subscribe(ChallengeExpired, on_expired)
+
+    with pytest.raises(EventHandlingError):
+        await sut.dispatch(ChallengeExpired(create_challenge_id()))
+    await sut.close()
+
+    (metrics,) = sut.metrics()
+    assert metrics.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_holds_back_dispatch() -> None:
+    sut = AsyncioEventBus()
+    release = asyncio.Event()
+
+    async def on_expired(_event: ChallengeExpired) -> None:
+        await release.wait()
+
+    sut.subscribe(ChallengeExpired, on_expired, max_queue_size=1)
+    dispatches = [
+        asyncio.create_task(sut.dispatch(ChallengeExpired(create_challenge_id())))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+
+    # One event in the handler, one in the queue, one waiting for room.
+    (metrics,) = sut.metrics()
+    assert metrics.queue_depth == 1
+    assert not any(dispatch.done() for dispatch in dispatches)
+
+    release.set()
+    await asyncio.gather(*dispatches)
+    await sut.close()
+
+    (metrics,) = sut.metrics()
+    assert metrics.handled == 3
+
+
+@pytest.mark.asyncio
+async def test_handler_concurrency_is_bounded() -> None:
+    sut = AsyncioEventBus()
+    running = 0
+    peak = 0
+
+    async def on_expired(_event: ChallengeExpired) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    sut.subscribe(ChallengeExpired, on_expired, concurrency=2)
+
+    await asyncio.gather(
+        *(sut.dispatch(ChallengeExpired(create_challenge_id())) for _ in range(6))
+    )
+    await sut.close()
+
+    assert peak == 2
@@ -0,0 +1,79 @@
+import threading
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+
+from app.infrastructure.adapters import id_generator_uuid7_block
+from app.infrastructure.adapters.id_generator_uuid7_block import (
+    BlockUuid7IdGenerator,
+)
+
+
+def test_ids_are_uuid7_with_current_timestamp() -> None:
+    sut = BlockUuid7IdGenerator()
+    before_ms = int(datetime.now(tz=UTC).timestamp() * 1000)
+
+    ids = [sut(), *sut.generate(3), *sut.generate(100)]
+
+    after_ms = int(datetime.now(tz=UTC).timestamp() * 1000)
+    assert all(id_.version == 7 for id_ in ids)
+    assert all(id_.variant == "specified in RFC 4122" for id_ in ids)
+    assert all(before_ms - 1 <= id_.int >> 80 <= after_ms + 1 for id_ in ids)
+
+
+def test_ids_are_unique_and_sorted_across_calls_and_block_refills(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(id_generator_uuid7_block, "RANDOM_BLOCK_SIZE", 8)
+    sut = BlockUuid7IdGenerator()
+
+    ids = [
+        *(sut() for _ in range(20)),
+        *sut.generate(5),
+        *sut.generate(40),
+        *(sut() for _ in range(20)),
+    ]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_ids_stay_sorted_when_clock_goes_back() -> None:
+    clock_ns = iter([5_000_000_000, 4_000_000_000, 4_000_000_000])
+    sut = BlockUuid7IdGenerator(clock_ns=lambda: next(clock_ns))
+
+    ids = [sut(), *sut.generate(40), sut()]
+
+    assert ids == sorted(ids)
+    assert {id_.int >> 80 for id_ in ids} == {5_000}
+
+
+def test_counter_overflow_moves_to_next_millisecond() -> None:
+    sut = BlockUuid7IdGenerator(clock_ns=lambda: 10**9)
+    first = sut()
+    sut._counter = id_generator_uuid7_block._COUNTER_MAX  # noqa: SLF001
+
+    second = sut()
+
+    assert second > first
+    assert second.int >> 80 == (first.int >> 80) + 1
+
+
+def test_ids_are_unique_across_threads() -> None:
+    sut = BlockUuid7IdGenerator()
+    results: list[list[UUID]] = [[] for _ in range(4)]
+
+    def generate(result: list[UUID]) -> None:
+        result.extend(sut() for _ in range(200))
+        result.extend(sut.generate(200))
+
+    threads = [threading.Thread(target=generate, args=(result,)) for result in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ids = [id_ for result in results for id_ in result]
+    assert len(set(ids)) == len(ids) == 4 * 400
+    assert all(result == sorted(result) for result in results)
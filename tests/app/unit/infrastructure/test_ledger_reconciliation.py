@@ -0,0 +1,126 @@
+import struct
+from collections import defaultdict
+from typing import Any
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+from sqlalchemy import Select
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.reconciliation.ledger_reconciler_sqla import (
+    SqlaLedgerReconciler,
+    transaction_totals_select,
+    wallet_net_select,
+)
+from app.infrastructure.reconciliation.report import (
+    ReconciliationReport,
+    WalletMismatch,
+)
+from app.infrastructure.reconciliation.sorted_group_sums import (
+    GroupSums,
+    SortedGroupSums,
+    unpack_records,
+)
+
+type Rows = list[tuple[UUID, int, int]]
+
+
+def pack(key: UUID, *values: int) -> bytes:
+    return key.bytes + struct.pack(f">{len(values)}q", *values)
+
+
+def sorted_rows() -> Rows:
+    """(key, head, value) rows sorted by key, with groups of 1 to 4 rows."""
+    keys = sorted((uuid4() for _ in range(50)), key=lambda key: key.bytes)
+    return [
+        (key, 1000 + index, copy - index * 10)
+        for index, key in enumerate(keys)
+        for copy in range(1 + index % 4)
+    ]
+
+
+def group_in_chunks(rows: Rows, chunk_size: int) -> list[GroupSums]:
+    groups = SortedGroupSums(head_count=1, value_count=1)
+    result = []
+    for start in range(0, len(rows), chunk_size):
+        records = [pack(*row) for row in rows[start : start + chunk_size]]
+        result.append(groups.feed(*unpack_records(records, 2)))
+    result.append(groups.finish())
+    return result
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_sorted_group_sums_match_across_chunk_boundaries(chunk_size: int) -> None:
+    rows = sorted_rows()
+    expected: dict[UUID, list[int]] = defaultdict(list)
+    for key, head, value in rows:
+        expected[key].append(value)
+
+    chunks = group_in_chunks(rows, chunk_size)
+    keys = [UUID(bytes=key.tobytes()) for chunk in chunks for key in chunk.keys]
+    heads = np.concatenate([chunk.heads[0] for chunk in chunks]).tolist()
+    sums = np.concatenate([chunk.sums[0] for chunk in chunks]).tolist()
+
+    assert keys == list(expected)
+    assert sums == [sum(values) for values in expected.values()]
+    assert heads == [1000 + index for index in range(len(expected))]
+
+
+def test_sorted_group_sums_finish_without_rows() -> None:
+    groups = SortedGroupSums(head_count=2, value_count=1)
+
+    finished = groups.finish()
+
+    assert len(finished) == 0
+    assert finished.heads.shape == (2, 0)
+    assert finished.sums.shape == (1, 0)
+
+
+def test_record_wallets_counts_every_mismatch_but_keeps_max_reported() -> None:
+    wallet_ids = sorted((uuid4() for _ in range(3)), key=lambda key: key.bytes)
+    keys, columns = unpack_records(
+        [
+            pack(wallet_ids[0], 0, 500, 500),
+            pack(wallet_ids[1], 0, 700, 600),
+            pack(wallet_ids[2], 1, 0, 200),
+        ],
+        3,
+    )
+    groups = GroupSums(keys=keys, heads=columns[:2], sums=columns[2:])
+    report = ReconciliationReport(max_reported=1)
+
+    SqlaLedgerReconciler._record_wallets(groups, report)  # noqa: SLF001
+
+    assert report.wallets_checked == 3
+    assert report.wallet_mismatch_count == 2
+    assert report.wallet_mismatches == [
+        WalletMismatch(wallet_id=wallet_ids[1], balance=700, ledger_net=600),
+    ]
+    assert not report.is_consistent
+
+
+@pytest.mark.parametrize(
+    ("statement", "order_by"),
+    [
+        pytest.param(
+            wallet_net_select(),
+            "ORDER BY coalesce(wallets.id, wallet_entries.account_id)",
+            id="wallets",
+        ),
+        pytest.param(
+            transaction_totals_select(),
+            "ORDER BY transactions.id",
+            id="transactions",
+        ),
+    ],
+)
+def test_streams_are_sorted_fixed_width_records(
+    statement: Select[Any],
+    order_by: str,
+) -> None:
+    sql = str(statement.compile(dialect=postgresql.psycopg.dialect()))
+
+    assert sql.startswith("SELECT ((uuid_send(")
+    assert sql.count("int8send(") == 3
+    assert sql.endswith(order_by)
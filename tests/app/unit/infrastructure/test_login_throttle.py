@@ -0,0 +1,144 @@
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.auth.throttle.limiter_memory import (
+    InMemoryLoginThrottle,
+    LoginThrottleConfig,
+    login_throttle_keys,
+)
+from app.infrastructure.auth.throttle.lockout_sync_sqla import (
+    lockouts_since_select,
+)
+from app.infrastructure.auth.throttle.model import LoginLockout
+
+KEYS = login_throttle_keys("Viewer", "203.0.113.7")
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def create_throttle(
+    clock: FakeClock,
+    burst: int = 3,
+    refill_per_s: float = 1.0,
+    lockout_after_failures: int = 2,
+) -> InMemoryLoginThrottle:
+    return InMemoryLoginThrottle(
+        LoginThrottleConfig(
+            burst=burst,
+            refill_per_s=refill_per_s,
+            lockout_after_failures=lockout_after_failures,
+            base_lockout_s=10.0,
+            max_lockout_s=25.0,
+            sync_interval_s=1.0,
+        ),
+        clock,
+    )
+
+
+def test_keys_cover_username_case_insensitively_and_address() -> None:
+    assert KEYS == ("username:viewer", "address:203.0.113.7")
+    assert login_throttle_keys("Viewer", None) == ("username:viewer",)
+
+
+def test_burst_is_allowed_then_refills_over_time(clock: FakeClock) -> None:
+    sut = create_throttle(clock, burst=2, refill_per_s=0.5)
+
+    assert sut.acquire(KEYS) is None
+    assert sut.acquire(KEYS) is None
+    assert sut.acquire(KEYS) == pytest.approx(2.0)
+
+    clock.now += 2.0
+    assert sut.acquire(KEYS) is None
+
+
+def test_lockout_doubles_with_each_failure_up_to_max(clock: FakeClock) -> None:
+    sut = create_throttle(clock, burst=100)
+
+    sut.record_failure(KEYS)
+    assert sut.acquire(KEYS) is None
+    sut.record_failure(KEYS)
+    assert sut.acquire(KEYS) == pytest.approx(10.0)
+    sut.record_failure(KEYS)
+    assert sut.acquire(KEYS) == pytest.approx(20.0)
+    sut.record_failure(KEYS)
+    assert sut.acquire(KEYS) == pytest.approx(25.0)
+    assert [lockout.key for lockout in sut.take_unpublished()] == [*KEYS] * 3
+
+
+def test_success_clears_username_failures_only(clock: FakeClock) -> None:
+    sut = create_throttle(clock, burst=100)
+    sut.record_failure(KEYS)
+
+    sut.record_success(KEYS[0])
+    sut.record_failure(KEYS)
+
+    assert [lockout.key for lockout in sut.take_unpublished()] == [KEYS[1]]
+
+
+def test_lockouts_of_other_workers_apply(clock: FakeClock) -> None:
+    sut = create_throttle(clock)
+    locked_until = datetime.fromtimestamp(clock.now + 5.0, tz=UTC)
+
+    sut.apply(
+        [LoginLockout(key=KEYS[1], locked_until=locked_until)],
+        sync_horizon=7,
+    )
+
+    assert sut.acquire(login_throttle_keys("other", "203.0.113.7")) == (
+        pytest.approx(5.0)
+    )
+    assert sut.acquire(login_throttle_keys("other", "198.51.100.1")) is None
+    assert sut.sync_horizon == 7
+
+
+def test_lockout_read_again_by_a_later_sync_changes_nothing(
+    clock: FakeClock,
+) -> None:
+    sut = create_throttle(clock)
+    lockout = LoginLockout(
+        key=KEYS[0],
+        locked_until=datetime.fromtimestamp(clock.now + 5.0, tz=UTC),
+    )
+
+    sut.apply([lockout], sync_horizon=7)
+    clock.now += 1.0
+    sut.apply([lockout], sync_horizon=9)
+
+    assert sut.acquire(KEYS) == pytest.approx(4.0)
+    clock.now += 4.0
+    assert sut.acquire(KEYS) is None
+
+
+def test_lockouts_expire_without_a_sync(clock: FakeClock) -> None:
+    sut = create_throttle(clock, burst=100, lockout_after_failures=1)
+    sut.record_failure(KEYS)
+    assert sut.acquire(KEYS) == pytest.approx(10.0)
+
+    clock.now += 10.0
+
+    assert sut.acquire(KEYS) is None
+
+
+def test_sync_reads_unexpired_lockouts_in_commit_order() -> None:
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+
+    statement = lockouts_since_select(7, now=now).compile(
+        dialect=postgresql.psycopg.dialect(),
+    )
+
+    assert "login_lockouts.xact_id >= %(xact_id_1)s" in str(statement)
+    assert "login_lockouts.locked_until > %(locked_until_1)s" in str(statement)
+    assert statement.params == {"xact_id_1": 7, "locked_until_1": now}
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, MetaData, Table, insert, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import ClauseElement
+
+from app.infrastructure.persistence_sqla.column_types import MinorUnits
+
+accounts_table = Table(
+    "accounts",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("balance", MinorUnits(), nullable=False),
+)
+
+
+def compile_pg(statement: ClauseElement) -> str:
+    return str(statement.compile(dialect=postgresql.psycopg.dialect()))
+
+
+def test_loads_minor_units_as_bigint() -> None:
+    sql = compile_pg(select(accounts_table.c.balance))
+
+    assert "CAST(accounts.balance * 100 AS BIGINT) AS balance" in sql
+
+
+def test_dumps_minor_units_as_bigint_scaled_back_to_numeric() -> None:
+    sql = compile_pg(insert(accounts_table))
+
+    assert (
+        "CAST(CAST(%(balance)s::BIGINT AS NUMERIC) / CAST(100 AS NUMERIC)"
+        " AS NUMERIC(12, 2))"
+    ) in sql
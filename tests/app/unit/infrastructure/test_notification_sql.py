@@ -0,0 +1,145 @@
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import ClauseElement
+
+from app.application.common.query_params.notification import NotificationPageParams
+from app.domain.shared.entities.notification.notification import Notification
+from app.domain.shared.value_objects.id import NotificationId, UserId
+from app.domain.shared.value_objects.time import CreatedAt
+from app.infrastructure.adapters.notification_data_mapper_sqla import (
+    SqlaNotificationDataMapper,
+    notifications_insert,
+    unread_counters_upsert,
+)
+from app.infrastructure.adapters.notification_reader_sqla import (
+    notification_page_select,
+)
+from tests.app.unit.factories.value_objects import create_challenge_id, create_id
+
+
+class FakeResult:
+    def __init__(self, ids: Iterable[UUID]):
+        self._ids = ids
+
+    def scalars(self) -> Iterable[UUID]:
+        return self._ids
+
+
+class FakeSession:
+    """The insert returns `inserted_ids`; every statement is recorded."""
+
+    def __init__(self, inserted_ids: Iterable[UUID]):
+        self._inserted_ids = inserted_ids
+        self.statements: list[Any] = []
+
+    async def execute(self, statement: Any) -> FakeResult:
+        self.statements.append(statement)
+        return FakeResult(self._inserted_ids if len(self.statements) == 1 else ())
+
+
+def compile_sql(statement: ClauseElement) -> str:
+    return str(
+        statement.compile(
+            dialect=postgresql.psycopg.dialect(),
+            compile_kwargs={"render_postcompile": True},
+        ),
+    )
+
+
+def create_notifications(*user_ids: UserId) -> list[Notification]:
+    return [
+        Notification(
+            id_=NotificationId(uuid4()),
+            product_id=create_challenge_id(),
+            user_id=user_id,
+            title="Challenge expired",
+            message="The challenge expired.",
+            created_at=CreatedAt(datetime(2024, 1, 1, tzinfo=timezone.utc)),
+            delivered_at=None,
+            is_read=False,
+        )
+        for user_id in user_ids
+    ]
+
+
+def test_fan_out_is_one_multi_row_insert() -> None:
+    notifications = create_notifications(create_id(), create_id(), create_id())
+
+    statement = notifications_insert(notifications).compile(
+        dialect=postgresql.psycopg.dialect(),
+    )
+
+    assert str(statement).count("), (") == 2
+    assert statement.params["user_id_m2"] == notifications[2].user_id.value
+
+
+def test_fan_out_skips_notifications_of_events_already_notified() -> None:
+    sql = compile_sql(notifications_insert(create_notifications(create_id())))
+
+    assert sql.endswith(
+        "ON CONFLICT (product_id, user_id, event_type) DO NOTHING "
+        "RETURNING notifications.id",
+    )
+
+
+def test_unread_counters_are_incremented_once_per_recipient() -> None:
+    viewer, streamer = sorted((create_id(), create_id()), key=lambda id_: id_.value)
+    notifications = create_notifications(streamer, viewer, streamer)
+
+    statement = unread_counters_upsert(notifications).compile(
+        dialect=postgresql.psycopg.dialect(),
+    )
+
+    assert "ON CONFLICT (user_id) DO UPDATE SET unread = " in str(statement)
+    assert "notification_counters.unread + excluded.unread" in str(statement)
+    assert statement.params == {
+        "user_id_m0": viewer.value,
+        "unread_m0": 1,
+        "user_id_m1": streamer.value,
+        "unread_m1": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_only_inserted_notifications_are_counted_unread() -> None:
+    notifications = create_notifications(create_id(), create_id())
+    session = FakeSession([notifications[1].id_.value])
+    sut = SqlaNotificationDataMapper(session)  # type: ignore[arg-type]
+
+    await sut.add_many(notifications)
+
+    assert len(session.statements) == 2
+    assert session.statements[1].compile().params == {
+        "user_id_m0": notifications[1].user_id.value,
+        "unread_m0": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_redelivered_fan_out_counts_nothing() -> None:
+    session = FakeSession([])
+    sut = SqlaNotificationDataMapper(session)  # type: ignore[arg-type]
+
+    await sut.add_many(create_notifications(create_id()))
+
+    assert len(session.statements) == 1
+
+
+def test_page_starts_after_cursor_newest_first() -> None:
+    before = uuid4()
+
+    sql = compile_sql(
+        notification_page_select(
+            create_id(),
+            NotificationPageParams(limit=20, before=before),
+        ),
+    )
+
+    assert "notifications.id < " in sql
+    assert "ORDER BY notifications.id DESC" in sql
+    assert "OFFSET" not in sql
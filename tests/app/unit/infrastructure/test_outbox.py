@@ -0,0 +1,245 @@
+import json
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.base import Event
+from app.domain.challenge.events import ChallengeCreated, ChallengeExpired
+from app.domain.shared.value_objects.id import StreamerId
+from app.domain.shared.value_objects.time import CreatedAt
+from app.infrastructure.outbox.codec import (
+    UnknownEventTypeError,
+    decode_event,
+    encode_event,
+)
+from app.infrastructure.outbox.model import ClaimedOutboxMessage
+from app.infrastructure.outbox.relay_sqla import (
+    SqlaOutboxRelay,
+    claim_heads_select,
+    claim_update,
+    dispatch_in_order,
+    lease_release_update,
+)
+from tests.app.unit.factories.value_objects import (
+    create_challenge_amount,
+    create_challenge_id,
+    create_description,
+    create_id,
+    create_title,
+)
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class RecordingDispatcher:
+    def __init__(self, fail_on: set[Event] | None = None):
+        self.dispatched: list[Event] = []
+        self._fail_on = fail_on or set()
+
+    async def dispatch(self, event: Event) -> None:
+        if event in self._fail_on:
+            raise RuntimeError("handler failed")
+        self.dispatched.append(event)
+
+
+class FakeResult:
+    def __init__(self, rows: Sequence[Any]):
+        self._rows = rows
+
+    def all(self) -> Sequence[Any]:
+        return self._rows
+
+
+class FakeSession:
+    """Hands out the claimed rows, then records what the ack executes."""
+
+    def __init__(self, rows: Sequence[Any]):
+        self._rows = rows
+        self.statements: list[Any] = []
+        self.commits = 0
+
+    async def execute(self, statement: Any) -> FakeResult:
+        self.statements.append(statement)
+        return FakeResult(self._rows if len(self.statements) == 1 else [])
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+class CommitCountingDispatcher:
+    def __init__(self, session: FakeSession):
+        self._session = session
+        self.commits_seen: list[int] = []
+
+    async def dispatch(self, _event: Event) -> None:
+        self.commits_seen.append(self._session.commits)
+
+
+def create_row(id_: int, aggregate_id: UUID) -> SimpleNamespace:
+    event_type, payload = encode_event(ChallengeExpired(create_challenge_id()))
+    return SimpleNamespace(
+        id=id_,
+        aggregate_id=aggregate_id,
+        event_type=event_type,
+        payload=payload,
+        attempts=0,
+    )
+
+
+def create_message(
+    id_: int,
+    event: Event,
+    *,
+    attempts: int = 0,
+) -> ClaimedOutboxMessage:
+    event_type, payload = encode_event(event)
+    return ClaimedOutboxMessage(
+        id_=id_,
+        aggregate_id=uuid4(),
+        event_type=event_type,
+        payload=payload,
+        attempts=attempts,
+    )
+
+
+def test_event_survives_json_round_trip() -> None:
+    event = ChallengeCreated(
+        id_=create_challenge_id(),
+        title=create_title(),
+        description=create_description(None),
+        created_by=create_id(),
+        assigned_to=StreamerId(uuid4()),
+        amount=create_challenge_amount(),
+        created_at=CreatedAt(datetime(2024, 1, 1, tzinfo=UTC)),
+    )
+
+    event_type, payload = encode_event(event)
+    decoded = decode_event(event_type, json.loads(json.dumps(payload)))
+
+    assert event_type == "ChallengeCreated"
+    assert decoded == event
+
+
+def test_unknown_event_type_is_rejected() -> None:
+    with pytest.raises(UnknownEventTypeError):
+        decode_event("ChallengeRenamed", {})
+
+
+def test_only_unleased_aggregate_heads_are_claimed_skipping_locked_rows() -> None:
+    sql = str(
+        claim_heads_select(now=NOW, batch_size=50, max_attempts=10).compile(
+            dialect=postgresql.psycopg.dialect(),
+            compile_kwargs={"render_postcompile": True},
+        ),
+    )
+
+    assert "head.claimed_until IS NULL OR head.claimed_until <= " in sql
+    assert "NOT (EXISTS (SELECT" in sql
+    assert "earlier.id < head.id" in sql
+    assert "ORDER BY head.id" in sql
+    assert sql.endswith("FOR UPDATE OF head SKIP LOCKED")
+
+
+def test_claim_leases_every_message_of_claimed_aggregates() -> None:
+    claimed_by = uuid4()
+    statement = claim_update(
+        now=NOW,
+        batch_size=50,
+        max_attempts=10,
+        claimed_by=claimed_by,
+        lease=timedelta(minutes=5),
+    ).compile(dialect=postgresql.psycopg.dialect())
+
+    sql = " ".join(str(statement).split())
+    assert sql.startswith(
+        "UPDATE outbox SET claimed_by=%(claimed_by)s::UUID, "
+        "claimed_until=%(claimed_until)s::TIMESTAMP WITH TIME ZONE "
+        "WHERE outbox.aggregate_id IN (SELECT head.aggregate_id",
+    )
+    assert "RETURNING outbox.id, outbox.aggregate_id" in sql
+    assert statement.params["claimed_by"] == claimed_by
+    assert statement.params["claimed_until"] == NOW + timedelta(minutes=5)
+
+
+def test_lease_release_only_touches_own_claim_and_counts_failures() -> None:
+    claimed_by = uuid4()
+    statement = lease_release_update(claimed_by, failed_ids=[7]).compile(
+        dialect=postgresql.psycopg.dialect(),
+        compile_kwargs={"render_postcompile": True},
+    )
+
+    sql = " ".join(str(statement).split())
+    assert "claimed_by=%(claimed_by)s::UUID, claimed_until=%(claimed_until)s" in sql
+    assert "WHEN (outbox.id IN (%(id_1_1)s::BIGINT)) THEN" in sql
+    assert "WHERE outbox.claimed_by = %(claimed_by_1)s::UUID" in sql
+    assert statement.params["claimed_by"] is None
+    assert statement.params["claimed_by_1"] == claimed_by
+
+
+@pytest.mark.asyncio
+async def test_aggregate_events_are_dispatched_in_order() -> None:
+    events = [ChallengeExpired(create_challenge_id()) for _ in range(3)]
+    dispatcher = RecordingDispatcher()
+
+    delivered, failed = await dispatch_in_order(
+        dispatcher,
+        [create_message(id_, event) for id_, event in enumerate(events, 1)],
+    )
+
+    assert dispatcher.dispatched == events
+    assert delivered == [1, 2, 3]
+    assert failed is None
+
+
+@pytest.mark.asyncio
+async def test_failure_holds_back_later_events_of_aggregate() -> None:
+    events = [ChallengeExpired(create_challenge_id()) for _ in range(3)]
+    dispatcher = RecordingDispatcher(fail_on={events[1]})
+
+    delivered, failed = await dispatch_in_order(
+        dispatcher,
+        [create_message(id_, event) for id_, event in enumerate(events, 1)],
+    )
+
+    assert dispatcher.dispatched == events[:1]
+    assert delivered == [1]
+    assert failed == 2
+
+
+@pytest.mark.asyncio
+async def test_dead_message_is_not_dispatched_again() -> None:
+    dispatcher = RecordingDispatcher()
+
+    delivered, failed = await dispatch_in_order(
+        dispatcher,
+        [create_message(1, ChallengeExpired(create_challenge_id()), attempts=10)],
+        max_attempts=10,
+    )
+
+    assert dispatcher.dispatched == []
+    assert delivered == []
+    assert failed is None
+
+
+@pytest.mark.asyncio
+async def test_claim_commits_before_handlers_run_and_ack_commits_after() -> None:
+    first, second = uuid4(), uuid4()
+    session = FakeSession(
+        [create_row(3, second), create_row(1, first), create_row(2, first)],
+    )
+    dispatcher = CommitCountingDispatcher(session)
+    sut = SqlaOutboxRelay(session, dispatcher)  # type: ignore[arg-type]
+
+    claimed = await sut.relay(batch_size=10, concurrency=2)
+
+    assert claimed == 2
+    assert dispatcher.commits_seen == [1, 1, 1]
+    assert session.commits == 2
+    delete_statement = session.statements[1]
+    assert delete_statement.is_delete
+    assert sorted(delete_statement.compile().params["id_1"]) == [1, 2, 3]
@@ -1,63 +1,113 @@
+import bcrypt
 import pytest
 
 from app.infrastructure.adapters.password_hasher_bcrypt import (
+    BcryptCost,
+    BcryptCostConfig,
     BcryptPasswordHasher,
     PasswordPepper,
+    bcrypt_cost_of,
+    calibrate_bcrypt_cost,
 )
+from tests.app.unit.factories.password_hasher_pool import create_password_hasher_pool
 from tests.app.unit.factories.value_objects import create_raw_password
 
 
-def create_bcrypt_password_hasher(pepper: str = "Habanero!") -> BcryptPasswordHasher:
-    return BcryptPasswordHasher(PasswordPepper(pepper))
+def create_bcrypt_password_hasher(
+    pepper: str = "Habanero!",
+    cost: int = 4,
+) -> BcryptPasswordHasher:
+    return BcryptPasswordHasher(
+        PasswordPepper(pepper),
+        create_password_hasher_pool(),
+        BcryptCost(cost),
+    )
 
 
 @pytest.mark.slow
-def test_verifies_correct_password() -> None:
+@pytest.mark.asyncio
+async def test_verifies_correct_password() -> None:
     sut = create_bcrypt_password_hasher()
     pwd = create_raw_password()
 
-    hashed = sut.hash(pwd)
+    hashed = await sut.hash(pwd)
 
-    assert sut.verify(raw_password=pwd, hashed_password=hashed)
+    assert await sut.verify(raw_password=pwd, hashed_password=hashed)
 
 
 @pytest.mark.slow
-def test_does_not_verify_incorrect_password() -> None:
+@pytest.mark.asyncio
+async def test_does_not_verify_incorrect_password() -> None:
     sut = create_bcrypt_password_hasher()
     correct_pwd = create_raw_password("secure")
     incorrect_pwd = create_raw_password("bruteforce")
 
-    hashed = sut.hash(correct_pwd)
+    hashed = await sut.hash(correct_pwd)
 
-    assert not sut.verify(raw_password=incorrect_pwd, hashed_password=hashed)
+    assert not await sut.verify(raw_password=incorrect_pwd, hashed_password=hashed)
 
 
 @pytest.mark.slow
-def test_supports_passwords_longer_than_bcrypt_limit() -> None:
+@pytest.mark.asyncio
+async def test_supports_passwords_longer_than_bcrypt_limit() -> None:
     bcrypt_limit = 72
     sut = create_bcrypt_password_hasher()
     pwd = create_raw_password("x" * (bcrypt_limit + 1))
 
-    hashed = sut.hash(pwd)
+    hashed = await sut.hash(pwd)
 
-    assert sut.verify(raw_password=pwd, hashed_password=hashed)
+    assert await sut.verify(raw_password=pwd, hashed_password=hashed)
 
 
 @pytest.mark.slow
-def test_hashes_are_unique_for_same_password() -> None:
+@pytest.mark.asyncio
+async def test_hashes_are_unique_for_same_password() -> None:
     sut = create_bcrypt_password_hasher()
     pwd = create_raw_password()
 
-    assert sut.hash(pwd) != sut.hash(pwd)
+    assert await sut.hash(pwd) != await sut.hash(pwd)
 
 
 @pytest.mark.slow
-def test_different_peppers_fail_verification() -> None:
+@pytest.mark.asyncio
+async def test_different_peppers_fail_verification() -> None:
     pwd = create_raw_password()
     hasher1 = create_bcrypt_password_hasher("PepperA")
     hasher2 = create_bcrypt_password_hasher("PepperB")
 
-    hashed = hasher1.hash(pwd)
+    hashed = await hasher1.hash(pwd)
 
-    assert hasher1.verify(raw_password=pwd, hashed_password=hashed)
-    assert not hasher2.verify(raw_password=pwd, hashed_password=hashed)
+    assert await hasher1.verify(raw_password=pwd, hashed_password=hashed)
+    assert not await hasher2.verify(raw_password=pwd, hashed_password=hashed)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_hash_records_configured_cost() -> None:
+    sut = create_bcrypt_password_hasher(cost=5)
+
+    hashed = await sut.hash(create_raw_password())
+
+    assert bcrypt_cost_of(hashed) == 5
+
+
+def test_only_hashes_below_current_cost_need_rehash() -> None:
+    sut = create_bcrypt_password_hasher(cost=6)
+
+    assert sut.needs_rehash(bcrypt.hashpw(b"password", bcrypt.gensalt(5)))
+    assert not sut.needs_rehash(bcrypt.hashpw(b"password", bcrypt.gensalt(6)))
+    assert not sut.needs_rehash(bcrypt.hashpw(b"password", bcrypt.gensalt(7)))
+
+
+def test_calibration_never_goes_below_min_cost() -> None:
+    config = BcryptCostConfig(target_verify_s=1e-9, min_cost=5)
+
+    assert calibrate_bcrypt_cost(config) == 5
+
+
+def test_calibration_raises_cost_within_target() -> None:
+    config = BcryptCostConfig(target_verify_s=60.0, min_cost=4)
+
+    cost = calibrate_bcrypt_cost(config)
+
+    assert cost > 4
@@ -0,0 +1,34 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+from tests.app.unit.factories.password_hasher_pool import create_password_hasher_pool
+
+
+@pytest.mark.asyncio
+async def test_runs_job_in_executor_and_counts_it() -> None:
+    sut = create_password_hasher_pool()
+
+    result = await sut.run(threading.current_thread)
+
+    assert result is not threading.current_thread()
+    assert sut.stats.completed == 1
+    assert sut.stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_job_when_queue_timeout_expires() -> None:
+    sut = create_password_hasher_pool(max_concurrency=1, queue_timeout_s=0.01)
+    release = threading.Event()
+    blocking_job = asyncio.create_task(sut.run(release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHasherBusyError):
+        await sut.run(release.is_set)
+
+    assert sut.stats.saturation == 1.0
+    assert sut.stats.rejected == 1
+    release.set()
+    await blocking_job
@@ -0,0 +1,60 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.user.ports import PasswordHasher
+from app.domain.user.user import User
+from app.infrastructure.adapters.password_rehasher_sqla import (
+    SqlaPasswordRehasher,
+    password_hash_update,
+)
+from tests.app.unit.factories.value_objects import (
+    create_id,
+    create_password_hash,
+    create_raw_password,
+)
+
+
+def test_update_applies_only_to_the_verified_hash() -> None:
+    user_id = uuid4()
+
+    statement = password_hash_update(
+        user_id,
+        old_hash=b"old",
+        new_hash=b"new",
+    ).compile(dialect=postgresql.psycopg.dialect())
+
+    assert "AND users.password_hash = %(password_hash_1)s" in str(statement)
+    assert statement.params["id_1"] == user_id
+    assert statement.params["password_hash"] == b"new"
+    assert statement.params["password_hash_1"] == b"old"
+
+
+@pytest.mark.asyncio
+async def test_one_rehash_per_user_at_a_time() -> None:
+    release = asyncio.Event()
+
+    async def hash_later(*_: object) -> bytes:
+        await release.wait()
+        return b"new"
+
+    password_hasher = create_autospec(PasswordHasher, instance=True)
+    password_hasher.hash = AsyncMock(side_effect=hash_later)
+    connection = AsyncMock()
+    engine = MagicMock()
+    engine.begin.return_value.__aenter__.return_value = connection
+    user = MagicMock(spec=User)
+    user.id_ = create_id()
+    user.password_hash = create_password_hash(b"old")
+    sut = SqlaPasswordRehasher(engine, password_hasher)
+
+    sut.schedule(user, create_raw_password())
+    sut.schedule(user, create_raw_password())
+    release.set()
+    await sut.close()
+
+    password_hasher.hash.assert_awaited_once()
+    connection.execute.assert_awaited_once()
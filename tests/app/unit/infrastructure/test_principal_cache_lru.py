@@ -0,0 +1,75 @@
+import time
+from datetime import timedelta
+
+import pytest
+
+from app.application.common.query_models.principal import Principal
+from app.domain.user.user_role import UserRole
+from app.infrastructure.adapters.principal_cache_lru import (
+    LruPrincipalCache,
+    PrincipalCacheMaxSize,
+    PrincipalCacheTtl,
+)
+from tests.app.unit.factories.value_objects import create_id
+
+
+def create_principal(role: UserRole = UserRole.VIEWER) -> Principal:
+    return Principal(id_=create_id(), role=role, is_active=True)
+
+
+def create_cache(max_size: int = 2, ttl_s: float = 5) -> LruPrincipalCache:
+    return LruPrincipalCache(
+        PrincipalCacheMaxSize(max_size),
+        PrincipalCacheTtl(timedelta(seconds=ttl_s)),
+    )
+
+
+def test_returns_cached_principal() -> None:
+    sut = create_cache()
+    principal = create_principal()
+    sut.put(principal)
+
+    assert sut.get(principal.id_) == principal
+
+
+def test_entry_expires_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    sut = create_cache(ttl_s=5)
+    principal = create_principal()
+    sut.put(principal)
+
+    now += 5
+    assert sut.get(principal.id_) is None
+
+
+def test_evicts_least_recently_used() -> None:
+    sut = create_cache(max_size=2)
+    first, second, third = create_principal(), create_principal(), create_principal()
+    sut.put(first)
+    sut.put(second)
+    sut.get(first.id_)
+
+    sut.put(third)
+
+    assert sut.get(first.id_) == first
+    assert sut.get(second.id_) is None
+    assert sut.get(third.id_) == third
+
+
+def test_invalidate_drops_entry() -> None:
+    sut = create_cache()
+    principal = create_principal()
+    sut.put(principal)
+
+    sut.invalidate(principal.id_)
+
+    assert sut.get(principal.id_) is None
+
+
+def test_disabled_when_max_size_is_zero() -> None:
+    sut = create_cache(max_size=0)
+    principal = create_principal()
+    sut.put(principal)
+
+    assert sut.get(principal.id_) is None
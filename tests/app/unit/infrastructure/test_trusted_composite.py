@@ -0,0 +1,43 @@
+import pytest
+
+from app.domain.base import DomainFieldError
+from app.domain.user.value_objects import Username
+from app.infrastructure.persistence_sqla.composites import (
+    none_if_null,
+    trusted_factory,
+)
+from tests.app.unit.factories.value_objects import (
+    MultiFieldVO,
+    SingleFieldVO,
+    create_multi_field_vo,
+    create_single_field_vo,
+)
+
+
+def test_builds_value_objects_equal_to_validated_ones() -> None:
+    assert trusted_factory(SingleFieldVO)(1) == create_single_field_vo(1)
+    assert trusted_factory(MultiFieldVO)(1, "Viewer") == create_multi_field_vo(
+        1,
+        "Viewer",
+    )
+
+
+def test_skips_validation() -> None:
+    invalid = "x"
+
+    with pytest.raises(DomainFieldError):
+        Username(invalid)
+
+    assert trusted_factory(Username)(invalid).value == invalid
+
+
+def test_rejects_wrong_number_of_values() -> None:
+    with pytest.raises(ValueError):
+        trusted_factory(MultiFieldVO)(1)
+
+
+def test_loads_all_null_columns_as_none() -> None:
+    build = none_if_null(trusted_factory(MultiFieldVO))
+
+    assert build(None, None) is None
+    assert build(1, None) == trusted_factory(MultiFieldVO)(1, None)
@@ -0,0 +1,110 @@
+import io
+import json
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.user.service import UserService
+from app.domain.wallet.service import WalletService
+from app.infrastructure.user_import.importer_sqla import (
+    SqlaUserImporter,
+    ValidRow,
+    staged_users_insert,
+)
+from app.infrastructure.user_import.report import RejectedRow, write_rejected_row
+from app.infrastructure.user_import.source import ImportRow, read_import_rows
+
+
+def create_importer(batch_size: int = 2) -> SqlaUserImporter:
+    return SqlaUserImporter(
+        MagicMock(),
+        create_autospec(UserService, instance=True),
+        create_autospec(WalletService, instance=True),
+        batch_size=batch_size,
+    )
+
+
+def test_csv_rows_keep_their_starting_line() -> None:
+    source = io.StringIO(
+        "username,email,password\n"
+        'viewer,viewer@example.com,"two\nlines"\n'
+        "streamer,streamer@example.com\n",
+    )
+
+    rows = list(read_import_rows(source, "csv"))
+
+    assert rows[0] == ImportRow(2, "viewer", "viewer@example.com", "two\nlines")
+    assert isinstance(rows[1], RejectedRow)
+    assert rows[1].line == 4
+    assert rows[1].username == "streamer"
+
+
+def test_unreadable_ndjson_lines_are_rejected() -> None:
+    source = io.StringIO(
+        '{"username": "viewer", "email": "viewer@example.com", "password": "p"}\n'
+        "\n"
+        "{not json\n"
+        '["viewer"]\n'
+        '{"username": "streamer", "email": 5, "password": "p"}\n',
+    )
+
+    rows = list(read_import_rows(source, "ndjson"))
+
+    assert isinstance(rows[0], ImportRow)
+    assert [(row.line, row.email) for row in rows[1:]] == [
+        (3, None),
+        (4, None),
+        (5, None),
+    ]
+    assert all(isinstance(row, RejectedRow) for row in rows[1:])
+
+
+def test_rejected_row_is_written_as_ndjson_without_password() -> None:
+    file = io.StringIO()
+
+    write_rejected_row(file, RejectedRow(7, "viewer", None, "Duplicate."))
+
+    assert json.loads(file.getvalue()) == {
+        "line": 7,
+        "username": "viewer",
+        "email": None,
+        "reason": "Duplicate.",
+    }
+
+
+@pytest.mark.asyncio
+async def test_invalid_and_repeated_rows_are_rejected_before_batching(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sut = create_importer(batch_size=2)
+    batches: list[list[str]] = []
+
+    async def import_batch(batch: list[ValidRow], _reject: object) -> int:
+        batches.append([row.username.value for row in batch])
+        return len(batch)
+
+    monkeypatch.setattr(sut, "_import_batch", import_batch)
+    rejected: list[RejectedRow] = []
+    rows = [
+        ImportRow(2, "viewer", "viewer@example.com", "Good Password"),
+        ImportRow(3, "viewer", "other@example.com", "Good Password"),
+        ImportRow(4, "other", "viewer@example.com", "Good Password"),
+        ImportRow(5, "short", "short@example.com", "pw"),
+        RejectedRow(6, None, None, "Line is not valid JSON."),
+        ImportRow(7, "streamer", "streamer@example.com", "Good Password"),
+        ImportRow(8, "admin", "admin@example.com", "Good Password"),
+    ]
+
+    report = await sut.import_rows(rows, rejected.append)
+
+    assert batches == [["viewer", "streamer"], ["admin"]]
+    assert [row.line for row in rejected] == [3, 4, 5, 6]
+    assert (report.imported, report.rejected) == (3, 4)
+
+
+def test_staged_users_skip_clashes_instead_of_failing() -> None:
+    sql = str(staged_users_insert().compile(dialect=postgresql.psycopg.dialect()))
+
+    assert "FROM user_import_staging ON CONFLICT DO NOTHING" in sql
+    assert sql.endswith("RETURNING users.id")